@@ -4,7 +4,6 @@ Usage: python -m nuclear.cli wb1 | wa | wb2 | p6 | wb
 """
 
 import argparse
-import asyncio
 import json
 import sys
 import uuid
@@ -13,16 +12,19 @@ from typing import Optional
 
 from nuclear.progress import log_run, update_checkpoint
 
-# Setup structlog for CLI
-structlog.configure(
-    processors=[
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer()
-    ]
-)
 log = structlog.get_logger()
 
 
+def configure_logging() -> None:
+    """JSON logs for CLI runs; done in main(), not at import, so importing the CLI has no side effects."""
+    structlog.configure(
+        processors=[
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.JSONRenderer()
+        ]
+    )
+
+
 def ensure_run_id(args: argparse.Namespace) -> str:
     """Get run_id from args or generate one."""
     if hasattr(args, "run_id") and args.run_id:
@@ -32,8 +34,7 @@ def ensure_run_id(args: argparse.Namespace) -> str:
 
 def cmd_wb1(args: argparse.Namespace) -> int:
     """Run WB-1 macro stub."""
-    from pathlib import Path
-    from nuclear.phases.weekly.wb1 import run_wb1_macro
+    from nuclear.phases.weekly.wb1 import run_wb1_macro, write_wb1_output
     
     # In M02, we don't strictly require run_id passing to the function yet 
     # unless we update wb1 signature, but SnapshotWriter implicitly needs it?
@@ -57,12 +58,7 @@ def cmd_wb1(args: argparse.Namespace) -> int:
     # Pass run_id via input dict which is loose typed
     # Pass recon_ctx as second arg
     out = run_wb1_macro({"run_id": run_id}, reconciliation_context=recon_ctx)
-    
-    Path("outputs").mkdir(parents=True, exist_ok=True)
-    Path("outputs/wb1_output.json").write_text(
-        json.dumps(out, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    write_wb1_output(out)
     
     # Auto-log run
     log_run(
@@ -77,8 +73,10 @@ def cmd_wb1(args: argparse.Namespace) -> int:
 
 def cmd_wa(_: argparse.Namespace) -> int:
     """Run W-A review stub."""
+    from nuclear.orchestration.arbiter import wait_timeout, workload_slot
     from nuclear.phases.weekly.wa import run_wa_worldview_review
-    out = run_wa_worldview_review({})
+    with workload_slot("wa", timeout=wait_timeout()):
+        out = run_wa_worldview_review({})
     print(json.dumps(out, indent=2, ensure_ascii=False))
     return 0
 
@@ -121,49 +119,75 @@ def cmd_wb2(args: argparse.Namespace) -> int:
 
 
 def cmd_wb_flow(args: argparse.Namespace) -> int:
-    """Run full WB sequence: DB Run -> WB1 -> WB2."""
-    from nuclear.db.repos import RunRepo
+    """
+    Run full WB sequence: DB Run -> WB1 -> WB2.
+    Each step is checkpointed (run_nodes); with args.resume_run_id the same run continues,
+    completed steps are skipped and WB-1's output is rehydrated from its snapshot.
+    """
+    from nuclear.db.repos import RunRepo, SnapshotRepo
     from nuclear.db.schema import create_tables
+    from nuclear.orchestration.checkpoint import RunCheckpoint
+    from nuclear.phases.weekly.wb1 import write_wb1_output
     
     create_tables()
 
-    run_id = str(uuid.uuid4())
-    log.info("Starting WB Flow", run_id=run_id)
-    
+    resume_run_id = getattr(args, "resume_run_id", None)
+    run_id = resume_run_id or str(uuid.uuid4())
+    checkpoint = RunCheckpoint(run_id, flow="wb")
+    log.info("Starting WB Flow", run_id=run_id, resume=bool(resume_run_id))
+
+    def snapshot_id(phase: str):
+        row = SnapshotRepo.latest_for_run(run_id, phase)
+        return row["snapshot_id"] if row else None
+
+    node = None
     try:
-        # 1. Create Run
-        RunRepo.create_run(run_id, trigger="cli_wb_flow")
-        
-        # --- M03 Reconciliation (Start) ---
-        from nuclear.history.reconcile import reconcile_history
-        recon_result = reconcile_history(phase="wb1")
-        log.info("Reconciliation", status=recon_result.continuity_status, summary=recon_result.summary)
-        # --- M03 Reconciliation (End) ---
+        # 1. Create Run (a resumed run keeps its row)
+        if not (resume_run_id and RunRepo.get(run_id)):
+            RunRepo.create_run(run_id, trigger="cli_wb_flow")
+        checkpoint.begin()
+        args.run_id = run_id
 
         # 2. Run WB1
-        # Pass run_id. We manually construct args.
-        args.run_id = run_id
-        # M03: Pass reconciliation result via args (hacky but keeps signature simple) or input dict?
-        # Since we modified cmd_wb1 to expect args, we need to pass recon result to it.
-        # But cmd_wb1 calls run_wb1_macro which now takes an argument.
-        # Let's attach it to args for cmd_wb1 to extract.
-        args.reconciliation_context = recon_result.model_dump()
-        
-        if cmd_wb1(args) != 0:
-            raise Exception("WB1 Failed")
-            
+        node = "wb1"
+        if checkpoint.is_done(node):
+            write_wb1_output(checkpoint.load(node))
+            log.info("Checkpoint reused", run_id=run_id, node=node)
+        else:
+            checkpoint.mark_running(node)
+            # --- M03 Reconciliation (Start) ---
+            from nuclear.history.reconcile import reconcile_history
+            recon_result = reconcile_history(phase="wb1")
+            log.info("Reconciliation", status=recon_result.continuity_status, summary=recon_result.summary)
+            # --- M03 Reconciliation (End) ---
+
+            # M03: cmd_wb1 picks the reconciliation result up from args.
+            args.reconciliation_context = recon_result.model_dump()
+            if cmd_wb1(args) != 0:
+                raise Exception("WB1 Failed")
+            checkpoint.mark_done(node, snapshot_id("wb1"))
+
         # 3. Run WB2
-        if cmd_wb2(args) != 0:
-            raise Exception("WB2 Failed")
-            
+        node = "wb2"
+        if not checkpoint.is_done(node):
+            checkpoint.mark_running(node)
+            if cmd_wb2(args) != 0:
+                raise Exception("WB2 Failed")
+            checkpoint.mark_done(node, snapshot_id("wb2"))
+
         # 4. Complete Run
         RunRepo.mark_completed(run_id)
+        checkpoint.finish(True)
         print(json.dumps({"status": "success", "run_id": run_id}))
         return 0
         
     except Exception as e:
-        log.error("Flow failed", error=str(e))
+        log.error("Flow failed", error=str(e), run_id=run_id, node=node)
         RunRepo.mark_failed(run_id)
+        if node:
+            checkpoint.mark_failed(node, str(e))
+            checkpoint.finish(False)
+        print(json.dumps({"status": "failed", "run_id": run_id, "node": node, "resume": f"nuclear resume {run_id}"}))
         return 1
 
 
@@ -197,6 +221,8 @@ def cmd_p6(args: argparse.Namespace) -> int:
             run_id=f"p6_daemon_{instance_id}",
             summary=f"P6 daemon started (interval={args.interval}s)",
         )
+        import asyncio
+
         asyncio.run(run_p6_daemon(interval_sec=args.interval, instance_id=instance_id))
         return 0
     
@@ -246,17 +272,160 @@ def cmd_daily(args: argparse.Namespace) -> int:
     import json
     
     tickers = args.tickers.split(",") if args.tickers else None
+    run_id = args.run_id or f"daily_{args.date}"
+    if getattr(args, "shard_index", None) is not None or getattr(args, "merge_shards", False):
+        return _cmd_d3_shards(args, tickers, run_id)
     summary = run_daily_pipeline(
         date=args.date,
         tickers=tickers,
         shards=args.shards,
-        run_id=args.run_id or f"daily_{args.date}"
+        run_id=run_id
     )
     
     print(json.dumps(summary.model_dump(), indent=2))
     return 0
 
 
+def _cmd_d3_shards(args: argparse.Namespace, tickers, run_id: str) -> int:
+    """Distributed D-3: --shard-index runs one shard (partial snapshot); --merge-shards assembles daily/d3."""
+    from nuclear.phases.daily.d3 import load_d3_shards, merge_d3_shards, run_d3_shard
+    from nuclear.storage.snapshot import SnapshotWriter
+
+    if args.shards < 2:
+        print("Error: --shard-index / --merge-shards need --shards >= 2")
+        return 1
+    tickers = tickers or ["AAPL", "MSFT", "NVDA"]
+    if args.shard_index is not None:
+        part = run_d3_shard(args.date, tickers, args.shards, args.shard_index, run_id=run_id)
+        print(json.dumps(part.model_dump(), indent=2))
+        return 0
+    parts = load_d3_shards(run_id, args.shards)
+    d3 = merge_d3_shards(args.date, tickers, parts, shards=args.shards)
+    if "missing_shards" in d3.signals:
+        print(f"Error: shards not yet written for run {run_id}: {d3.signals['missing_shards']}")
+        return 1
+    SnapshotWriter().save(phase="daily/d3", payload=d3.model_dump(), run_id=run_id)
+    print(json.dumps(d3.model_dump(), indent=2))
+    return 0
+
+
+def cmd_analyze(args: argparse.Namespace) -> int:
+    """Run the P0 -> P4 analysis chain as a DAG (per-ticker subgraphs in parallel)."""
+    from pathlib import Path
+    from nuclear.orchestration.checkpoint import RunCheckpoint
+
+    themes = json.loads(Path(args.themes).read_text(encoding="utf-8")) if args.themes else []
+    run_id = args.run_id or f"analysis_{uuid.uuid4().hex[:8]}"
+    params = {"themes": themes, "market_regime": args.market_regime, "defcon_level": args.defcon}
+    return _run_analysis_checkpointed(RunCheckpoint(run_id, flow="analysis", params=params), args.workers)
+
+
+def cmd_p3_delta(args: argparse.Namespace) -> int:
+    """P3-Delta weekly tracking of the P3 skeletons of an earlier analysis run."""
+    from nuclear.orchestration.run_graph import run_p3_delta_tracking
+
+    run_id = args.run_id or f"p3_delta_{uuid.uuid4().hex[:8]}"
+    batch = run_p3_delta_tracking(args.of, run_id, max_workers=args.workers)
+    if not batch.outcomes:
+        print(f"No P3 snapshots in run {args.of}", file=sys.stderr)
+        return 1
+    critical = [t for t, d in batch.results.items() if d.skeleton_validity == "CRITICAL"]
+    summary = {**batch.summary(), "critical": critical}
+    log_run(
+        command="p3_delta",
+        status="success" if batch.ok else "partial",
+        run_id=run_id,
+        summary=f"P3-Delta of {args.of}: {len(batch.results)} tracked, {len(batch.failed)} failed",
+        errors=[f"{t}: {e}" for t, e in batch.failed.items()],
+        metrics=summary,
+    )
+    print(json.dumps(summary, indent=2))
+    return 0 if batch.ok else 1
+
+
+def _run_analysis_checkpointed(checkpoint, workers: Optional[int]) -> int:
+    """Run (or resume) the analysis graph under `checkpoint`, with the parameters it was started with."""
+    from nuclear.orchestration.run_graph import run_analysis
+
+    run_id = checkpoint.run_id
+    params = checkpoint.begin().params
+    result = run_analysis(
+        params.get("themes", []),
+        run_id=run_id,
+        max_workers=workers,
+        checkpoint=checkpoint,
+        market_regime=params.get("market_regime", "BULL"),
+        defcon_level=params.get("defcon_level", 3),
+    )
+    summary = result.summary()
+    print(json.dumps(summary, indent=2, default=str))
+    status = "success" if result.ok else ("partial" if "P4" in result.results else "failed")
+    log_run(
+        command="analyze",
+        status=status,
+        run_id=run_id,
+        summary=f"P0->P4 graph: {len(result.nodes)} nodes, critical path {result.critical_path_ms} ms",
+        errors=[f"{n}: {result.nodes[n].error}" for n in result.failed()],
+    )
+    return 0 if result.ok else 1
+
+
+def cmd_resume(args: argparse.Namespace) -> int:
+    """Continue a checkpointed run: completed nodes are rehydrated from snapshots, the rest re-run."""
+    from nuclear.orchestration.checkpoint import RunCheckpoint
+
+    checkpoint = RunCheckpoint.open(args.run_id)
+    if checkpoint is None:
+        print(f"No checkpointed run: {args.run_id}", file=sys.stderr)
+        return 1
+    if checkpoint.flow == "wb":
+        return cmd_wb_flow(argparse.Namespace(run_id=None, resume_run_id=args.run_id))
+    if checkpoint.flow == "analysis":
+        return _run_analysis_checkpointed(checkpoint, args.workers)
+    print(f"Run {args.run_id} has unknown flow: {checkpoint.flow}", file=sys.stderr)
+    return 1
+
+
+def cmd_backfill(args: argparse.Namespace) -> int:
+    """Rebuild daily history over --from..--to; resumable, with progress and ETA."""
+    from nuclear.orchestration.backfill import run_backfill
+
+    def progress(p) -> None:
+        print(p.line(), flush=True)
+
+    try:
+        report = run_backfill(
+            args.kind,
+            args.date_from,
+            args.date_to,
+            workers=args.workers,
+            prefix=args.prefix,
+            force=args.force,
+            tickers=args.tickers.split(",") if args.tickers else None,
+            on_progress=progress,
+            dry_run=args.dry_run,
+        )
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    summary = report.summary()
+    if args.dry_run:
+        for key in report.pending:
+            print(f"[DRY RUN] Would run {args.kind} {key}")
+    else:
+        log_run(
+            command=f"backfill_{args.kind}",
+            status="success" if report.ok else "failed",
+            run_id=f"{args.prefix}_{args.kind}_{args.date_from}_{args.date_to}",
+            summary=f"Backfill {args.kind} {args.date_from}..{args.date_to}: {summary['done']} done, "
+                    f"{summary['skipped']} skipped, {len(summary['failed'])} failed",
+            errors=[f"{k}: {e}" for k, e in report.progress.failed.items()],
+            metrics=summary,
+        )
+    print(json.dumps(summary, indent=2))
+    return 0 if report.ok else 1
+
+
 def cmd_docs(args: argparse.Namespace) -> int:
     """Handle docs subcommands."""
     if args.action == "status":
@@ -301,14 +470,17 @@ def cmd_docs(args: argparse.Namespace) -> int:
 
 def cmd_schedule(args: argparse.Namespace) -> int:
     """Handle schedule subcommands."""
-    from nuclear.orchestration.schedule import run_daily, run_weekly, get_taipei_today
+    from nuclear.orchestration.schedule import run_catch_up, run_daily, run_weekly, get_taipei_today
     from nuclear.progress import read_recent_runs
     
     if args.action == "daily":
-        return run_daily(dry_run=args.dry_run)
+        return run_daily(dry_run=args.dry_run, mode=args.mode)
     
     elif args.action == "weekly":
-        return run_weekly(dry_run=args.dry_run)
+        return run_weekly(dry_run=args.dry_run, mode=args.mode)
+    
+    elif args.action == "catchup":
+        return run_catch_up(dry_run=args.dry_run, mode=args.mode)
     
     elif args.action == "status":
         # Show recent runs and timer info
@@ -326,6 +498,14 @@ def cmd_schedule(args: argparse.Namespace) -> int:
             summary = r.get("summary", "")[:50]
             print(f"  [{ts}] {cmd}: {status} - {summary}")
         
+        from nuclear.orchestration.arbiter import budgets, claims
+        print()
+        print(f"Resource Budgets: {budgets()}")
+        for c in claims():
+            flag = " (preempt requested)" if c["preempt"] else ""
+            print(f"  {c['workload']:<9} p{c['priority']:<4} {c['status']:<8} "
+                  f"cpu={c['cpu']} llm_tpm={c['llm_tpm']} db_write={c['db_write']}{flag}")
+        
         print()
         print("Systemd Timer Commands:")
         print("  systemctl list-timers --all | grep nuclear")
@@ -335,7 +515,112 @@ def cmd_schedule(args: argparse.Namespace) -> int:
     
     return 1
 
+def cmd_llm(args: argparse.Namespace) -> int:
+    """Handle llm subcommands."""
+    if args.action == "bench":
+        from nuclear.llm.bench import run_benchmark
+        from nuclear.llm.mock_server import MockLLMConfig
+
+        config = MockLLMConfig(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            latency_dist=args.latency_dist,
+            tail_rate=args.tail_rate,
+            tail_ms=args.tail_ms,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            think_text=args.think_text,
+            seed=args.seed,
+        )
+        report = run_benchmark(
+            calls=args.calls,
+            concurrency=args.concurrency,
+            phases=[p.strip() for p in args.phases.split(",") if p.strip()],
+            base_url=args.base_url,
+            config=config,
+            model_concurrency=args.model_concurrency,
+            prompt_chars=args.prompt_chars,
+        )
+        print(json.dumps(report, indent=2, default=str))
+        return 0 if report["ok"] else 1
+    if args.action == "stats":
+        from datetime import datetime, timezone
+
+        from nuclear.llm.telemetry import flush_telemetry, parse_window, stats_by_phase_model
+
+        flush_telemetry(timeout=5)
+        since = datetime.now(timezone.utc) - parse_window(args.since)
+        rows = stats_by_phase_model(since, phase=args.phase, model=args.model, run_id=args.run_id)
+        if args.json:
+            print(json.dumps(rows, indent=2, default=str))
+            return 0
+        if not rows:
+            print(f"No LLM calls recorded in the last {args.since}.")
+            return 0
+        print(f"{'PHASE':<8} {'MODEL':<36} {'CALLS':>6} {'ERR':>4} {'P50':>8} {'P95':>8} {'P99':>8} "
+              f"{'TTFT50':>8} {'IN':>7} {'OUT':>6} {'CACHE':>6} {'RETRY':>6} {'PARSE':>6}")
+        for r in rows:
+            lat, ttft = r["latency_ms"], r["ttft_ms"]
+            cells = [lat["p50"], lat["p95"], lat["p99"], ttft["p50"], r["prompt_tokens_avg"],
+                     r["completion_tokens_avg"], r["cache_hit_rate"], r["retries"], r["parse_ok_rate"]]
+            p50, p95, p99, t50, tin, tout, cache, retries, parse = ["-" if c is None else c for c in cells]
+            print(f"{r['phase']:<8} {r['model'][:36]:<36} {r['calls']:>6} {r['errors']:>4} {p50:>8} {p95:>8} {p99:>8} "
+                  f"{t50:>8} {tin:>7} {tout:>6} {cache:>6} {retries:>6} {parse:>6}")
+        return 0
+    return 1
+
+
+def cmd_trace(args: argparse.Namespace) -> int:
+    """Slowest spans, critical path and self time per kind for a run; without run_id, recent runs."""
+    from dataclasses import asdict
+
+    from nuclear.utils import tracing
+
+    tracing.flush_spans(timeout=5)
+    if not args.run_id:
+        from nuclear.db.repos import SpanRepo
+        from nuclear.db.schema import create_tables
+
+        create_tables()
+        runs = SpanRepo.recent_runs(args.top)
+        if not runs:
+            print("No traced runs recorded.")
+            return 0
+        print(f"{'RUN ID':<40} {'SPANS':>6} {'WALL MS':>10}")
+        for r in runs:
+            print(f"{r['run_id'][:40]:<40} {r['spans']:>6} {round((r['end_ns'] - r['start_ns']) / 1e6, 1):>10}")
+        return 0
+
+    records = tracing.load_spans(args.run_id)
+    if not records:
+        print(f"No spans recorded for run {args.run_id}.")
+        return 1
+    if args.json:
+        print(json.dumps({
+            "slowest": [{**asdict(r), "duration_ms": r.duration_ms}
+                        for r in tracing.slowest(records, args.top, kind=args.kind)],
+            "critical_path": [{"name": r.name, "kind": r.kind, "duration_ms": r.duration_ms}
+                              for r in tracing.critical_path(records)],
+            "self_ms_by_kind": tracing.self_time_by_kind(records),
+        }, indent=2, default=str))
+        return 0
+
+    print(f"Run {args.run_id}: {len(records)} spans")
+    print(f"\nSlowest {args.top}:")
+    print(f"  {'KIND':<9} {'NAME':<40} {'TICKER':<8} {'MS':>10} STATUS")
+    for r in tracing.slowest(records, args.top, kind=args.kind):
+        print(f"  {r.kind:<9} {r.name[:40]:<40} {str(r.attrs.get('ticker') or '-'):<8} {r.duration_ms:>10} {r.status}")
+    print("\nCritical path:")
+    for depth, r in enumerate(tracing.critical_path(records)):
+        print(f"  {'  ' * depth}{r.name} [{r.kind}] {r.duration_ms} ms")
+    print("\nSelf time by kind (ms):")
+    for kind, ms in tracing.self_time_by_kind(records).items():
+        print(f"  {kind:<9} {ms:>10}")
+    return 0
+
+
 def main() -> int:
+    configure_logging()
     parser = argparse.ArgumentParser(description="Nuclear CLI V8.45")
     sub = parser.add_subparsers(dest="cmd", required=True)
 
@@ -368,8 +653,40 @@ def main() -> int:
     daily.add_argument("--run-id", help="Optional run ID")
     daily.add_argument("--tickers", help="Comma-separated tickers")
     daily.add_argument("--shards", type=int, default=1, help="Number of shards")
+    daily.add_argument("--shard-index", type=int, help="D-3 only: run this shard (0-based) and write its partial snapshot")
+    daily.add_argument("--merge-shards", action="store_true", help="D-3 only: merge the partial shard snapshots")
     daily.set_defaults(func=cmd_daily)
 
+    analyze = sub.add_parser("analyze", help="P0 -> P4 analysis chain (DAG run graph)")
+    analyze.add_argument("--themes", help="JSON file with the P0 theme list")
+    analyze.add_argument("--run-id", help="Run ID context")
+    analyze.add_argument("--workers", type=int, help="Concurrent graph nodes (default NUCLEAR_RUN_GRAPH_WORKERS)")
+    analyze.add_argument("--market-regime", default="BULL", help="Market regime for P0.7 / P4")
+    analyze.add_argument("--defcon", type=int, default=3, help="DEFCON level for P4")
+    analyze.set_defaults(func=cmd_analyze)
+
+    p3_delta = sub.add_parser("p3-delta", help="P3-Delta weekly tracking of an analysis run's P3 skeletons")
+    p3_delta.add_argument("--of", required=True, help="Run ID of the analysis run whose P3 outputs are tracked")
+    p3_delta.add_argument("--run-id", help="Run ID context")
+    p3_delta.add_argument("--workers", type=int, help="Worker processes (default NUCLEAR_TICKER_PROCESS_WORKERS)")
+    p3_delta.set_defaults(func=cmd_p3_delta)
+
+    backfill = sub.add_parser("backfill", help="Rebuild daily history over a date range")
+    backfill.add_argument("kind", choices=["daily"], help="daily: dates in parallel")
+    backfill.add_argument("--from", dest="date_from", required=True, help="YYYY-MM-DD (first date)")
+    backfill.add_argument("--to", dest="date_to", required=True, help="YYYY-MM-DD (last date, inclusive)")
+    backfill.add_argument("--workers", type=int, help="daily: concurrent dates (default NUCLEAR_BACKFILL_WORKERS)")
+    backfill.add_argument("--prefix", default="backfill", help="Run ID prefix; a new prefix rebuilds everything")
+    backfill.add_argument("--force", action="store_true", help="Re-run dates that already have valid snapshots")
+    backfill.add_argument("--tickers", help="daily: comma-separated tickers")
+    backfill.add_argument("--dry-run", action="store_true", help="List the dates that would run")
+    backfill.set_defaults(func=cmd_backfill)
+
+    resume = sub.add_parser("resume", help="Resume a failed checkpointed run (wb / analyze)")
+    resume.add_argument("run_id", help="Run ID to resume")
+    resume.add_argument("--workers", type=int, help="analyze: concurrent graph nodes")
+    resume.set_defaults(func=cmd_resume)
+
     # Docs subcommands
     docs = sub.add_parser("docs", help="Docs Governance T-DOC-01")
     docs.add_argument("action", choices=["status"], help="Action")
@@ -377,10 +694,47 @@ def main() -> int:
 
     # Schedule subcommands
     schedule = sub.add_parser("schedule", help="Scheduled execution (Daily/Weekly)")
-    schedule.add_argument("action", choices=["daily", "weekly", "status"], help="Action")
+    schedule.add_argument("action", choices=["daily", "weekly", "catchup", "status"],
+                          help="Action (catchup: replay runs missed during downtime)")
     schedule.add_argument("--dry-run", action="store_true", help="Print command without executing")
+    schedule.add_argument("--mode", choices=["inprocess", "subprocess"],
+                          help="Run stages in this process (default) or as `python -m nuclear` subprocesses")
     schedule.set_defaults(func=cmd_schedule)
 
+    # LLM path tooling
+    llm = sub.add_parser("llm", help="LLM path tooling (load benchmark, call stats)")
+    llm.add_argument("action", choices=["bench", "stats"], help="Action")
+    llm.add_argument("--since", default="24h", help="stats: window, e.g. 30m / 24h / 7d")
+    llm.add_argument("--phase", help="stats: filter by phase")
+    llm.add_argument("--model", help="stats: filter by model")
+    llm.add_argument("--run-id", help="stats: filter by run ID")
+    llm.add_argument("--json", action="store_true", help="stats: JSON output")
+    llm.add_argument("--calls", type=int, default=200, help="Total phase calls")
+    llm.add_argument("--concurrency", type=int, default=32, help="Concurrent callers")
+    llm.add_argument("--phases", default="P1-2,P2-2", help="Comma-separated phases (round-robin)")
+    llm.add_argument("--base-url", help="OpenAI-compatible endpoint; default = in-process mock server")
+    llm.add_argument("--model-concurrency", type=int, help="Override per-model M0 pool size")
+    llm.add_argument("--prompt-chars", type=int, default=2000, help="Per-ticker prompt size")
+    llm.add_argument("--latency-ms", type=float, default=500.0, help="Mock latency (median / centre)")
+    llm.add_argument("--jitter-ms", type=float, default=200.0, help="Mock uniform jitter half-width")
+    llm.add_argument("--latency-dist", choices=["fixed", "uniform", "lognormal"], default="uniform")
+    llm.add_argument("--tail-rate", type=float, default=0.0, help="Fraction of straggler calls")
+    llm.add_argument("--tail-ms", type=float, default=0.0, help="Extra latency for stragglers")
+    llm.add_argument("--error-rate", type=float, default=0.0, help="Mock HTTP 500 rate")
+    llm.add_argument("--rate-limit-rate", type=float, default=0.0, help="Mock HTTP 429 rate")
+    llm.add_argument("--think-text", help="Wrap mock answers in <think>...</think>")
+    llm.add_argument("--seed", type=int, help="Mock RNG seed")
+    llm.set_defaults(func=cmd_llm)
+
+    # Tracing
+    trace = sub.add_parser("trace", help="Span trace of a run: slowest spans and critical path")
+    trace.add_argument("run_id", nargs="?", help="Run ID (omit to list recently traced runs)")
+    trace.add_argument("--top", type=int, default=20, help="Number of slowest spans / recent runs")
+    trace.add_argument("--kind", choices=["run", "phase", "ticker", "llm", "snapshot", "db", "internal"],
+                       help="Only spans of this kind in the slowest list")
+    trace.add_argument("--json", action="store_true", help="JSON output")
+    trace.set_defaults(func=cmd_trace)
+
     args = parser.parse_args()
     return args.func(args)
 
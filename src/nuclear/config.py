@@ -1,4 +1,10 @@
-"""Environment configuration."""
+"""Environment configuration.
+
+Settings are parsed on first use - get_settings() or the `settings` module attribute - not at
+import. Modules on the CLI cold path import this module lazily, inside the functions that need it.
+"""
+
+from functools import lru_cache
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -25,4 +31,12 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
+
+
+def __getattr__(name: str):
+    if name == "settings":  # backwards compatible `from nuclear.config import settings`
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
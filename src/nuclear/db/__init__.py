@@ -1,5 +1,11 @@
 """Database layer."""
 
-from nuclear.db.session import engine, get_session, init_db
+from nuclear.db.session import get_engine, get_session, init_db
 
-__all__ = ["engine", "get_session", "init_db"]
+__all__ = ["engine", "get_engine", "get_session", "init_db"]
+
+
+def __getattr__(name: str):
+    if name == "engine":  # created on first use, see db.session.get_engine
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
+import json
 import structlog
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from nuclear.db.sqlite import SQLiteEngine
 
 log = structlog.get_logger()
@@ -30,6 +31,12 @@ class RunRepo:
             conn.execute(sql, ("failed", run_id))
         log.error("Run failed", run_id=run_id)
 
+    @staticmethod
+    def get(run_id: str):
+        with SQLiteEngine.transaction() as conn:
+            row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        return dict(row) if row else None
+
 class SnapshotRepo:
     @staticmethod
     def insert_snapshot_index(
@@ -52,6 +59,30 @@ class SnapshotRepo:
             ))
         log.info("Snapshot indexed", snapshot_id=snapshot_id, run_id=run_id)
 
+    @staticmethod
+    def get(snapshot_id: str):
+        with SQLiteEngine.transaction() as conn:
+            row = conn.execute("SELECT * FROM snapshots_index WHERE snapshot_id = ?", (snapshot_id,)).fetchone()
+        return dict(row) if row else None
+
+    @staticmethod
+    def latest_for_run(run_id: str, phase: str):
+        sql = """
+        SELECT * FROM snapshots_index WHERE run_id = ? AND phase = ?
+        ORDER BY created_at DESC LIMIT 1
+        """
+        with SQLiteEngine.transaction() as conn:
+            row = conn.execute(sql, (run_id, phase)).fetchone()
+        return dict(row) if row else None
+
+    @staticmethod
+    def all_for_run(run_id: str, phase: str):
+        """Every snapshot of `phase` in a run (per-ticker phases write one each), oldest first."""
+        sql = "SELECT * FROM snapshots_index WHERE run_id = ? AND phase = ? ORDER BY created_at"
+        with SQLiteEngine.transaction() as conn:
+            rows = conn.execute(sql, (run_id, phase)).fetchall()
+        return [dict(r) for r in rows]
+
 class P6Repo:
     @staticmethod
     def upsert_heartbeat(
@@ -86,3 +117,517 @@ class P6Repo:
                 instance_id, started_at, last_tick_at, last_ok_at,
                 last_error_at, error_count, last_error_summary, status, pid, updated_at
             ))
+
+class BatchJobRepo:
+    _UPDATABLE = {"provider_batch_id", "status", "completed_count", "output_path", "error"}
+
+    @staticmethod
+    def create(
+        batch_id: str,
+        phase: str,
+        run_id: str,
+        backend: str,
+        item_count: int,
+        input_path: str
+    ):
+        now = datetime.now(timezone.utc).isoformat()
+        sql = """
+        INSERT INTO llm_batch_jobs (
+            batch_id, phase, run_id, backend, status, item_count, completed_count,
+            input_path, created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        with SQLiteEngine.transaction() as conn:
+            conn.execute(sql, (
+                batch_id, phase, run_id, backend, "created", item_count, 0, input_path, now, now
+            ))
+        log.info("Batch job created", batch_id=batch_id, phase=phase, items=item_count)
+
+    @staticmethod
+    def update(batch_id: str, **fields):
+        cols = [k for k in fields if k in BatchJobRepo._UPDATABLE]
+        if not cols:
+            return
+        assignments = ", ".join(f"{c} = ?" for c in cols) + ", updated_at = ?"
+        params = [fields[c] for c in cols] + [datetime.now(timezone.utc).isoformat(), batch_id]
+        with SQLiteEngine.transaction() as conn:
+            conn.execute(f"UPDATE llm_batch_jobs SET {assignments} WHERE batch_id = ?", params)
+
+    @staticmethod
+    def get(batch_id: str):
+        with SQLiteEngine.transaction() as conn:
+            row = conn.execute("SELECT * FROM llm_batch_jobs WHERE batch_id = ?", (batch_id,)).fetchone()
+        return dict(row) if row else None
+
+class AiOutputRepo:
+    @staticmethod
+    def insert(
+        output_id: str,
+        phase: str,
+        run_id: str,
+        ticker: str,
+        model_name: str,
+        include_reasoning: bool,
+        final_answer_storage_key: str,
+        reasoning_trace_storage_key: str,
+        created_at: str
+    ):
+        sql = """
+        INSERT INTO ai_outputs (
+            id, phase, run_id, ticker, model_name, include_reasoning,
+            final_answer_storage_key, reasoning_trace_storage_key, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        with SQLiteEngine.transaction() as conn:
+            conn.execute(sql, (
+                output_id, phase, run_id, ticker, model_name, int(include_reasoning),
+                final_answer_storage_key, reasoning_trace_storage_key, created_at
+            ))
+
+    @staticmethod
+    def list_for_run(run_id: str, phase: str = None, ticker: str = None):
+        sql = "SELECT * FROM ai_outputs WHERE run_id = ?"
+        params = [run_id]
+        if phase:
+            sql += " AND phase = ?"
+            params.append(phase)
+        if ticker:
+            sql += " AND ticker = ?"
+            params.append(ticker)
+        with SQLiteEngine.transaction() as conn:
+            rows = conn.execute(sql + " ORDER BY created_at", params).fetchall()
+        return [dict(r) for r in rows]
+
+class LlmCallRepo:
+    _COLUMNS = (
+        "id", "created_at", "run_id", "phase", "ticker", "model", "provider", "prompt_tokens",
+        "completion_tokens", "cached_tokens", "ttft_ms", "latency_ms", "cache_hit", "retry_count",
+        "status", "error",
+    )
+
+    @staticmethod
+    def insert_many(records: list):
+        cols = LlmCallRepo._COLUMNS
+        sql = f"INSERT OR IGNORE INTO llm_calls ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)})"
+        rows = []
+        for r in records:
+            row = [r.get(c) for c in cols]
+            hit = r.get("cache_hit")
+            row[cols.index("cache_hit")] = None if hit is None else int(hit)
+            rows.append(row)
+        with SQLiteEngine.transaction() as conn:
+            conn.executemany(sql, rows)
+
+    @staticmethod
+    def update_parse(call_id: str, ok: bool):
+        with SQLiteEngine.transaction() as conn:
+            conn.execute("UPDATE llm_calls SET parse_ok = ? WHERE id = ?", (int(ok), call_id))
+
+    @staticmethod
+    def list_since(since: str, phase: str = None, model: str = None, run_id: str = None):
+        sql = "SELECT * FROM llm_calls WHERE created_at >= ?"
+        params = [since]
+        if phase:
+            sql += " AND phase = ?"
+            params.append(phase)
+        if model:
+            sql += " AND model = ?"
+            params.append(model)
+        if run_id:
+            sql += " AND run_id = ?"
+            params.append(run_id)
+        with SQLiteEngine.transaction() as conn:
+            rows = conn.execute(sql + " ORDER BY created_at", params).fetchall()
+        return [dict(r) for r in rows]
+
+class ExtractionChunkRepo:
+    @staticmethod
+    def get_many(cache_keys: list):
+        """cache_key -> result_json for the keys that are cached."""
+        if not cache_keys:
+            return {}
+        sql = f"SELECT cache_key, result_json FROM extraction_chunks WHERE cache_key IN ({', '.join('?' for _ in cache_keys)})"
+        with SQLiteEngine.transaction() as conn:
+            rows = conn.execute(sql, list(cache_keys)).fetchall()
+        return {r["cache_key"]: r["result_json"] for r in rows}
+
+    @staticmethod
+    def put(cache_key: str, doc_hash: str, chunk_index: int, ticker: str, result_json: str):
+        sql = """
+        INSERT OR REPLACE INTO extraction_chunks (
+            cache_key, doc_hash, chunk_index, ticker, result_json, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?)
+        """
+        with SQLiteEngine.transaction() as conn:
+            conn.execute(sql, (
+                cache_key, doc_hash, chunk_index, ticker, result_json, datetime.now(timezone.utc).isoformat()
+            ))
+
+
+class RunStateRepo:
+    @staticmethod
+    def begin(run_id: str, flow: str, params_json: str):
+        """Register (or re-open on resume) a checkpointed run; params are kept from the first start."""
+        now = datetime.now(timezone.utc).isoformat()
+        sql = """
+        INSERT INTO run_state (run_id, flow, params_json, status, created_at, updated_at)
+        VALUES (?, ?, ?, 'running', ?, ?)
+        ON CONFLICT(run_id) DO UPDATE SET status = 'running', updated_at = excluded.updated_at
+        """
+        with SQLiteEngine.transaction() as conn:
+            conn.execute(sql, (run_id, flow, params_json, now, now))
+
+    @staticmethod
+    def get(run_id: str):
+        with SQLiteEngine.transaction() as conn:
+            row = conn.execute("SELECT * FROM run_state WHERE run_id = ?", (run_id,)).fetchone()
+        return dict(row) if row else None
+
+    @staticmethod
+    def set_status(run_id: str, status: str):
+        sql = "UPDATE run_state SET status = ?, updated_at = ? WHERE run_id = ?"
+        with SQLiteEngine.transaction() as conn:
+            conn.execute(sql, (status, datetime.now(timezone.utc).isoformat(), run_id))
+
+    @staticmethod
+    def mark_node(run_id: str, node: str, status: str, snapshot_id: str = None, error: str = None):
+        """Upsert one node's state; attempts counts every transition to running."""
+        sql = """
+        INSERT INTO run_nodes (run_id, node, status, snapshot_id, error, attempts, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(run_id, node) DO UPDATE SET
+            status = excluded.status,
+            snapshot_id = excluded.snapshot_id,
+            error = excluded.error,
+            attempts = run_nodes.attempts + excluded.attempts,
+            updated_at = excluded.updated_at
+        """
+        with SQLiteEngine.transaction() as conn:
+            conn.execute(sql, (
+                run_id, node, status, snapshot_id, error, 1 if status == "running" else 0,
+                datetime.now(timezone.utc).isoformat(),
+            ))
+
+    @staticmethod
+    def list_nodes(run_id: str):
+        sql = "SELECT * FROM run_nodes WHERE run_id = ? ORDER BY updated_at"
+        with SQLiteEngine.transaction() as conn:
+            rows = conn.execute(sql, (run_id,)).fetchall()
+        return [dict(r) for r in rows]
+
+
+class PhaseMemoRepo:
+    @staticmethod
+    def get(phase: str, input_hash: str):
+        sql = "SELECT * FROM phase_memo WHERE phase = ? AND input_hash = ?"
+        with SQLiteEngine.transaction() as conn:
+            row = conn.execute(sql, (phase, input_hash)).fetchone()
+        return dict(row) if row else None
+
+    @staticmethod
+    def put(phase: str, input_hash: str, snapshot_id: str, run_id: str, ticker: str = None):
+        sql = """
+        INSERT OR REPLACE INTO phase_memo (phase, input_hash, snapshot_id, run_id, ticker, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """
+        with SQLiteEngine.transaction() as conn:
+            conn.execute(sql, (
+                phase, input_hash, snapshot_id, run_id, ticker, datetime.now(timezone.utc).isoformat()
+            ))
+
+
+class JobRepo:
+    """
+    jobs table. claim() is a single UPDATE ... RETURNING, so concurrent worker processes
+    never get the same job; a running job whose lease expired is claimable again.
+    """
+
+    @staticmethod
+    def _now() -> str:
+        return JobRepo._at(0)
+
+    @staticmethod
+    def _at(seconds: float) -> str:
+        # fixed-width timestamps: lease / availability checks compare them as strings
+        return (datetime.now(timezone.utc) + timedelta(seconds=seconds)).isoformat(timespec="microseconds")
+
+    @staticmethod
+    def enqueue(job_id: str, job_type: str, payload_json: str, priority: int = 0, max_attempts: int = 3,
+                run_id: str = None, delay_sec: float = 0):
+        now = JobRepo._now()
+        sql = """
+        INSERT INTO jobs (
+            job_id, job_type, payload_json, priority, status, attempts, max_attempts,
+            available_at, run_id, created_at, updated_at
+        ) VALUES (?, ?, ?, ?, 'queued', 0, ?, ?, ?, ?, ?)
+        """
+        with SQLiteEngine.transaction() as conn:
+            conn.execute(sql, (
+                job_id, job_type, payload_json, priority, max_attempts, JobRepo._at(delay_sec), run_id, now, now
+            ))
+
+    @staticmethod
+    def claim(worker_id: str, lease_sec: float, job_types: list = None):
+        """Highest priority, oldest available job -> running under worker_id; None if nothing is due."""
+        now = JobRepo._now()
+        type_filter = f"AND job_type IN ({', '.join('?' for _ in job_types)})" if job_types else ""
+        dead_sql = """
+        UPDATE jobs SET status = 'dead', error = 'lease expired on last attempt', lease_owner = NULL, updated_at = ?
+        WHERE status = 'running' AND lease_expires_at < ? AND attempts >= max_attempts
+        """
+        claim_sql = f"""
+        UPDATE jobs SET status = 'running', attempts = attempts + 1, lease_owner = ?,
+            lease_expires_at = ?, heartbeat_at = ?, updated_at = ?
+        WHERE job_id = (
+            SELECT job_id FROM jobs
+            WHERE ((status = 'queued' AND available_at <= ?) OR (status = 'running' AND lease_expires_at < ?))
+            {type_filter}
+            ORDER BY priority DESC, available_at, created_at
+            LIMIT 1
+        )
+        RETURNING *
+        """
+        with SQLiteEngine.transaction() as conn:
+            conn.execute(dead_sql, (now, now))
+            row = conn.execute(claim_sql, (
+                worker_id, JobRepo._at(lease_sec), now, now, now, now, *(job_types or [])
+            )).fetchone()
+        return dict(row) if row else None
+
+    @staticmethod
+    def heartbeat(job_id: str, worker_id: str, lease_sec: float) -> bool:
+        """Extend the lease; False if this worker no longer owns the job."""
+        now = JobRepo._now()
+        sql = """
+        UPDATE jobs SET lease_expires_at = ?, heartbeat_at = ?, updated_at = ?
+        WHERE job_id = ? AND lease_owner = ? AND status = 'running'
+        """
+        with SQLiteEngine.transaction() as conn:
+            cur = conn.execute(sql, (JobRepo._at(lease_sec), now, now, job_id, worker_id))
+        return cur.rowcount == 1
+
+    @staticmethod
+    def complete(job_id: str, worker_id: str, result_json: str) -> bool:
+        sql = """
+        UPDATE jobs SET status = 'succeeded', result_json = ?, error = NULL, lease_owner = NULL,
+            lease_expires_at = NULL, updated_at = ?
+        WHERE job_id = ? AND lease_owner = ? AND status = 'running'
+        """
+        with SQLiteEngine.transaction() as conn:
+            cur = conn.execute(sql, (result_json, JobRepo._now(), job_id, worker_id))
+        return cur.rowcount == 1
+
+    @staticmethod
+    def fail(job_id: str, worker_id: str, error: str, retry_delay_sec: float = 0) -> str:
+        """Requeue (after retry_delay_sec) while attempts remain, else 'dead'; returns the new status."""
+        sql = """
+        UPDATE jobs SET
+            status = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'dead' END,
+            available_at = ?, error = ?, lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+        WHERE job_id = ? AND lease_owner = ? AND status = 'running'
+        RETURNING status
+        """
+        with SQLiteEngine.transaction() as conn:
+            row = conn.execute(sql, (
+                JobRepo._at(retry_delay_sec), error, JobRepo._now(), job_id, worker_id
+            )).fetchone()
+        return row["status"] if row else "lost"
+
+    @staticmethod
+    def get(job_id: str):
+        with SQLiteEngine.transaction() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    @staticmethod
+    def list_jobs(status: str = None, job_type: str = None, limit: int = 50):
+        sql = "SELECT * FROM jobs WHERE 1=1"
+        params = []
+        if status:
+            sql += " AND status = ?"
+            params.append(status)
+        if job_type:
+            sql += " AND job_type = ?"
+            params.append(job_type)
+        sql += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        with SQLiteEngine.transaction() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [dict(r) for r in rows]
+
+    @staticmethod
+    def counts():
+        with SQLiteEngine.transaction() as conn:
+            rows = conn.execute("SELECT status, count(*) AS n FROM jobs GROUP BY status").fetchall()
+        return {r["status"]: r["n"] for r in rows}
+
+
+class ResourceClaimRepo:
+    """
+    resource_claims table - one row per workload waiting for / holding a resource budget.
+    request() starts with writes, so it holds SQLite's write lock before it reads: concurrent
+    processes arbitrate against a consistent view of who holds what.
+    """
+
+    RESOURCES = ("cpu", "llm_tpm", "db_write")
+
+    @staticmethod
+    def request(
+        holder_id: str, workload: str, priority: int, demand: dict, capacity: dict, lease_sec: float,
+        may_preempt: bool = True,
+    ):
+        """
+        Register / refresh a claim and grant it if it fits; returns the claim row.
+        may_preempt=False (a claimant that will not wait) never asks holders to yield.
+        """
+        now = JobRepo._now()
+        upsert_sql = """
+        INSERT INTO resource_claims (
+            holder_id, workload, priority, cpu, llm_tpm, db_write, status, preempt, requested_at, lease_expires_at
+        ) VALUES (?, ?, ?, ?, ?, ?, 'waiting', 0, ?, ?)
+        ON CONFLICT(holder_id) DO UPDATE SET lease_expires_at = excluded.lease_expires_at
+        """
+        with SQLiteEngine.transaction() as conn:
+            conn.execute("DELETE FROM resource_claims WHERE lease_expires_at < ?", (now,))
+            conn.execute(upsert_sql, (
+                holder_id, workload, priority, *(demand.get(k, 0) for k in ResourceClaimRepo.RESOURCES),
+                now, JobRepo._at(lease_sec)
+            ))
+            rows = [dict(r) for r in conn.execute("SELECT * FROM resource_claims").fetchall()]
+            me = next(r for r in rows if r["holder_id"] == holder_id)
+            if me["status"] == "granted":
+                return me
+            granted = [r for r in rows if r["status"] == "granted"]
+            ahead = [
+                r for r in rows
+                if r["status"] == "waiting" and r["holder_id"] != holder_id
+                and (-r["priority"], r["requested_at"]) < (-me["priority"], me["requested_at"])
+            ]
+            fits = all(
+                sum(r[k] for r in granted) + me[k] <= capacity.get(k, 0) for k in ResourceClaimRepo.RESOURCES
+            )
+            if fits and not ahead:
+                conn.execute(
+                    "UPDATE resource_claims SET status = 'granted', granted_at = ? WHERE holder_id = ?",
+                    (now, holder_id),
+                )
+                me.update(status="granted", granted_at=now)
+            elif not fits and may_preempt:
+                # ask lower-priority holders to yield at their next phase boundary
+                conn.execute(
+                    "UPDATE resource_claims SET preempt = 1 WHERE status = 'granted' AND priority < ?",
+                    (me["priority"],),
+                )
+        return me
+
+    @staticmethod
+    def heartbeat(holder_id: str, lease_sec: float):
+        """Extend the lease; returns the claim row (see `preempt`), or None if it expired."""
+        with SQLiteEngine.transaction() as conn:
+            row = conn.execute(
+                "UPDATE resource_claims SET lease_expires_at = ? WHERE holder_id = ? RETURNING *",
+                (JobRepo._at(lease_sec), holder_id),
+            ).fetchone()
+        return dict(row) if row else None
+
+    @staticmethod
+    def release(holder_id: str):
+        with SQLiteEngine.transaction() as conn:
+            conn.execute("DELETE FROM resource_claims WHERE holder_id = ?", (holder_id,))
+
+    @staticmethod
+    def list_claims():
+        with SQLiteEngine.transaction() as conn:
+            rows = conn.execute(
+                "SELECT * FROM resource_claims WHERE lease_expires_at >= ? ORDER BY priority DESC, requested_at",
+                (JobRepo._now(),),
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+
+class ScheduleRunRepo:
+    """schedule_runs table - one row per scheduled run key (daily: date, weekly: ISO week)."""
+
+    @staticmethod
+    def mark(workload: str, run_key: str, status: str, run_id: str = None):
+        sql = """
+        INSERT INTO schedule_runs (workload, run_key, status, run_id, updated_at) VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(workload, run_key) DO UPDATE SET
+            status = excluded.status, run_id = excluded.run_id, updated_at = excluded.updated_at
+        """
+        with SQLiteEngine.transaction() as conn:
+            conn.execute(sql, (workload, run_key, status, run_id, datetime.now(timezone.utc).isoformat()))
+
+    @staticmethod
+    def get(workload: str, run_key: str):
+        with SQLiteEngine.transaction() as conn:
+            row = conn.execute(
+                "SELECT * FROM schedule_runs WHERE workload = ? AND run_key = ?", (workload, run_key)
+            ).fetchone()
+        return dict(row) if row else None
+
+    @staticmethod
+    def latest(workload: str, status: str = "success"):
+        with SQLiteEngine.transaction() as conn:
+            row = conn.execute(
+                "SELECT * FROM schedule_runs WHERE workload = ? AND status = ? ORDER BY run_key DESC LIMIT 1",
+                (workload, status),
+            ).fetchone()
+        return dict(row) if row else None
+
+
+class SpanRepo:
+    _COLUMNS = (
+        "span_id", "trace_id", "parent_id", "run_id", "name", "kind", "start_ns", "end_ns", "duration_ms",
+        "status", "error", "attrs_json",
+    )
+
+    @staticmethod
+    def insert_many(records: list):
+        """records: utils.tracing.SpanRecord objects."""
+        cols = SpanRepo._COLUMNS
+        sql = f"INSERT OR IGNORE INTO spans ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)})"
+        rows = [
+            (r.span_id, r.trace_id, r.parent_id, r.run_id, r.name, r.kind, r.start_ns, r.end_ns, r.duration_ms,
+             r.status, r.error, json.dumps(r.attrs, ensure_ascii=False, default=str))
+            for r in records
+        ]
+        with SQLiteEngine.transaction() as conn:
+            conn.executemany(sql, rows)
+
+    @staticmethod
+    def list_for_run(run_id: str):
+        with SQLiteEngine.transaction() as conn:
+            rows = conn.execute("SELECT * FROM spans WHERE run_id = ? ORDER BY start_ns", (run_id,)).fetchall()
+        return [dict(r) for r in rows]
+
+    @staticmethod
+    def recent_runs(limit: int = 20):
+        sql = """
+        SELECT run_id, count(*) AS spans, min(start_ns) AS start_ns, max(end_ns) AS end_ns
+        FROM spans WHERE run_id IS NOT NULL GROUP BY run_id ORDER BY max(end_ns) DESC LIMIT ?
+        """
+        with SQLiteEngine.transaction() as conn:
+            rows = conn.execute(sql, (limit,)).fetchall()
+        return [dict(r) for r in rows]
+
+
+class HttpCacheRepo:
+    """http_cache table - last ETag / Last-Modified and body per URL, for conditional GETs."""
+
+    @staticmethod
+    def get(url: str):
+        with SQLiteEngine.transaction() as conn:
+            row = conn.execute("SELECT * FROM http_cache WHERE url = ?", (url,)).fetchone()
+        return dict(row) if row else None
+
+    @staticmethod
+    def put(url: str, etag: str = None, last_modified: str = None, body: str = None):
+        sql = """
+        INSERT INTO http_cache (url, etag, last_modified, body, fetched_at) VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(url) DO UPDATE SET
+            etag = excluded.etag, last_modified = excluded.last_modified, body = excluded.body,
+            fetched_at = excluded.fetched_at
+        """
+        with SQLiteEngine.transaction() as conn:
+            conn.execute(sql, (url, etag, last_modified, body, datetime.now(timezone.utc).isoformat()))
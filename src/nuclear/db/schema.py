@@ -1,8 +1,10 @@
 import structlog
 from nuclear.db.sqlite import SQLiteEngine
+from nuclear.utils.tracing import untraced
 
 log = structlog.get_logger()
 
+@untraced
 def create_tables():
     """Create M02 tables if they don't exist."""
     
@@ -114,3 +116,250 @@ def create_tables():
         cursor.execute(schema_p6_heartbeat)
     
     log.info("M04/M06 Learning & Shadow Tables checked/created")
+
+    # --- V8.17 Batch API jobs (M0__BATCH_JOBS) ---
+    schema_llm_batch_jobs = """
+    CREATE TABLE IF NOT EXISTS llm_batch_jobs (
+        batch_id TEXT PRIMARY KEY,
+        phase TEXT,
+        run_id TEXT,
+        backend TEXT,
+        provider_batch_id TEXT,
+        status TEXT,
+        item_count INTEGER,
+        completed_count INTEGER,
+        input_path TEXT,
+        output_path TEXT,
+        error TEXT,
+        created_at TEXT,
+        updated_at TEXT
+    );
+    """
+    index_batch_jobs_run = "CREATE INDEX IF NOT EXISTS idx_llm_batch_jobs_run_id ON llm_batch_jobs (run_id);"
+
+    with SQLiteEngine.transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute(schema_llm_batch_jobs)
+        cursor.execute(index_batch_jobs_run)
+
+    # --- M20 Reasoning trace index (mirrors db.models.AiOutput) ---
+    schema_ai_outputs = """
+    CREATE TABLE IF NOT EXISTS ai_outputs (
+        id TEXT PRIMARY KEY,
+        phase TEXT,
+        run_id TEXT,
+        ticker TEXT,
+        model_name TEXT,
+        include_reasoning INTEGER,
+        final_answer_storage_key TEXT,
+        reasoning_trace_storage_key TEXT,
+        created_at TEXT
+    );
+    """
+    index_ai_outputs_run = "CREATE INDEX IF NOT EXISTS idx_ai_outputs_run_phase ON ai_outputs (run_id, phase);"
+    index_ai_outputs_ticker = "CREATE INDEX IF NOT EXISTS idx_ai_outputs_ticker ON ai_outputs (ticker);"
+
+    with SQLiteEngine.transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute(schema_ai_outputs)
+        cursor.execute(index_ai_outputs_run)
+        cursor.execute(index_ai_outputs_ticker)
+
+    # --- LLM call telemetry (one row per upstream router call) ---
+    schema_llm_calls = """
+    CREATE TABLE IF NOT EXISTS llm_calls (
+        id TEXT PRIMARY KEY,
+        created_at TEXT,
+        run_id TEXT,
+        phase TEXT,
+        ticker TEXT,
+        model TEXT,
+        provider TEXT,
+        prompt_tokens INTEGER,
+        completion_tokens INTEGER,
+        cached_tokens INTEGER,
+        ttft_ms REAL,
+        latency_ms REAL,
+        cache_hit INTEGER,
+        retry_count INTEGER,
+        status TEXT,
+        error TEXT,
+        parse_ok INTEGER
+    );
+    """
+    index_llm_calls_created = "CREATE INDEX IF NOT EXISTS idx_llm_calls_created_at ON llm_calls (created_at);"
+    index_llm_calls_phase_model = (
+        "CREATE INDEX IF NOT EXISTS idx_llm_calls_phase_model ON llm_calls (phase, model, created_at);"
+    )
+    index_llm_calls_run = "CREATE INDEX IF NOT EXISTS idx_llm_calls_run_id ON llm_calls (run_id);"
+
+    with SQLiteEngine.transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute(schema_llm_calls)
+        cursor.execute(index_llm_calls_created)
+        cursor.execute(index_llm_calls_phase_model)
+        cursor.execute(index_llm_calls_run)
+
+    # --- P1-1.5 per-chunk extraction cache (document hash + chunk) ---
+    schema_extraction_chunks = """
+    CREATE TABLE IF NOT EXISTS extraction_chunks (
+        cache_key TEXT PRIMARY KEY,
+        doc_hash TEXT,
+        chunk_index INTEGER,
+        ticker TEXT,
+        result_json TEXT,
+        created_at TEXT
+    );
+    """
+    index_extraction_chunks_doc = (
+        "CREATE INDEX IF NOT EXISTS idx_extraction_chunks_doc ON extraction_chunks (doc_hash, chunk_index);"
+    )
+
+    with SQLiteEngine.transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute(schema_extraction_chunks)
+        cursor.execute(index_extraction_chunks_doc)
+
+    # --- Run checkpoints: flow + per-node completion for `nuclear resume <run_id>` ---
+    schema_run_state = """
+    CREATE TABLE IF NOT EXISTS run_state (
+        run_id TEXT PRIMARY KEY,
+        flow TEXT,
+        params_json TEXT,
+        status TEXT,
+        created_at TEXT,
+        updated_at TEXT
+    );
+    """
+    schema_run_nodes = """
+    CREATE TABLE IF NOT EXISTS run_nodes (
+        run_id TEXT,
+        node TEXT,
+        status TEXT,
+        snapshot_id TEXT,
+        error TEXT,
+        attempts INTEGER DEFAULT 0,
+        updated_at TEXT,
+        PRIMARY KEY (run_id, node)
+    );
+    """
+
+    with SQLiteEngine.transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute(schema_run_state)
+        cursor.execute(schema_run_nodes)
+
+    # --- Phase memo: input hash -> snapshot of an earlier identical computation ---
+    schema_phase_memo = """
+    CREATE TABLE IF NOT EXISTS phase_memo (
+        phase TEXT,
+        input_hash TEXT,
+        snapshot_id TEXT,
+        run_id TEXT,
+        ticker TEXT,
+        created_at TEXT,
+        PRIMARY KEY (phase, input_hash)
+    );
+    """
+
+    with SQLiteEngine.transaction() as conn:
+        conn.cursor().execute(schema_phase_memo)
+
+    # --- Durable job queue (API / scheduler enqueue, worker processes claim with leases) ---
+    schema_jobs = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        job_id TEXT PRIMARY KEY,
+        job_type TEXT,
+        payload_json TEXT,
+        priority INTEGER DEFAULT 0,
+        status TEXT,
+        attempts INTEGER DEFAULT 0,
+        max_attempts INTEGER DEFAULT 3,
+        available_at TEXT,
+        lease_owner TEXT,
+        lease_expires_at TEXT,
+        heartbeat_at TEXT,
+        result_json TEXT,
+        error TEXT,
+        run_id TEXT,
+        created_at TEXT,
+        updated_at TEXT
+    );
+    """
+    index_jobs_claim = "CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, priority, available_at);"
+
+    with SQLiteEngine.transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute(schema_jobs)
+        cursor.execute(index_jobs_claim)
+
+    # --- Resource arbiter (daily / weekly / W-A / P6 budgets) and scheduled-run ledger for catch-up ---
+    schema_resource_claims = """
+    CREATE TABLE IF NOT EXISTS resource_claims (
+        holder_id TEXT PRIMARY KEY,
+        workload TEXT,
+        priority INTEGER,
+        cpu INTEGER DEFAULT 0,
+        llm_tpm INTEGER DEFAULT 0,
+        db_write INTEGER DEFAULT 0,
+        status TEXT,
+        preempt INTEGER DEFAULT 0,
+        requested_at TEXT,
+        granted_at TEXT,
+        lease_expires_at TEXT
+    );
+    """
+    schema_schedule_runs = """
+    CREATE TABLE IF NOT EXISTS schedule_runs (
+        workload TEXT,
+        run_key TEXT,
+        status TEXT,
+        run_id TEXT,
+        updated_at TEXT,
+        PRIMARY KEY (workload, run_key)
+    );
+    """
+
+    with SQLiteEngine.transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute(schema_resource_claims)
+        cursor.execute(schema_schedule_runs)
+
+    # --- Tracing spans (utils/tracing.py sqlite sink; `nuclear trace <run_id>`) ---
+    schema_spans = """
+    CREATE TABLE IF NOT EXISTS spans (
+        span_id TEXT PRIMARY KEY,
+        trace_id TEXT,
+        parent_id TEXT,
+        run_id TEXT,
+        name TEXT,
+        kind TEXT,
+        start_ns INTEGER,
+        end_ns INTEGER,
+        duration_ms REAL,
+        status TEXT,
+        error TEXT,
+        attrs_json TEXT
+    );
+    """
+    index_spans_run = "CREATE INDEX IF NOT EXISTS idx_spans_run ON spans (run_id, start_ns);"
+
+    with SQLiteEngine.transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute(schema_spans)
+        cursor.execute(index_spans_run)
+
+    # --- D-1 HTTP validators (conditional GETs; phases/daily/adapters/http_client.py) ---
+    schema_http_cache = """
+    CREATE TABLE IF NOT EXISTS http_cache (
+        url TEXT PRIMARY KEY,
+        etag TEXT,
+        last_modified TEXT,
+        body TEXT,
+        fetched_at TEXT
+    );
+    """
+
+    with SQLiteEngine.transaction() as conn:
+        cursor = conn.cursor()
+        cursor.execute(schema_http_cache)
@@ -1,21 +1,44 @@
-"""SQLAlchemy session."""
+"""SQLAlchemy session.
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+The engine is created on first use (get_engine()); importing this module does not import
+SQLAlchemy or parse settings.
+"""
 
-from nuclear.config import settings
+import threading
+from typing import TYPE_CHECKING, Any, Optional
 
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    echo=settings.app_env == "development",
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.orm import Session
 
+_engine: Optional["Engine"] = None
+_session_factory: Any = None
+_lock = threading.Lock()
 
-def get_session() -> Session:
+
+def get_engine() -> "Engine":
+    global _engine, _session_factory
+    with _lock:
+        if _engine is None:
+            from sqlalchemy import create_engine
+            from sqlalchemy.orm import sessionmaker
+
+            from nuclear.config import get_settings
+
+            settings = get_settings()
+            _engine = create_engine(
+                settings.database_url,
+                pool_pre_ping=True,
+                echo=settings.app_env == "development",
+            )
+            _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
+        return _engine
+
+
+def get_session() -> "Session":
     """Get database session."""
-    return SessionLocal()
+    get_engine()
+    return _session_factory()
 
 
 def init_db():
@@ -23,4 +46,13 @@ def init_db():
     from nuclear.db import models  # noqa: F401
     from nuclear.db.models import Base
 
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
+
+
+def __getattr__(name: str):
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        get_engine()
+        return _session_factory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
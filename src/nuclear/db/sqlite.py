@@ -2,6 +2,7 @@ import sqlite3
 import structlog
 from pathlib import Path
 from contextlib import contextmanager
+from nuclear.utils.tracing import DB, span
 
 log = structlog.get_logger()
 
@@ -28,12 +29,13 @@ class SQLiteEngine:
     @classmethod
     @contextmanager
     def transaction(cls):
-        conn = cls.connect()
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+        with span("db.transaction", kind=DB, db=cls.DB_PATH.name):
+            conn = cls.connect()
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                raise e
+            finally:
+                conn.close()
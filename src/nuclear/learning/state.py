@@ -12,9 +12,6 @@ from nuclear.db.schema import create_tables
 
 log = structlog.get_logger()
 
-# Ensure tables exist
-create_tables()
-
 def save_learning_state(state: LearningStateLatest) -> Dict[str, Any]:
     """
     Writes to learning_state_latest (replace latest row, by version)
@@ -59,6 +56,7 @@ def save_learning_state(state: LearningStateLatest) -> Dict[str, Any]:
     )
     
     # 3. Transaction
+    create_tables()
     with SQLiteEngine.transaction() as conn:
         cursor = conn.cursor()
         
@@ -132,6 +130,7 @@ def load_learning_state_latest() -> Optional[LearningStateLatest]:
     
     # Use repo pattern with safe closing
     # Reusing the pattern I fixed in reconcile.py
+    create_tables()
     conn = SQLiteEngine.connect()
     try:
         conn.row_factory = None # We want tuples or we map manually? 
@@ -20,3 +20,8 @@ class BaseLLMClient(ABC):
             Dict containing the response.
         """
         pass
+
+
+class LLMUnavailableError(RuntimeError):
+    """Raised when every provider in a chain failed or is circuit-open."""
+    pass
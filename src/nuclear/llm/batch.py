@@ -0,0 +1,360 @@
+"""
+V8.17 Batch API engine (Python port of 04_M0_BATCH_RUNNER / 04_M0_BATCH_INTEGRATION).
+
+Flow: collect per-ticker prompts for a phase -> write JSONL -> upload + create batch
+-> poll with exponential backoff -> download output -> fan results back by custom_id.
+
+Results are normalized to the same dict shape as BaseLLMClient.generate():
+{"text", "confidence", "reasoning", "metadata"} so callers parse them identically.
+
+Batch mode is opt-in per phase: get_batch_engine(phase) returns an engine only for phases listed
+in NUCLEAR_LLM_BATCH_PHASES (e.g. "P1-2"), with network enabled and a batch endpoint configured.
+The batch model for a phase is NUCLEAR_LLM_BATCH_MODEL, else the phase's routed model when the
+batch provider can serve it (api.openai.com: only "openai/..." slugs, without the prefix); with
+no servable model the phase stays on the sync path. A batch still running after
+NUCLEAR_LLM_BATCH_MAX_WAIT_SEC is cancelled; the items it finished before the cancel are still
+downloaded and resolved, and only the rest fail (callers re-run those synchronously).
+"""
+import json
+import os
+import random
+import time
+import uuid
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set
+from urllib.parse import urlparse
+
+import structlog
+
+from nuclear.llm.hermes_reasoning_parser import parse_hermes_response
+
+log = structlog.get_logger()
+
+DEFAULT_BATCH_BASE_URL = "https://api.openai.com/v1"
+DEFAULT_COMPLETION_WINDOW = "24h"
+DEFAULT_POLL_INITIAL_SEC = 5.0
+DEFAULT_POLL_MAX_SEC = 300.0
+DEFAULT_POLL_TIMEOUT_SEC = 1800.0
+CANCEL_GRACE_SEC = 60.0  # how long to wait for a cancelled batch to publish its partial output
+OPENAI_HOST = "api.openai.com"
+BATCH_ROOT_DIR = Path("outputs/batches")
+
+TERMINAL_OK = {"completed"}
+TERMINAL_FAILED = {"failed", "expired", "cancelled"}
+
+
+class BatchError(RuntimeError):
+    pass
+
+
+@dataclass
+class BatchItem:
+    custom_id: str
+    system_prompt: str
+    user_prompt: str
+    model: str
+    max_tokens: int = 4096
+    temperature: float = 0.2
+    future: Future = field(default_factory=Future, repr=False)
+
+    def to_request_line(self) -> Dict[str, Any]:
+        messages = []
+        if self.system_prompt:
+            messages.append({"role": "system", "content": self.system_prompt})
+        messages.append({"role": "user", "content": self.user_prompt})
+        return {
+            "custom_id": self.custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": self.model,
+                "messages": messages,
+                "max_tokens": self.max_tokens,
+                "temperature": self.temperature,
+            },
+        }
+
+
+class BatchCollector:
+    """Per-phase prompt collector. `add` returns a Future resolved when the batch finishes."""
+
+    def __init__(self, phase: str, model: str, run_id: str = "default"):
+        self.phase = phase
+        self.model = model
+        self.run_id = run_id
+        self.items: Dict[str, BatchItem] = {}
+
+    def add(self, custom_id: str, system_prompt: str, user_prompt: str, **overrides: Any) -> Future:
+        if custom_id in self.items:
+            raise ValueError(f"duplicate custom_id in batch: {custom_id}")
+        item = BatchItem(
+            custom_id=custom_id,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            model=overrides.pop("model", self.model),
+            **overrides,
+        )
+        self.items[custom_id] = item
+        return item.future
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def to_jsonl(self) -> str:
+        return "".join(
+            json.dumps(i.to_request_line(), ensure_ascii=False) + "\n" for i in self.items.values()
+        )
+
+
+class OpenAIBatchBackend:
+    """OpenAI-compatible /files + /batches client (also served by LocalBatchServer)."""
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None, timeout: float = 60.0):
+        self.base_url = (base_url or os.environ.get("NUCLEAR_LLM_BATCH_BASE_URL", DEFAULT_BATCH_BASE_URL)).rstrip("/")
+        self.api_key = api_key if api_key is not None else os.environ.get("OPENAI_API_KEY", "")
+        self.timeout = timeout
+
+    @property
+    def name(self) -> str:
+        return "openai_batch"
+
+    def model_for(self, route_model: str) -> Optional[str]:
+        """The provider's id for a routed (OpenRouter) model, or None if this provider cannot serve it."""
+        if urlparse(self.base_url).hostname != OPENAI_HOST:
+            return route_model  # OpenAI-compatible gateway: takes the routed slug as is
+        vendor, _, name = route_model.partition("/")
+        if not name:
+            return route_model
+        return name if vendor == "openai" else None
+
+    def _client(self):
+        import httpx
+
+        return httpx.Client(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+        )
+
+    def upload(self, filename: str, content: bytes) -> str:
+        with self._client() as c:
+            resp = c.post(
+                "/files",
+                files={"file": (filename, content, "application/jsonl")},
+                data={"purpose": "batch"},
+            )
+            resp.raise_for_status()
+            return resp.json()["id"]
+
+    def create(self, input_file_id: str, metadata: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        with self._client() as c:
+            resp = c.post(
+                "/batches",
+                json={
+                    "input_file_id": input_file_id,
+                    "endpoint": "/v1/chat/completions",
+                    "completion_window": DEFAULT_COMPLETION_WINDOW,
+                    "metadata": metadata or {},
+                },
+            )
+            resp.raise_for_status()
+            return resp.json()
+
+    def retrieve(self, batch_id: str) -> Dict[str, Any]:
+        with self._client() as c:
+            resp = c.get(f"/batches/{batch_id}")
+            resp.raise_for_status()
+            return resp.json()
+
+    def cancel(self, batch_id: str) -> None:
+        with self._client() as c:
+            c.post(f"/batches/{batch_id}/cancel").raise_for_status()
+
+    def download(self, file_id: str) -> str:
+        with self._client() as c:
+            resp = c.get(f"/files/{file_id}/content")
+            resp.raise_for_status()
+            return resp.text
+
+
+def _normalize_output_line(line: Dict[str, Any]) -> Dict[str, Any]:
+    """Batch output line -> generate()-shaped dict. Raises BatchError on per-item error."""
+    if line.get("error"):
+        raise BatchError(f"{line.get('custom_id')}: {line['error']}")
+    response = line.get("response") or {}
+    if response.get("status_code", 200) >= 400:
+        raise BatchError(f"{line.get('custom_id')}: HTTP {response.get('status_code')}")
+    body = response.get("body") or {}
+    content = body["choices"][0]["message"]["content"]
+    parsed = parse_hermes_response(content)
+    return {
+        "text": parsed.final_answer,
+        "confidence": 0.5,
+        "reasoning": parsed.reasoning_trace,
+        "metadata": {
+            "model": body.get("model"),
+            "finish_reason": body["choices"][0].get("finish_reason"),
+            "usage": body.get("usage"),
+            "batch": True,
+        },
+    }
+
+
+class BatchEngine:
+    """Submits a BatchCollector and fans results back to each item's Future."""
+
+    def __init__(
+        self,
+        backend: OpenAIBatchBackend,
+        poll_initial_sec: float = DEFAULT_POLL_INITIAL_SEC,
+        poll_max_sec: float = DEFAULT_POLL_MAX_SEC,
+        poll_timeout_sec: float = DEFAULT_POLL_TIMEOUT_SEC,
+        sleep: Callable[[float], None] = time.sleep,
+        root_dir: Path = BATCH_ROOT_DIR,
+    ):
+        self.backend = backend
+        self.poll_initial_sec = poll_initial_sec
+        self.poll_max_sec = poll_max_sec
+        self.poll_timeout_sec = poll_timeout_sec
+        self._sleep = sleep
+        self.root_dir = root_dir
+
+    def collect(self, phase: str, model: str, run_id: str = "default") -> BatchCollector:
+        return BatchCollector(phase=phase, model=model, run_id=run_id)
+
+    def model_for(self, phase: str) -> Optional[str]:
+        """Batch model for `phase` (see the module docstring); None = keep the phase on the sync path."""
+        override = os.environ.get("NUCLEAR_LLM_BATCH_MODEL")
+        if override:
+            return override
+        from nuclear.llm.routing import get_routing_table
+
+        return self.backend.model_for(get_routing_table().route_for(phase).model)
+
+    def _write_jsonl(self, collector: BatchCollector, local_id: str) -> Path:
+        phase_dir = self.root_dir / collector.phase.replace("/", "_")
+        phase_dir.mkdir(parents=True, exist_ok=True)
+        path = phase_dir / f"{local_id}.jsonl"
+        path.write_text(collector.to_jsonl(), encoding="utf-8")
+        return path
+
+    def _poll(self, batch_id: str) -> Dict[str, Any]:
+        delay = self.poll_initial_sec
+        waited = 0.0
+        while True:
+            status = self.backend.retrieve(batch_id)
+            state = status.get("status")
+            if state in TERMINAL_OK or state in TERMINAL_FAILED:
+                return status
+            if waited >= self.poll_timeout_sec:
+                log.warning("batch_timeout", batch_id=batch_id, status=state, waited_sec=round(waited))
+                return {**self._cancel(batch_id, status), "timed_out_after_sec": round(waited)}
+            wait_sec = min(self.poll_max_sec, delay) * random.uniform(0.8, 1.2)
+            log.info("batch_poll_wait", batch_id=batch_id, status=state, wait_sec=round(wait_sec, 2))
+            self._sleep(wait_sec)
+            waited += wait_sec
+            delay = min(self.poll_max_sec, delay * 2)
+
+    def _cancel(self, batch_id: str, status: Dict[str, Any]) -> Dict[str, Any]:
+        """Cancel a batch nobody will wait for and return its status once the partial output is out."""
+        try:
+            self.backend.cancel(batch_id)
+        except Exception as e:
+            log.warning("batch_cancel_failed", batch_id=batch_id, error=str(e))
+            return status
+        delay, waited = self.poll_initial_sec, 0.0
+        while True:
+            status = self.backend.retrieve(batch_id)
+            if status.get("status") in TERMINAL_OK or status.get("status") in TERMINAL_FAILED \
+                    or waited >= CANCEL_GRACE_SEC:
+                return status
+            self._sleep(delay)
+            waited += delay
+            delay = min(self.poll_max_sec, delay * 2)
+
+    def run(self, collector: BatchCollector) -> Dict[str, Future]:
+        """Submit, wait, and resolve every item's Future. Returns {custom_id: Future}."""
+        from nuclear.db.repos import BatchJobRepo
+        from nuclear.db.schema import create_tables
+
+        futures = {cid: item.future for cid, item in collector.items.items()}
+        if not collector.items:
+            return futures
+
+        create_tables()
+        local_id = f"batch_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        input_path = self._write_jsonl(collector, local_id)
+        BatchJobRepo.create(
+            local_id, collector.phase, collector.run_id, self.backend.name, len(collector), str(input_path)
+        )
+        log.info("batch_submit", phase=collector.phase, items=len(collector), local_id=local_id)
+
+        try:
+            file_id = self.backend.upload(input_path.name, input_path.read_bytes())
+            batch = self.backend.create(file_id, metadata={"phase": collector.phase, "run_id": collector.run_id})
+            BatchJobRepo.update(local_id, provider_batch_id=batch["id"], status=batch.get("status", "submitted"))
+            final = self._poll(batch["id"])
+        except Exception as e:
+            BatchJobRepo.update(local_id, status="failed", error=str(e))
+            for fut in futures.values():
+                if not fut.done():
+                    fut.set_exception(BatchError(f"batch submission failed: {e}"))
+            raise
+
+        state = final.get("status")
+        output_text = self.backend.download(final["output_file_id"]) if final.get("output_file_id") else ""
+        output_path = input_path.with_suffix(".out.jsonl")
+        output_path.write_text(output_text, encoding="utf-8")
+
+        resolved = 0
+        for raw in output_text.splitlines():
+            if not raw.strip():
+                continue
+            line = json.loads(raw)
+            item = collector.items.get(line.get("custom_id"))
+            if item is None or item.future.done():
+                continue
+            try:
+                item.future.set_result(_normalize_output_line(line))
+                resolved += 1
+            except Exception as e:
+                item.future.set_exception(e)
+
+        for cid, fut in futures.items():
+            if not fut.done():
+                fut.set_exception(BatchError(f"{cid}: missing from batch output (status={state})"))
+        if final.get("timed_out_after_sec") is not None:
+            log.warning("batch_partial", local_id=local_id, resolved=resolved, items=len(collector))
+
+        timed_out = final.get("timed_out_after_sec")
+        BatchJobRepo.update(
+            local_id,
+            status=state,
+            output_path=str(output_path),
+            completed_count=resolved,
+            error=f"not finished after {timed_out}s, cancelled" if timed_out is not None else None,
+        )
+        log.info("batch_complete", local_id=local_id, status=state, resolved=resolved, items=len(collector))
+        return futures
+
+
+def batch_phases() -> Set[str]:
+    return {p.strip() for p in os.environ.get("NUCLEAR_LLM_BATCH_PHASES", "").split(",") if p.strip()}
+
+
+def get_batch_engine(phase: str) -> Optional[BatchEngine]:
+    """
+    Batch engine for `phase` only when the phase opted in (NUCLEAR_LLM_BATCH_PHASES), network is
+    enabled and a batch endpoint is configured; else None (sync path).
+    """
+    if phase not in batch_phases():
+        return None
+    if os.environ.get("NUCLEAR_LLM_NETWORK", "0") != "1":
+        return None
+    if not os.environ.get("OPENAI_API_KEY") and not os.environ.get("NUCLEAR_LLM_BATCH_BASE_URL"):
+        return None
+    max_wait = float(os.environ.get("NUCLEAR_LLM_BATCH_MAX_WAIT_SEC", DEFAULT_POLL_TIMEOUT_SEC))
+    return BatchEngine(OpenAIBatchBackend(), poll_timeout_sec=max_wait)
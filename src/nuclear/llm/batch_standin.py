@@ -0,0 +1,213 @@
+"""
+Local stand-in for an OpenAI-compatible Batch API (/files, /batches).
+Used by tests and offline dry-runs; no network, everything in memory.
+
+    with LocalBatchServer(responder=lambda body: '{"tier": "A"}') as srv:
+        engine = BatchEngine(OpenAIBatchBackend(base_url=srv.base_url, api_key="x"))
+"""
+import email.parser
+import email.policy
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Set
+
+
+def _default_responder(body: Dict[str, Any]) -> str:
+    user = next((m["content"] for m in reversed(body.get("messages", [])) if m.get("role") == "user"), "")
+    return f"stub batch response ({len(user)} chars)"
+
+
+def _parse_multipart(content_type: str, raw: bytes) -> Dict[str, bytes]:
+    msg = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + raw
+    )
+    parts: Dict[str, bytes] = {}
+    for part in msg.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        if name:
+            parts[name] = part.get_payload(decode=True) or b""
+    return parts
+
+
+class LocalBatchServer:
+    """
+    In-memory batch provider on 127.0.0.1:<random port>.
+
+    responder: request body -> assistant content (may include <think> tags).
+    polls_until_complete: number of GET /batches/{id} answered "in_progress" first.
+    fail_custom_ids: custom_ids returned as per-item errors.
+    unfinished_custom_ids: custom_ids still running when the batch is cancelled (left out of the
+        partial output a cancelled batch publishes; everything else counts as finished).
+    """
+
+    def __init__(
+        self,
+        responder: Callable[[Dict[str, Any]], str] = _default_responder,
+        polls_until_complete: int = 1,
+        fail_custom_ids: Optional[Set[str]] = None,
+        batch_status: str = "completed",
+        unfinished_custom_ids: Optional[Set[str]] = None,
+    ):
+        self.responder = responder
+        self.polls_until_complete = polls_until_complete
+        self.fail_custom_ids = set(fail_custom_ids or ())
+        self.batch_status = batch_status
+        self.unfinished_custom_ids = set(unfinished_custom_ids or ())
+        self.files: Dict[str, bytes] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self.request_log: list = []
+        self._lock = threading.RLock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _new_file(self, content: bytes) -> str:
+        file_id = f"file-{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self.files[file_id] = content
+        return file_id
+
+    def _complete(self, batch: Dict[str, Any], skip: Set[str] = frozenset()) -> None:
+        lines = []
+        for raw in self.files[batch["input_file_id"]].decode("utf-8").splitlines():
+            if not raw.strip():
+                continue
+            req = json.loads(raw)
+            cid = req["custom_id"]
+            if cid in skip:
+                continue
+            if cid in self.fail_custom_ids:
+                lines.append({"id": f"req_{cid}", "custom_id": cid, "response": None,
+                              "error": {"code": "server_error", "message": "stand-in failure"}})
+                continue
+            body = req["body"]
+            lines.append({
+                "id": f"req_{cid}",
+                "custom_id": cid,
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "id": f"chatcmpl-{uuid.uuid4().hex[:8]}",
+                        "object": "chat.completion",
+                        "model": body.get("model"),
+                        "choices": [{
+                            "index": 0,
+                            "message": {"role": "assistant", "content": self.responder(body)},
+                            "finish_reason": "stop",
+                        }],
+                        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+                    },
+                },
+                "error": None,
+            })
+        payload = "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines)
+        batch["output_file_id"] = self._new_file(payload.encode("utf-8"))
+        batch["request_counts"] = {
+            "total": len(lines),
+            "completed": sum(1 for line in lines if not line["error"]),
+            "failed": sum(1 for line in lines if line["error"]),
+        }
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):  # keep test output quiet
+                pass
+
+            def _send(self, code: int, payload: Any, raw: bool = False):
+                data = payload if raw else json.dumps(payload).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/octet-stream" if raw else "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _body(self) -> bytes:
+                return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+            def do_POST(self):
+                path = self.path.rstrip("/")
+                server.request_log.append(("POST", path))
+                if path.endswith("/files"):
+                    parts = _parse_multipart(self.headers["Content-Type"], self._body())
+                    if "file" not in parts:
+                        return self._send(400, {"error": {"message": "file part missing"}})
+                    return self._send(200, {"id": server._new_file(parts["file"]), "object": "file",
+                                            "purpose": "batch"})
+                if path.endswith("/cancel") and "/batches/" in path:
+                    batch_id = path.rsplit("/", 2)[-2]
+                    with server._lock:
+                        batch = server.batches.get(batch_id)
+                        if batch is None:
+                            return self._send(404, {"error": {"message": "batch not found"}})
+                        if batch["status"] not in ("completed", "failed", "expired", "cancelled"):
+                            server._complete(batch, skip=server.unfinished_custom_ids)  # partial output
+                            batch["status"] = "cancelled"
+                        snapshot = {k: v for k, v in batch.items() if not k.startswith("_")}
+                    return self._send(200, snapshot)
+                if path.endswith("/batches"):
+                    req = json.loads(self._body() or b"{}")
+                    if req.get("input_file_id") not in server.files:
+                        return self._send(404, {"error": {"message": "input file not found"}})
+                    batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+                    batch = {"id": batch_id, "object": "batch", "status": "validating",
+                             "input_file_id": req["input_file_id"], "endpoint": req.get("endpoint"),
+                             "metadata": req.get("metadata") or {}, "output_file_id": None, "_polls": 0}
+                    with server._lock:
+                        server.batches[batch_id] = batch
+                    return self._send(200, {k: v for k, v in batch.items() if not k.startswith("_")})
+                self._send(404, {"error": {"message": "not found"}})
+
+            def do_GET(self):
+                path = self.path.rstrip("/")
+                server.request_log.append(("GET", path))
+                if "/batches/" in path:
+                    batch_id = path.rsplit("/", 1)[-1]
+                    with server._lock:
+                        batch = server.batches.get(batch_id)
+                        if batch is None:
+                            return self._send(404, {"error": {"message": "batch not found"}})
+                        batch["_polls"] += 1
+                        if batch["status"] not in ("completed", "failed", "expired", "cancelled"):
+                            if batch["_polls"] > server.polls_until_complete:
+                                if server.batch_status == "completed":
+                                    server._complete(batch)
+                                batch["status"] = server.batch_status
+                            else:
+                                batch["status"] = "in_progress"
+                        snapshot = {k: v for k, v in batch.items() if not k.startswith("_")}
+                    return self._send(200, snapshot)
+                if path.endswith("/content") and "/files/" in path:
+                    file_id = path.split("/files/", 1)[1].rsplit("/", 1)[0]
+                    content = server.files.get(file_id)
+                    if content is None:
+                        return self._send(404, {"error": {"message": "file not found"}})
+                    return self._send(200, content, raw=True)
+                self._send(404, {"error": {"message": "not found"}})
+
+        return Handler
+
+    def start(self) -> "LocalBatchServer":
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "LocalBatchServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,142 @@
+"""
+LLM path load benchmark: N concurrent phase calls through M0 -> router -> OpenRouterClient
+against a local stand-in (nuclear.llm.mock_server) or any OpenAI-compatible base URL.
+Reports throughput and end-to-end latency percentiles (queue wait + retries included).
+
+    nuclear llm bench --calls 500 --concurrency 64 --phases P1-2,P2-2 --latency-ms 800 --jitter-ms 400
+"""
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import structlog
+
+from nuclear.llm.mock_server import MockLLMConfig, MockLLMServer
+from nuclear.llm.telemetry import percentile
+
+log = structlog.get_logger()
+
+DEFAULT_PHASES = ("P1-2", "P2-2")
+
+
+def latency_summary(values_ms: Sequence[float]) -> Dict[str, Optional[float]]:
+    def r(v):
+        return round(v, 1) if v is not None else None
+
+    return {
+        "p50": r(percentile(values_ms, 50)),
+        "p95": r(percentile(values_ms, 95)),
+        "p99": r(percentile(values_ms, 99)),
+        "max": r(max(values_ms)) if values_ms else None,
+    }
+
+
+@contextmanager
+def _network_env(base_url: str) -> Iterator[None]:
+    """Point the OpenRouter client at base_url for the duration of the benchmark."""
+    overrides = {
+        "NUCLEAR_LLM_NETWORK": "1",
+        "OPENROUTER_BASE_URL": base_url.rstrip("/"),
+        "OPENROUTER_API_KEY": os.environ.get("OPENROUTER_API_KEY") or "mock",
+    }
+    saved = {k: os.environ.get(k) for k in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+def run_benchmark(
+    calls: int = 200,
+    concurrency: int = 32,
+    phases: Sequence[str] = DEFAULT_PHASES,
+    base_url: Optional[str] = None,
+    config: Optional[MockLLMConfig] = None,
+    model_concurrency: Optional[int] = None,
+    prompt_chars: int = 2000,
+) -> Dict[str, Any]:
+    """
+    Drive `calls` M0 requests from `concurrency` caller threads, round-robin over `phases`.
+    Without base_url a MockLLMServer(config) is started for the run.
+    """
+    from nuclear.llm.router import LLMRouter
+    from nuclear.m0.core import M0Engine, _router_call
+    from nuclear.m0.job import M0Request
+
+    server = None if base_url else MockLLMServer(config or MockLLMConfig()).start()
+    url = base_url or server.base_url
+    run_id = f"bench_{uuid.uuid4().hex[:8]}"
+    latencies: Dict[str, List[float]] = {p: [] for p in phases}
+    errors: Dict[str, int] = {}
+    lock = threading.Lock()
+    filler = "x" * max(prompt_chars, 0)
+
+    try:
+        with _network_env(url):
+            router = LLMRouter()
+            engine = M0Engine(llm_call=partial(_router_call, router=router), model_concurrency=model_concurrency)
+
+            def one(i: int) -> None:
+                phase = phases[i % len(phases)]
+                req = M0Request(
+                    phase=phase,
+                    system_prompt=f"[BENCH {phase}] static per-phase prefix",
+                    user_prompt=f"ticker T{i:05d}\n{filler}",
+                    run_id=run_id,
+                    ticker=f"T{i:05d}",
+                )
+                started = time.perf_counter()
+                try:
+                    engine.submit(req)
+                    with lock:
+                        latencies[phase].append((time.perf_counter() - started) * 1000.0)
+                except Exception as e:
+                    with lock:
+                        errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+
+            wall_started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="bench") as pool:
+                list(pool.map(one, range(calls)))
+            wall = time.perf_counter() - wall_started
+            m0_stats = engine.model_stats()
+            engine.shutdown()
+    finally:
+        if server:
+            server.stop()
+
+    all_ms = [v for vs in latencies.values() for v in vs]
+    report: Dict[str, Any] = {
+        "run_id": run_id,
+        "base_url": url,
+        "calls": calls,
+        "concurrency": concurrency,
+        "ok": len(all_ms),
+        "failed": sum(errors.values()),
+        "errors": errors,
+        "wall_sec": round(wall, 3),
+        "throughput_per_sec": round(len(all_ms) / wall, 2) if wall > 0 else None,
+        "latency_ms": latency_summary(all_ms),
+        "by_phase": {p: {"ok": len(v), **latency_summary(v)} for p, v in latencies.items()},
+        "m0": m0_stats,
+        "router": router.run_metrics(run_id),
+        "prefix_cache": router.prefix_cache.snapshot(),
+    }
+    if server:
+        report["server"] = {
+            "chat_requests": server.chat_requests,
+            "status_counts": dict(server.status_counts),
+            "max_in_flight": server.max_in_flight,
+        }
+    log.info("llm_bench_done", run_id=run_id, ok=report["ok"], failed=report["failed"],
+             throughput_per_sec=report["throughput_per_sec"], **{f"latency_{k}": v for k, v in report["latency_ms"].items()})
+    return report
@@ -0,0 +1,82 @@
+"""
+Per-provider circuit breaker for the LLM provider chain.
+CLOSED -> (N consecutive failures) -> OPEN -> (cooldown) -> HALF_OPEN -> probe ok -> CLOSED.
+"""
+import threading
+import time
+from typing import Callable
+
+import structlog
+
+log = structlog.get_logger()
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RESET_TIMEOUT_SEC = 60.0
+
+
+class CircuitBreaker:
+    """
+    Thread-safe breaker. While OPEN the router skips the provider entirely;
+    after `reset_timeout_sec` a single probe call is let through (HALF_OPEN).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout_sec: float = DEFAULT_RESET_TIMEOUT_SEC,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_sec = reset_timeout_sec
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout_sec:
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        """True if a call may be attempted now (reserves the probe slot when HALF_OPEN)."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                log.info("circuit_closed", provider=self.name)
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    log.warning("circuit_opened", provider=self.name, failures=self._failures)
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._probe_in_flight = False
@@ -0,0 +1,134 @@
+"""
+Request hedging for the LLM provider chain.
+Fire the primary provider; if it is still running after its observed p95 latency,
+fire the next provider and take whichever returns a valid answer first.
+
+A losing leg cannot be interrupted mid-request; it keeps its HedgePool thread until the
+client's own per-call timeout (the route's timeout_sec). The router therefore only hedges
+while the pool has room for both legs (HedgePool.has_room) and otherwise calls directly.
+"""
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+log = structlog.get_logger()
+
+DEFAULT_WINDOW = 200
+DEFAULT_MIN_SAMPLES = 20
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies (seconds) for one provider."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW, min_samples: int = DEFAULT_MIN_SAMPLES):
+        self.min_samples = min_samples
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Nearest-rank percentile; None until `min_samples` observations exist."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+        return ordered[rank]
+
+    def p95(self) -> Optional[float]:
+        return self.percentile(95)
+
+
+class HedgePool:
+    """Thread pool for hedged legs that counts legs queued or running, abandoned losers included."""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm-hedge")
+        self._busy = 0
+        self._lock = threading.Lock()
+
+    @property
+    def busy(self) -> int:
+        with self._lock:
+            return self._busy
+
+    def has_room(self, legs: int = 2) -> bool:
+        with self._lock:
+            return self._busy + legs <= self.workers
+
+    def submit(self, fn: Callable[[], Any]) -> Future:
+        with self._lock:
+            self._busy += 1
+        fut = self._executor.submit(fn)
+        fut.add_done_callback(self._release)
+        return fut
+
+    def _release(self, _fut: Future) -> None:
+        with self._lock:
+            self._busy -= 1
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+Attempt = Callable[[], Dict[str, Any]]
+
+
+def run_hedged(
+    executor: "HedgePool | ThreadPoolExecutor",
+    attempts: List[Tuple[str, Attempt]],
+    hedge_after_sec: float,
+    is_valid: Callable[[Dict[str, Any]], bool],
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Run attempts[0]; after `hedge_after_sec` without a valid answer also run attempts[1].
+    Returns (name, result) of the first valid answer. The losing call is abandoned:
+    its future is cancelled if not yet started, otherwise its result is discarded.
+    Raises the last error if neither attempt yields a valid answer.
+    """
+    primary_name, primary = attempts[0]
+    pending: Dict[Future, str] = {executor.submit(primary): primary_name}
+    backups = list(attempts[1:2])
+    last_error: Optional[BaseException] = None
+
+    timeout: Optional[float] = hedge_after_sec
+    while pending:
+        done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+        if not done:
+            # Primary exceeded its p95 - fire the hedge.
+            if backups:
+                name, fn = backups.pop(0)
+                log.info("llm_hedge_fired", primary=primary_name, hedge=name, after_sec=hedge_after_sec)
+                pending[executor.submit(fn)] = name
+            timeout = None
+            continue
+
+        for fut in done:
+            name = pending.pop(fut)
+            try:
+                result = fut.result()
+            except Exception as e:
+                last_error = e
+                log.warning("llm_hedge_attempt_failed", provider=name, error=str(e))
+                continue
+            if is_valid(result):
+                for loser, loser_name in pending.items():
+                    loser.cancel()
+                    log.info("llm_hedge_loser_abandoned", provider=loser_name, winner=name)
+                return name, result
+            last_error = ValueError(f"invalid response from {name}")
+
+        # Winner failed: make sure the hedge is running instead of waiting out the p95.
+        if backups:
+            name, fn = backups.pop(0)
+            pending[executor.submit(fn)] = name
+        timeout = None
+
+    raise last_error or RuntimeError("hedged call produced no result")
@@ -0,0 +1,248 @@
+"""
+Local OpenAI-compatible LLM stand-in for load and latency testing (no credits burned).
+
+Serves POST /chat/completions (JSON or SSE with "stream": true) plus the Batch API
+endpoints of LocalBatchServer, with configurable latency distribution, stragglers,
+500 / 429 rates, token counts, <think> payloads and a simulated prefix cache.
+
+    python -m nuclear.llm.mock_server --port 8089 --latency-ms 800 --jitter-ms 300 --rate-limit-rate 0.05
+    NUCLEAR_LLM_NETWORK=1 OPENROUTER_API_KEY=x OPENROUTER_BASE_URL=http://127.0.0.1:8089 nuclear ...
+
+See `nuclear llm bench` (nuclear.llm.bench) for a driver that reports throughput and tail latency.
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, fields
+from http.server import ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+from nuclear.llm.batch_standin import LocalBatchServer
+from nuclear.prompts.compaction import estimate_tokens
+
+LATENCY_DISTS = ("fixed", "uniform", "lognormal")
+
+
+@dataclass
+class MockLLMConfig:
+    latency_ms: float = 0.0  # fixed value / uniform centre / lognormal median
+    jitter_ms: float = 0.0  # uniform half-width
+    latency_dist: str = "fixed"
+    lognormal_sigma: float = 0.5
+    tail_rate: float = 0.0  # fraction of calls that straggle
+    tail_ms: float = 0.0  # extra latency for stragglers
+    error_rate: float = 0.0  # HTTP 500
+    rate_limit_rate: float = 0.0  # HTTP 429
+    retry_after_sec: float = 1.0
+    completion_tokens: Optional[int] = None  # None = estimate from the content
+    think_text: Optional[str] = None  # wraps the answer as <think>...</think>answer
+    stream_chunks: int = 8
+    prefix_cache: bool = True  # report repeated system prompts as cached_tokens
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.latency_dist not in LATENCY_DISTS:
+            raise ValueError(f"latency_dist must be one of {LATENCY_DISTS}")
+
+
+def _default_answer(body: Dict[str, Any]) -> str:
+    return json.dumps({"status": "ok", "model": body.get("model"), "summary": "mock analysis"})
+
+
+def _message_text(content: Any) -> str:
+    if isinstance(content, list):  # content parts (cache_control breakpoints)
+        return "".join(p.get("text", "") for p in content if isinstance(p, dict))
+    return str(content or "")
+
+
+class MockLLMServer(LocalBatchServer):
+    """
+    LocalBatchServer + /chat/completions. `responder(body) -> answer text` as for batches.
+    Counters (chat_requests, status_counts, max_in_flight) let tests assert on pool limits.
+    """
+
+    def __init__(
+        self,
+        config: Optional[MockLLMConfig] = None,
+        responder: Callable[[Dict[str, Any]], str] = _default_answer,
+        port: int = 0,
+        **batch_kwargs: Any,
+    ):
+        super().__init__(responder=responder, **batch_kwargs)
+        self.config = config or MockLLMConfig()
+        self.port = port
+        self._rng = random.Random(self.config.seed)
+        self._seen_prefixes: set = set()
+        self.chat_requests = 0
+        self.status_counts: Dict[int, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _draw(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+    def sample_latency_sec(self) -> float:
+        c = self.config
+        with self._lock:
+            if c.latency_dist == "uniform":
+                ms = self._rng.uniform(c.latency_ms - c.jitter_ms, c.latency_ms + c.jitter_ms)
+            elif c.latency_dist == "lognormal":
+                ms = self._rng.lognormvariate(math.log(max(c.latency_ms, 1e-3)), c.lognormal_sigma)
+            else:
+                ms = c.latency_ms
+            if c.tail_rate and self._rng.random() < c.tail_rate:
+                ms += c.tail_ms
+        return max(ms, 0.0) / 1000.0
+
+    def _count(self, status: int) -> None:
+        with self._lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def _completion(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        messages = body.get("messages") or []
+        answer = self.responder(body)
+        content = f"<think>{self.config.think_text}</think>\n{answer}" if self.config.think_text else answer
+        prompt_tokens = sum(estimate_tokens(_message_text(m.get("content"))) for m in messages)
+        cached = 0
+        system = next((_message_text(m.get("content")) for m in messages if m.get("role") == "system"), "")
+        if self.config.prefix_cache and system:
+            with self._lock:
+                if system in self._seen_prefixes:
+                    cached = estimate_tokens(system)
+                self._seen_prefixes.add(system)
+        completion_tokens = self.config.completion_tokens or estimate_tokens(content)
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model"),
+            "content": content,
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "prompt_tokens_details": {"cached_tokens": cached},
+            },
+        }
+
+    def _make_handler(self):
+        server = self
+        Base = super()._make_handler()
+
+        class Handler(Base):
+            def _chat(self):
+                body = json.loads(self._body() or b"{}")
+                with server._lock:
+                    server.chat_requests += 1
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    latency = server.sample_latency_sec()
+                    roll = server._draw()
+                    c = server.config
+                    if roll < c.rate_limit_rate:
+                        server._count(429)
+                        self.send_response(429)
+                        self.send_header("Retry-After", str(c.retry_after_sec))
+                        data = json.dumps({"error": {"message": "rate limited (mock)", "code": 429}}).encode()
+                        self.send_header("Content-Type", "application/json")
+                        self.send_header("Content-Length", str(len(data)))
+                        self.end_headers()
+                        self.wfile.write(data)
+                        return
+                    if roll < c.rate_limit_rate + c.error_rate:
+                        time.sleep(latency)
+                        server._count(500)
+                        return self._send(500, {"error": {"message": "upstream error (mock)", "code": 500}})
+                    done = server._completion(body)
+                    server._count(200)
+                    if body.get("stream"):
+                        return self._stream(done, latency)
+                    time.sleep(latency)
+                    self._send(200, {
+                        "id": done["id"], "object": done["object"], "created": done["created"],
+                        "model": done["model"],
+                        "choices": [{"index": 0, "message": {"role": "assistant", "content": done["content"]},
+                                     "finish_reason": "stop"}],
+                        "usage": done["usage"],
+                    })
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+            def _stream(self, done: Dict[str, Any], latency: float):
+                """SSE: first chunk after ~half the latency, the rest spread over the remainder."""
+                content = done["content"]
+                n = max(1, min(server.config.stream_chunks, len(content)))
+                size = math.ceil(len(content) / n)
+                pieces = [content[i:i + size] for i in range(0, len(content), size)]
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                time.sleep(latency / 2)
+                for i, piece in enumerate(pieces):
+                    chunk = {
+                        "id": done["id"], "object": "chat.completion.chunk", "created": done["created"],
+                        "model": done["model"],
+                        "choices": [{"index": 0, "delta": {"content": piece},
+                                     "finish_reason": "stop" if i == len(pieces) - 1 else None}],
+                    }
+                    if i == len(pieces) - 1:
+                        chunk["usage"] = done["usage"]
+                    self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+                    self.wfile.flush()
+                    if i < len(pieces) - 1:
+                        time.sleep(latency / 2 / max(1, len(pieces) - 1))
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+
+            def do_POST(self):
+                if self.path.rstrip("/").endswith("/chat/completions"):
+                    server.request_log.append(("POST", self.path.rstrip("/")))
+                    return self._chat()
+                return super().do_POST()
+
+        return Handler
+
+    def start(self) -> "MockLLMServer":
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", self.port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible LLM stand-in")
+    parser.add_argument("--port", type=int, default=8089)
+    for f in fields(MockLLMConfig):
+        flag = "--" + f.name.replace("_", "-")
+        if f.name == "latency_dist":
+            parser.add_argument(flag, choices=LATENCY_DISTS, default=f.default)
+        elif f.name == "prefix_cache":
+            parser.add_argument("--no-prefix-cache", dest="prefix_cache", action="store_false")
+        elif f.name == "think_text":
+            parser.add_argument(flag, default=None)
+        else:
+            kind = int if f.name in ("completion_tokens", "stream_chunks", "seed") else float
+            parser.add_argument(flag, type=kind, default=f.default)
+    args = parser.parse_args(argv)
+    config = MockLLMConfig(**{f.name: getattr(args, f.name) for f in fields(MockLLMConfig)})
+    server = MockLLMServer(config, port=args.port).start()
+    print(f"mock LLM server on {server.base_url} (OPENROUTER_BASE_URL={server.base_url})", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,10 +3,13 @@ M21 OpenRouter Real Client (Opt-in)
 """
 import os
 import json
+import threading
+import time
 import httpx
 import structlog
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set
 from .base import BaseLLMClient
+from .prompt_cache import build_messages
 
 log = structlog.get_logger()
 
@@ -17,6 +20,22 @@ DEFAULT_TIMEOUT = 30
 DEFAULT_MAX_TOKENS = 512
 DEFAULT_TEMP = 0.2
 
+# Models for which a provider answered 400 to response_format=json_schema (per model, not per client)
+_json_schema_unsupported: Set[str] = set()
+_schema_lock = threading.Lock()
+_SCHEMA_ERROR_MARKERS = ("response_format", "json_schema", "structured output")
+
+
+def _rejects_json_schema(resp: httpx.Response) -> bool:
+    """A 400 whose error body is about response_format - not a bad prompt or context length."""
+    if resp.status_code != 400:
+        return False
+    try:
+        body = resp.text.lower()
+    except Exception:
+        return False
+    return any(marker in body for marker in _SCHEMA_ERROR_MARKERS)
+
 class OpenRouterClient(BaseLLMClient):
     """
     Real OpenRouter Client using httpx.
@@ -31,15 +50,27 @@ class OpenRouterClient(BaseLLMClient):
         self.timeout = int(os.environ.get("NUCLEAR_LLM_TIMEOUT_SECONDS", DEFAULT_TIMEOUT))
         self.max_tokens = int(os.environ.get("NUCLEAR_LLM_MAX_OUTPUT_TOKENS", DEFAULT_MAX_TOKENS))
         self.temperature = float(os.environ.get("NUCLEAR_LLM_TEMPERATURE", DEFAULT_TEMP))
+        # response_format=json_schema where the provider supports it (NUCLEAR_LLM_JSON_SCHEMA=0: never);
+        # models whose provider rejected it are remembered process-wide in _json_schema_unsupported
+        self.json_schema_enabled = os.environ.get("NUCLEAR_LLM_JSON_SCHEMA", "1") != "0"
+        # SSE streaming: same result, with metadata["ttft_ms"] measured at the first content delta
+        self.stream = os.environ.get("NUCLEAR_LLM_STREAM", "0") == "1"
+
+    # Router passes cache_prefix_len (static per-phase prefix) to clients that set this
+    supports_prompt_cache = True
 
     @property
     def name(self) -> str:
         return "openrouter"
 
-    def generate(self, prompt: str, schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def generate(
+        self, prompt: str, schema: Optional[Dict[str, Any]] = None, cache_prefix_len: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Call OpenRouter chat completions.
         Normalize response to {"text": ..., "confidence": ..., "reasoning": ...}.
+        With cache_prefix_len the prompt's static prefix is sent as the system message
+        (with a cache_control breakpoint for Anthropic / Gemini models).
         """
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -58,11 +89,21 @@ class OpenRouterClient(BaseLLMClient):
 
         payload = {
             "model": self.model,
-            "messages": [{"role": "user", "content": final_prompt}],
+            "messages": build_messages(final_prompt, cache_prefix_len, self.model),
             "temperature": self.temperature,
             "max_tokens": self.max_tokens
         }
         
+        if schema and self.json_schema_enabled and self.model not in _json_schema_unsupported:
+            payload["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": schema.get("title", "response"),
+                    "strict": False,
+                    "schema": schema
+                }
+            }
+
         # Add provider routing if specified
         if self.provider_order:
             payload["provider"] = {
@@ -76,51 +117,26 @@ class OpenRouterClient(BaseLLMClient):
                  model=self.model,
                  provider=self.provider_order,
                  payload_keys=list(payload.keys()))
-        print(f"DEBUG URL: {self.base_url}/chat/completions")
-        print(f"DEBUG Model: {self.model}")
-        print(f"DEBUG Provider: {self.provider_order}")
-        print(f"DEBUG Payload: {json.dumps(payload, indent=2)}")
         
+        if self.stream:
+            payload["stream"] = True
+            payload["stream_options"] = {"include_usage": True}
+
         try:
             with httpx.Client(timeout=self.timeout) as client:
-                resp = client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                
-                # Parse OpenAI-compatible response
-                # choices[0].message.content
-                content = data["choices"][0]["message"]["content"]
-                
-                # Normalization
-                # If content looks like JSON and we asked for schema, we might parse it?
-                # But requirement says "Return dict MUST normalize to... text... confidence...".
-                # It doesn't mandatory say we parse the JSON here, just that we return the normalized dict structure.
-                # However, if M19/M18 expects JSON, they consume "text" and parse it themselves.
-                # So we just return the raw text in "text".
-                
-                # Reasoning?
-                # If OpenRouter/Model returns reasoning (e.g. DeepSeek R1), it might be in different fields?
-                # Or if we prompted for it?
-                # For M20, we just check if it's there.
-                # Standard OpenAI format doesn't have "reasoning", but some reasoning models might.
-                # Or we prompt "Explanation: ...".
-                # For M21 we rely on whatever we get.
-                
-                return {
-                    "text": content,
-                    "confidence": 0.5, # Placeholder unless model provides logprobs/confidence
-                    "reasoning": None, # Explicitly None if not extracted
-                    "metadata": {
-                        "model": data.get("model"),
-                        "finish_reason": data["choices"][0].get("finish_reason"),
-                        "usage": data.get("usage")
-                    }
-                }
-                
+                send = self._generate_stream if self.stream else self._generate_once
+                try:
+                    return send(client, headers, payload)
+                except httpx.HTTPStatusError as e:
+                    if "response_format" not in payload or not _rejects_json_schema(e.response):
+                        raise
+                    # Provider rejected json_schema for this model: prompt-only JSON from now on
+                    log.warning("openrouter_json_schema_unsupported", model=self.model, provider=self.provider_order)
+                    with _schema_lock:
+                        _json_schema_unsupported.add(self.model)
+                    payload.pop("response_format")
+                    return send(client, headers, payload)
+
         except Exception as e:
             log.error("openrouter_network_error", error=str(e))
             raise e # Router catches or we fallback? Prompt says "errors... raise controlled exception OR return stub-like"
@@ -131,3 +147,72 @@ class OpenRouterClient(BaseLLMClient):
             # "errors/timeouts -> raise a controlled exception OR return stub-like fallback, but DO NOT crash phases".
             # I will raise logic exception.
             raise e
+
+    def _generate_once(self, client: httpx.Client, headers: Dict[str, str], payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Non-streaming completion. The whole answer arrives in one response, so the first token
+        reaches the caller with the last: ttft_ms is the request -> response time.
+        """
+        started = time.perf_counter()
+        resp = client.post(
+            f"{self.base_url}/chat/completions",
+            headers=headers,
+            json=payload
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        # Parse OpenAI-compatible response
+        # choices[0].message.content
+        # The raw text is returned in "text"; M18/M19 consumers parse JSON themselves.
+        content = data["choices"][0]["message"]["content"]
+
+        return {
+            "text": content,
+            "confidence": 0.5, # Placeholder unless model provides logprobs/confidence
+            "reasoning": None, # Explicitly None if not extracted
+            "metadata": {
+                "model": data.get("model"),
+                "finish_reason": data["choices"][0].get("finish_reason"),
+                "usage": data.get("usage"),
+                "ttft_ms": (time.perf_counter() - started) * 1000.0,
+            }
+        }
+
+    def _generate_stream(self, client: httpx.Client, headers: Dict[str, str], payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Consume an SSE chat completion; ttft_ms = request start -> first content delta."""
+        started = time.perf_counter()
+        ttft_ms = None
+        parts = []
+        model = finish_reason = usage = None
+        with client.stream("POST", f"{self.base_url}/chat/completions", headers=headers, json=payload) as resp:
+            if resp.is_error:
+                resp.read()  # error body for _rejects_json_schema / logs
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                chunk = json.loads(data)
+                model = chunk.get("model") or model
+                usage = chunk.get("usage") or usage
+                for choice in chunk.get("choices") or []:
+                    piece = (choice.get("delta") or {}).get("content")
+                    if piece:
+                        if ttft_ms is None:
+                            ttft_ms = (time.perf_counter() - started) * 1000.0
+                        parts.append(piece)
+                    finish_reason = choice.get("finish_reason") or finish_reason
+        return {
+            "text": "".join(parts),
+            "confidence": 0.5,
+            "reasoning": None,
+            "metadata": {
+                "model": model,
+                "finish_reason": finish_reason,
+                "usage": usage,
+                "ttft_ms": ttft_ms,
+            }
+        }
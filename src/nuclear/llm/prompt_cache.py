@@ -0,0 +1,132 @@
+"""
+Provider prompt (prefix) caching support.
+
+Prompts are laid out as <static per-phase prefix><per-ticker data>; the prefix is the
+system prompt (constitution + role + rules + skills) and must be byte-identical across
+same-phase calls. Providers with automatic prefix caching (OpenAI, DeepSeek) need no
+hint; Anthropic and Gemini models get an explicit cache_control breakpoint on the prefix.
+
+PrefixCacheStats records, per phase, how often a request reused a prefix that was
+already sent to the same model within the cache TTL (expected hit), and the cached
+prompt tokens the provider actually reported.
+"""
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+log = structlog.get_logger()
+
+DEFAULT_CACHE_TTL_SEC = 300  # Anthropic ephemeral cache lifetime
+CACHE_CONTROL_MODEL_PREFIXES = ("anthropic/", "google/gemini")
+
+
+def prompt_cache_enabled() -> bool:
+    return os.environ.get("NUCLEAR_LLM_PROMPT_CACHE", "1") != "0"
+
+
+def prefix_hash(prefix: str) -> str:
+    return hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:16]
+
+
+def split_prompt(prompt: str, prefix_len: Optional[int]) -> Tuple[str, str]:
+    """(static prefix, dynamic rest). No prefix when prefix_len is unset or out of range."""
+    if not prefix_len or prefix_len <= 0 or prefix_len >= len(prompt):
+        return "", prompt
+    return prompt[:prefix_len], prompt[prefix_len:].lstrip("\n")
+
+
+def supports_cache_control(model: Optional[str]) -> bool:
+    return bool(model) and model.startswith(CACHE_CONTROL_MODEL_PREFIXES)
+
+
+def build_messages(prompt: str, prefix_len: Optional[int], model: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Chat messages for a prompt: system = static prefix, user = per-ticker rest.
+    Without a prefix this is the single user message the clients always sent.
+    """
+    prefix, rest = split_prompt(prompt, prefix_len)
+    if not prefix:
+        return [{"role": "user", "content": prompt}]
+    if prompt_cache_enabled() and supports_cache_control(model):
+        system: Any = [{"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}}]
+    else:
+        system = prefix
+    return [{"role": "system", "content": system}, {"role": "user", "content": rest}]
+
+
+def cached_tokens_from_usage(usage: Any) -> Optional[int]:
+    """Provider-reported cached prompt tokens (OpenAI/OpenRouter or Anthropic usage shape)."""
+    if not isinstance(usage, dict):
+        return None
+    details = usage.get("prompt_tokens_details")
+    if isinstance(details, dict) and details.get("cached_tokens") is not None:
+        return int(details["cached_tokens"])
+    if usage.get("cache_read_input_tokens") is not None:
+        return int(usage["cache_read_input_tokens"])
+    return None
+
+
+class PrefixCacheStats:
+    """Thread-safe per-phase prefix reuse counters."""
+
+    def __init__(self, ttl_sec: Optional[float] = None, clock=time.monotonic):
+        self.ttl_sec = float(
+            ttl_sec if ttl_sec is not None else os.environ.get("NUCLEAR_LLM_PROMPT_CACHE_TTL_SEC", DEFAULT_CACHE_TTL_SEC)
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_seen: Dict[Tuple[str, str], float] = {}  # (model, prefix hash) -> last send
+        self._phases: Dict[str, Dict[str, Any]] = {}
+
+    def observe(
+        self,
+        phase: Optional[str],
+        model: Optional[str],
+        prefix: str,
+        usage: Any = None,
+    ) -> bool:
+        """Record one request; returns True if the prefix was warm (expected cache hit)."""
+        h = prefix_hash(prefix)
+        now = self._clock()
+        key = (model or "", h)
+        cached = cached_tokens_from_usage(usage)
+        with self._lock:
+            last = self._last_seen.get(key)
+            warm = last is not None and now - last <= self.ttl_sec
+            self._last_seen[key] = now
+            s = self._phases.setdefault(
+                phase or "", {"requests": 0, "prefix_hits": 0, "prefixes": set(), "cached_tokens": 0, "prompt_tokens": 0}
+            )
+            s["requests"] += 1
+            s["prefix_hits"] += int(warm)
+            s["prefixes"].add(h)
+            if cached is not None:
+                s["cached_tokens"] += cached
+            if isinstance(usage, dict) and usage.get("prompt_tokens"):
+                s["prompt_tokens"] += int(usage["prompt_tokens"])
+        return warm
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            out = {}
+            for phase, s in self._phases.items():
+                out[phase] = {
+                    "requests": s["requests"],
+                    "prefix_hits": s["prefix_hits"],
+                    "hit_rate": round(s["prefix_hits"] / s["requests"], 4) if s["requests"] else 0.0,
+                    "distinct_prefixes": len(s["prefixes"]),
+                    "cached_tokens": s["cached_tokens"],
+                    "cached_token_ratio": (
+                        round(s["cached_tokens"] / s["prompt_tokens"], 4) if s["prompt_tokens"] else None
+                    ),
+                }
+            return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._last_seen.clear()
+            self._phases.clear()
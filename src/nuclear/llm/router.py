@@ -1,85 +1,447 @@
 import os
-from typing import Dict, Any, Optional
-from .base import BaseLLMClient
-from .stub import StubLLMClient
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+import structlog
+
+from .base import BaseLLMClient, LLMUnavailableError
+from .circuit_breaker import CircuitBreaker, OPEN
+from .hedging import HedgePool, LatencyTracker, run_hedged
+from .prompt_cache import PrefixCacheStats, cached_tokens_from_usage, split_prompt
+from .telemetry import LLMCallRecord, record_call
+from .routing import ModelRoute, get_routing_table
+from .singleflight import SingleFlight, prompt_fingerprint
 from .stub import StubLLMClient
+from nuclear.utils.tracing import LLM, span
 # from .openrouter import OpenRouterClient # Deprecated M17 skeleton
 
+log = structlog.get_logger()
+
+DEFAULT_CHAIN_KEY = "default"
+DEFAULT_HEDGE_WORKERS = 8  # floor; see _hedge_workers
+DEFAULT_RUN_KEY = "default_run"
+MAX_TRACKED_RUNS = 256  # per-run counters kept for runs nobody popped (long-lived workers)
+
+
+@dataclass
+class ProviderSlot:
+    """One provider in a chain. Breaker and latency stats are shared across phases."""
+    name: str
+    client: BaseLLMClient
+    breaker: CircuitBreaker
+    latency: LatencyTracker = field(default_factory=LatencyTracker)
+
+
+def _phase_env_suffix(phase: str) -> str:
+    """P1-2 -> P1_2, P2.5 -> P2_5 (env var friendly)."""
+    return phase.upper().replace("-", "_").replace(".", "_")
+
+
+def _hedge_workers() -> int:
+    """
+    NUCLEAR_LLM_HEDGE_WORKERS, else two legs for every M0 model-pool worker (each concurrent
+    call may run a primary and a hedge), never below DEFAULT_HEDGE_WORKERS.
+    """
+    configured = os.environ.get("NUCLEAR_LLM_HEDGE_WORKERS")
+    if configured:
+        return int(configured)
+    table = get_routing_table()
+    fallback = int(os.environ.get("NUCLEAR_M0_MODEL_CONCURRENCY", 4))
+    models = {r.model for r in list(table.routes.values()) + [table.default]}
+    return max(DEFAULT_HEDGE_WORKERS, 2 * sum(table.concurrency_for_model(m, fallback) for m in models))
+
+
+def _is_valid_result(result: Any) -> bool:
+    return isinstance(result, dict) and bool(str(result.get("text") or "").strip())
+
+
 class LLMRouter:
     """
     Routes requests to appropriate LLM backend.
     Default: Stub (safeguard).
     If env OPENROUTER_API_KEY is present, tries OpenRouter.
+
+    Provider chain (per phase):
+      NUCLEAR_LLM_PROVIDER_CHAIN=deepinfra,together          # default chain
+      NUCLEAR_LLM_PROVIDER_CHAIN_P1_2=fireworks,deepinfra    # phase override
+    Providers are tried in order; each has its own circuit breaker.
+    Each phase's model/max_tokens/temperature/timeout comes from the §2.7 routing table
+    (nuclear.llm.routing); the route's provider is tried before the chain providers.
+    NUCLEAR_LLM_HEDGE=1 fires the next provider once the current one passes its p95
+    (only while the hedge pool has room for both legs; see nuclear.llm.hedging).
+    Identical concurrent requests (same phase/prompt/schema) share one upstream call
+    unless NUCLEAR_LLM_SINGLEFLIGHT=0.
+    `cache_prefix_len` marks the static per-phase prefix of a prompt; clients that support
+    it send the prefix as a cacheable system message and prefix reuse is tracked in
+    `prefix_cache` (see nuclear.llm.prompt_cache).
     """
-    
-    def __init__(self):
-        self.client: BaseLLMClient = self._initialize_client()
 
-    def _initialize_client(self) -> BaseLLMClient:
+    def __init__(
+        self,
+        chains: Optional[Dict[str, List[BaseLLMClient]]] = None,
+        hedge: Optional[bool] = None,
+    ):
+        self._slots: Dict[str, ProviderSlot] = {}
+        self._chains: Dict[str, List[ProviderSlot]] = {}
+        self.hedge_enabled = (
+            hedge if hedge is not None else os.environ.get("NUCLEAR_LLM_HEDGE", "0") == "1"
+        )
+        self._hedge_pool: Optional[HedgePool] = None
+        # chain_for / _slot_for fill _chains / _slots lazily from concurrent M0 workers: one
+        # ProviderSlot (and so one CircuitBreaker) per provider must be created exactly once
+        self._chains_lock = threading.RLock()
+        self.singleflight_enabled = os.environ.get("NUCLEAR_LLM_SINGLEFLIGHT", "1") != "0"
+        self._flight = SingleFlight()
+        self._metrics_lock = threading.Lock()
+        self._run_metrics: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self._use_routes = not chains
+        self.prefix_cache = PrefixCacheStats()
+
+        if chains:
+            for key, clients in chains.items():
+                self._chains[key] = [self._slot_for(c) for c in clients]
+            default = self._chains.get(DEFAULT_CHAIN_KEY) or next(iter(self._chains.values()))
+            self._chains.setdefault(DEFAULT_CHAIN_KEY, default)
+            self.client: BaseLLMClient = default[0].client
+        else:
+            self.client = self._initialize_client()
+            self._chains[DEFAULT_CHAIN_KEY] = self._build_chain(
+                os.environ.get("NUCLEAR_LLM_PROVIDER_CHAIN")
+            ) or [self._slot_for(self.client)]
+
+    def _initialize_client(self, provider: Optional[str] = None, route: Optional[ModelRoute] = None) -> BaseLLMClient:
         network_enabled = os.environ.get("NUCLEAR_LLM_NETWORK", "0") == "1"
         key = os.environ.get("OPENROUTER_API_KEY")
-        
+
         if network_enabled:
             if key and key.strip():
                 try:
                     from .openrouter_client import OpenRouterClient
-                    
+
                     # Read model and provider from .env
                     model = os.environ.get("DEFAULT_ANALYST_MODEL") or os.environ.get("OPENROUTER_MODEL")
-                    provider = os.environ.get("DEFAULT_ANALYST_PROVIDER")
+                    if route:
+                        model = route.model
+                        provider = provider or route.provider
+                    provider = provider or os.environ.get("DEFAULT_ANALYST_PROVIDER")
                     provider_order = [provider] if provider else None
-                    
-                    return OpenRouterClient(api_key=key, model=model, provider_order=provider_order)
+
+                    client = OpenRouterClient(api_key=key, model=model, provider_order=provider_order)
+                    if route:
+                        client.max_tokens = route.max_tokens
+                        client.temperature = route.temperature
+                        client.timeout = route.timeout_sec
+                    return client
                 except Exception as e:
                     # Log error but fallback
-                    import structlog
-                    log = structlog.get_logger()
                     log.error("openrouter_init_failed", error=str(e))
                     return StubLLMClient()
             else:
-                 import structlog
-                 log = structlog.get_logger()
                  log.warning("NUCLEAR_LLM_NETWORK=1 but OPENROUTER_API_KEY missing. Fallback to Stub.")
                  return StubLLMClient()
-        
+
         return StubLLMClient()
 
+    def _slot_for(self, client: BaseLLMClient, name: Optional[str] = None) -> ProviderSlot:
+        order = getattr(client, "provider_order", None)
+        name = name or (f"{client.name}/{order[0]}" if order else client.name)
+        with self._chains_lock:
+            if name not in self._slots:
+                self._slots[name] = ProviderSlot(name=name, client=client, breaker=CircuitBreaker(name))
+            return self._slots[name]
+
+    def _build_chain(self, spec: Optional[str]) -> List[ProviderSlot]:
+        """Comma-separated provider list -> slots. Stub clients are collapsed (no network)."""
+        if not spec or not spec.strip():
+            return []
+        chain: List[ProviderSlot] = []
+        for provider in [p.strip() for p in spec.split(",") if p.strip()]:
+            existing = next((s for s in self._slots.values() if s.name.endswith(f"/{provider}")), None)
+            slot = existing or self._slot_for(self._initialize_client(provider))
+            if slot not in chain:
+                chain.append(slot)
+        return chain
+
+    def _build_route_chain(self, route: ModelRoute, spec: Optional[str]) -> List[ProviderSlot]:
+        """Slots for one routed model: route.provider first, then chain providers. Stub collapses."""
+        providers: List[Optional[str]] = []
+        for p in ([route.provider] if route.provider else []) + [
+            p.strip() for p in (spec or "").split(",") if p.strip()
+        ]:
+            if p not in providers:
+                providers.append(p)
+        chain: List[ProviderSlot] = []
+        for provider in providers or [None]:
+            client = self._initialize_client(provider, route=route)
+            name = None
+            if not isinstance(client, StubLLMClient):
+                name = f"{client.name}/{route.model}" + (f"@{provider}" if provider else "")
+            slot = self._slot_for(client, name=name)
+            if slot not in chain:
+                chain.append(slot)
+        return chain
+
+    def chain_for(self, phase: Optional[str] = None, model: Optional[str] = None) -> List[ProviderSlot]:
+        """Ordered provider chain for a phase (and optional model override)."""
+        if not phase:
+            return self._chains[DEFAULT_CHAIN_KEY]
+        key = f"{phase}|{model}" if model else phase
+        chain = self._chains.get(key)
+        if chain is not None:
+            return chain
+        with self._chains_lock:
+            if key not in self._chains:
+                spec = os.environ.get(f"NUCLEAR_LLM_PROVIDER_CHAIN_{_phase_env_suffix(phase)}")
+                if self._use_routes:
+                    route = get_routing_table().route_for(phase, model)
+                    self._chains[key] = self._build_route_chain(
+                        route, spec or os.environ.get("NUCLEAR_LLM_PROVIDER_CHAIN")
+                    )
+                else:
+                    self._chains[key] = self._build_chain(spec) or self._chains[DEFAULT_CHAIN_KEY]
+            return self._chains[key]
+
     @property
     def active_client_name(self) -> str:
         return self.client.name
 
-    def generate(self, prompt: str, schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        result = self.client.generate(prompt, schema)
-        
-        # M20 Reasoning Trace Storage
+    def _get_hedge_pool(self) -> HedgePool:
+        with self._chains_lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = HedgePool(_hedge_workers())
+            return self._hedge_pool
+
+    def _attempt(
+        self,
+        slot: ProviderSlot,
+        prompt: str,
+        schema: Optional[Dict[str, Any]],
+        cache_prefix_len: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Single provider call with breaker + latency bookkeeping."""
+        if not slot.breaker.allow():
+            raise LLMUnavailableError(f"circuit open: {slot.name}")
+        started = time.perf_counter()
+        try:
+            if cache_prefix_len and getattr(slot.client, "supports_prompt_cache", False):
+                result = slot.client.generate(prompt, schema, cache_prefix_len=cache_prefix_len)
+            else:
+                result = slot.client.generate(prompt, schema)
+        except Exception:
+            slot.breaker.record_failure()
+            raise
+        if not _is_valid_result(result):
+            slot.breaker.record_failure()
+            raise ValueError(f"empty response from {slot.name}")
+        slot.breaker.record_success()
+        slot.latency.record(time.perf_counter() - started)
+        result.setdefault("metadata", {})
+        if isinstance(result["metadata"], dict):
+            result["metadata"]["provider"] = slot.name
+        return result
+
+    def _generate_with_chain(
+        self,
+        chain: List[ProviderSlot],
+        prompt: str,
+        schema: Optional[Dict[str, Any]],
+        phase: Optional[str],
+        cache_prefix_len: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        candidates = [s for s in chain if s.breaker.state != OPEN]
+        if not candidates:
+            raise LLMUnavailableError(f"all providers circuit-open for phase={phase}")
+
+        errors: List[str] = []
+        start_idx = 0
+        hedge_after = candidates[0].latency.p95() if self.hedge_enabled and len(candidates) > 1 else None
+        if hedge_after is not None and not self._get_hedge_pool().has_room(2):
+            # Slow or stuck losers still hold the pool: a queued hedge leg would only wait behind them
+            log.warning("llm_hedge_skipped", phase=phase, reason="hedge pool saturated",
+                        busy=self._hedge_pool.busy, workers=self._hedge_pool.workers)
+            hedge_after = None
+        if hedge_after is not None:
+            pair = candidates[:2]
+            try:
+                _, result = run_hedged(
+                    self._get_hedge_pool(),
+                    [(s.name, (lambda s=s: self._attempt(s, prompt, schema, cache_prefix_len))) for s in pair],
+                    hedge_after_sec=hedge_after,
+                    is_valid=_is_valid_result,
+                )
+                return result
+            except Exception as e:
+                errors.append(f"hedged({pair[0].name},{pair[1].name}): {e}")
+                start_idx = 2
+
+        for slot in candidates[start_idx:]:
+            try:
+                result = self._attempt(slot, prompt, schema, cache_prefix_len)
+                if errors and isinstance(result.get("metadata"), dict):
+                    result["metadata"]["failovers"] = len(errors)
+                return result
+            except Exception as e:
+                errors.append(f"{slot.name}: {e}")
+                log.warning("llm_provider_failed", provider=slot.name, phase=phase, error=str(e))
+
+        raise LLMUnavailableError(f"all providers failed for phase={phase}: {'; '.join(errors)}")
+
+    def _count(self, run_id: Optional[str], metric: str) -> None:
+        key = run_id or DEFAULT_RUN_KEY
+        with self._metrics_lock:
+            bucket = self._run_metrics.get(key)
+            if bucket is None:
+                bucket = self._run_metrics[key] = {}
+                while len(self._run_metrics) > MAX_TRACKED_RUNS:
+                    self._run_metrics.popitem(last=False)
+            bucket[metric] = bucket.get(metric, 0) + 1
+
+    def run_metrics(self, run_id: Optional[str] = None) -> Dict[str, int]:
+        """Per-run counters: llm_requests, llm_upstream_calls, llm_singleflight_dedup,
+        llm_prefix_cache_hits / llm_prefix_cache_misses."""
+        with self._metrics_lock:
+            return dict(self._run_metrics.get(run_id or DEFAULT_RUN_KEY, {}))
+
+    def pop_run_metrics(self, run_id: Optional[str] = None) -> Dict[str, int]:
+        """Return and clear counters for a finished run (log_run merges them into its metrics)."""
+        with self._metrics_lock:
+            return self._run_metrics.pop(run_id or DEFAULT_RUN_KEY, {})
+
+    def _generate_upstream(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]],
+        phase: Optional[str],
+        run_id: Optional[str],
+        ticker: Optional[str] = None,
+        model: Optional[str] = None,
+        cache_prefix_len: Optional[int] = None,
+        attempt: int = 1,
+    ) -> Dict[str, Any]:
+        self._count(run_id, "llm_upstream_calls")
+        chain = self.chain_for(phase, model)
+        route_model = model or (get_routing_table().route_for(phase).model if self._use_routes and phase else None)
+        started = time.perf_counter()
+        with span("llm.generate", kind=LLM, phase=phase, model=route_model, ticker=ticker, attempt=attempt) as sp:
+            try:
+                result = self._generate_with_chain(chain, prompt, schema, phase, cache_prefix_len)
+            except Exception as e:
+                record_call(LLMCallRecord(
+                    phase=phase, model=route_model, provider=chain[0].name if chain else None,
+                    latency_ms=(time.perf_counter() - started) * 1000.0, status="error", run_id=run_id,
+                    ticker=ticker, retry_count=attempt - 1 + max(len(chain) - 1, 0), error=str(e)[:500],
+                ))
+                raise
+            metadata = result.get("metadata") if isinstance(result.get("metadata"), dict) else {}
+            if sp is not None:
+                usage = metadata.get("usage") if isinstance(metadata.get("usage"), dict) else {}
+                sp.set(provider=metadata.get("provider"), model=route_model or metadata.get("model"),
+                       prompt_tokens=usage.get("prompt_tokens"), completion_tokens=usage.get("completion_tokens"))
+        latency_ms = (time.perf_counter() - started) * 1000.0
+
+        warm: Optional[bool] = None
+        prefix, _ = split_prompt(prompt, cache_prefix_len)
+        if prefix:
+            warm = self.prefix_cache.observe(
+                phase, model or metadata.get("model") or metadata.get("provider"), prefix, metadata.get("usage")
+            )
+            self._count(run_id, "llm_prefix_cache_hits" if warm else "llm_prefix_cache_misses")
+
+        usage = metadata.get("usage") if isinstance(metadata.get("usage"), dict) else {}
+        cached = cached_tokens_from_usage(usage)
+        rec = LLMCallRecord(
+            phase=phase,
+            model=route_model or metadata.get("model"),
+            provider=metadata.get("provider"),
+            latency_ms=latency_ms,
+            run_id=run_id,
+            ticker=ticker,
+            prompt_tokens=usage.get("prompt_tokens"),
+            completion_tokens=usage.get("completion_tokens"),
+            cached_tokens=cached,
+            ttft_ms=metadata.get("ttft_ms"),
+            cache_hit=(cached > 0) if cached is not None else warm,
+            retry_count=attempt - 1 + int(metadata.get("failovers") or 0),
+        )
+        record_call(rec)
+        if "metadata" in result and isinstance(result["metadata"], dict):
+            result["metadata"]["llm_call_id"] = rec.id
+
+        # M20 Reasoning Trace Storage (key returned now, blob + ai_outputs row written async)
         if "reasoning" in result and result["reasoning"]:
             try:
                 from nuclear.llm.traces import ReasoningTrace, StoredTraceRef
                 from nuclear.storage.reasoning import write_reasoning_trace
                 from datetime import datetime, timezone
-                
+
+                metadata = result.get("metadata") or {}
                 trace = ReasoningTrace(
-                    model=self.active_client_name,
+                    model=metadata.get("model") or metadata.get("provider") or self.active_client_name,
                     text=result["reasoning"],
                     created_at=datetime.now(timezone.utc)
                 )
-                
-                ref_key = write_reasoning_trace(trace)
-                
+
+                ref_key = write_reasoning_trace(trace, run_id=run_id, phase=phase, ticker=ticker)
+
                 result["reasoning_trace_ref"] = StoredTraceRef(
                     storage_key=ref_key,
                     model=trace.model
                 )
             except Exception as e:
                 # Never block main flow
-                import structlog
-                log = structlog.get_logger()
                 log.error("reasoning_trace_write_failed", error=str(e))
-                
+
         return result
 
-# Singleton instance for easy import
-router = LLMRouter()
+    def generate(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None,
+        phase: Optional[str] = None,
+        run_id: Optional[str] = None,
+        ticker: Optional[str] = None,
+        model: Optional[str] = None,
+        cache_prefix_len: Optional[int] = None,
+        attempt: int = 1,
+    ) -> Dict[str, Any]:
+        """`attempt` is the caller's retry attempt (1-based), recorded in call telemetry."""
+        self._count(run_id, "llm_requests")
+        if not self.singleflight_enabled:
+            return self._generate_upstream(prompt, schema, phase, run_id, ticker, model, cache_prefix_len, attempt)
+
+        key = prompt_fingerprint(prompt, schema, f"{phase}|{model}" if model else phase)
+        result, shared = self._flight.do(
+            key,
+            lambda: self._generate_upstream(prompt, schema, phase, run_id, ticker, model, cache_prefix_len, attempt),
+        )
+        if shared:
+            self._count(run_id, "llm_singleflight_dedup")
+            log.info("llm_singleflight_dedup", phase=phase, run_id=run_id, key=key[:12])
+        return result
+
+_router: Optional[LLMRouter] = None
+_router_lock = threading.Lock()
+
 
 def get_router() -> LLMRouter:
-    return router
+    """Process-wide router, built on first use (provider clients and pools are not an import cost)."""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = LLMRouter()
+        return _router
+
+
+def __getattr__(name: str):
+    if name == "router":  # backwards compatible `from nuclear.llm.router import router`
+        return get_router()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def pop_run_metrics(run_id: Optional[str]) -> Dict[str, int]:
+    """Counters of a finished run from the process router; {} if it was never built."""
+    router = _router
+    return router.pop_run_metrics(run_id) if router is not None and run_id else {}
@@ -0,0 +1,108 @@
+"""
+SSOT §2.7 phase -> model routing table.
+
+Declarative defaults below; override per deployment with a JSON file
+(NUCLEAR_LLM_ROUTES_FILE) of the form {"P0.7": {"model": "...", "timeout_sec": 300}, ...}.
+Unlisted phases use DEFAULT_ROUTE.
+"""
+import json
+import os
+import threading
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+from typing import Dict, Optional
+
+import structlog
+
+log = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    model: str
+    provider: Optional[str] = None  # OpenRouter provider pinned first, None = OpenRouter default
+    max_tokens: int = 4096
+    temperature: float = 0.2
+    timeout_sec: float = 120.0
+    concurrency: int = 4  # worker pool size for this model
+    context_tokens: int = 128_000  # model context window (prompt budget = context - max_tokens)
+
+
+OPUS = "anthropic/claude-opus-4.5"
+O3 = "openai/o3"
+HERMES_4 = "nousresearch/hermes-4-405b"
+DEEPSEEK = "deepseek/deepseek-r1"
+GEMINI_FLASH = "google/gemini-2.5-flash"
+
+DEFAULT_ROUTE = ModelRoute(model=DEEPSEEK, max_tokens=4096, timeout_sec=120, concurrency=4)
+
+DEFAULT_ROUTES: Dict[str, ModelRoute] = {
+    "P0": ModelRoute(OPUS, max_tokens=8192, timeout_sec=180, concurrency=2, context_tokens=200_000),
+    "P0.5": ModelRoute(HERMES_4, max_tokens=8192, timeout_sec=180, concurrency=4),
+    "P0.7": ModelRoute(O3, max_tokens=8192, temperature=1.0, timeout_sec=300, concurrency=2, context_tokens=200_000),
+    "P1-1": ModelRoute(DEEPSEEK, max_tokens=8192, timeout_sec=180, concurrency=4),
+    "P1-1.5": ModelRoute(
+        GEMINI_FLASH, max_tokens=4096, temperature=0.0, timeout_sec=60, concurrency=16, context_tokens=1_000_000
+    ),
+    "P1-2": ModelRoute(HERMES_4, max_tokens=4096, timeout_sec=120, concurrency=4),
+    "P2-1": ModelRoute(HERMES_4, max_tokens=4096, timeout_sec=120, concurrency=4),
+    "P2-2": ModelRoute(HERMES_4, max_tokens=6144, timeout_sec=180, concurrency=4),
+    "P2.5": ModelRoute(HERMES_4, max_tokens=6144, timeout_sec=180, concurrency=4),
+    "P3": ModelRoute(HERMES_4, max_tokens=8192, timeout_sec=180, concurrency=4),
+    "P3-Delta": ModelRoute(HERMES_4, max_tokens=4096, timeout_sec=120, concurrency=4),
+}
+
+
+class RoutingTable:
+    def __init__(self, routes: Optional[Dict[str, ModelRoute]] = None, default: ModelRoute = DEFAULT_ROUTE):
+        self.routes: Dict[str, ModelRoute] = dict(routes if routes is not None else DEFAULT_ROUTES)
+        self.default = default
+
+    @classmethod
+    def from_env(cls) -> "RoutingTable":
+        table = cls()
+        path = os.environ.get("NUCLEAR_LLM_ROUTES_FILE")
+        if path:
+            table.apply_overrides(json.loads(Path(path).read_text(encoding="utf-8")))
+        default_model = os.environ.get("DEFAULT_ANALYST_MODEL")
+        if default_model:
+            table.default = replace(table.default, model=default_model)
+        return table
+
+    def apply_overrides(self, overrides: Dict[str, Dict]) -> None:
+        known = {f.name for f in fields(ModelRoute)}
+        for phase, spec in overrides.items():
+            unknown = set(spec) - known
+            if unknown:
+                raise ValueError(f"Unknown route fields for {phase}: {sorted(unknown)}")
+            base = self.routes.get(phase)
+            if base is None:
+                base = replace(self.default, **spec) if "model" not in spec else ModelRoute(**spec)
+            else:
+                base = replace(base, **spec)
+            self.routes[phase] = base
+        log.info("llm_routes_overridden", phases=sorted(overrides))
+
+    def route_for(self, phase: Optional[str], model: Optional[str] = None) -> ModelRoute:
+        """Route for a phase; `model` swaps the model (e.g. dual-analyst legs) keeping phase limits."""
+        route = self.routes.get(phase or "", self.default)
+        if model and model != route.model:
+            known = next((r for r in self.routes.values() if r.model == model), None)
+            route = replace(route, model=model, concurrency=known.concurrency if known else route.concurrency)
+        return route
+
+    def concurrency_for_model(self, model: str, fallback: int) -> int:
+        sizes = [r.concurrency for r in list(self.routes.values()) + [self.default] if r.model == model]
+        return max(sizes) if sizes else fallback
+
+
+_table: Optional[RoutingTable] = None
+_table_lock = threading.Lock()
+
+
+def get_routing_table() -> RoutingTable:
+    global _table
+    with _table_lock:
+        if _table is None:
+            _table = RoutingTable.from_env()
+        return _table
@@ -0,0 +1,77 @@
+"""
+Singleflight coalescing for LLM calls.
+Concurrent callers with the same key share one upstream call; the leader executes,
+followers block until it finishes and receive a copy of the same result (or error).
+Complements caching: only same-moment duplicates are merged, nothing is retained.
+"""
+import copy
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def prompt_fingerprint(prompt: str, schema: Optional[Dict[str, Any]] = None, phase: Optional[str] = None) -> str:
+    """Stable key for (phase, prompt, schema)."""
+    canonical = json.dumps(
+        {"phase": phase or "", "prompt": prompt, "schema": schema or {}},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "followers")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """Thread-safe singleflight group."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run fn once per in-flight key. Returns (result, shared) where shared=True
+        for followers that reused the leader's call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.followers += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result), True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+                shared = call.followers > 0
+            call.done.set()
+        # Followers copy from call.result; hand the leader its own copy so it may mutate freely.
+        return (copy.deepcopy(call.result) if shared else call.result), False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,206 @@
+"""
+Structured output helpers: tolerant JSON extraction/repair + field-scoped repair retries.
+
+LLM text -> strip <think>/code fences/prose -> single-pass scan that drops trailing commas
+and closes truncated tails -> pydantic validation against the phase schema. When only some
+fields are invalid, the repair call asks for those fields alone and merges them back.
+"""
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import structlog
+from pydantic import BaseModel, ValidationError
+
+log = structlog.get_logger()
+
+DEFAULT_MAX_REPAIR_ROUNDS = 2
+
+_THINK_RE = re.compile(r"<think>.*?(?:</think>|$)", re.DOTALL)
+_FENCE_RE = re.compile(r"```[a-zA-Z]*[ \t]*\n?(.*?)(?:```|$)", re.DOTALL)
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class JSONRepairError(ValueError):
+    pass
+
+
+def _strip_wrappers(text: str) -> str:
+    text = _THINK_RE.sub("", text or "")
+    fence = _FENCE_RE.search(text)
+    if fence and any(c in fence.group(1) for c in "{["):
+        text = fence.group(1)
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if not starts:
+        raise JSONRepairError("no JSON object or array in response")
+    return text[min(starts):]
+
+
+def repair_json(text: str) -> str:
+    """
+    Return a best-effort valid JSON string for the first object/array in `text`.
+    Handles code fences, leading/trailing prose, trailing commas and truncated tails.
+    """
+    s = _strip_wrappers(text)
+    out: List[str] = []
+    stack: List[str] = []
+    cuts: List[Tuple[int, str]] = []  # (output length, closers) where truncation is safe
+    in_str = escaped = False
+
+    for ch in s:
+        if in_str:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_str = False
+            continue
+        if ch == '"':
+            in_str = True
+        elif ch in _CLOSERS:
+            stack.append(_CLOSERS[ch])
+            out.append(ch)
+            cuts.append((len(out), "".join(reversed(stack))))
+            continue
+        elif ch in "}]":
+            j = len(out) - 1
+            while j >= 0 and out[j].isspace():
+                j -= 1
+            if j >= 0 and out[j] == ",":
+                del out[j]
+            if stack:
+                stack.pop()
+            out.append(ch)
+            if not stack:
+                return "".join(out)
+            continue
+        elif ch == ",":
+            cuts.append((len(out), "".join(reversed(stack))))
+        out.append(ch)
+
+    # Truncated: close the open string/containers, else back off to the last safe cut.
+    closers = "".join(reversed(stack))
+    candidates = ["".join(out) + ('"' if in_str else "") + closers]
+    candidates += ["".join(out[:pos]) + tail for pos, tail in reversed(cuts)]
+    for candidate in candidates:
+        try:
+            json.loads(candidate)
+            return candidate
+        except ValueError:
+            continue
+    raise JSONRepairError("unrepairable JSON")
+
+
+def extract_json(text: str) -> Tuple[Any, bool]:
+    """Parse LLM text as JSON. Returns (data, repaired)."""
+    try:
+        return json.loads(text), False
+    except (TypeError, ValueError):
+        pass
+    return json.loads(repair_json(text)), True
+
+
+def invalid_fields(data: Any, model: Type[BaseModel]) -> Tuple[Optional[BaseModel], List[str]]:
+    """Validate `data` against `model`. Returns (instance, []) or (None, top-level failing fields)."""
+    if not isinstance(data, dict):
+        return None, list(model.model_fields.keys())
+    try:
+        return model.model_validate(data), []
+    except ValidationError as e:
+        failing = []
+        for err in e.errors():
+            name = str(err["loc"][0]) if err.get("loc") else None
+            if name and name not in failing:
+                failing.append(name)
+        return None, failing or list(model.model_fields.keys())
+
+
+def field_subschema(model: Type[BaseModel], fields: List[str]) -> Dict[str, Any]:
+    """JSON schema restricted to `fields` (keeps $defs so nested refs resolve)."""
+    full = model.model_json_schema()
+    props = full.get("properties", {})
+    sub: Dict[str, Any] = {
+        "title": f"{full.get('title', 'Response')}Repair",
+        "type": "object",
+        "properties": {f: props[f] for f in fields if f in props},
+        "required": [f for f in fields if f in props],
+    }
+    if "$defs" in full:
+        sub["$defs"] = full["$defs"]
+    return sub
+
+
+def build_field_repair_prompt(prompt: str, fields: List[str], model: Type[BaseModel]) -> str:
+    return (
+        f"{prompt}\n\n---\n"
+        f"Your previous JSON answer had missing or invalid values for: {', '.join(fields)}.\n"
+        f"Return ONLY a JSON object with exactly these keys, matching this JSON schema:\n"
+        f"{json.dumps(field_subschema(model, fields), ensure_ascii=False, separators=(',', ':'))}"
+    )
+
+
+@dataclass
+class StructuredResult:
+    data: Dict[str, Any]
+    instance: Optional[BaseModel]
+    repaired: bool = False
+    repair_rounds: int = 0
+    failing_fields: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.instance is not None
+
+
+def parse_structured(
+    text: str,
+    model: Type[BaseModel],
+    repair_call: Optional[Callable[[str, Dict[str, Any]], str]] = None,
+    prompt: str = "",
+    max_rounds: int = DEFAULT_MAX_REPAIR_ROUNDS,
+) -> StructuredResult:
+    """
+    Parse + validate `text`. If `repair_call(prompt, schema) -> text` is given, failing
+    fields are re-requested (only those fields) up to `max_rounds` times and merged.
+    """
+    try:
+        data, repaired = extract_json(text)
+    except (JSONRepairError, ValueError) as e:
+        log.warning("structured_parse_failed", model=model.__name__, error=str(e))
+        data, repaired = {}, True
+    if not isinstance(data, dict):
+        data = {}
+
+    instance, failing = invalid_fields(data, model)
+    rounds = 0
+    while failing and repair_call is not None and rounds < max_rounds:
+        rounds += 1
+        log.info("structured_field_repair", model=model.__name__, fields=failing, round=rounds)
+        try:
+            patch, _ = extract_json(
+                repair_call(build_field_repair_prompt(prompt, failing, model), field_subschema(model, failing))
+            )
+        except Exception as e:
+            log.warning("structured_field_repair_failed", model=model.__name__, error=str(e))
+            continue
+        if isinstance(patch, dict):
+            data.update({k: v for k, v in patch.items() if k in failing})
+        instance, failing = invalid_fields(data, model)
+
+    return StructuredResult(
+        data=data, instance=instance, repaired=repaired or rounds > 0, repair_rounds=rounds, failing_fields=failing
+    )
+
+
+def generate_structured(
+    call: Callable[[str, Dict[str, Any]], str],
+    prompt: str,
+    model: Type[BaseModel],
+    max_rounds: int = DEFAULT_MAX_REPAIR_ROUNDS,
+) -> StructuredResult:
+    """One schema-constrained call + field-scoped repairs. `call(prompt, schema) -> text`."""
+    text = call(prompt, model.model_json_schema())
+    return parse_structured(text, model, repair_call=call, prompt=prompt, max_rounds=max_rounds)
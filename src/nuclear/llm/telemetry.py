@@ -0,0 +1,215 @@
+"""
+LLM call telemetry: one llm_calls row per upstream router call.
+
+Rows (phase, model, provider, tokens, TTFT, latency, prefix-cache hit, retries, outcome)
+are queued on the caller's thread and written in batches by a background writer, so the
+request path never waits on SQLite. Parse outcome is attached later via record_parse()
+using the call id the router puts in result["metadata"]["llm_call_id"].
+`nuclear llm stats` summarises the table (stats_by_phase_model).
+The writer is flushed at interpreter exit, so short-lived processes keep their last batch.
+"""
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import structlog
+
+log = structlog.get_logger()
+
+DEFAULT_BATCH_SIZE = 200
+
+
+def telemetry_enabled() -> bool:
+    return os.environ.get("NUCLEAR_LLM_TELEMETRY", "1") != "0"
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile; None for no samples."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+@dataclass
+class LLMCallRecord:
+    phase: Optional[str]
+    model: Optional[str]
+    provider: Optional[str]
+    latency_ms: float
+    status: str = "ok"  # ok | error
+    run_id: Optional[str] = None
+    ticker: Optional[str] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    cached_tokens: Optional[int] = None
+    ttft_ms: Optional[float] = None  # streaming: first content delta; otherwise the full response time
+    cache_hit: Optional[bool] = None
+    retry_count: int = 0  # M0 retries before this call + provider failovers within it
+    error: Optional[str] = None
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+
+class TelemetryWriter:
+    """Single background writer; records and parse updates are applied in submission order."""
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._tables_ready = False
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="llm-telemetry", daemon=True)
+                self._thread.start()
+
+    def record(self, rec: LLMCallRecord) -> None:
+        self._ensure_thread()
+        self._queue.put(("insert", asdict(rec)))
+
+    def record_parse(self, call_id: str, ok: bool) -> None:
+        self._ensure_thread()
+        self._queue.put(("parse", (call_id, ok)))
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until everything queued so far is written (tests / CLI / run end)."""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        done.wait(timeout)
+
+    def _run(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(items)
+            except Exception as e:
+                log.error("llm_telemetry_write_failed", error=str(e), items=len(items))
+            for kind, payload in items:
+                if kind == "flush":
+                    payload.set()
+
+    def _write(self, items: List) -> None:
+        from nuclear.db.repos import LlmCallRepo
+
+        inserts = [p for k, p in items if k == "insert"]
+        parses = [p for k, p in items if k == "parse"]
+        if not inserts and not parses:
+            return
+        for attempt in (1, 2):
+            if not self._tables_ready:
+                from nuclear.db.schema import create_tables
+
+                create_tables()
+                self._tables_ready = True
+            try:
+                if inserts:
+                    LlmCallRepo.insert_many(inserts)
+                for call_id, ok in parses:
+                    LlmCallRepo.update_parse(call_id, ok)
+                return
+            except sqlite3.OperationalError:
+                if attempt == 2:
+                    raise
+                self._tables_ready = False  # DB file replaced underneath us: recreate once
+
+
+_writer: Optional[TelemetryWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_telemetry_writer() -> TelemetryWriter:
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = TelemetryWriter()
+            atexit.register(_writer.flush, 5)
+        return _writer
+
+
+def record_call(rec: LLMCallRecord) -> None:
+    if telemetry_enabled():
+        get_telemetry_writer().record(rec)
+
+
+def record_parse(call_id: Optional[str], ok: bool) -> None:
+    """Attach the phase's parse/validation outcome to a recorded call."""
+    if call_id and telemetry_enabled():
+        get_telemetry_writer().record_parse(call_id, ok)
+
+
+def flush_telemetry(timeout: Optional[float] = None) -> None:
+    if _writer is not None:
+        _writer.flush(timeout)
+
+
+def parse_window(window: str) -> timedelta:
+    """'90m' / '24h' / '7d' -> timedelta."""
+    units = {"m": "minutes", "h": "hours", "d": "days"}
+    window = window.strip().lower()
+    if not window or window[-1] not in units:
+        raise ValueError(f"window must look like 30m, 24h or 7d: {window!r}")
+    return timedelta(**{units[window[-1]]: float(window[:-1])})
+
+
+def _summary(values: Sequence[float]) -> Dict[str, Optional[float]]:
+    def r(v):
+        return round(v, 1) if v is not None else None
+
+    return {"p50": r(percentile(values, 50)), "p95": r(percentile(values, 95)), "p99": r(percentile(values, 99))}
+
+
+def stats_by_phase_model(
+    since: datetime,
+    phase: Optional[str] = None,
+    model: Optional[str] = None,
+    run_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Per (phase, model): call counts, latency / TTFT percentiles, tokens, cache hits, retries, parse rate."""
+    from nuclear.db.repos import LlmCallRepo
+
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for row in LlmCallRepo.list_since(since.isoformat(), phase=phase, model=model, run_id=run_id):
+        groups.setdefault((row["phase"] or "", row["model"] or ""), []).append(row)
+
+    out = []
+    for (ph, mdl), rows in sorted(groups.items()):
+        ok = [r for r in rows if r["status"] == "ok"]
+        parsed = [r["parse_ok"] for r in rows if r["parse_ok"] is not None]
+        cache_known = [r["cache_hit"] for r in ok if r["cache_hit"] is not None]
+        out.append({
+            "phase": ph,
+            "model": mdl,
+            "calls": len(rows),
+            "errors": len(rows) - len(ok),
+            "latency_ms": _summary([r["latency_ms"] for r in ok]),
+            "ttft_ms": _summary([r["ttft_ms"] for r in ok if r["ttft_ms"] is not None]),
+            "prompt_tokens_avg": _avg([r["prompt_tokens"] for r in ok]),
+            "completion_tokens_avg": _avg([r["completion_tokens"] for r in ok]),
+            "cache_hit_rate": round(sum(cache_known) / len(cache_known), 3) if cache_known else None,
+            "retries": sum(r["retry_count"] or 0 for r in rows),
+            "parse_ok_rate": round(sum(parsed) / len(parsed), 3) if parsed else None,
+        })
+    return out
+
+
+def _avg(values: Sequence[Optional[float]]) -> Optional[float]:
+    known = [v for v in values if v is not None]
+    return round(sum(known) / len(known), 1) if known else None
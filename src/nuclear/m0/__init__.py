@@ -0,0 +1 @@
+"""M0 LLM job engine."""
@@ -0,0 +1,547 @@
+"""
+M0 LLM job engine - all P0-P3 AI calls go through here.
+
+- Priority queue across phases (upstream phases first; see PHASE_PRIORITY).
+- Phase -> model from the §2.7 routing table (nuclear.llm.routing).
+- One bounded worker pool per model (route concurrency; NUCLEAR_M0_MODEL_CONCURRENCY
+  for models not in the table), so a slow reasoning model cannot starve cheap calls.
+  Queue depth, queue wait and latency are reported per model (model_stats / report).
+- Idempotent job IDs (request hash): in-flight duplicates share a Future,
+  completed jobs are answered from a bounded in-memory result cache.
+- Retries with exponential backoff + full jitter.
+- submit_with_audit: Analyst -> Scout -> Deep Auditor (§2.6). Independent legs
+  (dual analysts and their scouts) run concurrently. With an agreement scorer, dual
+  analysts that agree skip the audit escalation (early exit) and are merged.
+  The Deep Auditor's verdict decides the final conclusion (see _apply_verdict).
+"""
+import heapq
+import itertools
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+from nuclear.llm.hedging import LatencyTracker
+from nuclear.llm.routing import RoutingTable, get_routing_table
+from nuclear.m0.job import (
+    ROLE_DEEP_AUDITOR,
+    ROLE_SCOUT,
+    M0AuditResult,
+    M0Request,
+    M0Result,
+)
+from nuclear.utils import tracing
+
+log = structlog.get_logger()
+
+DEFAULT_MODEL_KEY = "default"
+DEFAULT_MODEL_CONCURRENCY = 4
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BASE_MS = 500
+DEFAULT_RETRY_MAX_MS = 8000
+DEFAULT_RESULT_CACHE_SIZE = 2048
+DEFAULT_PRIORITY = 50
+DEFAULT_AGREEMENT_THRESHOLD = 0.8
+DEFAULT_AUDIT_WORKERS = 8
+
+VERDICT_UPHOLD = "uphold"
+VERDICT_REVISE = "revise"
+VERDICT_MERGE = "merge"
+
+# Lower runs first: upstream phases unblock everything downstream.
+PHASE_PRIORITY = {
+    "P0": 0, "P0.5": 1, "P0.7": 2,
+    "P1-1": 10, "P1-1.5": 11, "P1-2": 12,
+    "P2-1": 20, "P2-2": 21, "P2.5": 25,
+    "P3": 30, "P3-Delta": 31,
+    "D-3": 5, "WB-1": 40, "WB-2": 41, "W-A": 42,
+}
+
+# §2.6 dual-analyst phases (second leg only when NUCLEAR_M0_DUAL_ANALYST_MODELS is set)
+DUAL_ANALYST_PHASES = {"P1-1"}
+
+
+class M0JobError(RuntimeError):
+    pass
+
+
+LLMCall = Callable[[M0Request, str], Dict[str, Any]]
+AgreementFn = Callable[[List[str]], float]  # analyst texts -> agreement in [0, 1]
+MergeFn = Callable[[List[str]], str]  # analyst texts -> fused phase answer
+
+
+def _router_call(request: M0Request, model: str, router: Any = None) -> Dict[str, Any]:
+    """Default LLMCall: the shared router (or `router`, e.g. one pointed at a local stand-in)."""
+    if router is None:
+        from nuclear.llm.router import get_router
+
+        router = get_router()
+    return router.generate(
+        request.prompt,
+        request.response_schema,
+        phase=request.phase,
+        run_id=request.run_id,
+        ticker=request.ticker,
+        model=model,
+        cache_prefix_len=len(request.system_prompt) or None,  # system prompt = static per-phase prefix
+        attempt=request.attempt,
+    )
+
+
+class _Job:
+    __slots__ = ("request", "model", "future", "enqueued_at", "trace_ctx")
+
+    def __init__(self, request: M0Request, model: str):
+        self.request = request
+        self.model = model
+        self.future: Future = Future()
+        self.enqueued_at = time.monotonic()
+        self.trace_ctx = tracing.capture()  # the submitter's span: the LLM call nests under it
+
+
+class _ModelPool:
+    """Priority queue + fixed worker threads for one model."""
+
+    def __init__(self, model: str, concurrency: int, execute: Callable[[_Job], None]):
+        self.model = model
+        self.concurrency = concurrency
+        self._execute = execute
+        self._heap: List[Tuple[int, int, _Job]] = []
+        self._cv = threading.Condition()
+        self._seq = itertools.count()
+        self._workers: List[threading.Thread] = []
+        self._stopped = False
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.latency = LatencyTracker(window=500, min_samples=1)
+        self.queue_wait = LatencyTracker(window=500, min_samples=1)
+
+    def put(self, priority: int, job: _Job) -> None:
+        with self._cv:
+            heapq.heappush(self._heap, (priority, next(self._seq), job))
+            if len(self._workers) < self.concurrency:
+                t = threading.Thread(
+                    target=self._run, name=f"m0-{self.model}-{len(self._workers)}", daemon=True
+                )
+                self._workers.append(t)
+                t.start()
+            self._cv.notify()
+
+    def depth(self) -> int:
+        with self._cv:
+            return len(self._heap)
+
+    def stop(self) -> None:
+        with self._cv:
+            self._stopped = True
+            self._cv.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cv:
+                while not self._heap and not self._stopped:
+                    self._cv.wait()
+                if self._stopped and not self._heap:
+                    return
+                _, _, job = heapq.heappop(self._heap)
+                self.in_flight += 1
+            started = time.monotonic()
+            self.queue_wait.record(started - job.enqueued_at)
+            try:
+                with tracing.attached(job.trace_ctx):
+                    self._execute(job)
+            finally:
+                with self._cv:
+                    self.in_flight -= 1
+                    if job.future.done() and job.future.exception() is None:
+                        self.completed += 1
+                    else:
+                        self.failed += 1
+                self.latency.record(time.monotonic() - started)
+
+    def stats(self) -> Dict[str, Any]:
+        def ms(v: Optional[float]) -> Optional[float]:
+            return round(v * 1000, 1) if v is not None else None
+
+        with self._cv:
+            depth, in_flight, completed, failed = len(self._heap), self.in_flight, self.completed, self.failed
+        return {
+            "concurrency": self.concurrency,
+            "queue_depth": depth,
+            "in_flight": in_flight,
+            "completed": completed,
+            "failed": failed,
+            "latency_p50_ms": ms(self.latency.percentile(50)),
+            "latency_p95_ms": ms(self.latency.p95()),
+            "queue_wait_p95_ms": ms(self.queue_wait.p95()),
+        }
+
+
+class M0Engine:
+    def __init__(
+        self,
+        llm_call: Optional[LLMCall] = None,
+        model_concurrency: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        routing: Optional[RoutingTable] = None,
+    ):
+        self._llm_call = llm_call or _router_call
+        self.routing = routing or get_routing_table()
+        self._concurrency_override = model_concurrency
+        self.model_concurrency = model_concurrency or int(
+            os.environ.get("NUCLEAR_M0_MODEL_CONCURRENCY", DEFAULT_MODEL_CONCURRENCY)
+        )
+        self.max_attempts = max_attempts or int(os.environ.get("NUCLEAR_M0_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS))
+        self.retry_base_ms = int(os.environ.get("NUCLEAR_M0_RETRY_BASE_MS", DEFAULT_RETRY_BASE_MS))
+        self.retry_max_ms = int(os.environ.get("NUCLEAR_M0_RETRY_MAX_MS", DEFAULT_RETRY_MAX_MS))
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._pools: Dict[str, _ModelPool] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._results: "OrderedDict[str, M0Result]" = OrderedDict()
+        self._result_cache_size = int(os.environ.get("NUCLEAR_M0_RESULT_CACHE", DEFAULT_RESULT_CACHE_SIZE))
+        self._audit_executor: Optional[ThreadPoolExecutor] = None
+
+    # ---- model selection -------------------------------------------------
+
+    def default_model(self, phase: str) -> str:
+        return self.routing.route_for(phase).model or DEFAULT_MODEL_KEY
+
+    def _role_model(self, role: str, phase: str) -> str:
+        env = {ROLE_SCOUT: "NUCLEAR_M0_SCOUT_MODEL", ROLE_DEEP_AUDITOR: "NUCLEAR_M0_AUDITOR_MODEL"}.get(role)
+        return (env and os.environ.get(env)) or self.default_model(phase)
+
+    def _analyst_models(self, request: M0Request) -> List[str]:
+        if request.model:
+            return [request.model]
+        dual = [m.strip() for m in os.environ.get("NUCLEAR_M0_DUAL_ANALYST_MODELS", "").split(",") if m.strip()]
+        if request.phase in DUAL_ANALYST_PHASES and len(dual) >= 2:
+            return dual[:2]
+        return [self.default_model(request.phase)]
+
+    # ---- queueing ---------------------------------------------------------
+
+    def _pool(self, model: str) -> _ModelPool:
+        with self._lock:
+            pool = self._pools.get(model)
+            if pool is None:
+                size = self._concurrency_override or self.routing.concurrency_for_model(
+                    model, self.model_concurrency
+                )
+                pool = _ModelPool(model, size, self._execute)
+                self._pools[model] = pool
+            return pool
+
+    def submit_async(self, request: M0Request) -> Future:
+        """Enqueue a job; duplicates (same job_id) share the in-flight Future or cached result."""
+        model = request.model or self.default_model(request.phase)
+        request = request.model_copy(update={"model": model})
+        job_id = request.job_id
+        with self._lock:
+            cached = self._results.get(job_id)
+            if cached is not None:
+                self._results.move_to_end(job_id)
+                fut: Future = Future()
+                fut.set_result(cached)
+                return fut
+            existing = self._inflight.get(job_id)
+            if existing is not None:
+                return existing
+            job = _Job(request, model)
+            self._inflight[job_id] = job.future
+
+        priority = request.priority if request.priority is not None else PHASE_PRIORITY.get(request.phase, DEFAULT_PRIORITY)
+        self._pool(model).put(priority, job)
+        return job.future
+
+    def submit(self, request: M0Request, timeout: Optional[float] = None) -> M0Result:
+        return self.submit_async(request).result(timeout=timeout)
+
+    def queue_depth(self) -> Dict[str, int]:
+        with self._lock:
+            pools = list(self._pools.values())
+        return {p.model: p.depth() for p in pools}
+
+    def model_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-model pool stats: queue depth, in-flight, counts, latency / queue-wait percentiles."""
+        with self._lock:
+            pools = list(self._pools.values())
+        return {p.model: p.stats() for p in pools}
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        stats = self.model_stats()
+        for model, s in stats.items():
+            log.info("m0_model_stats", model=model, **s)
+        return stats
+
+    def _backoff_sec(self, attempt: int) -> float:
+        cap = min(self.retry_max_ms, self.retry_base_ms * (2 ** (attempt - 1)))
+        return random.uniform(0, cap) / 1000.0
+
+    def _execute(self, job: _Job) -> None:
+        req = job.request
+        job_id = req.job_id
+        max_attempts = req.max_attempts or self.max_attempts
+        last_error: Optional[BaseException] = None
+        for attempt in range(1, max_attempts + 1):
+            started = time.perf_counter()
+            try:
+                res = self._llm_call(req if attempt == 1 else req.model_copy(update={"attempt": attempt}), job.model)
+                text = str(res.get("text") or "")
+                if not text.strip():
+                    raise M0JobError("empty response")
+                result = M0Result(
+                    job_id=job_id,
+                    phase=req.phase,
+                    role=req.role,
+                    model=job.model,
+                    text=text,
+                    reasoning=res.get("reasoning"),
+                    attempts=attempt,
+                    latency_ms=(time.perf_counter() - started) * 1000,
+                    metadata=res.get("metadata") or {},
+                )
+                self._finish(job, result=result)
+                return
+            except Exception as e:
+                last_error = e
+                if attempt < max_attempts:
+                    wait = self._backoff_sec(attempt)
+                    log.warning("m0_job_retry", job_id=job_id, phase=req.phase, model=job.model,
+                                attempt=attempt, wait_sec=round(wait, 3), error=str(e))
+                    self._sleep(wait)
+        log.error("m0_job_failed", job_id=job_id, phase=req.phase, model=job.model, error=str(last_error))
+        self._finish(job, error=M0JobError(f"{job_id} failed after {max_attempts} attempts: {last_error}"))
+
+    def _finish(self, job: _Job, result: Optional[M0Result] = None, error: Optional[BaseException] = None) -> None:
+        job_id = job.request.job_id
+        with self._lock:
+            self._inflight.pop(job_id, None)
+            if result is not None:
+                self._results[job_id] = result
+                while len(self._results) > self._result_cache_size:
+                    self._results.popitem(last=False)
+        if error is not None:
+            job.future.set_exception(error)
+        else:
+            job.future.set_result(result)
+
+    # ---- §2.6 audit flow --------------------------------------------------
+
+    def _get_audit_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._audit_executor is None:
+                workers = int(os.environ.get("NUCLEAR_M0_AUDIT_WORKERS", DEFAULT_AUDIT_WORKERS))
+                self._audit_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="m0-audit")
+            return self._audit_executor
+
+    @staticmethod
+    def _as_payload(text: str) -> Dict[str, Any]:
+        from nuclear.llm.structured import extract_json
+
+        try:
+            data, _ = extract_json(text)
+            return data if isinstance(data, dict) else {"output": data}
+        except Exception:
+            return {"analyst_text": text}
+
+    def _try(self, request: M0Request) -> Optional[M0Result]:
+        try:
+            return self.submit(request)
+        except Exception as e:
+            log.warning("m0_audit_step_failed", phase=request.phase, role=request.role, error=str(e))
+            return None
+
+    def _scout(self, request: M0Request, analyst: M0Result) -> Optional[M0Result]:
+        from nuclear.prompts.audit import AuditPromptBuilder
+
+        scout_prompts = AuditPromptBuilder.build_scout_prompt(self._as_payload(analyst.text), phase=request.phase)
+        return self._try(request.model_copy(update={
+            "role": ROLE_SCOUT,
+            "model": self._role_model(ROLE_SCOUT, request.phase),
+            "system_prompt": scout_prompts["system"],
+            "user_prompt": scout_prompts["user"],
+            "response_schema": None,
+        }))
+
+    def _analyst_leg(self, request: M0Request) -> Tuple[M0Result, Optional[M0Result], float]:
+        started = time.perf_counter()
+        analyst = self.submit(request)
+        leg_ms = (time.perf_counter() - started) * 1000.0
+        return analyst, self._scout(request, analyst), leg_ms
+
+    def _timed_analyst(self, request: M0Request) -> Tuple[M0Result, float]:
+        started = time.perf_counter()
+        analyst = self.submit(request)
+        return analyst, (time.perf_counter() - started) * 1000.0
+
+    @staticmethod
+    def _verdict_options(analysts: List[M0Result], can_merge: bool) -> List[str]:
+        if len(analysts) == 1:
+            return [VERDICT_UPHOLD, VERDICT_REVISE]
+        return [a.model for a in analysts] + ([VERDICT_MERGE] if can_merge else [])
+
+    def _deep_audit(
+        self, request: M0Request, analysts: List[M0Result], scouts: List[Optional[M0Result]], can_merge: bool = False
+    ) -> Optional[M0Result]:
+        from nuclear.prompts.audit import AuditPromptBuilder
+
+        if len(analysts) == 1:
+            analyst_payload = self._as_payload(analysts[0].text)
+            scout_payload = self._as_payload(scouts[0].text) if scouts[0] else {}
+        else:
+            analyst_payload = {a.model: self._as_payload(a.text) for a in analysts}
+            scout_payload = {a.model: (self._as_payload(s.text) if s else {}) for a, s in zip(analysts, scouts)}
+        audit_prompts = AuditPromptBuilder.build_deep_auditor_prompt(
+            analyst_payload, scout_payload, phase=request.phase,
+            verdict_options=self._verdict_options(analysts, can_merge),
+        )
+        return self._try(request.model_copy(update={
+            "role": ROLE_DEEP_AUDITOR,
+            "model": self._role_model(ROLE_DEEP_AUDITOR, request.phase),
+            "system_prompt": audit_prompts["system"],
+            "user_prompt": audit_prompts["user"],
+            "response_schema": None,
+        }))
+
+    def _apply_verdict(
+        self, request: M0Request, analysts: List[M0Result], deep: Optional[M0Result], default: str, can_merge: bool
+    ) -> Tuple[str, Optional[str]]:
+        """
+        (final conclusion, verdict). The auditor adopts one analyst's answer, keeps `default`
+        (uphold / merge), or - single analyst - sends it back for one revision that carries the
+        audit. A missing, unknown or failed verdict keeps `default`.
+        """
+        if deep is None:
+            return default, None
+        verdict = self._as_payload(deep.text).get("verdict")
+        if verdict not in self._verdict_options(analysts, can_merge):
+            log.warning("m0_audit_verdict_unusable", phase=request.phase, job_id=request.job_id, verdict=verdict)
+            return default, None
+        adopted = next((a for a in analysts if a.model == verdict), None)
+        if adopted is not None:
+            return adopted.text, verdict
+        if verdict == VERDICT_REVISE:
+            revised = self._try(request.model_copy(update={
+                "model": analysts[0].model,
+                "user_prompt": f"{request.user_prompt}\n\n[DEEP AUDIT - revise your answer to address it]\n{deep.text}",
+            }))
+            return (revised.text if revised else default), verdict
+        return default, verdict
+
+    def submit_with_audit(
+        self,
+        request: M0Request,
+        agreement: Optional[AgreementFn] = None,
+        merge: Optional[MergeFn] = None,
+        agreement_threshold: Optional[float] = None,
+    ) -> M0AuditResult:
+        """
+        §2.6 Analyst -> Scout -> Deep Auditor.
+        With dual analysts and an `agreement` scorer the fusion path is used instead:
+        both analysts run concurrently; if agreement(texts) >= threshold the audit escalation
+        is skipped, otherwise scouts + Deep Auditor see both outputs. Without escalation the
+        final conclusion is merge(texts) (legs in configured model order, so the merge is
+        deterministic); with it, the auditor's verdict decides (_apply_verdict).
+        """
+        models = self._analyst_models(request)
+        if len(models) >= 2 and agreement is not None:
+            return self._submit_dual(request, models, agreement, merge, agreement_threshold)
+
+        legs = [
+            self._get_audit_executor().submit(tracing.propagate(self._analyst_leg), request.model_copy(update={"model": m}))
+            for m in models
+        ]
+        outcomes = [f.result() for f in legs]
+        analysts = [a for a, _, _ in outcomes]
+        scouts = [s for _, s, _ in outcomes]
+        deep = self._deep_audit(request, analysts, scouts)
+        final, verdict = self._apply_verdict(request, analysts, deep, analysts[0].text, can_merge=False)
+
+        return M0AuditResult(
+            job_id=request.job_id,
+            phase=request.phase,
+            analysts=analysts,
+            scouts=scouts,
+            deep_auditor=deep,
+            final_conclusion=final,
+            verdict=verdict,
+            leg_latency_ms={a.model: round(ms, 1) for a, _, ms in outcomes},
+        )
+
+    def _submit_dual(
+        self,
+        request: M0Request,
+        models: List[str],
+        agreement: AgreementFn,
+        merge: Optional[MergeFn],
+        threshold: Optional[float],
+    ) -> M0AuditResult:
+        if threshold is None:
+            threshold = float(os.environ.get("NUCLEAR_M0_AGREEMENT_THRESHOLD", DEFAULT_AGREEMENT_THRESHOLD))
+        executor = self._get_audit_executor()
+        legs = [executor.submit(tracing.propagate(self._timed_analyst), request.model_copy(update={"model": m})) for m in models]
+        outcomes = []
+        for m, f in zip(models, legs):
+            try:
+                outcomes.append(f.result())
+            except Exception as e:
+                log.warning("m0_analyst_leg_failed", phase=request.phase, model=m, error=str(e))
+        if not outcomes:
+            raise M0JobError(f"{request.job_id}: all analyst legs failed")
+        analysts = [a for a, _ in outcomes]
+        texts = [a.text for a in analysts]
+
+        score = agreement(texts) if len(analysts) >= 2 else 0.0
+        escalated = score < threshold
+        scouts: List[Optional[M0Result]] = []
+        deep = None
+        final, verdict = (merge(texts) if merge else texts[0]), None
+        if escalated:
+            scouts = list(executor.map(lambda a: self._scout(request, a), analysts))
+            deep = self._deep_audit(request, analysts, scouts, can_merge=merge is not None)
+            final, verdict = self._apply_verdict(request, analysts, deep, final, can_merge=merge is not None)
+        leg_latency = {a.model: round(ms, 1) for a, ms in outcomes}
+        log.info("m0_dual_analyst", phase=request.phase, job_id=request.job_id, agreement=round(score, 3),
+                 threshold=threshold, escalated=escalated, verdict=verdict, leg_latency_ms=leg_latency)
+
+        return M0AuditResult(
+            job_id=request.job_id,
+            phase=request.phase,
+            analysts=analysts,
+            scouts=scouts,
+            deep_auditor=deep,
+            final_conclusion=final,
+            verdict=verdict,
+            agreement=score,
+            escalated=escalated,
+            leg_latency_ms=leg_latency,
+        )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            executor = self._audit_executor
+        for p in pools:
+            p.stop()
+        if executor:
+            executor.shutdown(wait=False)
+
+
+_m0: Optional[M0Engine] = None
+_m0_lock = threading.Lock()
+
+
+def get_m0() -> M0Engine:
+    global _m0
+    with _m0_lock:
+        if _m0 is None:
+            _m0 = M0Engine()
+        return _m0
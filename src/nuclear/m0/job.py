@@ -0,0 +1,85 @@
+"""
+M0 job contracts: request, single-call result, audited result (§2.6).
+"""
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+ROLE_ANALYST = "analyst"
+ROLE_SCOUT = "scout"
+ROLE_DEEP_AUDITOR = "deep_auditor"
+
+
+class M0Request(BaseModel):
+    phase: str
+    system_prompt: str
+    user_prompt: str
+    run_id: str = "default"
+    ticker: Optional[str] = None
+    role: str = ROLE_ANALYST
+    model: Optional[str] = None  # None -> engine default for the phase
+    priority: Optional[int] = None  # None -> PHASE_PRIORITY[phase]; lower runs first
+    response_schema: Optional[Dict[str, Any]] = None
+    max_attempts: Optional[int] = None
+    attempt: int = 1  # set by the engine per retry (telemetry); not part of job_id
+
+    @property
+    def job_id(self) -> str:
+        """Idempotent ID: same run/phase/role/model/prompt/schema -> same job."""
+        canonical = json.dumps(
+            {
+                "run_id": self.run_id,
+                "phase": self.phase,
+                "role": self.role,
+                "model": self.model or "",
+                "system": self.system_prompt,
+                "user": self.user_prompt,
+                "schema": self.response_schema or {},
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return "m0_" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+    @property
+    def prompt(self) -> str:
+        if not self.system_prompt:
+            return self.user_prompt
+        return f"{self.system_prompt}\n\n{self.user_prompt}"
+
+
+class M0Result(BaseModel):
+    job_id: str
+    phase: str
+    role: str
+    model: str
+    text: str
+    reasoning: Optional[str] = None
+    attempts: int = 1
+    latency_ms: float = 0.0
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class M0AuditResult(BaseModel):
+    """
+    §2.6 audited result. final_conclusion is the analyst answer in the phase schema (primary
+    analyst, or the deterministic merge of dual analysts), as decided by the Deep Auditor's
+    verdict when the audit ran: adopt one analyst, uphold / merge, or revise (single analyst).
+    escalated=False: dual analysts agreed, audit skipped.
+    """
+    job_id: str
+    phase: str
+    analysts: List[M0Result]
+    scouts: List[Optional[M0Result]] = Field(default_factory=list)
+    deep_auditor: Optional[M0Result] = None
+    final_conclusion: str
+    verdict: Optional[str] = None  # Deep Auditor verdict that was applied; None = default kept
+    agreement: Optional[float] = None  # dual-analyst agreement score, None for single analyst
+    escalated: bool = True
+    leg_latency_ms: Dict[str, float] = Field(default_factory=dict)  # analyst model -> leg wall time
+
+    @property
+    def text(self) -> str:
+        return self.final_conclusion
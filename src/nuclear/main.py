@@ -1,10 +1,13 @@
 """FastAPI application."""
 
 from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel, Field
 
 from nuclear import __version__
+from nuclear.orchestration import jobs
 
 
 @asynccontextmanager
@@ -30,10 +33,35 @@ async def version():
     return {"version": __version__}
 
 
-# Jobs trigger - skeleton
-@app.post("/jobs/{job_type}")
-async def trigger_job(job_type: str):
-    return {"job_type": job_type, "status": "queued"}
+class JobRequest(BaseModel):
+    payload: Dict[str, Any] = Field(default_factory=dict)
+    priority: int = 0
+    max_attempts: Optional[int] = None
+    run_id: Optional[str] = None
+
+
+# Jobs - durable queue, run by `python -m nuclear.worker`
+@app.post("/jobs/{job_type}", status_code=202)
+def trigger_job(job_type: str, request: Optional[JobRequest] = None):
+    request = request or JobRequest()
+    if job_type not in jobs.JOB_HANDLERS:
+        raise HTTPException(status_code=404, detail=f"Unknown job type: {job_type}")
+    job_id = jobs.enqueue_job(job_type, request.payload, priority=request.priority,
+                              max_attempts=request.max_attempts, run_id=request.run_id)
+    return {"job_id": job_id, "job_type": job_type, "status": "queued"}
+
+
+@app.get("/jobs")
+def list_jobs(status: Optional[str] = None, job_type: Optional[str] = None, limit: int = 50):
+    return jobs.list_jobs(status=status, job_type=job_type, limit=limit)
+
+
+@app.get("/jobs/{job_id}")
+def job_status(job_id: str):
+    job = jobs.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
 
 
 # Alerts test - skeleton
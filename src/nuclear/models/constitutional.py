@@ -0,0 +1,13 @@
+"""
+SSOT §1.2 Article 1/2: every phase output ends in future-verifiable fields.
+"""
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+
+class ConstitutionalOutput(BaseModel):
+    future_projection: Dict[str, Any]  # direction + time_window (+ confidence)
+    falsification_checkpoints: List[Dict[str, Any]]  # signal / condition / timeline
+    verification_timeline: Dict[str, Any]  # next_review_date, confidence_decay_rate
+    failure_modes: List[Dict[str, Any]]  # where the call is most likely wrong
@@ -0,0 +1,213 @@
+"""
+Resource arbiter - daily, weekly, W-A, backfill and P6 share one small box.
+
+Each workload declares what it needs from three budgets (env-configurable capacity):
+    cpu       NUCLEAR_BUDGET_CPU_SLOTS      (default: os.cpu_count())
+    llm_tpm   NUCLEAR_BUDGET_LLM_TPM        LLM tokens / minute (default 100000)
+    db_write  NUCLEAR_BUDGET_DB_WRITE_SLOTS SQLite writers (default 1)
+and runs only while it holds a grant (resource_claims, leased + heartbeated, so a crashed
+holder frees its budget after NUCLEAR_ARBITER_LEASE_SEC). Priority decides who goes next:
+p6 > daily > wa > weekly > backfill; within a priority, first come first served.
+
+Preemption is cooperative, at phase boundaries: a waiter that does not fit flags every
+lower-priority holder; a flagged holder calling slot.boundary("<next stage>") releases its
+grant, waits for a new one and continues from that stage. Only claimants that will actually
+wait (timeout None or > 0) flag holders. The P6 daemon does not claim at all: its ticks are
+light and must never wait, so a claim could only make batch work yield for nothing.
+
+    with workload_slot("weekly") as slot:
+        run_wb1()
+        slot.boundary("wb2")
+        run_wb2()
+
+NUCLEAR_ARBITER=0 turns arbitration off (every slot is granted immediately).
+"""
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+import structlog
+
+from nuclear.db.repos import ResourceClaimRepo
+
+log = structlog.get_logger()
+
+DEFAULT_LEASE_SEC = 60
+DEFAULT_POLL_SEC = 2.0
+DEFAULT_LLM_TPM = 100_000
+DEFAULT_DB_WRITE_SLOTS = 1
+
+
+@dataclass(frozen=True)
+class Workload:
+    name: str
+    priority: int
+    cpu: int = 0
+    llm_tpm: int = 0
+    db_write: int = 0
+
+    def demand(self, capacity: Dict[str, int]) -> Dict[str, int]:
+        """Declared demand, clipped to capacity so an oversized workload can still run alone."""
+        return {k: min(getattr(self, k), capacity[k]) for k in ResourceClaimRepo.RESOURCES}
+
+
+WORKLOADS: Dict[str, Workload] = {
+    w.name: w for w in (
+        Workload("p6", priority=100, cpu=1),
+        Workload("daily", priority=50, cpu=2, llm_tpm=20_000, db_write=1),
+        Workload("wa", priority=40, cpu=1, llm_tpm=20_000),
+        Workload("weekly", priority=30, cpu=2, llm_tpm=60_000, db_write=1),
+        Workload("backfill", priority=10, cpu=1, llm_tpm=20_000, db_write=1),
+    )
+}
+
+
+def arbiter_enabled() -> bool:
+    return os.environ.get("NUCLEAR_ARBITER", "1") != "0"
+
+
+def budgets() -> Dict[str, int]:
+    return {
+        "cpu": int(os.environ.get("NUCLEAR_BUDGET_CPU_SLOTS", 0)) or os.cpu_count() or 1,
+        "llm_tpm": int(os.environ.get("NUCLEAR_BUDGET_LLM_TPM", DEFAULT_LLM_TPM)),
+        "db_write": int(os.environ.get("NUCLEAR_BUDGET_DB_WRITE_SLOTS", DEFAULT_DB_WRITE_SLOTS)),
+    }
+
+
+class Slot:
+    """A workload's claim on the budgets; granted once acquire() returns."""
+
+    def __init__(self, workload: str, lease_sec: Optional[float] = None, poll_sec: Optional[float] = None):
+        if workload not in WORKLOADS:
+            raise ValueError(f"Unknown workload: {workload} (known: {sorted(WORKLOADS)})")
+        self.workload = WORKLOADS[workload]
+        self.holder_id = f"{workload}:{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.lease_sec = lease_sec or float(os.environ.get("NUCLEAR_ARBITER_LEASE_SEC", DEFAULT_LEASE_SEC))
+        self.poll_sec = poll_sec if poll_sec is not None else float(
+            os.environ.get("NUCLEAR_ARBITER_POLL_SEC", DEFAULT_POLL_SEC)
+        )
+        self.wait_ms = 0.0
+        self.preemptions: List[str] = []  # stages at which this slot yielded
+        self._granted = False
+        self._preempt = threading.Event()
+        self._stop = threading.Event()
+        self._beat: Optional[threading.Thread] = None
+
+    @property
+    def granted(self) -> bool:
+        return self._granted
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Wait (at most `timeout` seconds; None = forever) for a grant; False and withdrawn on timeout."""
+        capacity = budgets()
+        demand = self.workload.demand(capacity)
+        will_wait = timeout is None or timeout > 0  # a one-shot probe must not make holders yield
+        started = time.perf_counter()
+        logged = False
+        while True:
+            claim = ResourceClaimRepo.request(self.holder_id, self.workload.name, self.workload.priority, demand,
+                                              capacity, self.lease_sec, may_preempt=will_wait)
+            if claim["status"] == "granted":
+                break
+            if not logged:
+                log.info("workload_waiting", workload=self.workload.name, demand=demand, capacity=capacity)
+                logged = True
+            waited = time.perf_counter() - started
+            if timeout is not None and waited >= timeout:
+                ResourceClaimRepo.release(self.holder_id)
+                self.wait_ms += round(waited * 1000, 1)
+                return False
+            time.sleep(self.poll_sec if timeout is None else min(self.poll_sec, max(timeout - waited, 0.0)))
+        self.wait_ms += round((time.perf_counter() - started) * 1000, 1)
+        self._granted = True
+        self._preempt.clear()
+        self._stop.clear()
+        self._beat = threading.Thread(target=self._heartbeat, name=f"arbiter-{self.workload.name}", daemon=True)
+        self._beat.start()
+        log.info("workload_granted", workload=self.workload.name, wait_ms=self.wait_ms)
+        return True
+
+    def _heartbeat(self) -> None:
+        while not self._stop.wait(max(self.lease_sec / 3, 0.05)):
+            claim = ResourceClaimRepo.heartbeat(self.holder_id, self.lease_sec)
+            if claim is not None and claim["preempt"]:
+                self._preempt.set()
+
+    def should_yield(self) -> bool:
+        return self._preempt.is_set()
+
+    def boundary(self, stage: str) -> None:
+        """Phase boundary: if a higher-priority workload asked for the budget, yield it and wait to resume."""
+        if not self._granted or not self.should_yield():
+            return
+        log.info("workload_preempted", workload=self.workload.name, resume_at=stage)
+        self.preemptions.append(stage)
+        self.release()
+        self.acquire()
+
+    def release(self) -> None:
+        if self._beat is not None:
+            self._stop.set()
+            self._beat.join()
+            self._beat = None
+        if self._granted:
+            ResourceClaimRepo.release(self.holder_id)
+            self._granted = False
+
+    def metrics(self) -> Dict[str, object]:
+        return {"wait_ms": self.wait_ms, "preemptions": list(self.preemptions)}
+
+
+class _FreeSlot(Slot):
+    """NUCLEAR_ARBITER=0: granted without touching the DB."""
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        self._granted = True
+        return True
+
+    def boundary(self, stage: str) -> None:
+        return None
+
+    def release(self) -> None:
+        self._granted = False
+
+
+def new_slot(workload: str, **kwargs) -> Slot:
+    if not arbiter_enabled():
+        return _FreeSlot(workload, **kwargs)
+    from nuclear.db.schema import create_tables
+
+    create_tables()
+    return Slot(workload, **kwargs)
+
+
+@contextmanager
+def workload_slot(workload: str, timeout: Optional[float] = None, required: bool = True) -> Iterator[Slot]:
+    """
+    Hold `workload`'s budget for the block. On timeout: TimeoutError if required, else the block
+    runs anyway with an ungranted slot.
+    """
+    slot = new_slot(workload)
+    if not slot.acquire(timeout) and required:
+        raise TimeoutError(f"{workload}: resource budget not granted within {timeout}s")
+    try:
+        yield slot
+    finally:
+        slot.release()
+
+
+def wait_timeout() -> Optional[float]:
+    """NUCLEAR_ARBITER_WAIT_SEC for scheduled runs; 0 = wait forever (systemd's TimeoutStartSec still applies)."""
+    return float(os.environ.get("NUCLEAR_ARBITER_WAIT_SEC", 0)) or None
+
+
+def claims() -> List[Dict[str, object]]:
+    from nuclear.db.schema import create_tables
+
+    create_tables()
+    return ResourceClaimRepo.list_claims()
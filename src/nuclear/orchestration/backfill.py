@@ -0,0 +1,220 @@
+"""
+Backfill - rebuild daily history over a date range.
+
+    nuclear backfill daily --from 2025-01-01 --to 2025-12-31 --workers 8
+
+Daily dates are independent (D-1..D-4 read only their own date) and run concurrently, at most
+NUCLEAR_BACKFILL_WORKERS (--workers) at a time. There is no weekly backfill: WB-1 takes no as-of
+date, the learning gate reads the latest state, and both phases write the live
+outputs/wb1_output.json / wb2_orders.json, so a "historical" week would be today's worldview
+overwriting today's artifacts. Add a weekly kind once they accept an as-of date.
+
+Every date has a deterministic run id, "<prefix>_daily_<YYYY-MM-DD>" (prefix default "backfill"). Re-running the same command resumes: a date whose phase snapshots
+are all indexed and pass their SHA256 check is skipped. Rebuild after a logic change with a new
+--prefix, or --force.
+
+The whole batch holds the arbiter's "backfill" budget (lowest priority). When a higher-priority
+workload asks for it, no new date is started: in-flight dates finish, the budget is yielded and
+the backfill continues once it is granted again.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import date as Date, datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+import structlog
+
+from nuclear.utils import tracing
+
+log = structlog.get_logger()
+
+DAILY = "daily"
+
+DAILY_PHASES = ("daily/d1", "daily/d2", "daily/d3", "daily/d4", "daily/daily_summary")
+DEFAULT_WORKERS = 4
+DEFAULT_PREFIX = "backfill"
+
+ProgressFn = Callable[["BackfillProgress"], None]
+
+
+@dataclass
+class BackfillProgress:
+    total: int
+    started: float = field(default_factory=time.perf_counter)
+    done: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    last: Optional[str] = None  # run key of the latest finished date
+
+    @property
+    def finished(self) -> int:
+        return len(self.done) + len(self.skipped) + len(self.failed)
+
+    @property
+    def elapsed_sec(self) -> float:
+        return time.perf_counter() - self.started
+
+    def eta_sec(self) -> Optional[float]:
+        """Remaining dates at the throughput seen so far (skips are free and not counted)."""
+        ran = len(self.done) + len(self.failed)
+        if not ran:
+            return None
+        return self.elapsed_sec / ran * (self.total - self.finished)
+
+    def line(self) -> str:
+        eta = self.eta_sec()
+        return (f"[{self.finished}/{self.total}] {self.last or '-'}  done={len(self.done)} "
+                f"skipped={len(self.skipped)} failed={len(self.failed)}  elapsed={format_duration(self.elapsed_sec)}"
+                f"  eta={'-' if eta is None else format_duration(eta)}")
+
+
+@dataclass
+class BackfillReport:
+    kind: str
+    run_keys: List[str]
+    progress: BackfillProgress
+    pending: List[str] = field(default_factory=list)  # run keys that needed (re)building
+    preemptions: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.progress.failed
+
+    def summary(self) -> Dict[str, object]:
+        p = self.progress
+        return {"kind": self.kind, "dates": len(self.run_keys), "pending": len(self.pending), "done": len(p.done),
+                "skipped": len(p.skipped), "failed": p.failed, "wall_sec": round(p.elapsed_sec, 1), "preemptions": self.preemptions}
+
+
+def format_duration(sec: float) -> str:
+    sec = int(round(sec))
+    h, rem = divmod(sec, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}h{m:02d}m" if h else f"{m}m{s:02d}s"
+
+
+def _parse(day: str) -> Date:
+    return datetime.strptime(day, "%Y-%m-%d").date()
+
+
+def daily_dates(start: str, end: str) -> List[str]:
+    first, last = _parse(start), _parse(end)
+    if last < first:
+        raise ValueError(f"--to {end} is before --from {start}")
+    return [(first + timedelta(days=i)).isoformat() for i in range((last - first).days + 1)]
+
+
+def run_id_for(kind: str, run_key: str, prefix: str = DEFAULT_PREFIX) -> str:
+    return f"{prefix}_{kind}_{run_key}"
+
+
+def has_valid_snapshots(run_id: str, phases) -> bool:
+    """Every phase has an indexed snapshot for run_id whose payload still matches its SHA256."""
+    from nuclear.db.repos import SnapshotRepo
+    from nuclear.storage.snapshot import load_snapshot
+
+    for phase in phases:
+        row = SnapshotRepo.latest_for_run(run_id, phase)
+        if row is None:
+            return False
+        try:
+            load_snapshot(row["snapshot_id"])
+        except Exception as e:
+            log.warning("backfill_snapshot_invalid", run_id=run_id, phase=phase, error=str(e))
+            return False
+    return True
+
+
+def _run_daily_date(day: str, run_id: str, tickers: Optional[List[str]]) -> None:
+    from nuclear.phases.daily.run_daily import run_daily_pipeline
+
+    run_daily_pipeline(date=day, tickers=tickers, run_id=run_id)
+
+
+def run_backfill(
+    kind: str,
+    start: str,
+    end: str,
+    workers: Optional[int] = None,
+    prefix: str = DEFAULT_PREFIX,
+    force: bool = False,
+    tickers: Optional[List[str]] = None,
+    on_progress: Optional[ProgressFn] = None,
+    dry_run: bool = False,
+) -> BackfillReport:
+    """Rebuild `kind` (only "daily") for every date in [start, end]; see the module docstring."""
+    from nuclear.db.schema import create_tables
+    from nuclear.orchestration.arbiter import wait_timeout, workload_slot
+
+    if kind != DAILY:
+        raise ValueError(f"Unknown backfill kind: {kind} (expected {DAILY!r})")
+    days = daily_dates(start, end)
+    workers = max(1, workers or int(os.environ.get("NUCLEAR_BACKFILL_WORKERS", DEFAULT_WORKERS)))
+    create_tables()
+    progress = BackfillProgress(total=len(days))
+    report = BackfillReport(kind, days, progress)
+    notify = on_progress or (lambda p: None)
+
+    todo = []
+    for day in days:
+        run_id = run_id_for(kind, day, prefix)
+        if not force and has_valid_snapshots(run_id, DAILY_PHASES):
+            progress.skipped.append(day)
+            progress.last = day
+        else:
+            todo.append((day, run_id))
+    report.pending = [day for day, _ in todo]
+    log.info("backfill_start", kind=kind, start=start, end=end, dates=len(days), skipped=len(progress.skipped),
+             workers=workers, prefix=prefix)
+    if dry_run or not todo:
+        notify(progress)
+        return report
+
+    lock = threading.Lock()
+
+    def finished(key: str, error: Optional[str]) -> None:
+        with lock:
+            if error is None:
+                progress.done.append(key)
+            else:
+                progress.failed[key] = error
+            progress.last = key
+        log.info("backfill_progress", kind=kind, run_key=key, error=error, finished=progress.finished,
+                 total=progress.total, eta_sec=progress.eta_sec())
+        notify(progress)
+
+    with workload_slot("backfill", timeout=wait_timeout()) as slot, \
+            tracing.span(f"backfill_{kind}", kind=tracing.RUN, run_id=run_id_for(kind, f"{start}_{end}", prefix)):
+        _run_parallel(todo, workers, tickers, slot, finished)
+        report.preemptions = list(slot.preemptions)
+
+    stopped = [d for d, _ in todo if d not in progress.done and d not in progress.failed]
+    log.info("backfill_done", **report.summary(), not_run=stopped)
+    return report
+
+
+def _run_parallel(todo, workers: int, tickers: Optional[List[str]], slot, finished) -> None:
+    """Daily dates on a bounded pool; dates are only dispatched while the budget is held."""
+    inflight: Dict[Future, str] = {}
+
+    def collect(return_when: str) -> None:
+        done, _ = wait(list(inflight), return_when=return_when)
+        for fut in done:
+            key = inflight.pop(fut)
+            exc = fut.exception()
+            finished(key, None if exc is None else f"{type(exc).__name__}: {exc}")
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="backfill") as pool:
+        for day, run_id in todo:
+            if slot.should_yield():  # let in-flight dates finish, then hand the budget over
+                if inflight:
+                    collect(ALL_COMPLETED)
+                slot.boundary(day)
+            if len(inflight) >= workers:
+                collect(FIRST_COMPLETED)
+            inflight[pool.submit(tracing.propagate(_run_daily_date), day, run_id, tickers)] = day
+        if inflight:
+            collect(ALL_COMPLETED)
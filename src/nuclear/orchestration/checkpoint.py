@@ -0,0 +1,86 @@
+"""
+Run checkpoints - per-node completion for one run_id, so `nuclear resume <run_id>` skips
+finished work instead of restarting the flow.
+
+run_state holds the flow name ("wb", "analysis") and the parameters it was started with;
+run_nodes holds one row per node (status, output snapshot_id, error, attempts). A node
+counts as completed only with a snapshot_id: its output is rehydrated from the snapshot
+store (load_snapshot), never recomputed.
+"""
+import json
+from typing import Any, Dict, Optional
+
+import structlog
+
+from nuclear.db.repos import RunStateRepo
+
+log = structlog.get_logger()
+
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class RunCheckpoint:
+    def __init__(self, run_id: str, flow: str, params: Optional[Dict[str, Any]] = None):
+        self.run_id = run_id
+        self.flow = flow
+        self.params = params or {}
+        self._completed: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def open(cls, run_id: str) -> Optional["RunCheckpoint"]:
+        """The checkpoint of an earlier run, or None if run_id was never checkpointed."""
+        from nuclear.db.schema import create_tables
+
+        create_tables()
+        row = RunStateRepo.get(run_id)
+        if row is None:
+            return None
+        return cls(run_id, row["flow"], json.loads(row["params_json"] or "{}"))
+
+    def begin(self) -> "RunCheckpoint":
+        from nuclear.db.schema import create_tables
+
+        create_tables()
+        RunStateRepo.begin(self.run_id, self.flow, json.dumps(self.params, default=str))
+        # an existing run_id continues with the parameters it was first started with
+        self.params = json.loads(RunStateRepo.get(self.run_id)["params_json"] or "{}")
+        self._completed = None
+        done = self.completed()
+        if done:
+            log.info("run_checkpoint_resume", run_id=self.run_id, flow=self.flow, completed=sorted(done))
+        return self
+
+    def completed(self) -> Dict[str, str]:
+        """node -> output snapshot_id, as of begin() (nodes finished during this attempt excluded)."""
+        if self._completed is None:
+            self._completed = {
+                r["node"]: r["snapshot_id"]
+                for r in RunStateRepo.list_nodes(self.run_id)
+                if r["status"] == DONE and r["snapshot_id"]
+            }
+        return self._completed
+
+    def is_done(self, node: str) -> bool:
+        return node in self.completed()
+
+    def load(self, node: str) -> Any:
+        from nuclear.storage.snapshot import load_snapshot
+
+        return load_snapshot(self.completed()[node])
+
+    def mark_running(self, node: str) -> None:
+        RunStateRepo.mark_node(self.run_id, node, RUNNING)
+
+    def mark_done(self, node: str, snapshot_id: Optional[str]) -> None:
+        RunStateRepo.mark_node(self.run_id, node, DONE, snapshot_id=snapshot_id)
+
+    def mark_failed(self, node: str, error: str) -> None:
+        RunStateRepo.mark_node(self.run_id, node, FAILED, error=error)
+
+    def finish(self, ok: bool) -> None:
+        RunStateRepo.set_status(self.run_id, "completed" if ok else "failed")
+
+    def nodes(self):
+        return RunStateRepo.list_nodes(self.run_id)
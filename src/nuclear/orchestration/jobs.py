@@ -0,0 +1,257 @@
+"""
+Durable job queue - the API / scheduler enqueue jobs, N worker processes claim and run them.
+
+Jobs live in the SQLite `jobs` table (JobRepo). A worker claims the highest-priority due job
+under a lease (NUCLEAR_JOB_LEASE_SEC) and heartbeats while the handler runs; if the worker
+dies, the lease expires and another worker picks the job up (visibility timeout). A failed
+attempt is re-queued with exponential backoff until max_attempts, then marked 'dead'.
+
+Job types are registered handlers (payload dict -> JSON-able result):
+    daily          {date?, tickers?, run_id?}      D-1..D-4 (schedule.run_daily, in-process)
+    weekly         {run_id?}                       WB-1 -> WB-2 (schedule.run_weekly, in-process)
+    analyze        {themes, run_id, ...}           P0 -> P4 graph, checkpointed: a retry resumes
+    p1_extraction  {ticker, market, run_id?}       per-ticker P1-1.5 report extraction
+
+    enqueue_job("p1_extraction", {"ticker": "NVDA", "market": "US"}, priority=5)
+    python -m nuclear.worker            # NUCLEAR_WORKER_PROCESSES worker processes
+"""
+import json
+import multiprocessing
+import os
+import socket
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import structlog
+
+from nuclear.db.repos import JobRepo
+
+log = structlog.get_logger()
+
+DEFAULT_LEASE_SEC = 300
+DEFAULT_POLL_INTERVAL_SEC = 2.0
+DEFAULT_RETRY_DELAY_SEC = 30
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_WORKER_PROCESSES = 2
+
+JobHandler = Callable[[Dict[str, Any]], Any]
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+
+def register_handler(job_type: str) -> Callable[[JobHandler], JobHandler]:
+    def decorator(fn: JobHandler) -> JobHandler:
+        JOB_HANDLERS[job_type] = fn
+        return fn
+    return decorator
+
+
+@register_handler("daily")
+def _daily(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from nuclear.orchestration.schedule import MODE_INPROCESS, run_daily
+
+    rc = run_daily(date=payload.get("date"), tickers=payload.get("tickers"), run_id=payload.get("run_id"),
+                   mode=MODE_INPROCESS)
+    if rc != 0:
+        raise RuntimeError(f"daily pipeline exited {rc}")
+    return {"returncode": rc}
+
+
+@register_handler("weekly")
+def _weekly(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from nuclear.orchestration.schedule import MODE_INPROCESS, run_weekly
+
+    rc = run_weekly(run_id=payload.get("run_id"), mode=MODE_INPROCESS)
+    if rc != 0:
+        raise RuntimeError(f"weekly pipeline exited {rc}")
+    return {"returncode": rc}
+
+
+@register_handler("analyze")
+def _analyze(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from nuclear.orchestration.checkpoint import RunCheckpoint
+    from nuclear.orchestration.run_graph import run_analysis
+
+    params = {"themes": payload.get("themes", []), "market_regime": payload.get("market_regime", "BULL"),
+              "defcon_level": payload.get("defcon_level", 3)}
+    checkpoint = RunCheckpoint(payload["run_id"], flow="analysis", params=params).begin()
+    result = run_analysis(params["themes"], run_id=payload["run_id"], checkpoint=checkpoint,
+                          market_regime=params["market_regime"], defcon_level=params["defcon_level"])
+    if not result.ok:
+        raise RuntimeError(f"analysis failed nodes: {result.failed()}")
+    return {"wall_ms": result.wall_ms, "critical_path_ms": result.critical_path_ms, "memo_hits": result.memo_hits}
+
+
+@register_handler("p1_extraction")
+def _p1_extraction(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from nuclear.phases.p1.p1_extraction import run_extraction
+
+    res = run_extraction(payload["ticker"], payload.get("market", "US"), payload.get("run_id", "default"))
+    return {"ticker": res.ticker, "evidence": {
+        "p1_industry_evidence": len(res.p1_industry_evidence),
+        "p2_financial_evidence": len(res.p2_financial_evidence),
+        "p2_5_institutional_evidence": len(res.p2_5_institutional_evidence),
+    }}
+
+
+def _ensure_tables() -> None:
+    from nuclear.db.schema import create_tables
+
+    create_tables()
+
+
+def enqueue_job(
+    job_type: str,
+    payload: Optional[Dict[str, Any]] = None,
+    priority: int = 0,
+    max_attempts: Optional[int] = None,
+    run_id: Optional[str] = None,
+    delay_sec: float = 0,
+) -> str:
+    """Queue a job (higher priority first); returns job_id. Unknown job types raise ValueError."""
+    if job_type not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job type: {job_type} (known: {sorted(JOB_HANDLERS)})")
+    payload = dict(payload or {})
+    if job_type == "analyze":
+        payload.setdefault("run_id", run_id or f"analysis_{uuid.uuid4().hex[:8]}")
+    run_id = run_id or payload.get("run_id")
+    max_attempts = max_attempts or int(os.environ.get("NUCLEAR_JOB_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS))
+    _ensure_tables()
+    job_id = uuid.uuid4().hex
+    JobRepo.enqueue(job_id, job_type, json.dumps(payload, default=str), priority, max_attempts, run_id, delay_sec)
+    log.info("job_enqueued", job_id=job_id, job_type=job_type, priority=priority, run_id=run_id)
+    return job_id
+
+
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    _ensure_tables()
+    row = JobRepo.get(job_id)
+    return _public(row) if row else None
+
+
+def list_jobs(status: Optional[str] = None, job_type: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
+    _ensure_tables()
+    return {"counts": JobRepo.counts(), "jobs": [_public(r) for r in JobRepo.list_jobs(status, job_type, limit)]}
+
+
+def _public(row: Dict[str, Any]) -> Dict[str, Any]:
+    out = {k: v for k, v in row.items() if k not in ("payload_json", "result_json")}
+    out["payload"] = json.loads(row["payload_json"] or "{}")
+    out["result"] = json.loads(row["result_json"]) if row.get("result_json") else None
+    return out
+
+
+class JobWorker:
+    """Claims and runs jobs one at a time; a heartbeat thread keeps the lease alive."""
+
+    def __init__(
+        self,
+        worker_id: Optional[str] = None,
+        job_types: Optional[List[str]] = None,
+        lease_sec: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+        retry_delay_sec: Optional[float] = None,
+    ):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.job_types = job_types
+        self.lease_sec = lease_sec or float(os.environ.get("NUCLEAR_JOB_LEASE_SEC", DEFAULT_LEASE_SEC))
+        self.poll_interval = (
+            poll_interval if poll_interval is not None
+            else float(os.environ.get("NUCLEAR_JOB_POLL_SEC", DEFAULT_POLL_INTERVAL_SEC))
+        )
+        self.retry_delay_sec = (
+            retry_delay_sec if retry_delay_sec is not None
+            else float(os.environ.get("NUCLEAR_JOB_RETRY_DELAY_SEC", DEFAULT_RETRY_DELAY_SEC))
+        )
+
+    def run_once(self) -> Optional[str]:
+        """Claim and run one due job; returns its id, or None when the queue has nothing due."""
+        job = JobRepo.claim(self.worker_id, self.lease_sec, self.job_types)
+        if job is None:
+            return None
+        job_id = job["job_id"]
+        log.info("job_claimed", job_id=job_id, job_type=job["job_type"], attempt=job["attempts"], worker=self.worker_id)
+        stop = threading.Event()
+        beat = threading.Thread(target=self._heartbeat, args=(job_id, stop), name=f"job-heartbeat-{job_id[:8]}",
+                                daemon=True)
+        beat.start()
+        started = time.perf_counter()
+        try:
+            handler = JOB_HANDLERS.get(job["job_type"])
+            if handler is None:
+                raise ValueError(f"No handler for job type {job['job_type']}")
+            result = handler(json.loads(job["payload_json"] or "{}"))
+        except Exception as e:
+            stop.set()
+            delay = self.retry_delay_sec * 2 ** (job["attempts"] - 1)
+            status = JobRepo.fail(job_id, self.worker_id, f"{type(e).__name__}: {e}", delay)
+            log.error("job_failed", job_id=job_id, job_type=job["job_type"], attempt=job["attempts"], status=status,
+                      error=str(e), retry_in_sec=delay if status == "queued" else None)
+            return job_id
+        finally:
+            stop.set()
+            beat.join()
+        if not JobRepo.complete(job_id, self.worker_id, json.dumps(result, default=str)):
+            log.warning("job_lease_lost", job_id=job_id, worker=self.worker_id)
+        log.info("job_succeeded", job_id=job_id, job_type=job["job_type"],
+                 duration_ms=round((time.perf_counter() - started) * 1000, 1))
+        return job_id
+
+    def _heartbeat(self, job_id: str, stop: threading.Event) -> None:
+        while not stop.wait(max(self.lease_sec / 3, 0.05)):
+            if not JobRepo.heartbeat(job_id, self.worker_id, self.lease_sec):
+                log.warning("job_lease_lost", job_id=job_id, worker=self.worker_id)
+                return
+
+    def run(self, stop: Optional[threading.Event] = None, max_jobs: Optional[int] = None, exit_when_idle: bool = False) -> int:
+        """Poll until stopped (or max_jobs run / queue idle); returns the number of jobs run."""
+        _ensure_tables()
+        stop = stop or threading.Event()
+        done = 0
+        log.info("job_worker_started", worker=self.worker_id, job_types=self.job_types)
+        while not stop.is_set() and (max_jobs is None or done < max_jobs):
+            if self.run_once() is not None:
+                done += 1
+                continue
+            if exit_when_idle:
+                break
+            stop.wait(self.poll_interval)
+        return done
+
+
+def _worker_process(db_path: str, job_types: Optional[List[str]], exit_when_idle: bool) -> None:
+    from nuclear.db.sqlite import SQLiteEngine
+
+    SQLiteEngine.DB_PATH = Path(db_path)
+    JobWorker(job_types=job_types).run(exit_when_idle=exit_when_idle)
+
+
+def run_worker_pool(
+    processes: Optional[int] = None,
+    job_types: Optional[List[str]] = None,
+    exit_when_idle: bool = False,
+) -> None:
+    """Start N worker processes (spawned, one warm interpreter each) against the same queue and wait."""
+    from nuclear.db.sqlite import SQLiteEngine
+
+    processes = processes or int(os.environ.get("NUCLEAR_WORKER_PROCESSES", DEFAULT_WORKER_PROCESSES))
+    _ensure_tables()
+    ctx = multiprocessing.get_context("spawn")
+    procs = [
+        ctx.Process(target=_worker_process, args=(str(SQLiteEngine.DB_PATH), job_types, exit_when_idle),
+                    name=f"nuclear-worker-{i}")
+        for i in range(processes)
+    ]
+    for p in procs:
+        p.start()
+    log.info("job_worker_pool_started", processes=processes, pids=[p.pid for p in procs])
+    try:
+        for p in procs:
+            p.join()
+    finally:
+        for p in procs:
+            if p.is_alive():
+                p.terminate()
+                p.join()
@@ -0,0 +1,150 @@
+"""
+Phase memoization - reuse a per-ticker phase output from an earlier run when nothing it
+depends on has changed (incremental recompute).
+
+The memo key of a node is a SHA256 over:
+  - its memo inputs: upstream outputs plus the external data the phase reads (financials,
+    smart-money flows, OHLCV), canonical JSON with VOLATILE_FIELDS dropped;
+  - a code fingerprint: the source of the phase package (MEMO_PHASES) + MEMO_VERSION;
+  - a skills hash (skills/drift.compute_skills_hash) of the injected skills text of
+    each LLM sub-phase;
+  - the M0 model route of each LLM sub-phase.
+
+Stale rules - a stored entry is NOT reused when:
+  1. any of the above differs (it is simply a different key);
+  2. it is older than NUCLEAR_MEMO_MAX_AGE_DAYS (default 30): forces a periodic full recompute;
+  3. its snapshot is missing, fails the SHA256 check or no longer validates as the output model.
+NUCLEAR_MEMO=0 disables lookups and recording.
+"""
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+log = structlog.get_logger()
+
+MEMO_VERSION = "1"  # bump to invalidate every memo entry
+DEFAULT_MAX_AGE_DAYS = 30
+VOLATILE_FIELDS = frozenset({"run_id", "version_chain_id", "snapshot_id", "created_at", "as_of_date"})
+
+# graph phase -> (source package, LLM sub-phases it prompts)
+MEMO_PHASES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "P2": ("nuclear.phases.p2", ("P2-1", "P2-2")),
+    "P2.5": ("nuclear.phases.p25", ("P2.5",)),
+    "P3": ("nuclear.phases.p3", ("P3",)),
+}
+
+
+def memo_enabled() -> bool:
+    return os.environ.get("NUCLEAR_MEMO", "1") != "0"
+
+
+def strip_volatile(value: Any) -> Any:
+    """JSON-mode copy of value without per-run bookkeeping fields (at any depth)."""
+    if hasattr(value, "model_dump"):
+        value = value.model_dump(mode="json")
+    if isinstance(value, dict):
+        return {k: strip_volatile(v) for k, v in value.items() if k not in VOLATILE_FIELDS}
+    if isinstance(value, (list, tuple)):
+        return [strip_volatile(v) for v in value]
+    return value
+
+
+def _sha(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def code_fingerprint(package: str) -> str:
+    """Hash of every .py file in the phase package (a code change invalidates its memo)."""
+    import importlib
+
+    root = Path(list(importlib.import_module(package).__path__)[0])  # phase packages may be namespace packages
+    digest = hashlib.sha256(MEMO_VERSION.encode())
+    for path in sorted(root.rglob("*.py")):
+        digest.update(str(path.relative_to(root)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def skills_fingerprint(sub_phases: Tuple[str, ...]) -> str:
+    from nuclear.prompts.skills_injector import SkillsInjector
+    from nuclear.skills.drift import compute_skills_hash
+
+    return compute_skills_hash({p: _sha(SkillsInjector.inject_skills(p))[:16] for p in sub_phases})
+
+
+class PhaseMemo:
+    """Memo lookups / records for one run; fingerprints are computed once per phase."""
+
+    def __init__(self, run_id: str, version_chain_id: str = "default", max_age_days: Optional[float] = None):
+        self.run_id = run_id
+        self.version_chain_id = version_chain_id
+        self.max_age_days = (
+            max_age_days if max_age_days is not None
+            else float(os.environ.get("NUCLEAR_MEMO_MAX_AGE_DAYS", DEFAULT_MAX_AGE_DAYS))
+        )
+        self._fingerprints: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def fingerprint(self, phase: str) -> Dict[str, Any]:
+        with self._lock:
+            cached = self._fingerprints.get(phase)
+        if cached is not None:
+            return cached
+        from nuclear.m0.core import get_m0
+
+        package, sub_phases = MEMO_PHASES.get(phase, ("nuclear.phases", (phase,)))
+        fp = {
+            "code": code_fingerprint(package),
+            "skills": skills_fingerprint(sub_phases),
+            "models": {p: get_m0().default_model(p) for p in sub_phases},
+        }
+        with self._lock:
+            return self._fingerprints.setdefault(phase, fp)
+
+    def key(self, phase: str, material: Any) -> str:
+        canonical = json.dumps(
+            {"phase": phase, "inputs": strip_volatile(material), **self.fingerprint(phase)},
+            sort_keys=True, ensure_ascii=False, default=str,
+        )
+        return _sha(canonical)
+
+    def lookup(self, phase: str, input_hash: str, output_model: Optional[type] = None) -> Optional[Tuple[str, Any]]:
+        """(snapshot_id, result rebound to this run) for a fresh entry, else None."""
+        if not memo_enabled():
+            return None
+        from nuclear.db.repos import PhaseMemoRepo
+        from nuclear.storage.snapshot import load_snapshot
+
+        row = PhaseMemoRepo.get(phase, input_hash)
+        if row is None:
+            return None
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(row["created_at"])
+        if age > timedelta(days=self.max_age_days):
+            log.info("phase_memo_expired", phase=phase, ticker=row["ticker"], age_days=round(age.total_seconds() / 86400, 1))
+            return None
+        try:
+            payload = load_snapshot(row["snapshot_id"])
+            result = output_model.model_validate(payload) if output_model else payload
+        except Exception as e:
+            log.warning("phase_memo_unusable", phase=phase, snapshot_id=row["snapshot_id"], error=str(e))
+            return None
+        return row["snapshot_id"], self._rebind(result)
+
+    def record(self, phase: str, input_hash: str, snapshot_id: Optional[str], ticker: Optional[str] = None) -> None:
+        if not memo_enabled() or not snapshot_id:
+            return
+        from nuclear.db.repos import PhaseMemoRepo
+
+        PhaseMemoRepo.put(phase, input_hash, snapshot_id, self.run_id, ticker)
+
+    def _rebind(self, result: Any) -> Any:
+        """A reused output belongs to this run: refresh its run_id / version_chain_id."""
+        fields = getattr(type(result), "model_fields", {})
+        update = {k: v for k, v in (("run_id", self.run_id), ("version_chain_id", self.version_chain_id)) if k in fields}
+        return result.model_copy(update=update) if update else result
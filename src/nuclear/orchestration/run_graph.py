@@ -1 +1,584 @@
-"""Run graph - task graph / state machine for WB-1 -> W-A -> WB-2."""
+"""
+Run graph - DAG executor for the P0 -> P4 analysis chain.
+
+Each Node names its upstream inputs; independent nodes run concurrently on a thread
+pool. A node may fan out (add per-ticker nodes once its result is known) and a join
+node may `collect` every node under a name prefix, e.g. P4 collects "P3:*":
+
+    P0 -> P0.5 -> P0.7 -> P1-1 -> P1-1.5:<ticker>* -> P1-2 -> P2:<t> -> P2.5:<t> -> P3:<t> -> P4
+
+Every node result is persisted as a snapshot (SnapshotWriter) and the run reports
+per-node timings plus the critical path (the chain of latest-finishing dependencies).
+A failed node skips its dependents; join nodes proceed with the tickers that finished.
+Nodes with a `memo` function reuse an earlier run's output when their memo key (inputs +
+code / skills / model fingerprint, see orchestration.memo) is unchanged.
+With a RunCheckpoint, completed nodes are recorded in run_nodes and a resumed run
+rehydrates them from their snapshots (as `output_model`) instead of running them again,
+as long as all of their inputs were rehydrated as well.
+The run is traced as a RUN span with one span per node (TICKER for per-ticker nodes).
+Nodes with a `pool` (the per-ticker P2 / P2.5 / P3 nodes) are not submitted one by one: the
+nodes of one phase that become ready together run as a single map_tickers batch on the
+per-ticker executor (orchestration.ticker_pool - chunked, NUCLEAR_TICKER_THREAD_WORKERS wide,
+per-ticker error isolation), and each keeps its own status, snapshot, memo and checkpoint.
+"""
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+from nuclear.utils import tracing
+
+log = structlog.get_logger()
+
+DEFAULT_MAX_WORKERS = 8
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+NodeFn = Callable[[Dict[str, Any]], Any]  # {input node name: result} -> result
+FanOut = Callable[[Any], List["Node"]]  # node result -> nodes to add
+
+
+@dataclass
+class Node:
+    name: str
+    fn: NodeFn
+    inputs: Tuple[str, ...] = ()
+    phase: Optional[str] = None  # snapshot phase; defaults to the name before ":"
+    ticker: Optional[str] = None
+    collect: Tuple[str, ...] = ()  # join: also wait for and receive every node named "<prefix>..."
+    fan_out: Optional[FanOut] = None
+    persist: bool = True
+    output_model: Optional[type] = None  # pydantic model to rehydrate a checkpointed snapshot into
+    memo: Optional[NodeFn] = None  # inputs -> memo key material (PhaseMemo); None = always compute
+    pool: Optional[str] = None  # ticker_pool.THREAD: batch with same-phase ready nodes on the per-ticker executor
+
+    @property
+    def snapshot_phase(self) -> str:
+        return self.phase or self.name.split(":", 1)[0]
+
+
+@dataclass
+class NodeRun:
+    name: str
+    status: str = PENDING
+    started_at: Optional[float] = None  # perf_counter seconds relative to run start
+    ended_at: Optional[float] = None
+    error: Optional[str] = None
+    snapshot_id: Optional[str] = None
+    resumed: bool = False  # rehydrated from a checkpoint snapshot, not executed
+    memo_hit: bool = False  # output reused from an earlier run with the same memo key
+    deps: List[str] = field(default_factory=list)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.started_at is None or self.ended_at is None:
+            return None
+        return round((self.ended_at - self.started_at) * 1000, 1)
+
+
+@dataclass
+class GraphRunResult:
+    run_id: str
+    results: Dict[str, Any]
+    nodes: Dict[str, NodeRun]
+    critical_path: List[str]
+    wall_ms: float
+
+    @property
+    def ok(self) -> bool:
+        return all(n.status == DONE for n in self.nodes.values())
+
+    @property
+    def critical_path_ms(self) -> float:
+        return round(sum(self.nodes[n].duration_ms or 0.0 for n in self.critical_path), 1)
+
+    @property
+    def memo_hits(self) -> int:
+        return sum(r.memo_hit for r in self.nodes.values())
+
+    def failed(self) -> List[str]:
+        return [n for n, r in self.nodes.items() if r.status == FAILED]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "ok": self.ok,
+            "wall_ms": self.wall_ms,
+            "critical_path": self.critical_path,
+            "critical_path_ms": self.critical_path_ms,
+            "memo_hits": self.memo_hits,
+            "nodes": {
+                n: {"status": r.status, "duration_ms": r.duration_ms, "snapshot_id": r.snapshot_id,
+                    "resumed": r.resumed, "memo_hit": r.memo_hit, "error": r.error}
+                for n, r in self.nodes.items()
+            },
+        }
+
+
+def _snapshot_payload(result: Any) -> Any:
+    if hasattr(result, "model_dump"):
+        return result.model_dump(mode="json")
+    if isinstance(result, dict):
+        return {k: _snapshot_payload(v) for k, v in result.items()}
+    if isinstance(result, list):
+        return [_snapshot_payload(v) for v in result]
+    return result
+
+
+class RunGraph:
+    """Nodes + dependency bookkeeping; run() executes it once."""
+
+    def __init__(self, nodes: Sequence[Node] = ()):
+        self.nodes: Dict[str, Node] = {}
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: Node) -> Node:
+        if node.name in self.nodes:
+            raise ValueError(f"Duplicate node: {node.name}")
+        if node.pool not in (None, "thread"):  # node fns are closures: they cannot be sent to a process
+            raise ValueError(f"{node.name}: graph nodes run on the thread pool only, got pool={node.pool!r}")
+        self.nodes[node.name] = node
+        return node
+
+    def validate(self) -> None:
+        """Unknown inputs or cycles among the statically declared nodes raise ValueError."""
+        for node in self.nodes.values():
+            missing = [i for i in node.inputs if i not in self.nodes]
+            if missing:
+                raise ValueError(f"{node.name}: unknown inputs {missing}")
+        state: Dict[str, int] = {}
+
+        def visit(name: str, stack: Tuple[str, ...]) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Cycle: {' -> '.join(stack + (name,))}")
+            state[name] = 1
+            for dep in self.nodes[name].inputs:
+                visit(dep, stack + (name,))
+            state[name] = 2
+
+        for name in self.nodes:
+            visit(name, ())
+
+    def _collected(self, node: Node) -> List[str]:
+        return [n for n in self.nodes for p in node.collect if n.startswith(p)]
+
+    def run(
+        self,
+        run_id: str = "default",
+        max_workers: Optional[int] = None,
+        snapshots: Any = None,
+        checkpoint: Any = None,
+        memo: Any = None,
+    ) -> GraphRunResult:
+        """
+        Execute until no node can make progress. `snapshots` is a SnapshotWriter-like
+        object (save(phase, payload, run_id) -> meta with snapshot_id); None = no persistence.
+        `checkpoint` is a RunCheckpoint: node outcomes are recorded there, and nodes it
+        already has as completed are loaded from their snapshots (fan-outs still apply).
+        `memo` is a PhaseMemo, consulted for nodes that define Node.memo.
+        """
+        self.validate()
+        max_workers = max_workers or int(os.environ.get("NUCLEAR_RUN_GRAPH_WORKERS", DEFAULT_MAX_WORKERS))
+        runs: Dict[str, NodeRun] = {n: NodeRun(n) for n in self.nodes}
+        results: Dict[str, Any] = {}
+        t0 = time.perf_counter()
+
+        def execute(node: Node, inputs: Dict[str, Any]) -> Any:
+            runs[node.name].started_at = time.perf_counter() - t0
+            if checkpoint is not None:
+                checkpoint.mark_running(node.name)
+            try:
+                with _node_span(node) as sp:
+                    result = _execute(node, inputs)
+                    if sp is not None:
+                        sp.set(memo_hit=runs[node.name].memo_hit, snapshot_id=runs[node.name].snapshot_id)
+                    return result
+            except Exception as e:
+                if checkpoint is not None:
+                    checkpoint.mark_failed(node.name, f"{type(e).__name__}: {e}")
+                raise
+            finally:
+                runs[node.name].ended_at = time.perf_counter() - t0
+
+        def _execute(node: Node, inputs: Dict[str, Any]) -> Any:
+            input_hash = hit = None
+            if memo is not None and node.memo is not None:
+                input_hash = memo.key(node.snapshot_phase, node.memo(inputs))
+                hit = memo.lookup(node.snapshot_phase, input_hash, node.output_model)
+            if hit is not None:
+                runs[node.name].snapshot_id, result = hit
+                runs[node.name].memo_hit = True
+            else:
+                result = node.fn(inputs)
+            if snapshots is not None and node.persist:
+                meta = snapshots.save(phase=node.snapshot_phase, payload=_snapshot_payload(result), run_id=run_id)
+                runs[node.name].snapshot_id = getattr(meta, "snapshot_id", None)
+            if input_hash is not None and hit is None:
+                memo.record(node.snapshot_phase, input_hash, runs[node.name].snapshot_id, node.ticker)
+            if checkpoint is not None:
+                checkpoint.mark_done(node.name, runs[node.name].snapshot_id)
+            return result
+
+        def _node_span(node: Node):
+            return tracing.span(node.name, kind=tracing.TICKER if node.ticker else tracing.PHASE,
+                                phase=node.snapshot_phase, ticker=node.ticker)
+
+        def restore(node: Node, inputs: Dict[str, Any]) -> Any:
+            run = runs[node.name]
+            run.started_at = time.perf_counter() - t0
+            try:
+                with _node_span(node) as sp:
+                    if sp is not None:
+                        sp.set(resumed=True)
+                    payload = checkpoint.load(node.name)
+                result = node.output_model.model_validate(payload) if node.output_model else payload
+            except Exception as e:
+                log.warning("run_graph_restore_failed", run_id=run_id, node=node.name, error=str(e))
+                return execute(node, inputs)
+            run.ended_at = time.perf_counter() - t0
+            run.snapshot_id = checkpoint.completed()[node.name]
+            run.resumed = True
+            return result
+
+        def ready(node: Node) -> Optional[bool]:
+            """True = runnable, False = waiting, None = skip (an input failed)."""
+            for dep in node.inputs:
+                if runs[dep].status in (FAILED, SKIPPED):
+                    return None
+                if runs[dep].status != DONE:
+                    return False
+            for dep in self._collected(node):
+                if runs[dep].status in (PENDING, RUNNING):
+                    return False
+            return True
+
+        def run_batch(group: List[Tuple[Node, Dict[str, Any], bool]]) -> List[Any]:
+            """Ready same-phase `pool` nodes on the per-ticker executor; outcomes keyed by node name."""
+            from nuclear.orchestration.ticker_pool import map_tickers
+
+            items = {node.name: (node, inputs, resume) for node, inputs, resume in group}
+            batch = map_tickers(_ticker_node, items, pool=group[0][0].pool, trace=False)
+            return batch.outcomes
+
+        def _ticker_node(name: str, item: Tuple[Node, Dict[str, Any], bool]) -> Any:
+            node, inputs, resume = item
+            return restore(node, inputs) if resume else execute(node, inputs)
+
+        def complete(name: str, result: Any = None, error: Optional[str] = None) -> None:
+            run = runs[name]
+            if error is not None:
+                run.status = FAILED
+                run.error = error
+                log.error("run_graph_node_failed", run_id=run_id, node=name, error=run.error)
+                return
+            results[name] = result
+            node = self.nodes[name]
+            if node.fan_out is not None:
+                try:
+                    added = node.fan_out(result)
+                except Exception as e:
+                    run.status = FAILED
+                    run.error = f"fan_out {type(e).__name__}: {e}"
+                    log.error("run_graph_fan_out_failed", run_id=run_id, node=name, error=run.error)
+                    if checkpoint is not None:
+                        checkpoint.mark_failed(name, run.error)
+                    return
+                for child in added:
+                    if name not in child.inputs:  # fan-out children depend on their parent
+                        child.inputs = (name,) + tuple(child.inputs)
+                    self.add(child)
+                    runs[child.name] = NodeRun(child.name)
+            run.status = DONE
+            log.info("run_graph_node_done", run_id=run_id, node=name, duration_ms=run.duration_ms,
+                     resumed=run.resumed, memo_hit=run.memo_hit)
+
+        inflight: Dict[Future, Any] = {}  # -> node name, or the node names of a per-ticker batch
+        with tracing.span("run_graph", kind=tracing.RUN, run_id=run_id), \
+                ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"graph-{run_id}"[:24]) as pool:
+            while True:
+                batches: Dict[Tuple[str, str], List[Tuple[Node, Dict[str, Any], bool]]] = {}
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for name, node in list(self.nodes.items()):
+                        if runs[name].status != PENDING:
+                            continue
+                        state = ready(node)
+                        if state is None:
+                            runs[name].status = SKIPPED
+                            progressed = True
+                        elif state:
+                            collected = [d for d in self._collected(node) if runs[d].status == DONE]
+                            runs[name].deps = list(node.inputs) + collected
+                            inputs = {d: results[d] for d in runs[name].deps}
+                            runs[name].status = RUNNING
+                            # reuse only if every input was reused too: anything downstream of a
+                            # re-run node (e.g. a join that ran without a failed ticker) runs again
+                            resume = (checkpoint is not None and checkpoint.is_done(name)
+                                      and all(runs[d].resumed for d in runs[name].deps))
+                            if node.pool is not None:
+                                batches.setdefault((node.snapshot_phase, node.pool), []).append((node, inputs, resume))
+                            else:
+                                inflight[pool.submit(tracing.propagate(restore if resume else execute), node,
+                                                     inputs)] = name
+                for group in batches.values():
+                    inflight[pool.submit(tracing.propagate(run_batch), group)] = [n.name for n, _, _ in group]
+                if not inflight:
+                    break
+                done, _ = wait(list(inflight), return_when=FIRST_COMPLETED)
+                for fut in done:
+                    key = inflight.pop(fut)
+                    try:
+                        outcome = fut.result()
+                    except Exception as e:
+                        for name in ([key] if isinstance(key, str) else key):
+                            complete(name, error=f"{type(e).__name__}: {e}")
+                        continue
+                    if isinstance(key, str):
+                        complete(key, outcome)
+                    else:
+                        for o in outcome:
+                            complete(o.ticker, o.result, o.error)
+
+        for name, run in runs.items():
+            if run.status == PENDING:  # waiting on something that never became ready
+                run.status = SKIPPED
+        wall_ms = round((time.perf_counter() - t0) * 1000, 1)
+        graph_result = GraphRunResult(run_id, results, runs, _critical_path(runs), wall_ms)
+        if checkpoint is not None:
+            checkpoint.finish(graph_result.ok)
+        log.info("run_graph_done", run_id=run_id, ok=graph_result.ok, wall_ms=wall_ms,
+                 critical_path=graph_result.critical_path, critical_path_ms=graph_result.critical_path_ms,
+                 failed=graph_result.failed())
+        return graph_result
+
+
+def _critical_path(runs: Dict[str, NodeRun]) -> List[str]:
+    """From the last node to finish, follow the latest-finishing dependency back to a root."""
+    finished = [r for r in runs.values() if r.status == DONE and r.ended_at is not None]
+    if not finished:
+        return []
+    node = max(finished, key=lambda r: r.ended_at)
+    path = [node.name]
+    while True:
+        deps = [runs[d] for d in node.deps if runs[d].ended_at is not None]
+        if not deps:
+            break
+        node = max(deps, key=lambda r: r.ended_at)
+        path.append(node.name)
+    return list(reversed(path))
+
+
+# --- SSOT P0 -> P4 analysis chain ---
+
+def p4_stock_input(p2: Dict[str, Any], p25: Dict[str, Any], p3: Dict[str, Any]) -> Dict[str, Any]:
+    """One P4 allocation input row from a ticker's P2 / P2.5 / P3 outputs."""
+    return {
+        **p2,
+        "conviction_level": p2.get("p0_conviction_level"),
+        "smart_money_score": p25.get("smart_money_score"),
+        "smart_money_direction": p25.get("smart_money_direction"),
+        "insider_alert": p25.get("insider_alert", False),
+        "alpha_exempt": p3.get("alpha_exempt", False),
+        "cat": p3.get("cat"),
+    }
+
+
+def _dump(obj: Any) -> Dict[str, Any]:
+    return obj.model_dump() if hasattr(obj, "model_dump") else dict(obj)
+
+
+def build_analysis_graph(
+    themes: List[Dict[str, Any]],
+    run_id: str = "default",
+    version_chain_id: str = "default",
+    market_regime: str = "BULL",
+    defcon_level: int = 3,
+    identity_drift: bool = False,
+    learning_state: Optional[Dict[str, Any]] = None,
+    current_positions: Optional[Dict[str, Any]] = None,
+    market_data: Optional[Callable[[str], Tuple[Dict[str, Any], Dict[str, Any]]]] = None,
+) -> RunGraph:
+    """
+    The P0 -> P4 chain as a RunGraph. P1-1 fans out per-ticker report extraction,
+    P1-2 joins it and fans out the per-ticker P2 -> P2.5 -> P3 subgraphs; P4 is the join.
+    `market_data(ticker) -> (ohlcv, indicators)` feeds P3 (default: empty).
+    """
+    from nuclear.llm.batch import get_batch_engine
+    from nuclear.orchestration.ticker_pool import THREAD
+    from nuclear.phases.p0.p0_industry import run_p0
+    from nuclear.phases.p0.p05_supply_chain import run_p05
+    from nuclear.phases.p0.p07_dynamics import run_p07
+    from nuclear.phases.p1.p1_extraction import run_extraction
+    from nuclear.phases.p1.p1_step1 import run_p1_step1
+    from nuclear.phases.p1.p1_step2 import run_p1_step2
+    from nuclear.phases.p2.p2_1_fact_model import fetch_financial_data
+    from nuclear.phases.p2.run_p2 import run_p2
+    from nuclear.phases.p25.p25_smart_money import fetch_smart_money_data, run_p25
+    from nuclear.phases.p3.p3_analysis import run_p3
+    from nuclear.phases.p4.run_p4 import run_p4
+    from nuclear.phases.p0.p0_schemas import P0Output
+    from nuclear.phases.p0.p05_schemas import P05Output
+    from nuclear.phases.p0.p07_schemas import P07Output
+    from nuclear.phases.p1.p1_schemas import P1FinancialReportExtraction, P1Step1Output, P1Step2Output
+    from nuclear.phases.p2.p2_schemas import Phase2Output
+    from nuclear.phases.p25.p25_schemas import P25Output
+    from nuclear.phases.p3.p3_schemas import P3Output
+    from nuclear.phases.p4.p4_schemas import P4Output
+
+    market_data = market_data or (lambda ticker: ({}, {}))
+    external: Dict[Tuple[str, str], Any] = {}  # per-ticker data, fetched once for memo key + phase
+
+    def fetched(source: str, ticker: str, fetch: Callable[[str], Any]) -> Any:
+        if (source, ticker) not in external:
+            external[(source, ticker)] = fetch(ticker)
+        return external[(source, ticker)]
+
+    def ticker_nodes(p1_output) -> List[Node]:
+        nodes = []
+        for company in p1_output.companies:
+            t = company.ticker
+            comp = company.model_dump()
+
+            def p2(i, t=t, comp=comp):
+                return run_p2(t, _dump(i["P0"]), _dump(i["P0.5"]), _dump(i["P0.7"]), comp,
+                              _dump(i[f"P1-1.5:{t}"]), run_id, version_chain_id,
+                              financial_data=fetched("financials", t, fetch_financial_data))
+
+            def p25(i, t=t):
+                return run_p25(t, _dump(i[f"P2:{t}"]), run_id, version_chain_id,
+                               smart_money_data=fetched("smart_money", t, fetch_smart_money_data))
+
+            def p3(i, t=t):
+                ohlcv, indicators = fetched("market", t, market_data)
+                return run_p3(t, _dump(i[f"P2:{t}"]), _dump(i[f"P2.5:{t}"]), _dump(i["P0.7"]), _dump(i["P0.5"]),
+                              ohlcv, indicators, run_id, version_chain_id)
+
+            def memo_key(source, fetch, t=t, comp=comp):
+                # this ticker's P1-2 row instead of the whole P1-2 output (the fan-out parent)
+                return lambda i: {"inputs": {k: v for k, v in i.items() if k != "P1-2"}, "company": comp,
+                                  source: fetched(source, t, fetch)}
+
+            nodes += [
+                Node(f"P2:{t}", p2, ("P0", "P0.5", "P0.7", f"P1-1.5:{t}"), ticker=t, output_model=Phase2Output,
+                     memo=memo_key("financials", fetch_financial_data), pool=THREAD),
+                Node(f"P2.5:{t}", p25, (f"P2:{t}",), ticker=t, output_model=P25Output,
+                     memo=memo_key("smart_money", fetch_smart_money_data), pool=THREAD),
+                Node(f"P3:{t}", p3, (f"P2:{t}", f"P2.5:{t}", "P0.5", "P0.7"), ticker=t, output_model=P3Output,
+                     memo=memo_key("market", market_data), pool=THREAD),
+            ]
+        return nodes
+
+    def extraction_nodes(s1_output) -> List[Node]:
+        return [
+            Node(f"P1-1.5:{c.ticker}", lambda i, c=c: run_extraction(c.ticker, c.market, run_id),
+                 ("P1-1",), ticker=c.ticker, output_model=P1FinancialReportExtraction)
+            for c in s1_output.companies
+        ]
+
+    def p1_step2(i):
+        extractions = {k.split(":", 1)[1]: v for k, v in i.items() if k.startswith("P1-1.5:")}
+        return run_p1_step2(i["P1-1"], i["P0"], i["P0.5"], i["P0.7"], extractions, run_id, version_chain_id,
+                            batch_engine=get_batch_engine("P1-2"))
+
+    def p4(i):
+        stocks = []
+        for key, p3_out in i.items():
+            if not key.startswith("P3:"):
+                continue
+            t = key.split(":", 1)[1]
+            stocks.append(p4_stock_input(_dump(i[f"P2:{t}"]), _dump(i[f"P2.5:{t}"]), _dump(p3_out)))
+        return run_p4(stocks, _dump(i["P0.7"]), market_regime, defcon_level, identity_drift,
+                      learning_state or {}, current_positions or {}, run_id, version_chain_id)
+
+    return RunGraph([
+        Node("P0", lambda i: run_p0(themes, run_id, version_chain_id), output_model=P0Output),
+        Node("P0.5", lambda i: run_p05("MODE_1", i["P0"], run_id=run_id, version_chain_id=version_chain_id),
+             ("P0",), output_model=P05Output),
+        Node("P0.7", lambda i: run_p07(i["P0"], i["P0.5"], market_regime, run_id, version_chain_id),
+             ("P0", "P0.5"), output_model=P07Output),
+        Node("P1-1", lambda i: run_p1_step1(i["P0"], i["P0.5"], i["P0.7"], run_id, version_chain_id),
+             ("P0", "P0.5", "P0.7"), fan_out=extraction_nodes, output_model=P1Step1Output),
+        Node("P1-2", p1_step2, ("P0", "P0.5", "P0.7", "P1-1"), collect=("P1-1.5:",), fan_out=ticker_nodes,
+             output_model=P1Step2Output),
+        Node("P4", p4, ("P0.7", "P1-2"), collect=("P2:", "P2.5:", "P3:"), output_model=P4Output),
+    ])
+
+
+def run_analysis(
+    themes: List[Dict[str, Any]],
+    run_id: str = "default",
+    max_workers: Optional[int] = None,
+    snapshots: Any = None,
+    checkpoint: Any = None,
+    memo: Any = None,
+    **graph_kwargs: Any,
+) -> GraphRunResult:
+    """
+    Build and run the P0 -> P4 graph; snapshots default to the local-FS SnapshotWriter.
+    Pass the run's RunCheckpoint to record node completion / resume a failed run.
+    `memo` defaults to a PhaseMemo for the run (NUCLEAR_MEMO=0 disables reuse).
+    """
+    if snapshots is None:
+        from nuclear.storage.snapshot import SnapshotWriter
+
+        snapshots = SnapshotWriter("local_fs")
+    if memo is None:
+        from nuclear.orchestration.memo import PhaseMemo, memo_enabled
+
+        if memo_enabled():
+            memo = PhaseMemo(run_id, graph_kwargs.get("version_chain_id", "default"))
+    graph = build_analysis_graph(themes, run_id=run_id, **graph_kwargs)
+    return graph.run(run_id=run_id, max_workers=max_workers, snapshots=snapshots, checkpoint=checkpoint, memo=memo)
+
+
+def run_p3_delta_tracking(
+    source_run_id: str,
+    run_id: str,
+    version_chain_id: str = "default",
+    market_data: Optional[Callable[[str], Tuple[Dict[str, Any], Dict[str, Any]]]] = None,
+    snapshots: Any = None,
+    max_workers: Optional[int] = None,
+) -> Any:
+    """
+    SSOT §8.7 weekly tracking: re-check the P3 skeleton of every ticker of analysis run
+    `source_run_id` against current market data. P3-Delta is deterministic, so the tickers run
+    on the per-ticker process pool (run_p3_delta_batch); each result is snapshotted as phase
+    "P3-Delta" under `run_id`. Returns the TickerBatch (failed tickers in batch.failed).
+    """
+    from nuclear.db.repos import SnapshotRepo
+    from nuclear.db.schema import create_tables
+    from nuclear.phases.p3.p3_delta import run_p3_delta_batch
+    from nuclear.storage.snapshot import load_snapshot
+
+    market_data = market_data or (lambda ticker: ({}, {}))
+    if snapshots is None:
+        from nuclear.storage.snapshot import SnapshotWriter
+
+        snapshots = SnapshotWriter("local_fs")
+    create_tables()
+    previous = {}
+    for row in SnapshotRepo.all_for_run(source_run_id, "P3"):
+        p3 = load_snapshot(row["snapshot_id"])
+        previous[p3["ticker"]] = p3  # a re-run ticker: the later snapshot wins
+    inputs = {}
+    for ticker, p3 in previous.items():
+        ohlcv, indicators = market_data(ticker)
+        inputs[ticker] = {"previous_p3": p3, "current_ohlcv": ohlcv, "current_indicators": indicators}
+    with tracing.span("p3_delta_tracking", kind=tracing.RUN, run_id=run_id):
+        batch = run_p3_delta_batch(inputs, run_id, version_chain_id, max_workers=max_workers)
+        for delta in batch.results.values():
+            snapshots.save(phase="P3-Delta", payload=delta.model_dump(mode="json"), run_id=run_id)
+    log.info("p3_delta_tracking_done", run_id=run_id, source_run_id=source_run_id, tickers=len(inputs),
+             failed=len(batch.failed))
+    return batch
@@ -2,26 +2,106 @@
 Scheduled Execution Module
 
 Provides wrapper functions for scheduled Daily and Weekly pipeline execution.
-Computes Asia/Taipei date and builds CLI subprocess calls.
+Computes Asia/Taipei date and runs the stages either in this process (default: one warm
+interpreter, WB-1 output handed to WB-2 in memory) or as `python -m nuclear` subprocesses
+(isolation mode; NUCLEAR_SCHEDULE_MODE=subprocess or --mode subprocess).
+Per-stage wall times go to run_log metrics (<stage>_ms) in both modes, and each run is
+traced (a RUN span per run, a PHASE span per stage; `nuclear trace <run_id>`).
+
+Runs go through the resource arbiter (orchestration/arbiter.py): a run waits for its workload's
+budget (daily / weekly / backfill) and yields it at stage boundaries when a higher-priority
+workload needs it. schedule_runs records each run key (daily: date, weekly: ISO week), so
+run_catch_up() can replay what was missed while the box was down.
 
 Usage:
     from nuclear.orchestration.schedule import run_daily, run_weekly, get_taipei_today
 """
 
+import os
 import subprocess
 import sys
+import time
 import structlog
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Callable, Dict, Iterator, List, Optional
 from zoneinfo import ZoneInfo
 
 from nuclear.progress import log_run, update_checkpoint
+from nuclear.utils import tracing
 
 log = structlog.get_logger()
 
 # Asia/Taipei timezone
 TAIPEI_TZ = ZoneInfo("Asia/Taipei")
 
+MODE_INPROCESS = "inprocess"
+MODE_SUBPROCESS = "subprocess"
+
+DEFAULT_CATCHUP_MAX_DAYS = 7
+WEEKLY_START_HOUR = 7  # Monday 07:00 Asia/Taipei (deploy/nuclear-weekly.timer)
+
+
+def schedule_mode(mode: Optional[str] = None) -> str:
+    """Explicit mode, else NUCLEAR_SCHEDULE_MODE, else in-process."""
+    mode = (mode or os.environ.get("NUCLEAR_SCHEDULE_MODE") or MODE_INPROCESS).strip().lower()
+    if mode not in (MODE_INPROCESS, MODE_SUBPROCESS):
+        raise ValueError(f"Unknown schedule mode: {mode}")
+    return mode
+
+
+@contextmanager
+def _stage(timings: Dict[str, float], name: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        with tracing.span(name, kind=tracing.PHASE):
+            yield
+    finally:
+        timings[f"{name}_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+
+def _mark(ledger: str, run_key: str, status: str, run_id: str) -> None:
+    from nuclear.db.repos import ScheduleRunRepo
+    from nuclear.db.schema import create_tables
+
+    create_tables()
+    ScheduleRunRepo.mark(ledger, run_key, status, run_id)
+
+
+def _arbitrated(workload: str, ledger: str, run_key: str, run_id: str, run: Callable[..., int]) -> int:
+    """Run `run(slot)` holding `workload`'s resource budget; the outcome goes to schedule_runs."""
+    from nuclear.orchestration.arbiter import new_slot, wait_timeout
+
+    slot = new_slot(workload)
+    timeout = wait_timeout()
+    if not slot.acquire(timeout):
+        log.error("run_resource_timeout", workload=workload, run_id=run_id, timeout_sec=timeout)
+        log_run(
+            command=ledger,
+            status="failed",
+            run_id=run_id,
+            summary=f"{ledger} not started: {workload} budget not granted within {timeout}s",
+            errors=["Resource budget timeout"],
+            metrics={"arbiter": slot.metrics()},
+        )
+        return 1
+    _mark(ledger, run_key, "running", run_id)
+    rc = 1
+    try:
+        with tracing.span(ledger, kind=tracing.RUN, run_id=run_id, workload=workload, run_key=run_key) as sp:
+            rc = run(slot)
+            if sp is not None:
+                sp.set(rc=rc, arbiter_wait_ms=slot.wait_ms)
+    finally:
+        slot.release()
+        _mark(ledger, run_key, "success" if rc == 0 else "failed", run_id)
+    return rc
+
+
+def iso_week_key(date: str) -> str:
+    year, week, _ = datetime.strptime(date, "%Y-%m-%d").isocalendar()
+    return f"{year}-W{week:02d}"
+
 
 def get_taipei_today() -> str:
     """
@@ -49,15 +129,19 @@ def run_daily(
     tickers: Optional[str] = None,
     run_id: Optional[str] = None,
     dry_run: bool = False,
+    mode: Optional[str] = None,
+    workload: str = "daily",
 ) -> int:
     """
-    Run the Daily pipeline via subprocess.
+    Run the Daily pipeline (in-process, or via subprocess).
     
     Args:
         date: Date in YYYY-MM-DD format. Defaults to Asia/Taipei today.
         tickers: Optional comma-separated ticker list
         run_id: Optional run ID. Auto-generated if not provided.
         dry_run: If True, only print command without executing.
+        mode: "inprocess" | "subprocess" (default: schedule_mode())
+        workload: arbiter workload ("daily"; catch-up of past dates runs as "backfill")
     
     Returns:
         Exit code (0 = success)
@@ -77,17 +161,31 @@ def run_daily(
     if tickers:
         cmd.extend(["--tickers", tickers])
     
-    log.info("run_daily_start", date=date, run_id=run_id, cmd=" ".join(cmd))
+    mode = schedule_mode(mode)
+    log.info("run_daily_start", date=date, run_id=run_id, cmd=" ".join(cmd), mode=mode)
     
     if dry_run:
-        print(f"[DRY RUN] Would execute: {' '.join(cmd)}")
+        where = " in-process" if mode == MODE_INPROCESS else ""
+        print(f"[DRY RUN] Would execute{where}: {' '.join(cmd)}")
         return 0
-    
+
+    def run(slot) -> int:
+        if mode == MODE_INPROCESS:
+            return _run_daily_inprocess(date, tickers, run_id, slot)
+        return _run_daily_subprocess(cmd, date, run_id, slot)
+
+    return _arbitrated(workload, "daily", date, run_id, run)
+
+
+def _run_daily_subprocess(cmd: List[str], date: str, run_id: str, slot) -> int:
+    mode = MODE_SUBPROCESS
+    timings: Dict[str, float] = {}
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
+        with _stage(timings, "daily"):
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
         
         status = "success" if result.returncode == 0 else "failed"
-        log.info("run_daily_complete", status=status, returncode=result.returncode)
+        log.info("run_daily_complete", status=status, returncode=result.returncode, mode=mode, **timings)
         
         # Log to run_log
         log_run(
@@ -96,6 +194,7 @@ def run_daily(
             run_id=run_id,
             summary=f"Daily pipeline for {date}",
             errors=[result.stderr] if result.returncode != 0 else [],
+            metrics={"mode": mode, **timings, "arbiter": slot.metrics()},
         )
         
         return result.returncode
@@ -122,16 +221,49 @@ def run_daily(
         return 1
 
 
+def _run_daily_inprocess(date: str, tickers: Optional[str], run_id: str, slot) -> int:
+    from nuclear.phases.daily.run_daily import run_daily_pipeline
+
+    timings: Dict[str, float] = {}
+    try:
+        with _stage(timings, "daily"):
+            run_daily_pipeline(date=date, tickers=tickers.split(",") if tickers else None, run_id=run_id,
+                               boundary=slot.boundary)
+    except Exception as e:
+        log.error("run_daily_error", error=str(e), mode=MODE_INPROCESS)
+        log_run(
+            command="daily",
+            status="failed",
+            run_id=run_id,
+            summary=f"Daily pipeline error for {date}",
+            errors=[str(e)],
+            metrics={"mode": MODE_INPROCESS, **timings},
+        )
+        return 1
+
+    log.info("run_daily_complete", status="success", mode=MODE_INPROCESS, **timings)
+    log_run(
+        command="daily",
+        status="success",
+        run_id=run_id,
+        summary=f"Daily pipeline for {date}",
+        metrics={"mode": MODE_INPROCESS, **timings, "arbiter": slot.metrics()},
+    )
+    return 0
+
+
 def run_weekly(
     run_id: Optional[str] = None,
     dry_run: bool = False,
+    mode: Optional[str] = None,
 ) -> int:
     """
-    Run the Weekly pipeline (WB1 then WB2) via subprocess.
+    Run the Weekly pipeline (WB1 then WB2), in-process or via subprocess.
     
     Args:
         run_id: Optional run ID. Auto-generated if not provided.
         dry_run: If True, only print command without executing.
+        mode: "inprocess" | "subprocess" (default: schedule_mode())
     
     Returns:
         Exit code (0 = success)
@@ -141,7 +273,8 @@ def run_weekly(
     if run_id is None:
         run_id = f"weekly_{date}_{datetime.now(timezone.utc).strftime('%H%M%S')}"
     
-    log.info("run_weekly_start", date=date, run_id=run_id)
+    mode = schedule_mode(mode)
+    log.info("run_weekly_start", date=date, run_id=run_id, mode=mode)
     
     # WB1
     cmd_wb1 = [sys.executable, "-m", "nuclear", "wb1", "--run-id", run_id]
@@ -149,16 +282,29 @@ def run_weekly(
     cmd_wb2 = [sys.executable, "-m", "nuclear", "wb2", "--run-id", run_id]
     
     if dry_run:
-        print(f"[DRY RUN] Would execute: {' '.join(cmd_wb1)}")
-        print(f"[DRY RUN] Would execute: {' '.join(cmd_wb2)}")
+        where = " in-process" if mode == MODE_INPROCESS else ""
+        print(f"[DRY RUN] Would execute{where}: {' '.join(cmd_wb1)}")
+        print(f"[DRY RUN] Would execute{where}: {' '.join(cmd_wb2)}")
         return 0
-    
+
+    def run(slot) -> int:
+        if mode == MODE_INPROCESS:
+            return _run_weekly_inprocess(run_id, date, slot)
+        return _run_weekly_subprocess(cmd_wb1, cmd_wb2, run_id, date, slot)
+
+    return _arbitrated("weekly", "weekly", iso_week_key(date), run_id, run)
+
+
+def _run_weekly_subprocess(cmd_wb1: List[str], cmd_wb2: List[str], run_id: str, date: str, slot) -> int:
+    mode = MODE_SUBPROCESS
     errors = []
+    timings: Dict[str, float] = {}
     
     try:
         # Run WB1
         log.info("run_wb1_start", run_id=run_id)
-        result_wb1 = subprocess.run(cmd_wb1, capture_output=True, text=True, timeout=1800)
+        with _stage(timings, "wb1"):
+            result_wb1 = subprocess.run(cmd_wb1, capture_output=True, text=True, timeout=1800)
         
         if result_wb1.returncode != 0:
             log.error("run_wb1_failed", returncode=result_wb1.returncode)
@@ -169,20 +315,23 @@ def run_weekly(
                 run_id=run_id,
                 summary=f"Weekly pipeline failed at WB1",
                 errors=errors,
+                metrics={"mode": mode, **timings},
             )
             return result_wb1.returncode
         
         log.info("run_wb1_complete")
         
         # Run WB2
+        slot.boundary("wb2")
         log.info("run_wb2_start", run_id=run_id)
-        result_wb2 = subprocess.run(cmd_wb2, capture_output=True, text=True, timeout=1800)
+        with _stage(timings, "wb2"):
+            result_wb2 = subprocess.run(cmd_wb2, capture_output=True, text=True, timeout=1800)
         
         status = "success" if result_wb2.returncode == 0 else "failed"
         if result_wb2.returncode != 0:
             errors.append(f"WB2 failed: {result_wb2.stderr}")
         
-        log.info("run_weekly_complete", status=status)
+        log.info("run_weekly_complete", status=status, mode=mode, **timings)
         
         log_run(
             command="weekly",
@@ -190,6 +339,7 @@ def run_weekly(
             run_id=run_id,
             summary=f"Weekly pipeline for week of {date}",
             errors=errors if errors else [],
+            metrics={"mode": mode, **timings, "arbiter": slot.metrics()},
         )
         
         return result_wb2.returncode
@@ -216,6 +366,51 @@ def run_weekly(
         return 1
 
 
+def _run_weekly_inprocess(run_id: str, date: str, slot) -> int:
+    """WB-1 then WB-2 in this process; WB-2 gets WB-1's output in memory (the file is still written)."""
+    from nuclear.db.schema import create_tables
+    from nuclear.phases.weekly.wb1 import run_wb1_macro, write_wb1_output
+    from nuclear.phases.weekly.wb2 import run_wb2_and_persist
+
+    timings: Dict[str, float] = {}
+    stage = "WB1"
+    try:
+        create_tables()
+        log.info("run_wb1_start", run_id=run_id)
+        with _stage(timings, "wb1"):
+            wb1_out = run_wb1_macro({"run_id": run_id})
+            write_wb1_output(wb1_out)
+        log.info("run_wb1_complete")
+
+        stage = "WB2"
+        slot.boundary("wb2")
+        log.info("run_wb2_start", run_id=run_id)
+        with _stage(timings, "wb2"):
+            orders = run_wb2_and_persist(run_context={"run_id": run_id}, wb1_output=wb1_out)
+    except Exception as e:
+        log.error("run_weekly_error", step=stage, error=str(e), mode=MODE_INPROCESS)
+        log_run(
+            command="weekly",
+            status="failed",
+            run_id=run_id,
+            summary=f"Weekly pipeline failed at {stage}",
+            errors=[f"{stage} failed: {e}"],
+            metrics={"mode": MODE_INPROCESS, **timings},
+        )
+        return 1
+
+    log.info("run_weekly_complete", status="success", mode=MODE_INPROCESS, **timings)
+    log_run(
+        command="weekly",
+        status="success",
+        run_id=run_id,
+        summary=f"Weekly pipeline for week of {date}",
+        artifacts=["outputs/wb1_output.json", "outputs/wb2_orders.json"],
+        metrics={"mode": MODE_INPROCESS, "order_count": len(orders), **timings, "arbiter": slot.metrics()},
+    )
+    return 0
+
+
 def build_daily_command(date: Optional[str] = None) -> list[str]:
     """
     Build the daily command for external use (e.g., systemd ExecStart).
@@ -234,3 +429,55 @@ def build_daily_command(date: Optional[str] = None) -> list[str]:
 def build_weekly_command() -> list[str]:
     """Build the weekly wrapper command."""
     return ["python", "-m", "nuclear", "schedule", "weekly"]
+
+
+def missed_runs(now: Optional[datetime] = None, max_days: Optional[int] = None) -> Dict[str, List[str]]:
+    """
+    Scheduled runs that never succeeded since the last successful one:
+    daily dates up to yesterday (at most NUCLEAR_CATCHUP_MAX_DAYS), and this ISO week's weekly
+    run once Monday 07:00 Asia/Taipei has passed. Nothing is missed before the first success.
+    """
+    from nuclear.db.repos import ScheduleRunRepo
+    from nuclear.db.schema import create_tables
+
+    create_tables()
+    now = (now or get_taipei_now()).astimezone(TAIPEI_TZ)
+    max_days = max_days or int(os.environ.get("NUCLEAR_CATCHUP_MAX_DAYS", DEFAULT_CATCHUP_MAX_DAYS))
+    missed: Dict[str, List[str]] = {"daily": [], "weekly": []}
+
+    last_daily = ScheduleRunRepo.latest("daily")
+    if last_daily:
+        today = now.date()
+        start = max(datetime.strptime(last_daily["run_key"], "%Y-%m-%d").date() + timedelta(days=1),
+                    today - timedelta(days=max_days))
+        day = start
+        while day < today:
+            key = day.strftime("%Y-%m-%d")
+            if (ScheduleRunRepo.get("daily", key) or {}).get("status") != "success":
+                missed["daily"].append(key)
+            day += timedelta(days=1)
+
+    last_weekly = ScheduleRunRepo.latest("weekly")
+    week = iso_week_key(now.strftime("%Y-%m-%d"))
+    weekly_due = now.weekday() > 0 or now.hour >= WEEKLY_START_HOUR
+    if last_weekly and last_weekly["run_key"] < week and weekly_due:
+        missed["weekly"].append(week)
+    return missed
+
+
+def run_catch_up(dry_run: bool = False, mode: Optional[str] = None) -> int:
+    """Replay missed runs oldest first: past daily dates as "backfill" (lowest priority), then weekly."""
+    missed = missed_runs()
+    log.info("run_catch_up", daily=missed["daily"], weekly=missed["weekly"])
+    if dry_run:
+        for date in missed["daily"]:
+            print(f"[DRY RUN] Would catch up daily {date} (backfill priority)")
+        for week in missed["weekly"]:
+            print(f"[DRY RUN] Would catch up weekly {week}")
+        return 0
+    rc = 0
+    for date in missed["daily"]:
+        rc = max(rc, run_daily(date=date, run_id=f"catchup_daily_{date}", mode=mode, workload="backfill"))
+    for week in missed["weekly"]:
+        rc = max(rc, run_weekly(run_id=f"catchup_weekly_{week}", mode=mode))
+    return rc
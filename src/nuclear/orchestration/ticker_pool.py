@@ -0,0 +1,217 @@
+"""
+Per-ticker executor - fan a phase function out over a (large) ticker universe.
+
+    batch = map_tickers(fetch_one, tickers, date, pool=THREAD)                 # fn(ticker, date)
+    batch = map_tickers(score_one, {ticker: item, ...}, run_id, pool=PROCESS)  # fn(ticker, item, run_id)
+    batch.results   # {ticker: result} in input order, successful tickers only
+    batch.failed    # {ticker: "ExcType: message"} - one bad ticker never aborts the run
+
+Tickers are assigned to workers in chunks (one task per chunk, not per ticker) and every
+ticker runs inside its own try/except. Two pool types:
+  - THREAD  for I/O-bound work (LLM calls, data adapters): NUCLEAR_TICKER_THREAD_WORKERS;
+  - PROCESS for CPU-bound deterministic work: NUCLEAR_TICKER_PROCESS_WORKERS spawned
+    processes, each capped at NUCLEAR_TICKER_WORKER_MEMORY_MB of address space (RLIMIT_AS,
+    POSIX only). A process fn and its arguments must be picklable (module-level functions).
+A worker process that dies (OOM kill, segfault) breaks the pool: the tickers of the chunks it took
+down are re-run one at a time in a fresh pool, and only the ticker that kills a worker again is
+recorded as failed.
+Each ticker runs in its own TICKER span under the caller's span, in process workers too
+(trace=False for callers that span each ticker themselves, e.g. the run graph).
+"""
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import structlog
+
+from nuclear.utils import tracing
+
+log = structlog.get_logger()
+
+THREAD = "thread"
+PROCESS = "process"
+
+DEFAULT_THREAD_WORKERS = 16
+CHUNKS_PER_WORKER = 4  # auto chunk size: enough chunks per worker to even out slow tickers
+
+Chunk = List[Tuple[str, Any]]  # [(ticker, per-ticker item)]
+
+
+@dataclass
+class TickerOutcome:
+    ticker: str
+    result: Any = None
+    error: Optional[str] = None
+    duration_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class TickerBatch:
+    outcomes: List[TickerOutcome]  # input order
+    wall_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return all(o.ok for o in self.outcomes)
+
+    @property
+    def results(self) -> Dict[str, Any]:
+        return {o.ticker: o.result for o in self.outcomes if o.ok}
+
+    @property
+    def failed(self) -> Dict[str, str]:
+        return {o.ticker: o.error for o in self.outcomes if not o.ok}
+
+    def summary(self) -> Dict[str, Any]:
+        return {"tickers": len(self.outcomes), "failed": self.failed, "wall_ms": self.wall_ms}
+
+
+def default_workers(pool: str) -> int:
+    if pool == PROCESS:
+        return int(os.environ.get("NUCLEAR_TICKER_PROCESS_WORKERS", 0)) or os.cpu_count() or 1
+    return int(os.environ.get("NUCLEAR_TICKER_THREAD_WORKERS", DEFAULT_THREAD_WORKERS))
+
+
+def _chunk_size(n: int, workers: int, chunk_size: Optional[int]) -> int:
+    chunk_size = chunk_size or int(os.environ.get("NUCLEAR_TICKER_CHUNK_SIZE", 0))
+    return chunk_size or max(1, math.ceil(n / (workers * CHUNKS_PER_WORKER)))
+
+
+def _run_chunk(
+    fn: Callable[..., Any], chunk: Chunk, with_item: bool, args: tuple, kwargs: dict,
+    trace_ctx: Optional[tracing.SpanContext] = None, flush: bool = False, trace: bool = True,
+) -> List[TickerOutcome]:
+    outcomes = []
+    name = getattr(fn, "__name__", "ticker")
+    for ticker, item in chunk:
+        started = time.perf_counter()
+        try:
+            with tracing.attached(trace_ctx), \
+                    (tracing.span(name, kind=tracing.TICKER, ticker=ticker) if trace else nullcontext()):
+                result = fn(ticker, item, *args, **kwargs) if with_item else fn(ticker, *args, **kwargs)
+            outcomes.append(TickerOutcome(ticker, result=result))
+        except BaseException as e:  # MemoryError / RecursionError included: isolate the ticker
+            if isinstance(e, (KeyboardInterrupt, SystemExit)):
+                raise
+            log.warning("ticker_failed", ticker=ticker, error=f"{type(e).__name__}: {e}")
+            outcomes.append(TickerOutcome(ticker, error=f"{type(e).__name__}: {e}"))
+        outcomes[-1].duration_ms = round((time.perf_counter() - started) * 1000, 1)
+    if flush:  # a process worker's spans must be exported before the parent reads the trace
+        tracing.flush_spans(timeout=5)
+    return outcomes
+
+
+def _limit_memory(memory_limit_mb: int) -> None:
+    """Process pool initializer: cap this worker's address space."""
+    try:
+        import resource
+    except ImportError:  # not POSIX
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _executor(pool: str, workers: int, memory_limit_mb: int) -> Executor:
+    if pool == THREAD:
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ticker")
+    if pool != PROCESS:
+        raise ValueError(f"Unknown pool type: {pool} (expected {THREAD!r} or {PROCESS!r})")
+    ctx = multiprocessing.get_context(os.environ.get("NUCLEAR_TICKER_POOL_START_METHOD", "spawn"))
+    if memory_limit_mb:
+        return ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_limit_memory,
+                                   initargs=(memory_limit_mb,))
+    return ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+
+
+def _run_chunks(
+    pool: str, workers: int, memory_limit_mb: int, fn: Callable[..., Any], chunks: List[Chunk], with_item: bool,
+    args: tuple, kwargs: dict, trace: bool = True,
+) -> Tuple[List[TickerOutcome], List[Chunk]]:
+    """Outcomes of the chunks that completed, plus the chunks lost to a broken process pool."""
+    outcomes: List[TickerOutcome] = []
+    lost: List[Chunk] = []
+    with _executor(pool, workers, memory_limit_mb) as executor:
+        trace_ctx = tracing.capture()
+        futures = {executor.submit(_run_chunk, fn, chunk, with_item, args, kwargs, trace_ctx, pool == PROCESS,
+                                   trace): chunk
+                   for chunk in chunks}
+        for future in as_completed(futures):
+            try:
+                outcomes += future.result()
+            except BrokenProcessPool:
+                lost.append(futures[future])
+            except Exception as e:  # e.g. an unpicklable result: fail the whole chunk, keep going
+                outcomes += [TickerOutcome(t, error=f"{type(e).__name__}: {e}") for t, _ in futures[future]]
+    return outcomes, lost
+
+
+def _isolate(
+    pool: str, memory_limit_mb: int, fn: Callable[..., Any], pairs: Chunk, with_item: bool, args: tuple,
+    kwargs: dict, trace: bool = True,
+) -> List[TickerOutcome]:
+    """
+    Re-run tickers lost to a dead worker on a single-worker pool, one per task: tasks run in
+    submission order, so when the pool breaks again the first lost ticker is the one that killed it.
+    """
+    outcomes: List[TickerOutcome] = []
+    while pairs:
+        done, lost = _run_chunks(pool, 1, memory_limit_mb, fn, [[p] for p in pairs], with_item, args, kwargs, trace)
+        outcomes += done
+        lost_tickers = {t for chunk in lost for t, _ in chunk}
+        pairs = [p for p in pairs if p[0] in lost_tickers]
+        if pairs:
+            outcomes.append(TickerOutcome(pairs[0][0], error="BrokenProcessPool: worker process died"))
+            pairs = pairs[1:]
+    return outcomes
+
+
+def map_tickers(
+    fn: Callable[..., Any],
+    tickers: Union[Sequence[str], Mapping[str, Any]],
+    *args: Any,
+    pool: str = THREAD,
+    max_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    memory_limit_mb: Optional[int] = None,
+    trace: bool = True,
+    **kwargs: Any,
+) -> TickerBatch:
+    """
+    fn(ticker, *args, **kwargs) for every ticker - or fn(ticker, item, *args, **kwargs) when
+    `tickers` is a {ticker: item} mapping of per-ticker inputs. Outcomes come back in input order.
+    """
+    started = time.perf_counter()
+    with_item = isinstance(tickers, Mapping)
+    pairs: Chunk = list(tickers.items()) if with_item else [(t, None) for t in dict.fromkeys(tickers)]
+    if not pairs:
+        return TickerBatch([])
+    workers = max(1, min(max_workers or default_workers(pool), len(pairs)))
+    size = _chunk_size(len(pairs), workers, chunk_size)
+    if memory_limit_mb is None:
+        memory_limit_mb = int(os.environ.get("NUCLEAR_TICKER_WORKER_MEMORY_MB", 0))
+    chunks = [pairs[i:i + size] for i in range(0, len(pairs), size)]
+
+    outcomes, lost = _run_chunks(pool, workers, memory_limit_mb, fn, chunks, with_item, args, kwargs, trace)
+    if lost:
+        retry = [pair for chunk in lost for pair in chunk]
+        log.warning("ticker_pool_broken", retrying=len(retry))
+        outcomes += _isolate(pool, memory_limit_mb, fn, retry, with_item, args, kwargs, trace)
+
+    by_ticker = {o.ticker: o for o in outcomes}
+    batch = TickerBatch([by_ticker[t] for t, _ in pairs], wall_ms=round((time.perf_counter() - started) * 1000, 1))
+    log.info("ticker_pool_done", fn=getattr(fn, "__name__", str(fn)), pool=pool, workers=workers, chunk_size=size,
+             tickers=len(pairs), failed=len(batch.failed), wall_ms=batch.wall_ms)
+    return batch
@@ -1,11 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from nuclear.phases.daily.adapters.http_client import PooledFetcher
 
 class ForumAdapter(ABC):
     @abstractmethod
     def fetch(self, date: str) -> List[Dict[str, Any]]:
         pass
 
+class AsyncForumAdapter(ABC):
+    """Async ForumAdapter; see AsyncNewsAdapter."""
+
+    @abstractmethod
+    async def fetch(self, date: str, http: "PooledFetcher") -> List[Dict[str, Any]]:
+        pass
+
 class StubForumAdapter(ForumAdapter):
     def fetch(self, date: str) -> List[Dict[str, Any]]:
         # Returns tiny list of items from authorized forum domains
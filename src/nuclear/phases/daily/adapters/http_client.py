@@ -0,0 +1,175 @@
+"""
+Pooled async HTTP for D-1 ingestion: one httpx.AsyncClient shared by every async adapter.
+
+    async with PooledFetcher() as http:
+        result = await http.get("https://www.reuters.com/markets/rss")
+
+- connection pool capped at NUCLEAR_D1_MAX_CONNECTIONS (default 20)
+- per domain: at most NUCLEAR_D1_DOMAIN_CONCURRENCY requests in flight (default 2) and request
+  starts spaced NUCLEAR_D1_POLITENESS_MS apart (default 500)
+- every request bounded by NUCLEAR_D1_HTTP_TIMEOUT_SEC end to end (default 10)
+- conditional GETs: the ETag / Last-Modified of the last 200 are kept in the http_cache table and
+  sent back as If-None-Match / If-Modified-Since; a 304 returns the cached body
+
+A failed fetch (timeout, connection error, non-2xx) is returned as FetchResult.error rather than
+raised, so one slow or broken source cannot fail D-1.
+"""
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import structlog
+
+log = structlog.get_logger()
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_DOMAIN_CONCURRENCY = 2
+DEFAULT_POLITENESS_MS = 500
+DEFAULT_TIMEOUT_SEC = 10.0
+USER_AGENT = "nuclear-d1/1.0"
+
+
+@dataclass
+class FetchResult:
+    url: str
+    domain: str
+    status: Optional[int] = None
+    text: Optional[str] = None
+    not_modified: bool = False  # 304: text is the cached body
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def domain_of(url: str) -> str:
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class _DomainGate:
+    """Concurrency limit plus a minimum spacing between request starts for one domain."""
+
+    def __init__(self, concurrency: int, delay_sec: float):
+        self._slots = asyncio.Semaphore(concurrency)
+        self._lock = asyncio.Lock()
+        self._delay = delay_sec
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self._slots.acquire()
+        async with self._lock:
+            wait = self._next_start - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_start = time.monotonic() + self._delay
+
+    async def __aexit__(self, *exc):
+        self._slots.release()
+
+
+class PooledFetcher:
+    """Shared client for async adapters; see the module docstring. `transport` is for tests."""
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        domain_concurrency: Optional[int] = None,
+        politeness_ms: Optional[float] = None,
+        timeout_sec: Optional[float] = None,
+        use_cache: bool = True,
+        transport: Any = None,
+    ):
+        env = os.environ.get
+        self.max_connections = max_connections or int(env("NUCLEAR_D1_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS))
+        self.domain_concurrency = domain_concurrency or int(env("NUCLEAR_D1_DOMAIN_CONCURRENCY",
+                                                                DEFAULT_DOMAIN_CONCURRENCY))
+        self.politeness_ms = politeness_ms if politeness_ms is not None else float(
+            env("NUCLEAR_D1_POLITENESS_MS", DEFAULT_POLITENESS_MS))
+        self.timeout_sec = timeout_sec or float(env("NUCLEAR_D1_HTTP_TIMEOUT_SEC", DEFAULT_TIMEOUT_SEC))
+        self.use_cache = use_cache
+        self._transport = transport
+        self._client = None
+        self._gates: Dict[str, _DomainGate] = {}
+        self._stats = {"requests": 0, "not_modified": 0, "errors": 0}
+
+    async def __aenter__(self) -> "PooledFetcher":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    def _http(self):
+        if self._client is None:
+            import httpx
+
+            if self.use_cache:
+                from nuclear.db.schema import create_tables
+
+                create_tables()
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections),
+                timeout=httpx.Timeout(self.timeout_sec),
+                headers={"User-Agent": USER_AGENT},
+                follow_redirects=True,
+                transport=self._transport,
+            )
+        return self._client
+
+    def _gate(self, domain: str) -> _DomainGate:
+        if domain not in self._gates:
+            self._gates[domain] = _DomainGate(self.domain_concurrency, self.politeness_ms / 1000)
+        return self._gates[domain]
+
+    async def get(self, url: str) -> FetchResult:
+        from nuclear.db.repos import HttpCacheRepo
+
+        client = self._http()
+        domain = domain_of(url)
+        cached = await asyncio.to_thread(HttpCacheRepo.get, url) if self.use_cache else None
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        async with self._gate(domain):
+            started = time.perf_counter()
+            self._stats["requests"] += 1
+            try:
+                # httpx bounds each connect / read; wait_for bounds the whole request (slow trickles)
+                resp = await asyncio.wait_for(client.get(url, headers=headers), self.timeout_sec)
+            except Exception as e:
+                error = (f"Timeout: no response in {self.timeout_sec:g}s" if isinstance(e, asyncio.TimeoutError)
+                         else f"{type(e).__name__}: {e}")
+                self._stats["errors"] += 1
+                log.warning("d1_fetch_failed", url=url, error=error)
+                return FetchResult(url, domain, error=error, elapsed_ms=round((time.perf_counter() - started) * 1000, 1))
+            elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        if resp.status_code == 304 and cached:
+            self._stats["not_modified"] += 1
+            return FetchResult(url, domain, 304, cached["body"], not_modified=True, elapsed_ms=elapsed_ms)
+        if not resp.is_success:
+            self._stats["errors"] += 1
+            log.warning("d1_fetch_failed", url=url, status=resp.status_code)
+            return FetchResult(url, domain, resp.status_code, error=f"HTTP {resp.status_code}", elapsed_ms=elapsed_ms)
+
+        etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+        if self.use_cache and (etag or last_modified):
+            await asyncio.to_thread(HttpCacheRepo.put, url, etag, last_modified, resp.text)
+        return FetchResult(url, domain, resp.status_code, resp.text, elapsed_ms=elapsed_ms)
@@ -1,11 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from nuclear.phases.daily.adapters.http_client import PooledFetcher
 
 class NewsAdapter(ABC):
     @abstractmethod
     def fetch(self, date: str) -> List[Dict[str, Any]]:
         pass
 
+class AsyncNewsAdapter(ABC):
+    """Async variant for HTTP-backed sources; `http` is the shared PooledFetcher (adapters/http_client.py)."""
+
+    @abstractmethod
+    async def fetch(self, date: str, http: "PooledFetcher") -> List[Dict[str, Any]]:
+        pass
+
 class StubNewsAdapter(NewsAdapter):
     def fetch(self, date: str) -> List[Dict[str, Any]]:
         # Returns tiny list of items from allowed whitelist domains
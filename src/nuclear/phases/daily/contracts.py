@@ -20,6 +20,10 @@ class D1Output(BaseModel):
         default_factory=lambda: {"news_per_source_cap": 50, "total_forum_cap": 300},
         description="Caps and filters applied during ingestion."
     )
+    ingestion: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Per-source wall time, item counts and HTTP fetch stats."
+    )
 
 class D2Output(BaseModel):
     model_config = ConfigDict(extra="forbid")
@@ -38,6 +42,22 @@ class D3Output(BaseModel):
     per_ticker_stub_index: List[str]
     derivatives_stub: Dict[str, Any] = Field(default_factory=dict)
     signals: Dict[str, Any] = Field(default_factory=dict)
+    shard_timings_ms: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Wall time per shard index (sharded runs only)."
+    )
+
+class D3ShardOutput(BaseModel):
+    """One D-3 shard's partial result; merge_d3_shards assembles D3Output from all of them."""
+    model_config = ConfigDict(extra="forbid")
+
+    date: str = Field(pattern=r"^\d{4}-\d{2}-\d{2}$")
+    shard_index: int
+    shards: int
+    tickers: List[str]
+    derivatives_stub: Dict[str, Any] = Field(default_factory=dict)
+    failed_tickers: Dict[str, str] = Field(default_factory=dict)
+    duration_ms: float = 0.0
 
 class D4Output(BaseModel):
     model_config = ConfigDict(extra="forbid")
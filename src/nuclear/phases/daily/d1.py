@@ -1,53 +1,143 @@
-from typing import Any, Dict, List
+import asyncio
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Set, Union
+
+import structlog
+
 from nuclear.phases.daily.contracts import D1Output
 from nuclear.phases.daily.whitelist_loader import load_d1a_news_domains, load_d1b_forum_domains
-from nuclear.phases.daily.adapters.news_adapter import NewsAdapter, StubNewsAdapter
-from nuclear.phases.daily.adapters.forum_adapter import ForumAdapter, StubForumAdapter
+from nuclear.phases.daily.adapters.news_adapter import AsyncNewsAdapter, NewsAdapter, StubNewsAdapter
+from nuclear.phases.daily.adapters.forum_adapter import AsyncForumAdapter, ForumAdapter, StubForumAdapter
+
+log = structlog.get_logger()
+
+NEWS_PER_SOURCE_CAP = 50
+TOTAL_FORUM_CAP = 300
+
+AnyNewsAdapter = Union[NewsAdapter, AsyncNewsAdapter]
+AnyForumAdapter = Union[ForumAdapter, AsyncForumAdapter]
+
 
-def run_d1(date: str, news_adapter: NewsAdapter = None, forum_adapter: ForumAdapter = None) -> D1Output:
+def run_d1(
+    date: str,
+    news_adapter: AnyNewsAdapter = None,
+    forum_adapter: AnyForumAdapter = None,
+    fetcher=None,
+) -> D1Output:
     """
     D-1: News + Forum ingestion.
     Enforces whitelist and caps.
+    Sources are fetched concurrently (see run_d1_async); call from synchronous code only.
     """
-    news_adapter = news_adapter or StubNewsAdapter()
-    forum_adapter = forum_adapter or StubForumAdapter()
-    
+    return asyncio.run(run_d1_async(date, news_adapter, forum_adapter, fetcher))
+
+
+async def run_d1_async(
+    date: str,
+    news_adapter: AnyNewsAdapter = None,
+    forum_adapter: AnyForumAdapter = None,
+    fetcher=None,
+) -> D1Output:
+    """
+    News and forum sources are fetched at the same time, so ingestion takes as long as the
+    slowest source. Async adapters share one PooledFetcher (pooled connections, per-domain
+    limits, conditional GETs, timeouts - adapters/http_client.py); sync adapters run on a
+    worker thread. Without explicit adapters, NUCLEAR_D1_NEWS_FEEDS / NUCLEAR_D1_FORUM_FEEDS
+    (inline JSON {domain: [feed urls]}, or the path of a file holding it) select FeedAdapter,
+    otherwise the stubs are used.
+    """
+    news_adapter = news_adapter or _feeds_from_env("NUCLEAR_D1_NEWS_FEEDS") or StubNewsAdapter()
+    forum_adapter = forum_adapter or _feeds_from_env("NUCLEAR_D1_FORUM_FEEDS") or StubForumAdapter()
+
     # 1. Load whitelists
     news_domains = load_d1a_news_domains()
     forum_domains = load_d1b_forum_domains()
-    
-    # 2. Fetch raw items
-    raw_news = news_adapter.fetch(date)
-    raw_forums = forum_adapter.fetch(date)
-    
-    # 3. Filter & Cap News
+
+    # 2. Fetch raw items (concurrently)
+    started = time.perf_counter()
+    owns_fetcher = fetcher is None
+    if owns_fetcher and _needs_http(news_adapter, forum_adapter):
+        from nuclear.phases.daily.adapters.http_client import PooledFetcher
+
+        fetcher = PooledFetcher()
+    try:
+        (raw_news, news_ms), (raw_forums, forum_ms) = await asyncio.gather(
+            _timed(news_adapter, date, fetcher), _timed(forum_adapter, date, fetcher)
+        )
+    finally:
+        if owns_fetcher and fetcher is not None:
+            await fetcher.aclose()
+
+    # 3. Filter & Cap News / 4. Filter & Cap Forums
+    news_items = filter_news(raw_news, news_domains)
+    forum_items = filter_forums(raw_forums, forum_domains)
+
+    ingestion: Dict[str, Any] = {
+        "wall_ms": round((time.perf_counter() - started) * 1000, 1),
+        "news": {"ms": news_ms, "raw": len(raw_news), "kept": len(news_items)},
+        "forum": {"ms": forum_ms, "raw": len(raw_forums), "kept": len(forum_items)},
+    }
+    if fetcher is not None:
+        ingestion["http"] = fetcher.stats()
+    log.info("d1_ingested", date=date, **ingestion)
+
+    return D1Output(
+        date=date,
+        news_items=news_items,
+        forum_items=forum_items,
+        signals={"risk_on_shift": False},
+        whitelist_used={
+            "news_whitelist_doc": "docs/d1a_news_whitelist.md",
+            "forum_whitelist_doc": "docs/d1b_forum_whitelist.md"
+        },
+        ingestion=ingestion,
+    )
+
+
+def filter_news(raw_news: List[Dict[str, Any]], news_domains: Set[str]) -> List[Dict[str, Any]]:
+    """Whitelisted domains only, at most NEWS_PER_SOURCE_CAP items per domain."""
     news_items = []
     source_counts: Dict[str, int] = {}
     for item in raw_news:
         domain = item.get("source_domain")
         if domain in news_domains:
             count = source_counts.get(domain, 0)
-            if count < 50:
+            if count < NEWS_PER_SOURCE_CAP:
                 news_items.append(item)
                 source_counts[domain] = count + 1
-                
-    # 4. Filter & Cap Forums
+    return news_items
+
+
+def filter_forums(raw_forums: List[Dict[str, Any]], forum_domains: Set[str]) -> List[Dict[str, Any]]:
+    """Whitelisted domains only, at most TOTAL_FORUM_CAP items overall."""
     forum_items = []
-    total_forums = 0
     for item in raw_forums:
-        domain = item.get("source_domain")
-        if domain in forum_domains:
-            if total_forums < 300:
-                forum_items.append(item)
-                total_forums += 1
-                
-    return D1Output(
-        date=date,
-        news_items=news_items,
-        forum_items=forum_items,
-        signals={"risk_on_shift": False},
-        whitelist_used={
-            "news_whitelist_doc": "docs/d1a_news_whitelist.md",
-            "forum_whitelist_doc": "docs/d1b_forum_whitelist.md"
-        }
-    )
+        if item.get("source_domain") in forum_domains and len(forum_items) < TOTAL_FORUM_CAP:
+            forum_items.append(item)
+    return forum_items
+
+
+def _needs_http(*adapters) -> bool:
+    return any(isinstance(a, (AsyncNewsAdapter, AsyncForumAdapter)) for a in adapters)
+
+
+async def _timed(adapter, date: str, fetcher) -> tuple:
+    started = time.perf_counter()
+    if isinstance(adapter, (AsyncNewsAdapter, AsyncForumAdapter)):
+        items = await adapter.fetch(date, fetcher)
+    else:
+        items = await asyncio.to_thread(adapter.fetch, date)
+    return items, round((time.perf_counter() - started) * 1000, 1)
+
+
+def _feeds_from_env(var: str) -> Optional[AsyncNewsAdapter]:
+    value = (os.environ.get(var) or "").strip()
+    if not value:
+        return None
+    from nuclear.phases.daily.adapters.feed_adapter import FeedAdapter
+
+    if value.startswith("{"):
+        return FeedAdapter(json.loads(value))
+    return FeedAdapter.from_file(value)
@@ -1,27 +1,213 @@
-from typing import List
-from nuclear.phases.daily.contracts import D3Output
+"""
+D-3 sharding (M07): tickers are assigned to shards by rendezvous (highest-random-weight)
+hashing - deterministic across processes and hosts, and growing from N to N+1 shards moves
+only ~1/(N+1) of the tickers. Each shard fetches its tickers, writes a partial snapshot
+(daily/d3_shard_<i>of<N>) when a run_id is given, and merge_d3_shards assembles D3Output
+with per-shard timings.
+
+    run_d3(date, tickers, shards=4)                       # all shards, one worker process each
+    run_d3_shard(date, tickers, shards=4, shard_index=2)  # one shard (`nuclear daily --shard-index 2`)
+    merge_d3_shards(date, tickers, load_d3_shards(run_id, 4))
+
+NUCLEAR_D3_SHARD_POOL=thread runs the shards on threads instead (adapters that cannot be pickled).
+
+Within a shard the adapter is called once per chunk of NUCLEAR_D3_FETCH_CHUNK tickers (default
+50), chunks in parallel; when a chunk's fetch raises, its tickers are fetched one at a time so
+only the bad ticker ends up in signals["failed_tickers"].
+"""
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+from nuclear.orchestration.ticker_pool import PROCESS, THREAD, map_tickers
+from nuclear.phases.daily.contracts import D3Output, D3ShardOutput
 from nuclear.phases.daily.adapters.d3_ticker_adapter import TickerDerivativeAdapter, StubTickerDerivativeAdapter
 
-def run_d3(date: str, tickers: List[str] = None, shards: int = 1, adapter: TickerDerivativeAdapter = None) -> D3Output:
+log = structlog.get_logger()
+
+DEFAULT_FETCH_CHUNK = 50
+
+
+def shard_of(ticker: str, shards: int) -> int:
+    """Rendezvous hash: the shard with the highest hash(shard, ticker) owns the ticker."""
+    return max(range(shards), key=lambda i: hashlib.blake2b(f"{i}:{ticker}".encode(), digest_size=8).digest())
+
+
+def assign_shards(tickers: Sequence[str], shards: int) -> List[List[str]]:
+    """Tickers per shard index, each in input order."""
+    if shards < 1:
+        raise ValueError(f"shards must be >= 1, got {shards}")
+    out: List[List[str]] = [[] for _ in range(shards)]
+    for t in dict.fromkeys(tickers):
+        out[shard_of(t, shards)].append(t)
+    return out
+
+
+def d3_shard_phase(shard_index: int, shards: int) -> str:
+    return f"daily/d3_shard_{shard_index}of{shards}"
+
+
+def run_d3(
+    date: str,
+    tickers: List[str] = None,
+    shards: int = 1,
+    adapter: TickerDerivativeAdapter = None,
+    pool: str = THREAD,
+    max_workers: Optional[int] = None,
+    run_id: Optional[str] = None,
+) -> D3Output:
     """
     D-3: Per-ticker specialist.
-    Supports sharding.
+    Tickers are fetched on the per-ticker executor (orchestration/ticker_pool); a ticker whose
+    fetch fails is listed in signals["failed_tickers"] instead of failing D-3.
+    With shards > 1 every shard runs in its own worker process (see module notes) and the
+    partial results are merged; `pool` / `max_workers` then apply within each shard.
     """
     adapter = adapter or StubTickerDerivativeAdapter()
     tickers = tickers or ["AAPL", "MSFT", "NVDA"]
-    universe_size = len(tickers)
-    
-    # Simulate sharding (M07 requirement)
-    # If shards > 1, we normally split the workload. 
-    # For skeleton, we just record the shard count and the tickers processed.
-    
-    derivatives = adapter.fetch(date, tickers)
-    
+    if shards <= 1:
+        shard = run_d3_shard(date, tickers, 1, 0, adapter=adapter, pool=pool, max_workers=max_workers)
+        return merge_d3_shards(date, tickers, [shard])
+
+    from nuclear.db.sqlite import SQLiteEngine
+    from nuclear.storage.backends.local_fs import LocalFSBackend
+
+    shard_pool = os.environ.get("NUCLEAR_D3_SHARD_POOL", PROCESS)
+    storage = (str(SQLiteEngine.DB_PATH), str(LocalFSBackend.ROOT_DIR))
+    batch = map_tickers(
+        _run_shard_worker, {str(i): i for i in range(shards)}, date, tickers, shards, adapter, pool, max_workers,
+        run_id, storage, pool=shard_pool, max_workers=shards, chunk_size=1,
+    )
+    out = merge_d3_shards(date, tickers, list(batch.results.values()), shards=shards)
+    if batch.failed:
+        out.signals["failed_shards"] = batch.failed
+        for index, error in batch.failed.items():
+            for t in assign_shards(tickers, shards)[int(index)]:
+                out.signals.setdefault("failed_tickers", {})[t] = f"shard {index}: {error}"
+    return out
+
+
+def run_d3_shard(
+    date: str,
+    tickers: List[str],
+    shards: int,
+    shard_index: int,
+    adapter: TickerDerivativeAdapter = None,
+    pool: str = THREAD,
+    max_workers: Optional[int] = None,
+    run_id: Optional[str] = None,
+) -> D3ShardOutput:
+    """Fetch the tickers assigned to `shard_index`; with a run_id the partial result is snapshotted."""
+    if not 0 <= shard_index < shards:
+        raise ValueError(f"shard_index {shard_index} out of range for {shards} shards")
+    adapter = adapter or StubTickerDerivativeAdapter()
+    started = time.perf_counter()
+    mine = assign_shards(tickers, shards)[shard_index]
+    derivatives, failed = _fetch_chunked(date, mine, adapter, pool, max_workers)
+    out = D3ShardOutput(
+        date=date,
+        shard_index=shard_index,
+        shards=shards,
+        tickers=mine,
+        derivatives_stub=derivatives,
+        failed_tickers=failed,
+        duration_ms=round((time.perf_counter() - started) * 1000, 1),
+    )
+    if run_id is not None and shards > 1:
+        from nuclear.storage.snapshot import SnapshotWriter
+
+        SnapshotWriter().save(phase=d3_shard_phase(shard_index, shards), payload=out.model_dump(), run_id=run_id)
+    log.info("d3_shard_done", date=date, shard=f"{shard_index}/{shards}", tickers=len(mine),
+             failed=len(out.failed_tickers), duration_ms=out.duration_ms)
+    return out
+
+
+def merge_d3_shards(
+    date: str, tickers: List[str], parts: List[D3ShardOutput], shards: Optional[int] = None
+) -> D3Output:
+    """Assemble D3Output (tickers in universe order) from shard partials; absent shards are listed."""
+    shards = shards or (parts[0].shards if parts else 1)
+    derivatives: Dict[str, Any] = {}
+    failed: Dict[str, str] = {}
+    for part in parts:
+        derivatives.update(part.derivatives_stub)
+        failed.update(part.failed_tickers)
+    signals: Dict[str, Any] = {"high_iv_tickers": []}
+    if failed:
+        signals["failed_tickers"] = {t: failed[t] for t in tickers if t in failed}
+    missing = sorted(set(range(shards)) - {p.shard_index for p in parts})
+    if missing:
+        signals["missing_shards"] = missing
+
     return D3Output(
         date=date,
-        universe_size=universe_size,
+        universe_size=len(tickers),
         shards=shards,
         per_ticker_stub_index=tickers,
-        derivatives_stub=derivatives,
-        signals={"high_iv_tickers": []}
+        derivatives_stub={t: derivatives[t] for t in tickers if t in derivatives},
+        signals=signals,
+        shard_timings_ms={str(p.shard_index): p.duration_ms for p in sorted(parts, key=lambda p: p.shard_index)}
+        if shards > 1 else {},
     )
+
+
+def load_d3_shards(run_id: str, shards: int) -> List[D3ShardOutput]:
+    """Partial snapshots written by run_d3_shard (possibly on other nodes) for this run."""
+    from nuclear.db.repos import SnapshotRepo
+    from nuclear.db.schema import create_tables
+    from nuclear.storage.snapshot import load_snapshot
+
+    create_tables()
+    parts = []
+    for i in range(shards):
+        row = SnapshotRepo.latest_for_run(run_id, d3_shard_phase(i, shards))
+        if row is not None:
+            parts.append(D3ShardOutput.model_validate(load_snapshot(row["snapshot_id"])))
+    return parts
+
+
+def _run_shard_worker(
+    key: str, shard_index: int, date: str, tickers: List[str], shards: int, adapter: TickerDerivativeAdapter,
+    pool: str, max_workers: Optional[int], run_id: Optional[str], storage: tuple,
+) -> D3ShardOutput:
+    """Shard entry point in a worker process: point it at the parent's DB / snapshot root first."""
+    from nuclear.db.sqlite import SQLiteEngine
+    from nuclear.storage.backends.local_fs import LocalFSBackend
+
+    SQLiteEngine.DB_PATH, LocalFSBackend.ROOT_DIR = Path(storage[0]), Path(storage[1])
+    return run_d3_shard(date, tickers, shards, shard_index, adapter=adapter, pool=pool, max_workers=max_workers,
+                        run_id=run_id)
+
+
+def _fetch_chunked(
+    date: str, tickers: List[str], adapter: TickerDerivativeAdapter, pool: str, max_workers: Optional[int]
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """(derivatives, failed) in input order: one fetch per chunk, per-ticker retry for failed chunks."""
+    size = max(1, int(os.environ.get("NUCLEAR_D3_FETCH_CHUNK", DEFAULT_FETCH_CHUNK)))
+    chunks = {str(i): tickers[i:i + size] for i in range(0, len(tickers), size)}
+    batch = map_tickers(_fetch_chunk, chunks, date, adapter, pool=pool, max_workers=max_workers, chunk_size=1)
+    fetched: Dict[str, Any] = {}
+    for part in batch.results.values():
+        fetched.update(part)
+    failed: Dict[str, str] = {}
+    retry = [t for key in batch.failed for t in chunks[key]]
+    if retry:
+        log.warning("d3_chunk_fetch_failed", chunks=len(batch.failed), retrying=len(retry))
+        single = map_tickers(_fetch_ticker, retry, date, adapter, pool=pool, max_workers=max_workers)
+        fetched.update(single.results)
+        failed = single.failed
+    return ({t: fetched[t] for t in tickers if fetched.get(t) is not None},
+            {t: failed[t] for t in tickers if t in failed})
+
+
+def _fetch_chunk(key: str, chunk: List[str], date: str, adapter: TickerDerivativeAdapter) -> Dict[str, Any]:
+    fetched = adapter.fetch(date, chunk)
+    return {t: fetched.get(t) for t in chunk}
+
+
+def _fetch_ticker(ticker: str, date: str, adapter: TickerDerivativeAdapter) -> Any:
+    return adapter.fetch(date, [ticker]).get(ticker)
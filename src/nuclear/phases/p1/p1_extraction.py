@@ -1,11 +1,26 @@
 
-from typing import Dict, List, Optional
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Dict, List, Optional, Tuple
 import structlog
-from nuclear.phases.p1.p1_schemas import P1FinancialReportExtraction, EvidenceItem
+from nuclear.db.repos import ExtractionChunkRepo
+from nuclear.llm.prompt_cache import prefix_hash
+from nuclear.llm.structured import parse_structured
+from nuclear.llm.telemetry import record_parse
+from nuclear.m0.core import get_m0
+from nuclear.m0.job import M0Request
+from nuclear.phases.p1.p1_schemas import P1FinancialReportExtraction, EvidenceItem, P1ExtractionChunkResponse
 from nuclear.phases.p1.p1_extraction_prompts import build_extraction_prompt
+from nuclear.phases.p1.p1_extraction_chunks import (
+    EVIDENCE_FIELDS, PHASE, DocChunk, chunk_budget, document_hash, merge_evidence, split_document
+)
 
 log = structlog.get_logger()
 
+DEFAULT_SOURCE_DOCUMENT = "Annual Report"
+
 def run_extraction(ticker: str, market: str, run_id: str = "default") -> P1FinancialReportExtraction:
     """
     SSOT §5.3: P1-1.5 Financial Report Extraction pipeline.
@@ -26,15 +41,19 @@ def run_extraction(ticker: str, market: str, run_id: str = "default") -> P1Finan
             p2_5_institutional_evidence=[]
         )
 
-    # 2. Extract with Gemini Flash 3.0 (Stub)
-    raw_extraction = _stub_gemini_flash_extraction(ticker, market)
+    # 2. Extract with Gemini Flash: per-chunk, concurrently, merged + deduplicated
+    raw_extraction, failed_chunks = extract_document(ticker, market, doc_text, run_id)
+    if raw_extraction is None:
+        log.warning("Extraction JSON invalid for every chunk, using stub", ticker=ticker)
+        raw_extraction = _stub_gemini_flash_extraction(ticker, market)
     
     # 3. Validation & Assembly
     p1_ev = [EvidenceItem(**i) for i in raw_extraction["p1_industry_evidence"]]
     p2_ev = [EvidenceItem(**i) for i in raw_extraction["p2_financial_evidence"]]
     p25_ev = [EvidenceItem(**i) for i in raw_extraction["p2_5_institutional_evidence"]]
     
-    status = "EXTRACTED" if (p1_ev or p2_ev or p25_ev) else "INCOMPLETE_EXTRACTION"
+    # a lost chunk is evidence P1-2 / P2 / P2.5 never see: the extraction is not complete
+    status = "EXTRACTED" if (p1_ev or p2_ev or p25_ev) and not failed_chunks else "INCOMPLETE_EXTRACTION"
     
     # SSOT §5.3.5 Routing logic (Informational Comment)
     # ✅ P1-2 (Tiering) reads -> p1_industry_evidence
@@ -46,12 +65,119 @@ def run_extraction(ticker: str, market: str, run_id: str = "default") -> P1Finan
         extraction_status=status,
         p1_industry_evidence=p1_ev,
         p2_financial_evidence=p2_ev,
-        p2_5_institutional_evidence=p25_ev
+        p2_5_institutional_evidence=p25_ev,
+        failed_chunks=failed_chunks
     )
     
-    log.info("Extraction completed", ticker=ticker, status=status)
+    log.info("Extraction completed", ticker=ticker, status=status, failed_chunks=failed_chunks)
     return res
 
+def _cache_enabled() -> bool:
+    return os.environ.get("NUCLEAR_EXTRACTION_CACHE", "1") != "0"
+
+def _chunk_cache_key(ticker: str, market: str, model: str, system_prompt: str, chunk: DocChunk) -> str:
+    """Same chunk text + location, prompt and model -> same extraction."""
+    parts = [ticker, market, model, prefix_hash(system_prompt), chunk.content_hash, chunk.label]
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+def _with_chunk_defaults(data: Dict, chunk: DocChunk, source_document: str) -> Dict[str, List[Dict]]:
+    out = {}
+    for f in EVIDENCE_FIELDS:
+        out[f] = [{
+            "content": item["content"],
+            "page_number": item.get("page_number") if item.get("page_number") is not None else chunk.page_start,
+            "source_document": item.get("source_document") or source_document,
+            "section": item.get("section") or chunk.section or "n/a",
+        } for item in data.get(f) or []]
+    return out
+
+def extract_document(
+    ticker: str,
+    market: str,
+    doc_text: str,
+    run_id: str = "default",
+    source_document: str = DEFAULT_SOURCE_DOCUMENT,
+) -> Tuple[Optional[Dict[str, List[Dict]]], int]:
+    """
+    Split the filing into context-sized chunks, extract all uncached chunks concurrently
+    through M0 (P1-1.5 pool), then merge and deduplicate the three evidence lists.
+    Chunk results are cached by (chunk text/location, prompt, model), so re-running a ticker
+    on an unchanged filing makes no LLM calls.
+    Returns (merged evidence, number of chunks that failed or stayed invalid JSON); the
+    evidence is None if no chunk produced valid JSON. Failed chunks are not cached.
+    """
+    system_prompt = build_extraction_prompt(ticker, market, "")["system"]
+    chunks = split_document(doc_text, chunk_budget(system_prompt))
+    doc_hash = document_hash(doc_text)
+    m0 = get_m0()
+    model = m0.default_model(PHASE)
+    keys = [_chunk_cache_key(ticker, market, model, system_prompt, c) for c in chunks]
+    cached = _cache_get(keys)
+
+    schema = P1ExtractionChunkResponse.model_json_schema()
+    pending = {}
+    for chunk, key in zip(chunks, keys):
+        if key in cached:
+            continue
+        prompts = build_extraction_prompt(ticker, market, chunk.text, chunk.label)
+        request = M0Request(phase=PHASE, system_prompt=prompts["system"], user_prompt=prompts["user"],
+                            run_id=run_id, ticker=ticker, response_schema=schema)
+        pending[chunk.index] = (prompts, m0.submit_async(request))
+    log.info("Extraction chunks", ticker=ticker, doc_hash=doc_hash[:12], chunks=len(chunks),
+             cached=len(chunks) - len(pending))
+
+    results = []
+    failed = 0
+    for chunk, key in zip(chunks, keys):
+        if key in cached:
+            results.append(json.loads(cached[key]))
+            continue
+        prompts, future = pending[chunk.index]
+
+        def _repair(user_prompt: str, repair_schema: Dict, prompts=prompts) -> str:
+            return m0.submit(M0Request(phase=PHASE, system_prompt=prompts["system"], user_prompt=user_prompt,
+                                       run_id=run_id, ticker=ticker, response_schema=repair_schema)).text
+
+        try:
+            res = future.result()
+        except Exception as e:
+            log.warning("Extraction chunk failed", ticker=ticker, chunk=chunk.index, error=str(e))
+            failed += 1
+            continue
+        parsed = parse_structured(res.text, P1ExtractionChunkResponse, repair_call=_repair, prompt=prompts["user"])
+        record_parse(res.metadata.get("llm_call_id"), parsed.ok)
+        if not parsed.ok:
+            log.warning("Extraction chunk JSON invalid after repair", ticker=ticker, chunk=chunk.index,
+                        failing_fields=parsed.failing_fields)
+            failed += 1
+            continue
+        data = _with_chunk_defaults(parsed.data, chunk, source_document)
+        results.append(data)
+        _cache_put(key, doc_hash, chunk.index, ticker, data)
+
+    if failed:
+        log.warning("Extraction incomplete", ticker=ticker, failed_chunks=failed, chunks=len(chunks))
+    if not results:
+        return None, failed
+    return merge_evidence(results), failed
+
+def _cache_get(keys: List[str]) -> Dict[str, str]:
+    if not _cache_enabled():
+        return {}
+    try:
+        return ExtractionChunkRepo.get_many(keys)
+    except sqlite3.Error as e:
+        log.warning("Extraction cache unavailable", error=str(e))
+        return {}
+
+def _cache_put(key: str, doc_hash: str, chunk_index: int, ticker: str, data: Dict) -> None:
+    if not _cache_enabled():
+        return
+    try:
+        ExtractionChunkRepo.put(key, doc_hash, chunk_index, ticker, json.dumps(data, ensure_ascii=False))
+    except sqlite3.Error as e:
+        log.warning("Extraction cache write failed", error=str(e))
+
 def _stub_fetch_report(ticker: str, market: str) -> Optional[str]:
     """Stub for SEC/Drive fetching."""
     return "Sample report text for " + ticker
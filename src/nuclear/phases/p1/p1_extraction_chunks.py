@@ -0,0 +1,202 @@
+"""
+SSOT §5.3: P1-1.5 long-filing support - split a report into context-sized chunks and
+merge the per-chunk three-field evidence back together.
+
+Pages are separated by form feeds (pdftotext output); section headings (10-K "PART II",
+"Item 7. ...", markdown "#") start a new chunk once the current one is half full, so
+chunks follow the filing structure. Consecutive chunks share `overlap_tokens` of trailing
+paragraphs so evidence cut at a boundary is seen whole at least once; merge_evidence()
+removes the resulting duplicates.
+"""
+import hashlib
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from nuclear.prompts.compaction import estimate_tokens, payload_budget
+
+PHASE = "P1-1.5"
+EVIDENCE_FIELDS = ("p1_industry_evidence", "p2_financial_evidence", "p2_5_institutional_evidence")
+DEFAULT_CHUNK_TOKENS = 24_000  # well under Flash's window: smaller chunks extract more faithfully and in parallel
+DEFAULT_OVERLAP_TOKENS = 400
+PAGE_BREAK = "\f"
+SECTION_RE = re.compile(r"^(?:#{1,3}\s+\S.*|PART\s+[IVX]+\b.*|ITEM\s+\d+[A-C]?\b.*)$", re.IGNORECASE)
+MAX_HEADING_CHARS = 120
+
+
+@dataclass
+class DocChunk:
+    index: int
+    text: str
+    page_start: Optional[int]
+    page_end: Optional[int]
+    section: Optional[str]
+    tokens: int
+
+    @property
+    def content_hash(self) -> str:
+        return hashlib.sha256(self.text.encode("utf-8")).hexdigest()
+
+    @property
+    def label(self) -> str:
+        pages = f"pages {self.page_start}-{self.page_end}" if self.page_start != self.page_end else f"page {self.page_start}"
+        return f"{pages}, section: {self.section or 'n/a'}"
+
+
+def document_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def chunk_budget(fixed_text: str = "") -> int:
+    """
+    Tokens per chunk: the P1-1.5 route's prompt budget (context - max output - fixed prompt),
+    capped by NUCLEAR_EXTRACTION_CHUNK_TOKENS.
+    """
+    cap = int(os.environ.get("NUCLEAR_EXTRACTION_CHUNK_TOKENS", DEFAULT_CHUNK_TOKENS))
+    budget = payload_budget(PHASE, fixed_text)
+    return max(1, min(cap, budget) if budget is not None else cap)
+
+
+def _is_heading(line: str) -> bool:
+    line = line.strip()
+    return 0 < len(line) <= MAX_HEADING_CHARS and bool(SECTION_RE.match(line))
+
+
+def _units(text: str) -> List[Tuple[str, int, Optional[str], bool]]:
+    """(paragraph, page, section, starts_section) in document order."""
+    out = []
+    section: Optional[str] = None
+    for page_no, page in enumerate(text.split(PAGE_BREAK), start=1):
+        for para in re.split(r"\n\s*\n", page):
+            para = para.strip()
+            if not para:
+                continue
+            first = para.splitlines()[0]
+            starts = _is_heading(first)
+            if starts:
+                section = first.strip().lstrip("#").strip()
+            out.append((para, page_no, section, starts))
+    return out
+
+
+def _split_oversized(para: str, max_tokens: int) -> List[str]:
+    """Hard-split a paragraph larger than a chunk, preferring line then sentence boundaries."""
+    pieces: List[str] = []
+    current = ""
+    for part in re.split(r"(?<=[\n.!?。！？])", para):
+        if current and estimate_tokens(current + part) > max_tokens:
+            pieces.append(current)
+            current = ""
+        while estimate_tokens(part) > max_tokens:
+            # no boundary at all: cut by characters (1 char >= 1/4 token)
+            cut = max(1, max_tokens)
+            pieces.append(part[:cut])
+            part = part[cut:]
+        current += part
+    if current:
+        pieces.append(current)
+    return [p.strip() for p in pieces if p.strip()]
+
+
+def split_document(
+    text: str,
+    max_tokens: Optional[int] = None,
+    overlap_tokens: Optional[int] = None,
+) -> List[DocChunk]:
+    """Split by page and section into chunks of <= max_tokens with trailing-paragraph overlap."""
+    max_tokens = max_tokens or chunk_budget()
+    if overlap_tokens is None:
+        overlap_tokens = int(os.environ.get("NUCLEAR_EXTRACTION_OVERLAP_TOKENS", DEFAULT_OVERLAP_TOKENS))
+    overlap_tokens = min(overlap_tokens, max_tokens // 4)
+
+    units = []
+    for para, page, section, starts in _units(text):
+        pieces = _split_oversized(para, max_tokens) if estimate_tokens(para) > max_tokens else [para]
+        for i, piece in enumerate(pieces):
+            units.append((piece, page, section, starts and i == 0, estimate_tokens(piece)))
+
+    chunks: List[DocChunk] = []
+    current: List[tuple] = []
+    size = 0
+    fresh = 0  # units in `current` not carried over as overlap
+    for unit in units:
+        starts_section, tokens = unit[3], unit[4]
+        if fresh and (size + tokens > max_tokens or (starts_section and size >= max_tokens // 2)):
+            chunks.append(_make_chunk(len(chunks), current))
+            # no overlap across a section break: the new section starts clean
+            current = [] if starts_section else _tail(current, overlap_tokens)
+            size = sum(u[4] for u in current)
+            fresh = 0
+            while current and size + tokens > max_tokens:
+                size -= current.pop(0)[4]
+        current.append(unit)
+        size += tokens
+        fresh += 1
+    if fresh:
+        chunks.append(_make_chunk(len(chunks), current))
+    return chunks
+
+
+def _tail(units: List[tuple], overlap_tokens: int) -> List[tuple]:
+    tail: List[tuple] = []
+    size = 0
+    for u in reversed(units):
+        if size + u[4] > overlap_tokens:
+            break
+        tail.insert(0, u)
+        size += u[4]
+    return tail
+
+
+def _make_chunk(index: int, units: List[tuple]) -> DocChunk:
+    parts: List[str] = []
+    last_page = None
+    for text, page, _, _, _ in units:
+        if page != last_page:
+            parts.append(f"[Page {page}]")
+            last_page = page
+        parts.append(text)
+    body = "\n\n".join(parts)
+    return DocChunk(
+        index=index,
+        text=body,
+        page_start=units[0][1] if units else None,
+        page_end=units[-1][1] if units else None,
+        section=units[0][2] if units else None,
+        tokens=estimate_tokens(body),
+    )
+
+
+def _norm(content: str) -> str:
+    return re.sub(r"\s+", " ", content).strip().casefold()
+
+
+def merge_evidence(chunk_results: Iterable[Dict[str, List[Dict[str, Any]]]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Concatenate per-chunk evidence in chunk order and drop duplicates per field: identical
+    text (whitespace / case-insensitive) and fragments contained in a longer item, which is
+    what overlapping chunks produce. The longer, more complete quote wins.
+    """
+    merged: Dict[str, List[Dict[str, Any]]] = {f: [] for f in EVIDENCE_FIELDS}
+    keys: Dict[str, List[str]] = {f: [] for f in EVIDENCE_FIELDS}
+    for result in chunk_results:
+        for f in EVIDENCE_FIELDS:
+            for item in result.get(f) or []:
+                key = _norm(item.get("content") or "")
+                if not key:
+                    continue
+                kept = keys[f]
+                if any(key in k for k in kept):
+                    continue
+                shorter = [i for i, k in enumerate(kept) if k in key]
+                if shorter:
+                    merged[f][shorter[0]] = item
+                    kept[shorter[0]] = key
+                    for i in reversed(shorter[1:]):
+                        del merged[f][i]
+                        del kept[i]
+                    continue
+                merged[f].append(item)
+                kept.append(key)
+    return merged
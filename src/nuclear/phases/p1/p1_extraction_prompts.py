@@ -1,11 +1,12 @@
 
-from typing import Dict
+from typing import Dict, Optional
 from nuclear.prompts.base import PromptBuilder
 
-def build_extraction_prompt(ticker: str, market: str, document_text: str) -> Dict:
+def build_extraction_prompt(ticker: str, market: str, document_text: str, chunk_label: Optional[str] = None) -> Dict:
     """
     SSOT §5.3: P1-1.5 Financial Report Extraction Prompt.
     Role: Emotionless OCR machine.
+    document_text is one context-sized chunk (p1_extraction_chunks); chunk_label locates it in the filing.
     """
     
     role = """
@@ -42,10 +43,11 @@ def build_extraction_prompt(ticker: str, market: str, document_text: str) -> Dic
 
     system_prompt = "\n".join([role, three_fields])
     
+    location = f"（本段為財報節選：{chunk_label}；[Page N] 標記為頁碼）" if chunk_label else ""
     user_prompt = f"""
-請針對 {ticker} ({market}) 的財報文本執行提取任務：
+請針對 {ticker} ({market}) 的財報文本執行提取任務{location}：
 
-{document_text[:10000]}  # 限制長度示範
+{document_text}
 
 請以 JSON 格式輸出指定的三個欄位。
 """
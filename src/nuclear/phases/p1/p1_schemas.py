@@ -132,6 +132,42 @@ class P1Step1Output(BaseModel):
     market_distribution: Dict[str, int]  # {"US": int, "TW": int, "JP": int}
     low_confidence_candidates: List[str]  # 低信心候選的 ticker 列表
 
+class P1Step1Response(BaseModel):
+    """Raw LLM answer for P1 Step 1 (validated before company-level filtering)."""
+    companies: List[Dict]
+    market_distribution: Dict[str, int] = {}
+    low_confidence_candidates: List[str] = []
+
+class P1Step2AnalystResponse(BaseModel):
+    """Raw LLM answer for one P1 Step 2 company; ticker/market/chain fields come from Step 1."""
+    tier: str
+    tier_reasoning: str
+    eng_fit: EngFitResult
+    struct_fit: StructFitResult
+    time_role_fit: TimeRoleFitResult
+    moat_types: List[str]
+    moat_primary: str
+    rerate_state: str
+    frontier_eligible: bool = False
+
+    @validator("tier")
+    def validate_tier(cls, v):
+        if v not in VALID_TIERS:
+            raise ValueError(f"Invalid tier: {v}")
+        return v
+
+    @validator("moat_primary")
+    def validate_moat_primary(cls, v):
+        if v not in VALID_MOAT_TYPES:
+            raise ValueError(f"Invalid primary moat type: {v}")
+        return v
+
+    @validator("rerate_state")
+    def validate_rerate_state(cls, v):
+        if v not in VALID_RERATE_STATES:
+            raise ValueError(f"Invalid rerate state: {v}")
+        return v
+
 class P1Step2Output(ConstitutionalOutput):
     """
     SSOT §5.6: P1 Final Output.
@@ -150,9 +186,23 @@ class EvidenceItem(BaseModel):
     source_document: str  # 例如 "10-K 2024"
     section: str  # 例如 "Business Description"
 
+class ExtractedEvidence(BaseModel):
+    """Evidence as returned for one chunk; missing page / section / source default to the chunk's."""
+    content: str
+    page_number: Optional[int] = None
+    source_document: Optional[str] = None
+    section: Optional[str] = None
+
+class P1ExtractionChunkResponse(BaseModel):
+    """SSOT §5.3: three-field extraction of one report chunk (LLM response contract)."""
+    p1_industry_evidence: List[ExtractedEvidence]
+    p2_financial_evidence: List[ExtractedEvidence]
+    p2_5_institutional_evidence: List[ExtractedEvidence]
+
 class P1FinancialReportExtraction(BaseModel):
     ticker: str
-    extraction_status: str  # "PENDING" | "EXTRACTED" | "FAILED"
+    extraction_status: str  # "PENDING" | "EXTRACTED" | "INCOMPLETE_EXTRACTION" | "FAILED"
     p1_industry_evidence: List[EvidenceItem]  # → P1-2 Tiering
     p2_financial_evidence: List[EvidenceItem]  # → P2-1 / P2-2
     p2_5_institutional_evidence: List[EvidenceItem]  # → P2.5
+    failed_chunks: int = 0  # chunks lost to LLM errors / invalid JSON
@@ -1,9 +1,11 @@
-from typing import Dict, List
-import structlog
 import json
+from typing import Dict, List, Optional
+import structlog
 from nuclear.m0.core import get_m0
 from nuclear.m0.job import M0Request
-from nuclear.phases.p1.p1_schemas import P1Step1Output, P1Step1Company
+from nuclear.llm.structured import extract_json, parse_structured
+from nuclear.llm.telemetry import record_parse
+from nuclear.phases.p1.p1_schemas import P1Step1Output, P1Step1Company, P1Step1Response
 from nuclear.phases.p1.p1_step1_prompts import build_p1_step1_prompt
 from nuclear.phases.p0.p0_schemas import P0Output
 from nuclear.phases.p0.p05_schemas import P05Output
@@ -37,15 +39,30 @@ def run_p1_step1(
         phase="P1-1",
         system_prompt=prompts["system"],
         user_prompt=prompts["user"],
-        run_id=run_id
+        run_id=run_id,
+        response_schema=P1Step1Response.model_json_schema()
     )
-    # §2.6: P1-1 is a dual-analyst phase
-    audited_res = m0.submit_with_audit(request)
-    
-    try:
-        raw_output = json.loads(audited_res.final_conclusion)
-    except Exception as e:
-        log.warning("P1 Step 1 JSON parse failed, using stub", error=str(e))
+    # §2.6: P1-1 is a dual-analyst phase; agreeing analysts skip the audit escalation
+    audited_res = m0.submit_with_audit(request, agreement=_company_overlap, merge=_merge_company_outputs)
+    log.info("P1 Step 1 analysts done", agreement=audited_res.agreement, escalated=audited_res.escalated,
+             leg_latency_ms=audited_res.leg_latency_ms)
+
+    def _repair(user_prompt: str, schema: Dict) -> str:
+        return m0.submit(M0Request(
+            phase="P1-1",
+            system_prompt=prompts["system"],
+            user_prompt=user_prompt,
+            run_id=run_id,
+            response_schema=schema
+        )).text
+
+    parsed = parse_structured(audited_res.final_conclusion, P1Step1Response, repair_call=_repair, prompt=prompts["user"])
+    for analyst in audited_res.analysts:
+        record_parse(analyst.metadata.get("llm_call_id"), parsed.ok)
+    if parsed.ok:
+        raw_output = parsed.data
+    else:
+        log.warning("P1 Step 1 JSON invalid after repair, using stub", failing_fields=parsed.failing_fields)
         raw_output = _stub_dual_analyst_p1_step1()
     
     # 3. Parsing and Schema Validation
@@ -67,6 +84,72 @@ def run_p1_step1(
     log.info("P1 Step 1 completed", total_companies=p1_s1_out.total_count)
     return p1_s1_out
 
+def _companies(text: str) -> Optional[List[Dict]]:
+    try:
+        data, _ = extract_json(text)
+    except Exception:
+        return None
+    companies = data.get("companies") if isinstance(data, dict) else None
+    if not isinstance(companies, list):
+        return None
+    return [c for c in companies if isinstance(c, dict) and str(c.get("ticker") or "").strip()]
+
+def _ticker(company: Dict) -> str:
+    return str(company["ticker"]).strip().upper()
+
+def _company_overlap(texts: List[str]) -> float:
+    """Jaccard overlap of the analysts' ticker sets (0.0 if any answer is unparseable)."""
+    sets = []
+    for text in texts:
+        companies = _companies(text)
+        if companies is None:
+            return 0.0
+        sets.append({_ticker(c) for c in companies})
+    union = set().union(*sets)
+    if not union:
+        return 1.0
+    return len(set.intersection(*sets)) / len(union)
+
+def _merge_company_outputs(texts: List[str]) -> str:
+    """
+    Deterministic §5.2 fusion: primary-leg order, then tickers only the other leg found.
+    Shared tickers keep the higher-confidence entry (ties -> earlier leg);
+    tickers named by only one analyst are also listed as low-confidence candidates.
+    """
+    parsed = [(text, _companies(text)) for text in texts]
+    legs = [companies for _, companies in parsed if companies is not None]
+    if not legs:
+        return texts[0]
+    merged: Dict[str, Dict] = {}
+    seen_in: Dict[str, int] = {}
+    for companies in legs:
+        for c in companies:
+            key = _ticker(c)
+            seen_in[key] = seen_in.get(key, 0) + 1
+            current = merged.get(key)
+            if current is None or float(c.get("confidence") or 0) > float(current.get("confidence") or 0):
+                merged[key] = {**c, "ticker": key}
+    companies = list(merged.values())
+
+    low_confidence: List[str] = []
+    for text, legs_companies in parsed:
+        if legs_companies is None:
+            continue
+        data, _ = extract_json(text)
+        low_confidence.extend(str(t) for t in data.get("low_confidence_candidates") or [])
+    if len(legs) > 1:
+        low_confidence.extend(k for k in merged if seen_in[k] < len(legs))
+
+    distribution: Dict[str, int] = {}
+    for c in companies:
+        market = str(c.get("market") or "")
+        distribution[market] = distribution.get(market, 0) + 1
+    return json.dumps({
+        "companies": companies,
+        "market_distribution": distribution,
+        "low_confidence_candidates": list(dict.fromkeys(low_confidence)),
+    }, ensure_ascii=False)
+
 def _stub_dual_analyst_p1_step1() -> Dict:
     return {
         "companies": [
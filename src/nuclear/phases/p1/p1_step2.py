@@ -1,12 +1,14 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime, timezone
 import structlog
-import json
 from nuclear.m0.core import get_m0
 from nuclear.m0.job import M0Request
+from nuclear.llm.batch import BatchEngine
+from nuclear.llm.structured import parse_structured
+from nuclear.llm.telemetry import record_parse
 
 from nuclear.phases.p1.p1_schemas import (
-    P1Step1Output, P1Step2Output, P1CompanyEntry, 
+    P1Step1Output, P1Step2Output, P1CompanyEntry, P1Step2AnalystResponse,
     P1FinancialReportExtraction, FrontierChecks,
     VALID_MOAT_TYPES, VALID_RERATE_STATES, VALID_TIERS
 )
@@ -39,37 +41,57 @@ def run_p1_step2(
     p07_output: P07Output,
     extractions: Dict[str, P1FinancialReportExtraction],
     run_id: str = "default",
-    version_chain_id: str = "default"
+    version_chain_id: str = "default",
+    batch_engine: Optional[BatchEngine] = None
 ) -> P1Step2Output:
     log.info("Starting P1 Step 2", run_id=run_id)
     
     final_companies = []
     p0_card = p0_output.industry_logic_cards[0].model_dump() if p0_output.industry_logic_cards else {}
 
+    prompts_by_ticker = {}
     for s1_comp in step1_output.companies:
-        log.info("Tiering company", ticker=s1_comp.ticker)
-        
         extraction = extractions.get(s1_comp.ticker)
-        prompts = build_p1_step2_analyst_prompt(
+        prompts_by_ticker[s1_comp.ticker] = build_p1_step2_analyst_prompt(
             s1_comp.model_dump(),
             p0_card,
             p05_output.model_dump(),
             p07_output.model_dump(),
             extraction.model_dump() if extraction else {}
         )
-        
-        m0 = get_m0()
-        request = M0Request(
-            phase="P1-2",
-            system_prompt=prompts["system"],
-            user_prompt=prompts["user"],
-            run_id=run_id
-        )
-        res = m0.submit(request)
-        
-        try:
-            raw_ai_res = json.loads(res.text)
-        except:
+
+    # V8.17 Batch API: one batch for all tickers instead of N sequential calls
+    batch_texts = _run_p1_step2_batch(batch_engine, prompts_by_ticker, run_id) if batch_engine else {}
+
+    for s1_comp in step1_output.companies:
+        log.info("Tiering company", ticker=s1_comp.ticker)
+        prompts = prompts_by_ticker[s1_comp.ticker]
+
+        def _submit(user_prompt: str, schema: Dict):
+            return get_m0().submit(M0Request(
+                phase="P1-2",
+                system_prompt=prompts["system"],
+                user_prompt=user_prompt,
+                run_id=run_id,
+                response_schema=schema
+            ))
+
+        def _call(user_prompt: str, schema: Dict) -> str:
+            return _submit(user_prompt, schema).text
+
+        call_id = None
+        text = batch_texts.get(s1_comp.ticker)
+        if text is None:
+            res = _submit(prompts["user"], P1Step2AnalystResponse.model_json_schema())
+            text, call_id = res.text, res.metadata.get("llm_call_id")
+
+        parsed = parse_structured(text, P1Step2AnalystResponse, repair_call=_call, prompt=prompts["user"])
+        record_parse(call_id, parsed.ok)
+        if parsed.ok:
+            raw_ai_res = parsed.data
+        else:
+            log.warning("P1 Step 2 JSON invalid after repair, using stub",
+                        ticker=s1_comp.ticker, failing_fields=parsed.failing_fields)
             raw_ai_res = _stub_hermes_p1_step2(s1_comp.ticker)
         
         frontier = check_frontier_eligibility(raw_ai_res, s1_comp.market)
@@ -111,6 +133,28 @@ def run_p1_step2(
         failure_modes=[{"description": "Geopolitical risk", "probability": "MEDIUM"}]
     )
 
+def _run_p1_step2_batch(engine: BatchEngine, prompts_by_ticker: Dict[str, Dict], run_id: str) -> Dict[str, str]:
+    """Submit all P1-2 prompts as one batch. Tickers that fail are left out (sync fallback)."""
+    model = engine.model_for("P1-2")
+    if model is None:
+        log.info("P1 Step 2 batch skipped: batch provider cannot serve the routed model", run_id=run_id)
+        return {}
+    collector = engine.collect("P1-2", model=model, run_id=run_id)
+    for ticker, prompts in prompts_by_ticker.items():
+        collector.add(ticker, prompts["system"], prompts["user"])
+    try:
+        futures = engine.run(collector)
+    except Exception as e:
+        log.warning("P1 Step 2 batch failed, falling back to sync", run_id=run_id, error=str(e))
+        return {}
+    texts = {}
+    for ticker, fut in futures.items():
+        if fut.exception() is None:
+            texts[ticker] = fut.result()["text"]
+        else:
+            log.warning("P1 Step 2 batch item failed", ticker=ticker, error=str(fut.exception()))
+    return texts
+
 def _stub_hermes_p1_step2(ticker: str) -> Dict:
     return {
         "tier": "S" if ticker in ["NVDA", "TSMC", "2330.TW"] else "A",
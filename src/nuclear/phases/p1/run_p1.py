@@ -1,5 +1,6 @@
 
 import structlog
+from nuclear.llm.batch import get_batch_engine
 from nuclear.phases.p1.p1_schemas import P1Step2Output
 from nuclear.phases.p1.p1_step1 import run_p1_step1
 from nuclear.phases.p1.p1_extraction import run_extraction
@@ -39,7 +40,8 @@ def run_p1(
         p07_output, 
         extractions, 
         run_id, 
-        version_chain_id
+        version_chain_id,
+        batch_engine=get_batch_engine("P1-2")
     )
     
     log.info("Full P1 pipeline completed", total_count=p1_output.total_count)
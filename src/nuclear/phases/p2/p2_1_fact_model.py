@@ -1,5 +1,5 @@
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import structlog
 from datetime import datetime, timezone
 from nuclear.phases.p2.p2_schemas import P21FactModel, PeerGroup, PeerEntry, OperatingLeverageInflection
@@ -15,10 +15,13 @@ def run_p2_1(
     p0_logic_card: Dict[str, Any], 
     p1_extraction: Dict[str, Any], 
     run_id: str = "default", 
-    version_chain_id: str = "default"
+    version_chain_id: str = "default",
+    financial_data: Optional[Dict[str, Any]] = None
 ) -> P21FactModel:
     """
     SSOT §6.2: P2-1 Fact Modeling (Facts only, no causation).
+    financial_data: pre-fetched fetch_financial_data(ticker) (the run graph fetches it once
+    for the memo key); None = fetch here.
     """
     log.info("Starting P2-1 Fact Modeling", ticker=ticker)
 
@@ -27,7 +30,8 @@ def run_p2_1(
     log.info("Filtering forbidden metrics", ticker=ticker, forbidden=forbidden)
 
     # 2. Fetch Data (Stub)
-    financial_data = _stub_fetch_financial_data(ticker)
+    if financial_data is None:
+        financial_data = fetch_financial_data(ticker)
     
     # 3. Deterministic Calculations (Task 3.2 - Calculators)
     risk_res = compute_risk_profile(financial_data)
@@ -69,6 +73,10 @@ def run_p2_1(
     log.info("P2-1 Fact Modeling completed", ticker=ticker, risk=fact_model.risk_profile)
     return fact_model
 
+def fetch_financial_data(ticker: str) -> Dict[str, Any]:
+    """P2-1 financial data source."""
+    return _stub_fetch_financial_data(ticker)
+
 def _stub_fetch_financial_data(ticker: str) -> Dict[str, Any]:
     """Stub for financial data fetching."""
     return {
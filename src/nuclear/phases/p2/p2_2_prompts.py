@@ -1,8 +1,24 @@
 
+import json
 from typing import Dict
 from nuclear.prompts.base import PromptBuilder
+from nuclear.prompts.compaction import compact_json, render_payload
 from nuclear.prompts.skills_injector import SkillsInjector
 
+# Compaction priorities (lower = kept longer; 0 = never truncated).
+# Fact model and logic card are the analysis anchors; evidence / peer lists shrink first.
+P22_PRIORITIES = {
+    "p21_fact_model": 0,
+    "p0_logic_card": 0,
+    "p1_extraction_evidence": 60,
+    "peers": 70,
+    "peer_comparison": 70,
+}
+
+
+def _section(data) -> str:
+    return compact_json(data) if isinstance(data, (dict, list)) else str(data)
+
 def build_p22_analyst_prompt(
     ticker: str, 
     p21_fact_model: Dict, 
@@ -126,21 +142,40 @@ G) Mispricing Map（市場定價 vs 基本面路徑）
         cfo_chairman_kill, 
         analysis_modules, 
         output_format, 
-        handoff_context, 
         skills
     ])
+    # system_prompt is the static P2-2 prefix (prompt-cacheable); per-ticker context goes below
+
+    payload = {
+        "p21_fact_model": p21_fact_model,
+        "p0_logic_card": p0_logic_card,
+        "p1_extraction_evidence": p1_extraction.get('p2_financial_evidence', []),
+    }
+    _, compaction = render_payload(
+        payload, phase="P2-2", fixed_text=system_prompt, priorities=P22_PRIORITIES
+    )
+    if compaction is not None:
+        # pruned-away (empty) sections fall back to the original value
+        sections = {
+            k: "(omitted for length)" if k in compaction.dropped else _section(compaction.data.get(k, v))
+            for k, v in payload.items()
+        }
+        if compaction.truncated:
+            sections["p1_extraction_evidence"] += f"\n(items omitted for length: {compact_json(compaction.truncated)})"
+    else:
+        sections = {k: json.dumps(v, indent=2, ensure_ascii=False, default=str) for k, v in payload.items()}
 
     user_prompt = f"""
 請針對 {ticker} 執行 P2-2 因果推演分析。
-
+{handoff_context}
 [P2-1 FACT MODEL]
-{p21_fact_model}
+{sections["p21_fact_model"]}
 
 [P0 LOGIC CARD]
-{p0_logic_card}
+{sections["p0_logic_card"]}
 
 [P1 EXTRACTION EVIDENCE]
-{p1_extraction.get('p2_financial_evidence', [])}
+{sections["p1_extraction_evidence"]}
 
 請以 JSON 格式輸出指定的所有欄位。
 """
@@ -148,7 +183,8 @@ G) Mispricing Map（市場定價 vs 基本面路徑）
 
     return {
         "system": system_prompt,
-        "user": user_prompt
+        "user": user_prompt,
+        "compaction": compaction.as_dict() if compaction else None
     }
 
 def build_p22_scout_prompt(causal_results: Dict) -> Dict:
@@ -1,6 +1,6 @@
 
 import structlog
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from nuclear.phases.p2.p2_schemas import Phase2Output
 from nuclear.phases.p2.p2_1_fact_model import run_p2_1
 from nuclear.phases.p2.p2_2_causal import run_p2_2
@@ -15,7 +15,8 @@ def run_p2(
     p1_company: Dict[str, Any], 
     p1_extraction: Dict[str, Any], 
     run_id: str = "default", 
-    version_chain_id: str = "default"
+    version_chain_id: str = "default",
+    financial_data: Optional[Dict[str, Any]] = None
 ) -> Phase2Output:
     """
     SSOT §6: P2 Fundamental Financial Analysis (The Fundamental Core) Entry Point.
@@ -33,7 +34,8 @@ def run_p2(
         p0_logic_card, 
         p1_extraction, 
         run_id, 
-        version_chain_id
+        version_chain_id,
+        financial_data=financial_data
     )
     
     # 3. Phase 2-2: Causal 推論
@@ -1,9 +1,8 @@
 import structlog
 from datetime import datetime, timezone
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from nuclear.phases.p25.p25_schemas import P25Output, ICDZRange, compute_icdz_confidence
 from nuclear.phases.p25.p25_prompts import build_p25_analyst_prompt
-from nuclear.risk.freeze_state import set_freeze # Assuming this exists or will be stubbed
 
 log = structlog.get_logger()
 
@@ -11,17 +10,18 @@ def run_p25(
     ticker: str,
     p2_output: Dict[str, Any],
     run_id: str = "default",
-    version_chain_id: str = "default"
+    version_chain_id: str = "default",
+    smart_money_data: Optional[Tuple[Dict, Dict]] = None
 ) -> P25Output:
     """
     SSOT §7.5: P2.5 Institutional Smart Money Analysis.
     The "Lie Detector" phase.
+    smart_money_data: pre-fetched fetch_smart_money_data(ticker); None = fetch here.
     """
     log.info("Starting P2.5 Smart Money Analysis", ticker=ticker)
 
     # 1. Fetch Data (Stubs as per instructions)
-    daily_data = _stub_fetch_daily_smart_money(ticker)
-    quarterly_13f = _stub_fetch_13f_data(ticker)
+    daily_data, quarterly_13f = smart_money_data or fetch_smart_money_data(ticker)
     institutional_evidence = p2_output.get("institutional_evidence", []) # From P1-1.5
 
     # 2. Prompt Construction
@@ -78,6 +78,10 @@ def run_p25(
     log.info("P2.5 completed", ticker=ticker, sm_direction=p25_res.smart_money_direction)
     return p25_res
 
+def fetch_smart_money_data(ticker: str) -> Tuple[Dict, Dict]:
+    """(daily smart-money flows, quarterly 13F) for P2.5."""
+    return _stub_fetch_daily_smart_money(ticker), _stub_fetch_13f_data(ticker)
+
 def _stub_fetch_daily_smart_money(ticker: str) -> Dict:
     return {"accumulation_index": 0.65, "dark_pool_balance": 0.2}
 
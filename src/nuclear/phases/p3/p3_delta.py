@@ -1,6 +1,7 @@
 import structlog
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
+from nuclear.orchestration.ticker_pool import PROCESS, TickerBatch, map_tickers
 from nuclear.phases.p3.p3_schemas import P3DeltaOutput, CatUpdate, KeyLevelBreach
 
 log = structlog.get_logger()
@@ -60,3 +61,21 @@ def run_p3_delta(
 
     log.info("P3-Delta completed", ticker=ticker, validity=skeleton_validity)
     return p3_delta_res
+
+
+def run_p3_delta_batch(
+    inputs: Mapping[str, Dict[str, Any]],
+    run_id: str = "default",
+    version_chain_id: str = "default",
+    pool: str = PROCESS,
+    max_workers: Optional[int] = None
+) -> TickerBatch:
+    """
+    run_p3_delta over the tracked universe: {ticker: {"previous_p3", "current_ohlcv", "current_indicators"}}.
+    Deterministic and CPU-bound, so a process pool by default; failing tickers land in batch.failed.
+    """
+    return map_tickers(_run_p3_delta_one, inputs, run_id, version_chain_id, pool=pool, max_workers=max_workers)
+
+def _run_p3_delta_one(ticker: str, item: Dict[str, Any], run_id: str, version_chain_id: str) -> P3DeltaOutput:
+    return run_p3_delta(ticker, item["previous_p3"], item.get("current_ohlcv", {}), item.get("current_indicators", {}),
+                        run_id, version_chain_id)
@@ -66,13 +66,13 @@ Cat 5 Markdown（下跌趨勢）：趨勢破壞，低點破前低，結構性下
         cat_definitions,
         distortion_risk,
         prohibitions,
-        mispricing_context,
         SkillsInjector.inject_skills("P3")
     ])
+    # system_prompt is the static P3 prefix (prompt-cacheable); per-ticker context goes below
 
     user_prompt = f"""
 請針對 {ticker} 執行 P3 技術分析。
-
+{mispricing_context}
 [OHLCV DATA]
 {ohlcv_data}
 
@@ -45,6 +45,8 @@ async def run_p6_daemon(interval_sec: int = 30, instance_id: Optional[str] = Non
                 
             now = datetime.now(timezone.utc)
             try:
+                # no arbiter claim: a tick never waits for a budget, so claiming would only make
+                # daily / weekly yield theirs at every boundary for nothing
                 result = p6_tick(run_id=None, instance_id=instance_id, now_utc=now)
                 mark_ok(state)
                 log.info("p6_tick_result", result=result)
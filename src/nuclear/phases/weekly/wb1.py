@@ -5,10 +5,14 @@ asset_identity_map, narrative_map, identity_shift_signals_summary, framework_sta
 rebuild_recommendation, rebuild_reason_top5.
 """
 
+import json
+from pathlib import Path
 from typing import Any
 
 from nuclear.models.schemas import WB1Output
 
+WB1_OUTPUT_PATH = "outputs/wb1_output.json"
+
 
 def run_wb1_macro(worldview_input: dict[str, Any], reconciliation_context: dict = None) -> dict[str, Any]:
     """
@@ -49,6 +53,13 @@ def run_wb1_macro(worldview_input: dict[str, Any], reconciliation_context: dict
     return out.model_dump()
 
 
+def write_wb1_output(out: dict[str, Any], path: str = WB1_OUTPUT_PATH) -> None:
+    """Write the WB-1 artifact (standalone `nuclear wb2` reads it)."""
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(json.dumps(out, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
 def run_wb1_stocks(stocks_input: dict[str, Any]) -> dict[str, Any]:
     """WB-1 stocks: per-stock state snapshot, escalation判定."""
     return {"stocks": [], "escalation_list": []}
@@ -6,6 +6,7 @@ Reads WB1Output from outputs/wb1_output.json; writes orders to outputs/wb2_order
 
 import json
 from pathlib import Path
+from typing import Optional
 
 from nuclear.models.schemas import IdentityContext, OrderPlan, WB1Output
 
@@ -60,9 +61,13 @@ def run_wb2_and_persist(
     wb1_path: str = "outputs/wb1_output.json",
     wb2_path: str = "outputs/wb2_orders.json",
     run_context: dict = None,
+    wb1_output: Optional[dict] = None,
 ) -> list[OrderPlan]:
-    """Load WB1, produce at least 1 order, write to wb2_orders.json; return orders."""
-    wb1 = load_wb1_output(wb1_path)
+    """
+    Load WB1, produce at least 1 order, write to wb2_orders.json; return orders.
+    wb1_output: WB-1 result handed over in memory (in-process weekly runner); None = read wb1_path.
+    """
+    wb1 = WB1Output.model_validate(wb1_output) if wb1_output is not None else load_wb1_output(wb1_path)
     worldview = {"worldview_version": wb1.worldview_version}
     orders = run_wb2_light([], worldview)
     out_path = Path(wb2_path)
@@ -5,6 +5,7 @@ CLI 執行完成後自動記錄到 run_log.jsonl，供 Agent 讀取以了解自
 """
 
 import json
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -32,6 +33,7 @@ def log_run(
         artifacts: 產出的檔案路徑列表
         errors: 錯誤訊息列表
         metrics: 額外指標 (duration_sec, record_count, etc.)
+            本 run 的 LLM router 計數 (llm_requests, llm_singleflight_dedup, ...) 會自動併入並清除
     
     Returns:
         寫入的 entry dict
@@ -44,7 +46,7 @@ def log_run(
         "summary": summary,
         "artifacts": artifacts or [],
         "errors": errors or [],
-        "metrics": metrics or {},
+        "metrics": {**_llm_run_metrics(run_id), **(metrics or {})},
     }
     
     RUN_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -54,6 +56,12 @@ def log_run(
     return entry
 
 
+def _llm_run_metrics(run_id: str) -> dict:
+    """Pop the router's per-run counters; without an imported router there are none (no import cost)."""
+    router = sys.modules.get("nuclear.llm.router")
+    return router.pop_run_metrics(run_id) if router is not None else {}
+
+
 def read_recent_runs(n: int = 20) -> list[dict]:
     """
     讀取最近 n 條執行記錄，供 Agent 了解 CLI 進度
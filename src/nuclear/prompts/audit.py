@@ -1,5 +1,5 @@
 
-from typing import Dict
+from typing import Dict, List, Optional
 from .base import PromptBuilder
 
 class AuditPromptBuilder(PromptBuilder):
@@ -30,13 +30,16 @@ class AuditPromptBuilder(PromptBuilder):
         
         task_prompt = f"Analyze the following {phase} output. Identify the blind spots."
         
-        return cls.build(system_blocks, task_prompt, analyst_output)
+        return cls.build(system_blocks, task_prompt, analyst_output, phase=phase)
 
     @classmethod
-    def build_deep_auditor_prompt(cls, analyst_output: Dict, scout_output: Dict, phase: str) -> Dict:
+    def build_deep_auditor_prompt(
+        cls, analyst_output: Dict, scout_output: Dict, phase: str, verdict_options: Optional[List[str]] = None
+    ) -> Dict:
         """
         Builds the Deep Auditor prompt (§2.6.6).
         Synthesizes Analyst vs Scout into a final judgment.
+        With verdict_options the auditor must also pick one of them in 'verdict' (M0 acts on it).
         """
         system_blocks = [
             cls.role_calibrator("W-A"),
@@ -56,9 +59,16 @@ class AuditPromptBuilder(PromptBuilder):
             "     {'scenario': 'C', 'prob': '30%', 'outcome': '...'}",
             "  ],",
             "  'action_under_uncertainty': '...',",
-            "  'what_analyst_missed': '...'",
+            "  'what_analyst_missed': '...'" + (",\n  'verdict': '...'" if verdict_options else ""),
             "}"
         ]
+        if verdict_options:
+            system_blocks += [
+                "[VERDICT]",
+                f"Set 'verdict' to exactly one of: {', '.join(verdict_options)}.",
+                "uphold = keep the analyst answer; revise = the analyst must redo it using your audit;",
+                "an analyst key = adopt that analyst's answer; merge = combine the analysts' answers.",
+            ]
         
         payload = {
             "analyst_output": analyst_output,
@@ -67,4 +77,4 @@ class AuditPromptBuilder(PromptBuilder):
         
         task_prompt = f"Conduct a Deep Audit on the {phase} decision."
         
-        return cls.build(system_blocks, task_prompt, payload)
+        return cls.build(system_blocks, task_prompt, payload, phase=phase)
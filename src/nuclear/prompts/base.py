@@ -1,5 +1,8 @@
 
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
+
+from nuclear.llm.prompt_cache import prefix_hash
+from nuclear.prompts.compaction import render_payload
 
 class PromptBuilder:
     """
@@ -58,11 +61,23 @@ class PromptBuilder:
 """
 
     @classmethod
-    def build(cls, system_blocks: List[str], task_prompt: str, data_payload: Dict) -> Dict:
+    def build(
+        cls,
+        system_blocks: List[str],
+        task_prompt: str,
+        data_payload: Dict,
+        phase: Optional[str] = None,
+        priorities: Optional[Dict[str, int]] = None,
+        defaults: Optional[Dict[str, Any]] = None,
+        budget_tokens: Optional[int] = None,
+    ) -> Dict:
         """
         Assemble the complete prompt.
         Structure: System (Preamble + Role + Rules) | User (Task + ID) | Suffix (Future Check)
-        Presents data as structured context.
+        Presents data as structured context, compacted to the phase model's token budget
+        (see nuclear.prompts.compaction). "compaction" carries tokens before/after/saved.
+        The system prompt must only hold static per-phase text (it is the provider-cached
+        prefix, identified by "prefix_hash"); anything per-ticker belongs in data_payload.
         """
         # 1. System Prompt Construction
         system_parts = [cls.constitutional_preamble()]
@@ -73,9 +88,15 @@ class PromptBuilder:
         full_system_prompt = "\n".join(system_parts)
 
         # 2. User Prompt Construction
-        import json
-        # Serialize data payload to JSON string for clarity
-        data_str = json.dumps(data_payload, indent=2, ensure_ascii=False)
+        # Compact JSON (pruned, budget-truncated) unless NUCLEAR_PROMPT_COMPACT=0
+        data_str, compaction = render_payload(
+            data_payload,
+            phase=phase,
+            fixed_text=full_system_prompt + task_prompt + cls.future_alignment_check(),
+            priorities=priorities,
+            defaults=defaults,
+            budget_tokens=budget_tokens,
+        )
         
         full_user_prompt = f"""
 [TASK]
@@ -90,5 +111,7 @@ class PromptBuilder:
 
         return {
             "system": full_system_prompt,
-            "user": full_user_prompt
+            "user": full_user_prompt,
+            "compaction": compaction.as_dict() if compaction else None,
+            "prefix_hash": prefix_hash(full_system_prompt)
         }
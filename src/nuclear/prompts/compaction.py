@@ -0,0 +1,194 @@
+"""
+Prompt payload compaction (token-budget aware).
+
+compact separators -> null/empty/default pruning -> budget-driven truncation of long
+lists (least important fields first) -> drop low-priority fields as a last resort.
+Token counts use a local estimator (no tokenizer dependency): ~4 ASCII chars per token,
+~1 token per CJK / other non-ASCII character.
+"""
+import json
+import math
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+log = structlog.get_logger()
+
+DEFAULT_PRIORITY = 50  # lower = more important; 0 = never truncated or dropped
+MIN_LIST_KEEP = 3
+
+
+def _is_empty(v: Any) -> bool:
+    return v is None or (isinstance(v, (str, list, dict)) and len(v) == 0)
+
+
+def estimate_tokens(text: str) -> int:
+    if not text:
+        return 0
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4 + (len(text) - ascii_chars))
+
+
+def compact_json(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def prune(obj: Any, defaults: Optional[Dict[str, Any]] = None) -> Any:
+    """Drop None / empty values and keys whose value equals `defaults[key]`, recursively."""
+    defaults = defaults or {}
+    if isinstance(obj, dict):
+        out = {}
+        for k, v in obj.items():
+            v = prune(v, defaults)
+            if _is_empty(v):
+                continue
+            if k in defaults and v == defaults[k]:
+                continue
+            out[k] = v
+        return out
+    if isinstance(obj, list):
+        return [prune(v, defaults) for v in obj if v is not None]
+    return obj
+
+
+@dataclass
+class CompactionResult:
+    text: str
+    tokens_before: int
+    tokens_after: int
+    truncated: Dict[str, int] = field(default_factory=dict)  # path -> items removed
+    dropped: List[str] = field(default_factory=list)
+    data: Any = None  # compacted payload (for callers that lay out sections themselves)
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.tokens_before - self.tokens_after)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "tokens_saved": self.tokens_saved,
+            "truncated": dict(self.truncated),
+            "dropped": list(self.dropped),
+        }
+
+
+def _list_slots(obj: Any, path: str = "") -> List[Tuple[str, str, dict]]:
+    """(path, key, parent) for every list value reachable through dicts."""
+    slots = []
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            p = f"{path}.{k}" if path else k
+            if isinstance(v, list):
+                slots.append((p, k, obj))
+                for item in v:
+                    slots.extend(_list_slots(item, p + "[]"))
+            elif isinstance(v, dict):
+                slots.extend(_list_slots(v, p))
+    return slots
+
+
+def compact_payload(
+    payload: Any,
+    budget_tokens: Optional[int] = None,
+    priorities: Optional[Dict[str, int]] = None,
+    defaults: Optional[Dict[str, Any]] = None,
+) -> CompactionResult:
+    """
+    Compact `payload` to JSON within `budget_tokens` (if given).
+    `priorities` maps field names (any depth) to importance; lower = kept longer.
+    """
+    priorities = priorities or {}
+    tokens_before = estimate_tokens(json.dumps(payload, indent=2, ensure_ascii=False, default=str))
+    data = prune(payload, defaults)
+    text = compact_json(data)
+    result = CompactionResult(
+        text=text, tokens_before=tokens_before, tokens_after=estimate_tokens(text), data=data
+    )
+    if budget_tokens is None or result.tokens_after <= budget_tokens:
+        return result
+
+    # 1. Halve long lists, least important (then longest) first, until within budget.
+    while result.tokens_after > budget_tokens:
+        slots = [
+            s for s in _list_slots(data)
+            if priorities.get(s[1], DEFAULT_PRIORITY) > 0 and len(s[2][s[1]]) > MIN_LIST_KEEP
+        ]
+        if not slots:
+            break
+        path, key, parent = max(slots, key=lambda s: (priorities.get(s[1], DEFAULT_PRIORITY), len(s[2][s[1]])))
+        items = parent[key]
+        keep = max(MIN_LIST_KEEP, len(items) // 2)
+        result.truncated[path] = result.truncated.get(path, 0) + len(items) - keep
+        parent[key] = items[:keep]
+        result.tokens_after = estimate_tokens(compact_json(data))
+
+    # 2. Drop whole top-level fields, least important first.
+    if isinstance(data, dict):
+        droppable = sorted(
+            (k for k in data if priorities.get(k, DEFAULT_PRIORITY) > 0),
+            key=lambda k: -priorities.get(k, DEFAULT_PRIORITY),
+        )
+        for k in droppable:
+            if result.tokens_after <= budget_tokens:
+                break
+            data.pop(k)
+            result.dropped.append(k)
+            result.tokens_after = estimate_tokens(compact_json(data))
+
+    if result.truncated and isinstance(data, dict):
+        data["_truncated"] = result.truncated  # tell the model the lists are partial
+    result.text = compact_json(data)
+    result.tokens_after = estimate_tokens(result.text)
+    return result
+
+
+def compaction_enabled() -> bool:
+    return os.environ.get("NUCLEAR_PROMPT_COMPACT", "1") != "0"
+
+
+def payload_budget(phase: Optional[str], fixed_text: str = "") -> Optional[int]:
+    """
+    Tokens left for the data payload: model context - max output - fixed prompt text,
+    capped by NUCLEAR_PROMPT_MAX_INPUT_TOKENS (cost control). None if nothing applies.
+    """
+    budget: Optional[int] = None
+    if phase:
+        from nuclear.llm.routing import get_routing_table
+
+        route = get_routing_table().route_for(phase)
+        budget = route.context_tokens - route.max_tokens - estimate_tokens(fixed_text)
+    cap = os.environ.get("NUCLEAR_PROMPT_MAX_INPUT_TOKENS")
+    if cap:
+        remaining = int(cap) - estimate_tokens(fixed_text)
+        budget = remaining if budget is None else min(budget, remaining)
+    return max(budget, 0) if budget is not None else None
+
+
+def render_payload(
+    payload: Any,
+    phase: Optional[str] = None,
+    fixed_text: str = "",
+    priorities: Optional[Dict[str, int]] = None,
+    defaults: Optional[Dict[str, Any]] = None,
+    budget_tokens: Optional[int] = None,
+) -> Tuple[str, Optional[CompactionResult]]:
+    """Payload text for a prompt. Compacted unless NUCLEAR_PROMPT_COMPACT=0."""
+    if not compaction_enabled():
+        return json.dumps(payload, indent=2, ensure_ascii=False, default=str), None
+    if budget_tokens is None:
+        budget_tokens = payload_budget(phase, fixed_text)
+    res = compact_payload(payload, budget_tokens=budget_tokens, priorities=priorities, defaults=defaults)
+    log.info(
+        "prompt_compacted",
+        phase=phase,
+        tokens_before=res.tokens_before,
+        tokens_after=res.tokens_after,
+        tokens_saved=res.tokens_saved,
+        truncated=res.truncated or None,
+        dropped=res.dropped or None,
+    )
+    return res.text, res
@@ -1,5 +1,6 @@
 
 import os
+import threading
 from pathlib import Path
 from typing import List, Dict
 
@@ -49,11 +50,21 @@ class SkillsInjector:
     
     BASE_PATH = Path("src/nuclear/skills")
 
+    # phase -> rendered block. Memoized so the skills part of the static prompt prefix stays
+    # byte-identical for every call in a process (provider prefix caching); clear_cache() reloads.
+    _rendered: Dict[str, str] = {}
+    _lock = threading.Lock()
+
     @classmethod
     def inject_skills(cls, phase: str) -> str:
         """
         Returns concatenated text of all skills required for the phase.
         """
+        with cls._lock:
+            cached = cls._rendered.get(phase)
+        if cached is not None:
+            return cached
+
         required_skills = cls.PHASE_SKILLS_MAP.get(phase, [])
         if not required_skills:
             return ""
@@ -61,10 +72,17 @@ class SkillsInjector:
         injected_text = ["\n[INJECTED SKILLS MODULES]\n"]
         
         for skill_id in required_skills:
-            content = cls._load_skill_text(skill_id)
+            content = cls._load_skill_text(skill_id).replace("\r\n", "\n").rstrip()
             injected_text.append(f"--- Module: {skill_id} ---\n{content}\n")
             
-        return "\n".join(injected_text)
+        rendered = "\n".join(injected_text)
+        with cls._lock:
+            return cls._rendered.setdefault(phase, rendered)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._lock:
+            cls._rendered.clear()
 
     @classmethod
     def _load_skill_text(cls, skill_id: str) -> str:
@@ -32,3 +32,6 @@ class LocalFSBackend:
         file_path.write_text(content, encoding="utf-8")
         
         return str(file_path)
+
+    def read(self, payload_ref: str) -> Any:
+        return json.loads(Path(payload_ref).read_text(encoding="utf-8"))
@@ -6,3 +6,6 @@ class R2StubBackend:
     """
     def write(self, phase: str, snapshot_id: str, payload: Any, created_at: str) -> str:
         raise NotImplementedError("R2 backend is not yet implemented (Stub Only)")
+
+    def read(self, payload_ref: str) -> Any:
+        raise NotImplementedError("R2 backend is not yet implemented (Stub Only)")
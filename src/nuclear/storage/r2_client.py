@@ -5,8 +5,6 @@ import hashlib
 import json
 from typing import Any, Optional
 
-from nuclear.config import settings
-
 _r2_client: Optional["R2Client"] = None
 
 
@@ -14,7 +12,11 @@ class R2Client:
     """S3-compatible R2 client for cold data (snapshots, reasoning_trace)."""
 
     def __init__(self):
+        from nuclear.config import get_settings
+
+        settings = get_settings()
         self._client = None
+        self._settings = settings
         self._bucket = settings.r2_bucket_name
         self._endpoint = settings.r2_endpoint_url or (
             f"https://{settings.r2_account_id}.r2.cloudflarestorage.com"
@@ -23,6 +25,7 @@ class R2Client:
         )
 
     def _ensure_client(self):
+        settings = self._settings
         if self._client is None and settings.r2_access_key_id:
             import boto3
 
@@ -0,0 +1,193 @@
+"""
+M20 Reasoning Trace Store.
+Content-addressed gzip blobs (LocalFS or R2) + ai_outputs index (run, phase, ticker, model).
+
+The storage key is computed on the caller's thread (sha256 only); compression, upload and
+indexing run on a background writer so generation is never blocked by trace I/O.
+Identical traces share one blob; every call still gets its own ai_outputs row.
+"""
+import gzip
+import hashlib
+import os
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+import structlog
+
+from nuclear.llm.traces import ReasoningTrace
+
+log = structlog.get_logger()
+
+TRACE_KEY_PREFIX = "reasoning"
+DEFAULT_TRACE_BACKEND = "local_fs"
+DEFAULT_TRACE_WRITERS = 2
+
+
+class LocalTraceBackend:
+    """Stores blobs at outputs/reasoning_traces/<key>.gz"""
+    ROOT_DIR = Path("outputs/reasoning_traces")
+
+    def path_for(self, key: str) -> Path:
+        return self.ROOT_DIR / f"{key}.gz"
+
+    def exists(self, key: str) -> bool:
+        return self.path_for(key).exists()
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{uuid.uuid4().hex[:8]}.tmp")
+        tmp.write_bytes(gzip.compress(data))
+        os.replace(tmp, path)  # atomic: concurrent writers of the same key are harmless
+
+    def get(self, key: str) -> bytes:
+        return gzip.decompress(self.path_for(key).read_bytes())
+
+
+class R2TraceBackend:
+    """Stores blobs in R2 via the shared content-addressed client."""
+
+    def __init__(self):
+        from nuclear.storage.r2_client import get_r2_client
+
+        self.client = get_r2_client()
+
+    def exists(self, key: str) -> bool:
+        return False  # put is idempotent for content-addressed keys
+
+    def put(self, key: str, data: bytes) -> None:
+        self.client.put(key, data, gzip_compress=True)
+
+    def get(self, key: str) -> bytes:
+        return self.client.get(key, gunzip=True)
+
+
+def trace_key(text: str) -> str:
+    """Content-addressed key, same layout as R2Client.content_key."""
+    h = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{TRACE_KEY_PREFIX}/{h[:2]}/{h[2:4]}/{h}"
+
+
+class ReasoningTraceStore:
+    def __init__(self, backend_type: Optional[str] = None, async_writes: Optional[bool] = None):
+        self.backend_type = backend_type or os.environ.get("NUCLEAR_TRACE_BACKEND", DEFAULT_TRACE_BACKEND)
+        if self.backend_type == "local_fs":
+            self.backend = LocalTraceBackend()
+        elif self.backend_type == "r2":
+            self.backend = R2TraceBackend()
+        else:
+            raise ValueError(f"Unknown trace backend type: {self.backend_type}")
+        self.async_writes = (
+            async_writes if async_writes is not None else os.environ.get("NUCLEAR_TRACE_ASYNC", "1") != "0"
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending: List[Future] = []
+        self._tables_ready = False
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                workers = int(os.environ.get("NUCLEAR_TRACE_WRITERS", DEFAULT_TRACE_WRITERS))
+                self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="trace-writer")
+            return self._executor
+
+    def _persist(
+        self,
+        key: str,
+        trace: ReasoningTrace,
+        run_id: Optional[str],
+        phase: Optional[str],
+        ticker: Optional[str],
+        final_answer_key: Optional[str],
+    ) -> None:
+        from nuclear.db.repos import AiOutputRepo
+
+        if not self.backend.exists(key):
+            self.backend.put(key, trace.text.encode("utf-8"))
+        if not self._tables_ready:
+            from nuclear.db.schema import create_tables
+
+            create_tables()
+            self._tables_ready = True
+        AiOutputRepo.insert(
+            output_id=str(uuid.uuid4()),
+            phase=phase or "",
+            run_id=run_id or "",
+            ticker=ticker,
+            model_name=trace.model,
+            include_reasoning=True,
+            final_answer_storage_key=final_answer_key,
+            reasoning_trace_storage_key=key,
+            created_at=trace.created_at.isoformat(),
+        )
+
+    def _persist_logged(self, key: str, *args) -> None:
+        try:
+            self._persist(key, *args)
+        except Exception as e:
+            log.error("reasoning_trace_persist_failed", key=key, error=str(e))
+
+    def write(
+        self,
+        trace: ReasoningTrace,
+        run_id: Optional[str] = None,
+        phase: Optional[str] = None,
+        ticker: Optional[str] = None,
+        final_answer_key: Optional[str] = None,
+    ) -> str:
+        """Return the storage key immediately; blob + index are written in the background."""
+        key = trace_key(trace.text)
+        args = (trace, run_id, phase, ticker, final_answer_key)
+        if not self.async_writes:
+            self._persist(key, *args)
+            return key
+        fut = self._get_executor().submit(self._persist_logged, key, *args)
+        with self._lock:
+            self._pending = [f for f in self._pending if not f.done()]
+            self._pending.append(fut)
+        return key
+
+    def read(self, key: str) -> str:
+        return self.backend.get(key).decode("utf-8")
+
+    def flush(self, timeout: Optional[float] = None) -> int:
+        """Wait for queued writes (run end / shutdown / tests). Returns number waited on."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for fut in pending:
+            fut.result(timeout=timeout)
+        return len(pending)
+
+
+_store: Optional[ReasoningTraceStore] = None
+_store_lock = threading.Lock()
+
+
+def get_trace_store() -> ReasoningTraceStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ReasoningTraceStore()
+        return _store
+
+
+def write_reasoning_trace(
+    trace: ReasoningTrace,
+    run_id: Optional[str] = None,
+    phase: Optional[str] = None,
+    ticker: Optional[str] = None,
+    final_answer_key: Optional[str] = None,
+) -> str:
+    return get_trace_store().write(trace, run_id=run_id, phase=phase, ticker=ticker, final_answer_key=final_answer_key)
+
+
+def read_reasoning_trace(key: str) -> str:
+    return get_trace_store().read(key)
+
+
+def flush_reasoning_traces(timeout: Optional[float] = None) -> int:
+    return get_trace_store().flush(timeout=timeout)
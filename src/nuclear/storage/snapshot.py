@@ -3,6 +3,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field
+from nuclear.utils.tracing import SNAPSHOT, span
 
 """
 M01 Cold Storage Layer.
@@ -25,6 +26,21 @@ class SnapshotMetadata(BaseModel):
     backend: str
     payload_ref: str
 
+def _backend(backend_type: str):
+    if backend_type == "local_fs":
+        return LocalFSBackend()
+    if backend_type == "r2":
+        return R2StubBackend()
+    raise ValueError(f"Unknown backend type: {backend_type}")
+
+
+def _payload_sha256(payload: Any) -> str:
+    import hashlib
+    import json
+    json_bytes = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.sha256(json_bytes).hexdigest()
+
+
 class SnapshotWriter:
     """
     Persists outputs to cold storage (LocalFS or R2).
@@ -33,66 +49,75 @@ class SnapshotWriter:
     
     def __init__(self, backend_type: str = "local_fs"):
         self.backend_type = backend_type
-        if backend_type == "local_fs":
-            self.backend = LocalFSBackend()
-        elif backend_type == "r2":
-            self.backend = R2StubBackend()
-        else:
-            raise ValueError(f"Unknown backend type: {backend_type}")
+        self.backend = _backend(backend_type)
 
     def save(self, phase: str, payload: Any, run_id: str = "default_run") -> SnapshotMetadata:
         """
         Save payload to storage, return metadata.
         """
-        snapshot_id = self._generate_snapshot_id()
-        created_at = datetime.now(timezone.utc).isoformat()
+        with span("snapshot.write", kind=SNAPSHOT, phase=phase, backend=self.backend_type):
+            snapshot_id = self._generate_snapshot_id()
+            created_at = datetime.now(timezone.utc).isoformat()
         
-        # 1. Save payload via backend
-        payload_ref = self.backend.write(
-            phase=phase,
-            snapshot_id=snapshot_id,
-            payload=payload,
-            created_at=created_at
-        )
-
-        # 2. Compute SHA256 (for immutability check)
-        import hashlib
-        import json
-        # Re-serialize deterministically to compute hash, or use what was written if backend returned bytes.
-        # But backend.write just returns path.
-        # We ensure consistency by serializing same way.
-        json_bytes = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
-        payload_sha256 = hashlib.sha256(json_bytes).hexdigest()
-
-        # 3. Write Index Limit
-        from nuclear.db.repos import SnapshotRepo
-        from nuclear.db.schema import create_tables
+            # 1. Save payload via backend
+            payload_ref = self.backend.write(
+                phase=phase,
+                snapshot_id=snapshot_id,
+                payload=payload,
+                created_at=created_at
+            )
+
+            # 2. Compute SHA256 (for immutability check)
+            # Re-serialize deterministically to compute hash, or use what was written if backend returned bytes.
+            # But backend.write just returns path.
+            # We ensure consistency by serializing same way.
+            payload_sha256 = _payload_sha256(payload)
+
+            # 3. Write Index Limit
+            from nuclear.db.repos import SnapshotRepo
+            from nuclear.db.schema import create_tables
         
-        # Ensure tables exist (lazy init)
-        create_tables()
-
-        SnapshotRepo.insert_snapshot_index(
-            snapshot_id=snapshot_id,
-            run_id=run_id,
-            phase=phase,
-            created_at=created_at,
-            backend=self.backend_type,
-            payload_ref=payload_ref,
-            payload_sha256=payload_sha256
-        )
-
-        # 4. Construct metadata
-        meta = SnapshotMetadata(
-            snapshot_id=snapshot_id,
-            phase=phase,
-            run_id=run_id,
-            created_at=created_at,
-            backend=self.backend_type,
-            payload_ref=payload_ref
-        )
+            # Ensure tables exist (lazy init)
+            create_tables()
+
+            SnapshotRepo.insert_snapshot_index(
+                snapshot_id=snapshot_id,
+                run_id=run_id,
+                phase=phase,
+                created_at=created_at,
+                backend=self.backend_type,
+                payload_ref=payload_ref,
+                payload_sha256=payload_sha256
+            )
+
+            # 4. Construct metadata
+            meta = SnapshotMetadata(
+                snapshot_id=snapshot_id,
+                phase=phase,
+                run_id=run_id,
+                created_at=created_at,
+                backend=self.backend_type,
+                payload_ref=payload_ref
+            )
         
-        log.info("Snapshot saved & indexed", snapshot_id=snapshot_id, phase=phase, ref=payload_ref)
-        return meta
+            log.info("Snapshot saved & indexed", snapshot_id=snapshot_id, phase=phase, ref=payload_ref)
+            return meta
 
     def _generate_snapshot_id(self) -> str:
         return str(uuid.uuid4())
+
+
+def load_snapshot(snapshot_id: str) -> Any:
+    """
+    Read a payload back via snapshots_index (resume / rehydration).
+    The stored SHA256 is re-checked so a modified payload file is never silently reused.
+    """
+    from nuclear.db.repos import SnapshotRepo
+
+    row = SnapshotRepo.get(snapshot_id)
+    if row is None:
+        raise KeyError(f"Snapshot not indexed: {snapshot_id}")
+    payload = _backend(row["backend"]).read(row["payload_ref"])
+    if row["payload_sha256"] and _payload_sha256(payload) != row["payload_sha256"]:
+        raise ValueError(f"Snapshot {snapshot_id} does not match its indexed SHA256")
+    return payload
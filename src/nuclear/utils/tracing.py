@@ -0,0 +1,397 @@
+"""
+Tracing - nested, timed spans: run -> phase -> ticker -> LLM call / snapshot write / DB transaction.
+
+    with span("weekly", kind=RUN, run_id=run_id):
+        with span("WB-1", kind=PHASE):
+            ...                       # LLM calls, snapshot writes, DB transactions nest here
+
+The current span lives in a ContextVar. Thread pools do not inherit it: submit through
+propagate(fn), or carry capture() across and re-enter it with attached(ctx) (M0 model
+pools, process pools). ticker / db / snapshot spans are only recorded inside a trace, never as roots.
+
+Finished spans are queued and written by a background writer (the caller never waits on
+I/O) to the sinks in NUCLEAR_TRACE_SINKS (comma-separated, default "sqlite"):
+    sqlite  spans table in the nuclear DB (what `nuclear trace <run_id>` reads)
+    file    JSONL at NUCLEAR_TRACE_FILE (default outputs/traces/spans.jsonl)
+    otlp    OTLP/HTTP JSON to NUCLEAR_OTLP_ENDPOINT (default http://localhost:4318/v1/traces)
+A root RUN span flushes the writer when it ends. NUCLEAR_TRACING=0 disables tracing.
+"""
+import atexit
+import contextvars
+import functools
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import structlog
+
+log = structlog.get_logger()
+
+RUN = "run"
+PHASE = "phase"
+TICKER = "ticker"
+LLM = "llm"
+SNAPSHOT = "snapshot"
+DB = "db"
+INTERNAL = "internal"
+
+NESTED_ONLY_KINDS = frozenset({TICKER, DB, SNAPSHOT})
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_TRACE_FILE = "outputs/traces/spans.jsonl"
+DEFAULT_OTLP_ENDPOINT = "http://localhost:4318/v1/traces"
+
+
+def tracing_enabled() -> bool:
+    return os.environ.get("NUCLEAR_TRACING", "1") != "0"
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    trace_id: str
+    span_id: str
+    run_id: Optional[str] = None
+
+
+@dataclass
+class SpanRecord:
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    run_id: Optional[str]
+    name: str
+    kind: str
+    start_ns: int  # wall clock, epoch nanoseconds
+    end_ns: int = 0
+    status: str = "ok"  # ok | error
+    error: Optional[str] = None
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return round((self.end_ns - self.start_ns) / 1e6, 3)
+
+
+class Span:
+    """Handle for the active span: add attributes while it runs."""
+
+    def __init__(self, record: SpanRecord):
+        self.record = record
+
+    def set(self, **attrs: Any) -> None:
+        self.record.attrs.update({k: v for k, v in attrs.items() if v is not None})
+
+
+_current: contextvars.ContextVar[Optional[SpanContext]] = contextvars.ContextVar("nuclear_span", default=None)
+_suppressed: contextvars.ContextVar[bool] = contextvars.ContextVar("nuclear_span_suppressed", default=False)
+
+
+def capture() -> Optional[SpanContext]:
+    return _current.get()
+
+
+@contextmanager
+def attached(ctx: Optional[SpanContext]) -> Iterator[None]:
+    """Make `ctx` (from capture() in another thread / process) the parent of spans opened here."""
+    token = _current.set(ctx)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def propagate(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """fn bound to the caller's current span, for ThreadPoolExecutor.submit and friends."""
+    ctx = _current.get()
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with attached(ctx):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def suppressed() -> Iterator[None]:
+    token = _suppressed.set(True)
+    try:
+        yield
+    finally:
+        _suppressed.reset(token)
+
+
+def untraced(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """No spans for anything fn does (bookkeeping such as create_tables)."""
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with suppressed():
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def span(name: str, kind: str = INTERNAL, run_id: Optional[str] = None, **attrs: Any) -> Iterator[Optional[Span]]:
+    """Time the block as a child of the current span (or as a new trace); yields None when not traced."""
+    parent = _current.get()
+    if not tracing_enabled() or _suppressed.get() or (parent is None and kind in NESTED_ONLY_KINDS):
+        yield None
+        return
+    record = SpanRecord(
+        trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+        span_id=uuid.uuid4().hex[:16],
+        parent_id=parent.span_id if parent else None,
+        run_id=run_id or (parent.run_id if parent else None),
+        name=name,
+        kind=kind,
+        start_ns=time.time_ns(),
+        attrs={k: v for k, v in attrs.items() if v is not None},
+    )
+    token = _current.set(SpanContext(record.trace_id, record.span_id, record.run_id))
+    try:
+        yield Span(record)
+    except BaseException as e:
+        record.status = "error"
+        record.error = f"{type(e).__name__}: {e}"[:500]
+        raise
+    finally:
+        record.end_ns = time.time_ns()
+        _current.reset(token)
+        writer = get_span_writer()
+        writer.record(record)
+        if parent is None and kind == RUN:  # the run's trace is readable once the run returns
+            writer.flush(timeout=5)
+
+
+def traced(name: Optional[str] = None, kind: str = INTERNAL) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name or fn.__qualname__, kind=kind):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# ---- sinks ----------------------------------------------------------------------------------
+
+
+def _sqlite_sink(records: List[SpanRecord]) -> None:
+    from nuclear.db.repos import SpanRepo
+    from nuclear.db.schema import create_tables
+
+    try:
+        SpanRepo.insert_many(records)
+    except sqlite3.OperationalError:
+        create_tables()  # first write to this DB file
+        SpanRepo.insert_many(records)
+
+
+def _file_sink(records: List[SpanRecord]) -> None:
+    path = Path(os.environ.get("NUCLEAR_TRACE_FILE", DEFAULT_TRACE_FILE))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        for r in records:
+            f.write(json.dumps({**asdict(r), "duration_ms": r.duration_ms}, ensure_ascii=False, default=str) + "\n")
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": value if isinstance(value, str) else json.dumps(value, default=str)}
+
+
+def to_otlp(records: List[SpanRecord]) -> Dict[str, Any]:
+    """OTLP/HTTP JSON ExportTraceServiceRequest for the records."""
+    spans = []
+    for r in records:
+        attrs = {**r.attrs, "nuclear.kind": r.kind, **({"nuclear.run_id": r.run_id} if r.run_id else {})}
+        spans.append({
+            "traceId": r.trace_id,
+            "spanId": r.span_id,
+            **({"parentSpanId": r.parent_id} if r.parent_id else {}),
+            "name": r.name,
+            "kind": 3 if r.kind == LLM else 1,  # CLIENT for upstream calls, else INTERNAL
+            "startTimeUnixNano": str(r.start_ns),
+            "endTimeUnixNano": str(r.end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in attrs.items()],
+            "status": {"code": 2, "message": r.error or ""} if r.status == "error" else {"code": 1},
+        })
+    return {"resourceSpans": [{
+        "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": "nuclear"}}]},
+        "scopeSpans": [{"scope": {"name": "nuclear.tracing"}, "spans": spans}],
+    }]}
+
+
+def _otlp_sink(records: List[SpanRecord]) -> None:
+    import httpx
+
+    endpoint = os.environ.get("NUCLEAR_OTLP_ENDPOINT", DEFAULT_OTLP_ENDPOINT)
+    httpx.post(endpoint, json=to_otlp(records), timeout=10).raise_for_status()
+
+
+SINKS: Dict[str, Callable[[List[SpanRecord]], None]] = {
+    "sqlite": _sqlite_sink,
+    "file": _file_sink,
+    "otlp": _otlp_sink,
+}
+
+
+def configured_sinks() -> List[str]:
+    names = [s.strip() for s in os.environ.get("NUCLEAR_TRACE_SINKS", "sqlite").split(",") if s.strip()]
+    unknown = [n for n in names if n not in SINKS]
+    if unknown:
+        raise ValueError(f"Unknown trace sink(s): {unknown} (known: {sorted(SINKS)})")
+    return names
+
+
+class SpanWriter:
+    """Single background writer; spans are exported in batches, in completion order."""
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="span-writer", daemon=True)
+                self._thread.start()
+
+    def record(self, rec: SpanRecord) -> None:
+        self._ensure_thread()
+        self._queue.put(("span", rec))
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        done.wait(timeout)
+
+    def _run(self) -> None:
+        _suppressed.set(True)  # the writer's own DB transactions are not traced
+        while True:
+            items = [self._queue.get()]
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            records = [p for k, p in items if k == "span"]
+            if records:
+                self._export(records)
+            for kind, payload in items:
+                if kind == "flush":
+                    payload.set()
+
+    def _export(self, records: List[SpanRecord]) -> None:
+        try:
+            sinks = configured_sinks()
+        except ValueError as e:
+            log.error("trace_sink_config_invalid", error=str(e))
+            return
+        for name in sinks:
+            try:
+                SINKS[name](records)
+            except Exception as e:
+                log.error("trace_export_failed", sink=name, error=str(e), spans=len(records))
+
+
+_writer: Optional[SpanWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_span_writer() -> SpanWriter:
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = SpanWriter()
+            atexit.register(_writer.flush, 5)
+        return _writer
+
+
+def flush_spans(timeout: Optional[float] = None) -> None:
+    if _writer is not None:
+        _writer.flush(timeout)
+
+
+# ---- analysis (nuclear trace) ---------------------------------------------------------------
+
+
+def load_spans(run_id: str) -> List[SpanRecord]:
+    """A run's spans from the sqlite sink, else from the JSONL file sink."""
+    from nuclear.db.repos import SpanRepo
+    from nuclear.db.schema import create_tables
+
+    create_tables()
+    rows = SpanRepo.list_for_run(run_id)
+    if rows:
+        return [
+            SpanRecord(**{k: r[k] for k in ("trace_id", "span_id", "parent_id", "run_id", "name", "kind",
+                                             "start_ns", "end_ns", "status", "error")},
+                       attrs=json.loads(r["attrs_json"] or "{}"))
+            for r in rows
+        ]
+    path = Path(os.environ.get("NUCLEAR_TRACE_FILE", DEFAULT_TRACE_FILE))
+    if not path.exists():
+        return []
+    records = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            d = json.loads(line)
+            if d.get("run_id") == run_id:
+                d.pop("duration_ms", None)
+                records.append(SpanRecord(**d))
+    return records
+
+
+def slowest(records: List[SpanRecord], n: int = 20, kind: Optional[str] = None) -> List[SpanRecord]:
+    pool = [r for r in records if kind is None or r.kind == kind]
+    return sorted(pool, key=lambda r: r.end_ns - r.start_ns, reverse=True)[:n]
+
+
+def critical_path(records: List[SpanRecord]) -> List[SpanRecord]:
+    """From the longest root, repeatedly descend into the child that finished last."""
+    ids = {r.span_id for r in records}
+    children: Dict[Optional[str], List[SpanRecord]] = {}
+    for r in records:
+        children.setdefault(r.parent_id if r.parent_id in ids else None, []).append(r)
+    path: List[SpanRecord] = []
+    level = children.get(None, [])
+    key = lambda r: r.end_ns - r.start_ns  # noqa: E731 - roots: longest
+    while level:
+        node = max(level, key=key)
+        path.append(node)
+        level = children.get(node.span_id, [])
+        key = lambda r: r.end_ns  # noqa: E731 - children: the one the parent waited for last
+    return path
+
+
+def self_time_by_kind(records: List[SpanRecord]) -> Dict[str, float]:
+    """Total exclusive time (ms) per span kind: where the run's time actually went."""
+    child_ms: Dict[str, float] = {}
+    for r in records:
+        if r.parent_id:
+            child_ms[r.parent_id] = child_ms.get(r.parent_id, 0.0) + r.duration_ms
+    totals: Dict[str, float] = {}
+    for r in records:
+        totals[r.kind] = totals.get(r.kind, 0.0) + max(r.duration_ms - child_ms.get(r.span_id, 0.0), 0.0)
+    return {k: round(v, 1) for k, v in sorted(totals.items(), key=lambda kv: -kv[1])}
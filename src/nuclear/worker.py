@@ -1,17 +1,21 @@
-"""Worker - batch jobs / weekly pipeline."""
+"""Worker - claims jobs from the durable queue (orchestration/jobs.py): batch jobs, weekly."""
+
+import os
 
-import asyncio
 import structlog
 
+from nuclear.orchestration.jobs import DEFAULT_WORKER_PROCESSES, run_worker_pool
+
 log = structlog.get_logger()
 
 
-async def run_worker():
-    """Worker loop - batch jobs, weekly."""
-    log.info("Worker starting")
-    while True:
-        await asyncio.sleep(60)
+def run_worker():
+    """Worker pool - NUCLEAR_WORKER_PROCESSES processes, optionally limited to NUCLEAR_WORKER_JOB_TYPES."""
+    processes = int(os.environ.get("NUCLEAR_WORKER_PROCESSES", DEFAULT_WORKER_PROCESSES))
+    job_types = [t.strip() for t in os.environ.get("NUCLEAR_WORKER_JOB_TYPES", "").split(",") if t.strip()] or None
+    log.info("Worker starting", processes=processes, job_types=job_types)
+    run_worker_pool(processes, job_types)
 
 
 if __name__ == "__main__":
-    asyncio.run(run_worker())
+    run_worker()
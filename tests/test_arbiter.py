@@ -0,0 +1,177 @@
+"""
+Resource arbiter tests - budgets, priority order, phase-boundary preemption, leases,
+and catch-up of scheduled runs missed during downtime. DB in tmp_path.
+"""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from nuclear.db.repos import ResourceClaimRepo, ScheduleRunRepo
+from nuclear.db.sqlite import SQLiteEngine
+from nuclear.orchestration.arbiter import new_slot, workload_slot
+from nuclear.orchestration.schedule import TAIPEI_TZ, missed_runs, run_catch_up, run_daily
+from nuclear.storage.backends.local_fs import LocalFSBackend
+
+
+@pytest.fixture(autouse=True)
+def tmp_db(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SQLiteEngine, "DB_PATH", tmp_path / "nuclear.db")
+    monkeypatch.setattr(LocalFSBackend, "ROOT_DIR", tmp_path / "snapshots")
+    monkeypatch.setenv("NUCLEAR_BUDGET_CPU_SLOTS", "4")
+    monkeypatch.setenv("NUCLEAR_BUDGET_DB_WRITE_SLOTS", "1")
+    monkeypatch.setenv("NUCLEAR_ARBITER_POLL_SEC", "0.02")
+    monkeypatch.delenv("NUCLEAR_ARBITER", raising=False)
+    monkeypatch.delenv("NUCLEAR_SCHEDULE_MODE", raising=False)
+
+
+def _status():
+    return {c["workload"]: c["status"] for c in ResourceClaimRepo.list_claims()}
+
+
+def test_budgets_admit_what_fits_and_queue_by_priority():
+    weekly = new_slot("weekly")
+    assert weekly.acquire(timeout=0)
+    p6 = new_slot("p6")
+    assert p6.acquire(timeout=0)  # cpu 2 + 1 of 4, no db_write needed
+
+    daily, backfill = new_slot("daily"), new_slot("backfill")
+    assert not daily.acquire(timeout=0.05)  # db_write taken by weekly
+    daily_wait = threading.Thread(target=daily.acquire)
+    daily_wait.start()
+    time.sleep(0.05)
+    assert not backfill.acquire(timeout=0.05)  # daily is ahead in the queue
+
+    weekly.release()
+    daily_wait.join(2)
+    assert daily.granted and _status() == {"p6": "granted", "daily": "granted"}
+    for s in (daily, p6):
+        s.release()
+    assert ResourceClaimRepo.list_claims() == []
+
+
+def test_higher_priority_preempts_at_phase_boundary(monkeypatch):
+    monkeypatch.setenv("NUCLEAR_ARBITER_LEASE_SEC", "0.3")  # heartbeat every 0.1s
+    stages = []
+    daily_started = threading.Event()
+
+    def weekly_run():
+        with workload_slot("weekly") as slot:
+            stages.append("wb1")
+            daily_started.wait(2)
+            time.sleep(0.2)  # daily's request flags the holder; heartbeat picks it up
+            slot.boundary("wb2")
+            stages.append("wb2")
+            assert slot.preemptions == ["wb2"]
+
+    weekly = threading.Thread(target=weekly_run)
+    weekly.start()
+    while "wb1" not in stages:
+        time.sleep(0.01)
+
+    def daily_run():
+        with workload_slot("daily"):
+            stages.append("daily")
+            time.sleep(0.05)
+
+    daily = threading.Thread(target=daily_run)
+    daily.start()
+    daily_started.set()
+    daily.join(5)
+    weekly.join(5)
+    assert stages == ["wb1", "daily", "wb2"]
+
+
+def test_dead_holder_lease_expires():
+    crashed = new_slot("weekly", lease_sec=0.1)
+    assert crashed.acquire(timeout=0)
+    crashed._stop.set()  # heartbeat dies with the process
+    assert not new_slot("daily").acquire(timeout=0)
+    time.sleep(0.15)
+    assert new_slot("daily").acquire(timeout=0)
+
+
+def test_only_waiting_claimants_preempt(monkeypatch):
+    monkeypatch.setenv("NUCLEAR_BUDGET_CPU_SLOTS", "2")
+    holder = new_slot("weekly")
+    assert holder.acquire(timeout=0)
+    with workload_slot("p6", timeout=0, required=False) as slot:
+        assert not slot.granted
+    assert ResourceClaimRepo.list_claims()[0]["preempt"] == 0  # a probe that will not wait
+    with pytest.raises(TimeoutError):
+        with workload_slot("daily", timeout=0):
+            pass
+    assert ResourceClaimRepo.list_claims()[0]["preempt"] == 0
+    assert not new_slot("daily").acquire(timeout=0.05)
+    assert ResourceClaimRepo.list_claims()[0]["preempt"] == 1
+    holder.release()
+
+
+def test_p6_daemon_does_not_claim_budget(monkeypatch):
+    import asyncio
+
+    from nuclear.phases.p6 import runtime
+
+    stop = asyncio.Event()
+
+    def tick(**kw):
+        stop.set()
+        return {"action": "ok"}
+
+    monkeypatch.setattr(runtime, "p6_tick", tick)
+    holder = new_slot("weekly")
+    assert holder.acquire(timeout=0)
+    asyncio.run(runtime.run_p6_daemon(interval_sec=0, instance_id="t", stop_event=stop))
+    assert [c["workload"] for c in ResourceClaimRepo.list_claims()] == ["weekly"]
+    assert not holder.should_yield()
+    holder.release()
+
+
+def test_arbiter_off(monkeypatch):
+    monkeypatch.setenv("NUCLEAR_ARBITER", "0")
+    a, b = new_slot("weekly"), new_slot("weekly")
+    assert a.acquire(timeout=0) and b.acquire(timeout=0)
+
+
+def test_scheduled_daily_records_ledger_and_arbiter_metrics(monkeypatch):
+    from nuclear.progress import read_recent_runs
+
+    def pipeline(date, tickers, run_id, boundary):
+        assert _status() == {"daily": "granted"}
+        for stage in ("d2", "d3", "d4"):
+            boundary(stage)
+        if date == "2026-02-05":
+            raise RuntimeError("D-1 source down")
+
+    monkeypatch.setattr("nuclear.phases.daily.run_daily.run_daily_pipeline", pipeline)
+    assert run_daily(date="2026-02-04", run_id="d1") == 0
+    assert ScheduleRunRepo.get("daily", "2026-02-04")["status"] == "success"
+    assert read_recent_runs(1)[-1]["metrics"]["arbiter"]["preemptions"] == []
+    assert run_daily(date="2026-02-05", run_id="d2") == 1
+    assert ScheduleRunRepo.get("daily", "2026-02-05")["status"] == "failed"
+    assert ResourceClaimRepo.list_claims() == []
+
+
+def test_missed_runs_after_downtime(monkeypatch):
+    now = datetime(2026, 2, 9, 8, 0, tzinfo=TAIPEI_TZ)  # Monday 08:00
+    assert missed_runs(now) == {"daily": [], "weekly": []}  # nothing before the first success
+
+    ScheduleRunRepo.mark("daily", "2026-02-05", "success")
+    ScheduleRunRepo.mark("daily", "2026-02-07", "success")
+    ScheduleRunRepo.mark("weekly", "2026-W05", "success")
+    assert missed_runs(now) == {"daily": ["2026-02-08"], "weekly": ["2026-W07"]}
+    ScheduleRunRepo.mark("daily", "2026-01-20", "success")
+    assert missed_runs(now, max_days=3)["daily"] == ["2026-02-08"]
+    assert missed_runs(datetime(2026, 2, 9, 6, 0, tzinfo=TAIPEI_TZ))["weekly"] == []  # before Monday 07:00
+
+    calls = []
+    monkeypatch.setattr("nuclear.orchestration.schedule.missed_runs",
+                        lambda: {"daily": ["2026-02-08"], "weekly": ["2026-W07"]})
+    monkeypatch.setattr("nuclear.orchestration.schedule.run_daily", lambda **kw: calls.append(kw) or 0)
+    monkeypatch.setattr("nuclear.orchestration.schedule.run_weekly", lambda **kw: calls.append(kw) or 0)
+    assert run_catch_up() == 0
+    assert calls[0]["date"] == "2026-02-08" and calls[0]["workload"] == "backfill"
+    assert calls[1]["run_id"] == "catchup_weekly_2026-W07"
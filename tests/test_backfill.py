@@ -0,0 +1,127 @@
+"""
+Backfill tests - date ranges, bounded parallelism for daily, resume
+(skip dates with valid snapshots), progress / ETA and the CLI. DB in tmp_path.
+"""
+
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+from nuclear.db.sqlite import SQLiteEngine
+from nuclear.orchestration import backfill
+from nuclear.orchestration.backfill import (
+    DAILY_PHASES,
+    BackfillProgress,
+    daily_dates,
+    format_duration,
+    run_backfill,
+)
+from nuclear.storage.backends.local_fs import LocalFSBackend
+from nuclear.storage.snapshot import SnapshotWriter
+
+
+@pytest.fixture(autouse=True)
+def tmp_db(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SQLiteEngine, "DB_PATH", tmp_path / "nuclear.db")
+    monkeypatch.setattr(LocalFSBackend, "ROOT_DIR", tmp_path / "snapshots")
+    monkeypatch.setenv("NUCLEAR_ARBITER_POLL_SEC", "0.02")
+    monkeypatch.delenv("NUCLEAR_ARBITER", raising=False)
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Fake D-1..D-4: writes every phase snapshot; records concurrency."""
+    state = {"running": 0, "peak": 0, "runs": [], "fail": set()}
+    lock = threading.Lock()
+
+    def run(day, run_id, tickers):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            state["runs"].append(day)
+        try:
+            time.sleep(0.03)
+            if day in state["fail"]:
+                raise RuntimeError("D-1 source down")
+            for phase in DAILY_PHASES:
+                SnapshotWriter().save(phase=phase, payload={"date": day}, run_id=run_id)
+        finally:
+            with lock:
+                state["running"] -= 1
+
+    monkeypatch.setattr(backfill, "_run_daily_date", run)
+    return state
+
+
+def test_date_ranges():
+    assert daily_dates("2026-02-27", "2026-03-02") == ["2026-02-27", "2026-02-28", "2026-03-01", "2026-03-02"]
+    with pytest.raises(ValueError):
+        daily_dates("2026-02-05", "2026-02-04")
+
+
+def test_daily_runs_dates_in_parallel_within_the_worker_bound(pipeline):
+    seen = []
+    report = run_backfill("daily", "2026-01-01", "2026-01-10", workers=3, on_progress=lambda p: seen.append(p.finished))
+    assert report.ok and sorted(pipeline["runs"]) == daily_dates("2026-01-01", "2026-01-10")
+    assert 1 < pipeline["peak"] <= 3
+    assert seen == list(range(1, 11))
+    assert report.summary()["done"] == 10
+
+
+def test_resume_skips_dates_with_valid_snapshots(pipeline):
+    pipeline["fail"] = {"2026-01-03"}
+    first = run_backfill("daily", "2026-01-01", "2026-01-04", workers=2)
+    assert list(first.progress.failed) == ["2026-01-03"] and not first.ok
+
+    pipeline["fail"], pipeline["runs"] = set(), []
+    tampered = next((LocalFSBackend.ROOT_DIR / "daily" / "d2").rglob("*.json"))
+    tampered.write_text(json.dumps({"date": "edited"}))  # fails its SHA256 check: rebuilt
+    second = run_backfill("daily", "2026-01-01", "2026-01-04", workers=2)
+    assert second.ok and len(second.progress.skipped) == 2
+    assert sorted(pipeline["runs"]) == sorted(second.pending) and "2026-01-03" in second.pending
+
+    pipeline["runs"] = []
+    assert run_backfill("daily", "2026-01-01", "2026-01-04", dry_run=True).pending == []
+    assert run_backfill("daily", "2026-01-01", "2026-01-04", prefix="v2", dry_run=True).pending == \
+        daily_dates("2026-01-01", "2026-01-04")
+    assert pipeline["runs"] == []
+
+
+def test_only_daily_backfill_is_offered(monkeypatch, capsys):
+    from nuclear.cli import main
+
+    with pytest.raises(ValueError, match="Unknown backfill kind"):
+        run_backfill("weekly", "2026-02-02", "2026-02-22")
+    monkeypatch.setattr(sys, "argv", ["nuclear", "backfill", "weekly", "--from", "2026-02-02", "--to", "2026-02-09"])
+    with pytest.raises(SystemExit):
+        main()
+    assert "invalid choice: 'weekly'" in capsys.readouterr().err
+
+
+def test_progress_eta():
+    p = BackfillProgress(total=10, started=time.perf_counter() - 20)
+    assert p.eta_sec() is None
+    p.skipped += ["a", "b"]
+    p.done += ["c", "d"]
+    assert p.eta_sec() == pytest.approx(60, rel=0.05)  # 10 s per date run, 6 left
+    assert "[4/10]" in p.line() and "eta=1m0" in p.line()
+    assert format_duration(3 * 3600 + 125) == "3h02m"
+
+
+def test_backfill_cli(pipeline, monkeypatch, capsys):
+    from nuclear.cli import main
+
+    monkeypatch.setattr(sys, "argv", ["nuclear", "backfill", "daily", "--from", "2026-01-01", "--to", "2026-01-03",
+                                      "--workers", "2"])
+    assert main() == 0
+    out = capsys.readouterr().out
+    assert "[3/3]" in out and '"done": 3' in out
+
+    monkeypatch.setattr(sys, "argv", ["nuclear", "backfill", "daily", "--from", "2026-01-01", "--to", "2026-01-04",
+                                      "--dry-run"])
+    assert main() == 0
+    assert "Would run daily 2026-01-04" in capsys.readouterr().out
@@ -0,0 +1,169 @@
+"""
+D-1 async ingestion tests - sources fetched concurrently, per-domain concurrency / politeness,
+conditional GETs (ETag -> 304), timeout isolation, RSS / Atom parsing, and the unchanged
+whitelist filter and caps. HTTP via httpx.MockTransport, DB in tmp_path.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from nuclear.db.sqlite import SQLiteEngine
+from nuclear.phases.daily import d1
+from nuclear.phases.daily.adapters.feed_adapter import FeedAdapter, parse_feed
+from nuclear.phases.daily.adapters.forum_adapter import ForumAdapter
+from nuclear.phases.daily.adapters.http_client import PooledFetcher, domain_of
+from nuclear.phases.daily.adapters.news_adapter import NewsAdapter
+
+DATE = "2026-02-04"
+
+
+def rss(*titles, day="Wed, 04 Feb 2026 09:00:00 GMT"):
+    items = "".join(f"<item><title>{t}</title><link>https://x/{t}</link><pubDate>{day}</pubDate></item>"
+                    for t in titles)
+    return f"<rss><channel>{items}</channel></rss>"
+
+
+@pytest.fixture(autouse=True)
+def tmp_db(monkeypatch, tmp_path):
+    monkeypatch.setattr(SQLiteEngine, "DB_PATH", tmp_path / "nuclear.db")
+    monkeypatch.setattr(d1, "load_d1a_news_domains", lambda: {"reuters.com", "wsj.com"})
+    monkeypatch.setattr(d1, "load_d1b_forum_domains", lambda: {"reddit.com", "ptt.cc"})
+    monkeypatch.delenv("NUCLEAR_D1_NEWS_FEEDS", raising=False)
+    monkeypatch.delenv("NUCLEAR_D1_FORUM_FEEDS", raising=False)
+
+
+def slow_transport(delay_sec, log=None):
+    async def handler(request):
+        if log is not None:
+            log.append((request.url.host, time.monotonic()))
+        await asyncio.sleep(delay_sec)
+        return httpx.Response(200, text=rss(request.url.path.strip("/") or "root"))
+
+    return httpx.MockTransport(handler)
+
+
+def test_sources_are_fetched_concurrently():
+    news = FeedAdapter({"reuters.com": ["https://www.reuters.com/a"], "wsj.com": ["https://wsj.com/b"]})
+    forum = FeedAdapter({"reddit.com": ["https://reddit.com/c"], "ptt.cc": ["https://ptt.cc/d"]})
+    fetcher = PooledFetcher(politeness_ms=0, use_cache=False, transport=slow_transport(0.2))
+
+    started = time.perf_counter()
+    out = d1.run_d1(DATE, news, forum, fetcher=fetcher)
+    assert time.perf_counter() - started < 0.5  # four 200 ms fetches, ~200 ms in total
+    assert sorted(i["source_domain"] for i in out.news_items) == ["reuters.com", "wsj.com"]
+    assert len(out.forum_items) == 2
+    assert out.ingestion["http"] == {"requests": 4, "not_modified": 0, "errors": 0}
+
+
+def test_sync_adapters_run_alongside_each_other():
+    class SlowNews(NewsAdapter):
+        def fetch(self, date):
+            time.sleep(0.2)
+            return [{"date": date, "source_domain": "reuters.com", "title": "n"}]
+
+    class SlowForum(ForumAdapter):
+        def fetch(self, date):
+            time.sleep(0.2)
+            return [{"date": date, "source_domain": "reddit.com", "title": "f"}]
+
+    started = time.perf_counter()
+    out = d1.run_d1(DATE, SlowNews(), SlowForum())
+    assert time.perf_counter() - started < 0.35
+    assert len(out.news_items) == 1 and len(out.forum_items) == 1
+    assert "http" not in out.ingestion and out.signals == {"risk_on_shift": False}
+
+
+def test_per_domain_concurrency_and_politeness():
+    calls = []
+    urls = [f"https://reuters.com/{i}" for i in range(4)] + ["https://wsj.com/x"]
+    fetcher = PooledFetcher(domain_concurrency=1, politeness_ms=100, use_cache=False,
+                            transport=slow_transport(0.01, calls))
+
+    async def go():
+        async with fetcher:
+            return await asyncio.gather(*(fetcher.get(u) for u in urls))
+
+    assert all(r.ok for r in asyncio.run(go()))
+    reuters = [t for host, t in calls if host == "reuters.com"]
+    gaps = [b - a for a, b in zip(reuters, reuters[1:])]
+    assert len(reuters) == 4 and min(gaps) >= 0.09
+    assert [h for h, _ in calls].index("wsj.com") < 2  # other domains are not held up
+
+
+def test_conditional_get_uses_cached_body_on_304():
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=rss("Fed Holds Rates"), headers={"ETag": '"v1"'})
+
+    adapter = FeedAdapter({"reuters.com": ["https://www.reuters.com/markets/rss"]})
+    forum = FeedAdapter({})
+    runs = [d1.run_d1(DATE, adapter, forum, fetcher=PooledFetcher(politeness_ms=0,
+                                                                  transport=httpx.MockTransport(handler)))
+            for _ in range(2)]
+    assert seen == [None, '"v1"']
+    assert runs[0].news_items == runs[1].news_items and runs[1].news_items[0]["title"] == "Fed Holds Rates"
+    assert runs[1].ingestion["http"]["not_modified"] == 1
+
+
+def test_timeouts_and_bad_sources_are_isolated():
+    async def handler(request):
+        if request.url.host == "wsj.com":
+            await asyncio.sleep(5)
+        if request.url.host == "ptt.cc":
+            return httpx.Response(503)
+        return httpx.Response(200, text=rss("ok"))
+
+    news = FeedAdapter({"reuters.com": ["https://reuters.com/rss"], "wsj.com": ["https://wsj.com/rss"]})
+    forum = FeedAdapter({"ptt.cc": ["https://ptt.cc/rss"]})
+    fetcher = PooledFetcher(politeness_ms=0, timeout_sec=0.2, use_cache=False,
+                            transport=httpx.MockTransport(handler))
+    started = time.perf_counter()
+    out = d1.run_d1(DATE, news, forum, fetcher=fetcher)
+    assert time.perf_counter() - started < 2
+    assert [i["source_domain"] for i in out.news_items] == ["reuters.com"]
+    assert out.forum_items == [] and out.ingestion["http"]["errors"] == 2
+    assert news.errors["https://wsj.com/rss"].startswith("Timeout") and forum.errors["https://ptt.cc/rss"] == "HTTP 503"
+
+
+def test_whitelist_and_caps_still_apply():
+    def handler(request):
+        return httpx.Response(200, text=rss(*[f"t{i}" for i in range(60)]))
+
+    news = FeedAdapter({"reuters.com": ["https://reuters.com/rss"], "evil.example": ["https://evil.example/rss"]})
+    forum = FeedAdapter({"reddit.com": [f"https://reddit.com/r/{i}" for i in range(6)]})
+    out = d1.run_d1(DATE, news, forum, fetcher=PooledFetcher(politeness_ms=0, use_cache=False,
+                                                              transport=httpx.MockTransport(handler)))
+    assert len(out.news_items) == d1.NEWS_PER_SOURCE_CAP
+    assert {i["source_domain"] for i in out.news_items} == {"reuters.com"}
+    assert len(out.forum_items) == d1.TOTAL_FORUM_CAP
+    assert out.ingestion["news"] == {"ms": out.ingestion["news"]["ms"], "raw": 120, "kept": 50}
+
+
+def test_feeds_from_env_inline_json_or_path(monkeypatch, tmp_path):
+    monkeypatch.setenv("NUCLEAR_D1_NEWS_FEEDS", '{"reuters.com": ["https://reuters.com/rss"]}')
+    path = tmp_path / "forums.json"
+    path.write_text('{"reddit.com": ["https://reddit.com/r/stocks"]}', encoding="utf-8")
+    monkeypatch.setenv("NUCLEAR_D1_FORUM_FEEDS", str(path))
+
+    def handler(request):
+        return httpx.Response(200, text=rss(request.url.host))
+
+    out = d1.run_d1(DATE, fetcher=PooledFetcher(politeness_ms=0, use_cache=False,
+                                                transport=httpx.MockTransport(handler)))
+    assert [i["title"] for i in out.news_items] == ["reuters.com"]
+    assert [i["title"] for i in out.forum_items] == ["reddit.com"]
+
+
+def test_parse_feed_rss_and_atom():
+    atom = ('<feed xmlns="http://www.w3.org/2005/Atom"><entry><title>A</title><link href="https://a"/>'
+            '<updated>2026-02-03T23:00:00Z</updated><summary>s</summary></entry></feed>')
+    assert parse_feed(atom) == [{"title": "A", "url": "https://a", "published": "2026-02-03", "content": "s"}]
+    assert parse_feed(rss("B"))[0]["published"] == DATE
+    assert domain_of("https://www.Reuters.com/x") == "reuters.com"
@@ -0,0 +1,89 @@
+"""
+D-3 sharding tests - deterministic rendezvous assignment, shards in worker processes with
+partial snapshots, merge with per-shard timings, and the distributed --shard-index CLI flow.
+DB in tmp_path.
+"""
+
+import sys
+
+import pytest
+
+from nuclear.db.sqlite import SQLiteEngine
+from nuclear.phases.daily.adapters.d3_ticker_adapter import TickerDerivativeAdapter
+from nuclear.phases.daily.d3 import assign_shards, load_d3_shards, merge_d3_shards, run_d3, shard_of
+from nuclear.storage.backends.local_fs import LocalFSBackend
+
+UNIVERSE = [f"T{i:03d}" for i in range(200)]
+
+
+@pytest.fixture(autouse=True)
+def tmp_db(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SQLiteEngine, "DB_PATH", tmp_path / "nuclear.db")
+    monkeypatch.setattr(LocalFSBackend, "ROOT_DIR", tmp_path / "snapshots")
+    monkeypatch.delenv("NUCLEAR_D3_SHARD_POOL", raising=False)
+
+
+class IVAdapter(TickerDerivativeAdapter):
+    def fetch(self, date, tickers):
+        if "BAD" in tickers:
+            raise ConnectionError("timeout")
+        return {t: {"iv": len(t) / 10} for t in tickers}
+
+
+def test_assignment_is_deterministic_balanced_and_stable():
+    four = assign_shards(UNIVERSE, 4)
+    assert all(shard == sorted(shard) for shard in four)  # input order within a shard
+    assert sorted(t for shard in four for t in shard) == UNIVERSE
+    assert all(30 <= len(shard) <= 70 for shard in four)
+    assert shard_of("NVDA", 4) == shard_of("NVDA", 4)
+
+    moved = sum(shard_of(t, 4) != shard_of(t, 5) for t in UNIVERSE)
+    assert moved < len(UNIVERSE) * 0.35  # ~1/5 move; modulo hashing would move ~4/5
+    with pytest.raises(ValueError):
+        assign_shards(UNIVERSE, 0)
+
+
+def test_shards_run_in_processes_and_merge(tmp_path):
+    tickers = UNIVERSE[:20] + ["BAD"]
+    out = run_d3("2026-02-04", tickers=tickers, shards=3, adapter=IVAdapter(), run_id="r1")
+    assert out.shards == 3 and out.universe_size == 21
+    assert list(out.derivatives_stub) == UNIVERSE[:20]  # universe order
+    assert out.signals["failed_tickers"] == {"BAD": "ConnectionError: timeout"}
+    assert sorted(out.shard_timings_ms) == ["0", "1", "2"]
+
+    parts = load_d3_shards("r1", 3)  # each worker process wrote its own partial snapshot
+    assert sorted(p.shard_index for p in parts) == [0, 1, 2]
+    assert merge_d3_shards("2026-02-04", tickers, parts).derivatives_stub == out.derivatives_stub
+
+
+def test_unsharded_output_is_unchanged():
+    out = run_d3("2026-02-04", tickers=["AAPL", "BAD", "MSFT"], adapter=IVAdapter())
+    assert out.shards == 1 and out.shard_timings_ms == {}
+    assert list(out.derivatives_stub) == ["AAPL", "MSFT"]
+    assert load_d3_shards("r1", 1) == []
+
+
+def test_missing_shard_is_reported():
+    parts = load_d3_shards("none", 2)
+    out = merge_d3_shards("2026-02-04", ["A"], parts, shards=2)
+    assert out.signals["missing_shards"] == [0, 1]
+
+
+def test_distributed_shard_index_then_merge(monkeypatch, capsys):
+    from nuclear.cli import main
+
+    base = ["nuclear", "daily", "--date", "2026-02-04", "--run-id", "dist", "--shards", "2",
+            "--tickers", ",".join(UNIVERSE[:10])]
+    monkeypatch.setattr(sys, "argv", base + ["--merge-shards"])
+    assert main() == 1  # nothing written yet
+    for i in (0, 1):
+        monkeypatch.setattr(sys, "argv", base + ["--shard-index", str(i)])
+        assert main() == 0
+    monkeypatch.setattr(sys, "argv", base + ["--merge-shards"])
+    assert main() == 0
+    assert '"universe_size": 10' in capsys.readouterr().out
+
+    from nuclear.db.repos import SnapshotRepo
+
+    assert SnapshotRepo.latest_for_run("dist", "daily/d3") is not None
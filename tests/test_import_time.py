@@ -0,0 +1,60 @@
+"""
+CLI cold-start tests - `python -X importtime` over the modules a scheduled command loads:
+no heavy optional dependencies, no import-time side effects, and a total startup budget
+(NUCLEAR_IMPORT_BUDGET_MS, default 400 ms; best of three runs).
+"""
+
+import os
+import subprocess
+import sys
+
+COLD_PATH = (
+    "nuclear.cli",
+    "nuclear.orchestration.schedule",
+    "nuclear.orchestration.arbiter",
+    "nuclear.phases.p6.runtime",
+    "nuclear.llm.router",
+)
+HEAVY = ("sqlalchemy", "pydantic_settings", "boto3", "httpx", "fastapi", "nuclear.config")
+DEFAULT_BUDGET_MS = 400
+
+
+def _importtime(code: str, cwd) -> dict:
+    """{module: (cumulative microseconds, nesting depth)} for a fresh interpreter running `code`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd, capture_output=True, text=True, env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    times = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "cumulative" not in line:
+            _, cumulative, name = line.split("|")
+            times[name.strip()] = (int(cumulative), len(name) - len(name.lstrip()))
+    return times
+
+
+def test_cold_path_skips_heavy_dependencies(tmp_path):
+    times = _importtime(f"import {', '.join(COLD_PATH)}, nuclear.learning.state", tmp_path)
+    loaded = [m for m in times if m.split(".")[0] in HEAVY or m in HEAVY]
+    assert loaded == []
+
+
+def test_no_import_time_side_effects(tmp_path):
+    code = (
+        "import structlog, nuclear.cli, nuclear.llm.router as r, nuclear.learning.state;"
+        "assert r._router is None, 'router built at import';"
+        "assert not structlog.is_configured(), 'structlog configured at import'"
+    )
+    _importtime(code, tmp_path)
+    assert not (tmp_path / "outputs").exists()  # no create_tables() at import
+
+
+def test_startup_budget(tmp_path):
+    budget_ms = float(os.environ.get("NUCLEAR_IMPORT_BUDGET_MS", DEFAULT_BUDGET_MS))
+    runs = []
+    for _ in range(3):
+        times = _importtime(f"import {', '.join(COLD_PATH)}", tmp_path)
+        # top-level entries only: nested imports are already inside their importer's cumulative time
+        runs.append(sum(us for name, (us, indent) in times.items() if indent == 1) / 1000)
+    assert min(runs) < budget_ms, f"cold-start imports took {min(runs):.0f} ms (budget {budget_ms:.0f} ms)"
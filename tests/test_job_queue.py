@@ -0,0 +1,150 @@
+"""
+Job queue tests - priority order, leases / visibility timeout, retry -> dead, worker
+handlers, the /jobs API and concurrent claims. DB in tmp_path.
+"""
+
+import threading
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from nuclear.db.repos import JobRepo
+from nuclear.db.sqlite import SQLiteEngine
+from nuclear.main import app
+from nuclear.orchestration import jobs
+from nuclear.orchestration.jobs import JobWorker, enqueue_job, get_job
+
+
+@pytest.fixture(autouse=True)
+def tmp_db(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SQLiteEngine, "DB_PATH", tmp_path / "nuclear.db")
+
+
+@pytest.fixture
+def handlers(monkeypatch):
+    calls = []
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "echo", lambda p: calls.append(p) or {"echo": p})
+
+    def boom(p):
+        calls.append(p)
+        raise RuntimeError("upstream 503")
+
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "boom", boom)
+    return calls
+
+
+def test_claim_order_is_priority_then_fifo(handlers):
+    low = enqueue_job("echo", {"n": 1})
+    high = enqueue_job("echo", {"n": 2}, priority=5)
+    low2 = enqueue_job("echo", {"n": 3})
+    later = enqueue_job("echo", {"n": 4}, priority=9, delay_sec=60)
+    order = [JobRepo.claim("w", 60)["job_id"] for _ in range(3)]
+    assert order == [high, low, low2]
+    assert JobRepo.claim("w", 60) is None  # the delayed job is not due yet
+    assert get_job(later)["status"] == "queued"
+
+
+def test_expired_lease_is_reclaimed_and_old_owner_loses_it(handlers):
+    job_id = enqueue_job("echo", {})
+    assert JobRepo.claim("w1", lease_sec=0.05)["job_id"] == job_id
+    assert JobRepo.claim("w2", lease_sec=60) is None
+    time.sleep(0.1)
+    job = JobRepo.claim("w2", lease_sec=60)
+    assert job["job_id"] == job_id and job["attempts"] == 2 and job["lease_owner"] == "w2"
+    assert not JobRepo.heartbeat(job_id, "w1", 60)
+    assert not JobRepo.complete(job_id, "w1", "{}")
+    assert JobRepo.complete(job_id, "w2", "{}")
+    assert get_job(job_id)["status"] == "succeeded"
+
+
+def test_expired_lease_on_last_attempt_goes_dead(handlers):
+    job_id = enqueue_job("echo", {}, max_attempts=1)
+    JobRepo.claim("w1", lease_sec=0.01)
+    time.sleep(0.05)
+    assert JobRepo.claim("w2", lease_sec=60) is None
+    assert get_job(job_id)["status"] == "dead"
+
+
+def test_worker_runs_handler_and_stores_result(handlers):
+    job_id = enqueue_job("echo", {"ticker": "NVDA"})
+    assert JobWorker(poll_interval=0).run(exit_when_idle=True) == 1
+    job = get_job(job_id)
+    assert job["status"] == "succeeded" and job["result"] == {"echo": {"ticker": "NVDA"}}
+    assert handlers == [{"ticker": "NVDA"}]
+
+
+def test_failed_job_retries_with_backoff_then_dead(handlers):
+    job_id = enqueue_job("boom", {}, max_attempts=2)
+    worker = JobWorker(poll_interval=0, retry_delay_sec=0)
+    worker.run_once()
+    job = get_job(job_id)
+    assert job["status"] == "queued" and job["attempts"] == 1 and "upstream 503" in job["error"]
+    worker.run_once()
+    assert get_job(job_id)["status"] == "dead"
+    assert worker.run_once() is None
+
+    delayed = enqueue_job("boom", {}, max_attempts=2)
+    JobWorker(retry_delay_sec=60).run_once()
+    assert get_job(delayed)["status"] == "queued"
+    assert JobRepo.claim("w", 60) is None  # backing off
+
+
+def test_heartbeat_keeps_a_long_job_leased(monkeypatch, handlers):
+    started, release = threading.Event(), threading.Event()
+
+    def slow(p):
+        started.set()
+        release.wait(5)
+        return "ok"
+
+    monkeypatch.setitem(jobs.JOB_HANDLERS, "slow", slow)
+    job_id = enqueue_job("slow", {})
+    t = threading.Thread(target=JobWorker(lease_sec=0.3).run_once)
+    t.start()
+    started.wait(5)
+    time.sleep(0.6)  # twice the lease: only the heartbeat keeps it
+    assert JobRepo.claim("thief", 60) is None
+    release.set()
+    t.join(5)
+    assert get_job(job_id)["status"] == "succeeded" and get_job(job_id)["attempts"] == 1
+
+
+def test_concurrent_workers_never_double_claim(handlers):
+    ids = {enqueue_job("echo", {"n": i}) for i in range(30)}
+    claimed = []
+
+    def drain(name):
+        while (job := JobRepo.claim(name, 60)) is not None:
+            claimed.append(job["job_id"])
+
+    threads = [threading.Thread(target=drain, args=(f"w{i}",)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(claimed) == sorted(ids)
+
+
+def test_unknown_job_type_rejected():
+    with pytest.raises(ValueError):
+        enqueue_job("nope", {})
+
+
+@pytest.mark.asyncio
+async def test_jobs_api(handlers):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        r = await client.post("/jobs/echo", json={"payload": {"ticker": "AMD"}, "priority": 3})
+        assert r.status_code == 202
+        job_id = r.json()["job_id"]
+        assert (await client.post("/jobs/nope")).status_code == 404
+        assert (await client.post("/jobs/echo")).status_code == 202  # body is optional
+
+        job = (await client.get(f"/jobs/{job_id}")).json()
+        assert job["status"] == "queued" and job["priority"] == 3 and job["payload"] == {"ticker": "AMD"}
+        JobWorker().run(exit_when_idle=True)
+        assert (await client.get(f"/jobs/{job_id}")).json()["result"] == {"echo": {"ticker": "AMD"}}
+        listing = (await client.get("/jobs")).json()
+        assert listing["counts"] == {"succeeded": 2} and len(listing["jobs"]) == 2
+        assert (await client.get("/jobs/missing")).status_code == 404
@@ -0,0 +1,170 @@
+"""
+V8.17 Batch API engine tests - JSONL build, submit/poll, fan-out by custom_id.
+Runs against the in-process LocalBatchServer (no network).
+"""
+
+import json
+
+import pytest
+
+from nuclear.llm.batch import BatchEngine, BatchError, OpenAIBatchBackend
+from nuclear.llm.batch_standin import LocalBatchServer
+
+
+def _engine(srv, tmp_path, sleeps=None):
+    return BatchEngine(
+        OpenAIBatchBackend(base_url=srv.base_url, api_key="test"),
+        poll_initial_sec=1.0,
+        poll_max_sec=4.0,
+        sleep=(sleeps.append if sleeps is not None else (lambda s: None)),
+        root_dir=tmp_path,
+    )
+
+
+def test_jsonl_lines_are_chat_completion_requests():
+    engine = BatchEngine(OpenAIBatchBackend(base_url="http://unused", api_key="x"))
+    collector = engine.collect("P1-2", model="m1")
+    collector.add("NVDA", "sys", "user nvda")
+    collector.add("TSM", "", "user tsm", max_tokens=100)
+    lines = [json.loads(line) for line in collector.to_jsonl().splitlines()]
+    assert [line["custom_id"] for line in lines] == ["NVDA", "TSM"]
+    assert lines[0]["url"] == "/v1/chat/completions"
+    assert lines[0]["body"]["messages"][0] == {"role": "system", "content": "sys"}
+    assert lines[1]["body"]["messages"] == [{"role": "user", "content": "user tsm"}]
+    assert lines[1]["body"]["max_tokens"] == 100
+    with pytest.raises(ValueError):
+        collector.add("NVDA", "s", "u")
+
+
+def test_results_fan_back_by_custom_id(tmp_path):
+    def responder(body):
+        return "<think>why</think>" + json.dumps({"echo": body["messages"][-1]["content"]})
+
+    with LocalBatchServer(responder=responder, polls_until_complete=2) as srv:
+        sleeps = []
+        engine = _engine(srv, tmp_path, sleeps)
+        collector = engine.collect("P2-2", model="m1", run_id="run_b1")
+        futs = {t: collector.add(t, "sys", f"prompt {t}") for t in ["AAPL", "MSFT", "NVDA"]}
+        engine.run(collector)
+
+    for t, fut in futs.items():
+        res = fut.result(timeout=0)
+        assert json.loads(res["text"]) == {"echo": f"prompt {t}"}
+        assert res["reasoning"] == "why"
+        assert res["metadata"]["batch"] is True
+    # Two in_progress polls -> two backoff sleeps, exponential with jitter
+    assert len(sleeps) == 2
+    assert 0.8 <= sleeps[0] <= 1.2 and 1.6 <= sleeps[1] <= 2.4
+    assert list((tmp_path / "P2-2").glob("*.out.jsonl"))
+
+
+def test_per_item_errors_isolated_and_recorded(tmp_path):
+    from nuclear.db.repos import BatchJobRepo
+
+    with LocalBatchServer(fail_custom_ids={"BAD"}, polls_until_complete=0) as srv:
+        engine = _engine(srv, tmp_path)
+        collector = engine.collect("P3", model="m1", run_id="run_b2")
+        good = collector.add("GOOD", "s", "u")
+        bad = collector.add("BAD", "s", "u")
+        engine.run(collector)
+
+    assert good.result()["text"].startswith("stub batch response")
+    with pytest.raises(BatchError):
+        bad.result()
+
+    batch_id = next((tmp_path / "P3").glob("*.out.jsonl")).name.split(".")[0]
+    row = BatchJobRepo.get(batch_id)
+    assert row["status"] == "completed"
+    assert row["item_count"] == 2 and row["completed_count"] == 1
+    assert row["provider_batch_id"].startswith("batch_")
+
+
+def test_failed_batch_rejects_all_futures(tmp_path):
+    with LocalBatchServer(batch_status="expired", polls_until_complete=0) as srv:
+        engine = _engine(srv, tmp_path)
+        collector = engine.collect("P1-2", model="m1")
+        fut = collector.add("X", "s", "u")
+        engine.run(collector)
+    with pytest.raises(BatchError, match="expired"):
+        fut.result()
+
+
+def test_poll_timeout_cancels_and_keeps_finished_items(tmp_path):
+    from nuclear.db.repos import BatchJobRepo
+
+    with LocalBatchServer(polls_until_complete=1000, unfinished_custom_ids={"SLOW"}) as srv:
+        engine = _engine(srv, tmp_path)
+        engine.poll_timeout_sec = 5.0
+        collector = engine.collect("P1-2", model="m1")
+        done = collector.add("DONE", "s", "u")
+        slow = collector.add("SLOW", "s", "u")
+        engine.run(collector)
+        assert [b["status"] for b in srv.batches.values()] == ["cancelled"]
+    assert done.result()["text"].startswith("stub batch response")
+    with pytest.raises(BatchError, match="missing from batch output"):
+        slow.result()
+    row = BatchJobRepo.get(next((tmp_path / "P1-2").glob("*.out.jsonl")).name.split(".")[0])
+    assert row["status"] == "cancelled" and row["completed_count"] == 1 and "cancelled" in row["error"]
+
+
+def test_p1_step2_batch_timeout_leaves_only_unfinished_tickers_to_sync(tmp_path):
+    from nuclear.phases.p1.p1_step2 import _run_p1_step2_batch
+
+    prompts = {t: {"system": "s", "user": f"u {t}"} for t in ("NVDA", "AMD", "SLOW")}
+    with LocalBatchServer(polls_until_complete=1000, unfinished_custom_ids={"SLOW"}) as srv:
+        engine = _engine(srv, tmp_path)
+        engine.poll_timeout_sec = 5.0
+        texts = _run_p1_step2_batch(engine, prompts, "r1")
+    assert sorted(texts) == ["AMD", "NVDA"]
+
+
+def test_engine_is_an_explicit_per_phase_opt_in(monkeypatch):
+    from nuclear.llm.batch import get_batch_engine
+
+    monkeypatch.setenv("NUCLEAR_LLM_NETWORK", "1")
+    monkeypatch.setenv("NUCLEAR_LLM_BATCH_BASE_URL", "https://api.openai.com/v1")
+    monkeypatch.delenv("NUCLEAR_LLM_BATCH_PHASES", raising=False)
+    assert get_batch_engine("P1-2") is None  # endpoint configured, but no phase opted in
+    monkeypatch.setenv("NUCLEAR_LLM_BATCH_PHASES", "P1-2, P3")
+    assert get_batch_engine("P1-2") is not None and get_batch_engine("P2-2") is None
+    monkeypatch.delenv("NUCLEAR_LLM_NETWORK")
+    assert get_batch_engine("P1-2") is None
+
+
+def test_batch_model_is_resolved_per_route(monkeypatch):
+    monkeypatch.delenv("NUCLEAR_LLM_BATCH_MODEL", raising=False)
+    openai = BatchEngine(OpenAIBatchBackend(base_url="https://api.openai.com/v1", api_key="x"))
+    assert openai.model_for("P0.7") == "o3"  # openai/o3 route
+    assert openai.model_for("P1-2") is None  # Hermes is not served by the OpenAI Batch API
+    gateway = BatchEngine(OpenAIBatchBackend(base_url="http://gateway.local/v1", api_key="x"))
+    assert gateway.model_for("P1-2") == "nousresearch/hermes-4-405b"
+    monkeypatch.setenv("NUCLEAR_LLM_BATCH_MODEL", "gpt-4.1-mini")
+    assert openai.model_for("P1-2") == "gpt-4.1-mini"
+
+
+def test_p1_step2_without_servable_model_stays_sync(monkeypatch, tmp_path):
+    from nuclear.phases.p1.p1_step2 import _run_p1_step2_batch
+
+    monkeypatch.delenv("NUCLEAR_LLM_BATCH_MODEL", raising=False)
+    with LocalBatchServer() as srv:
+        engine = _engine(srv, tmp_path)
+        engine.backend.base_url = "https://api.openai.com/v1"  # would reject the Hermes slug
+        assert _run_p1_step2_batch(engine, {"NVDA": {"system": "s", "user": "u"}}, "r1") == {}
+        assert srv.request_log == []
+
+
+def test_analysis_graph_batches_p1_step2(monkeypatch, tmp_path):
+    from nuclear.db.sqlite import SQLiteEngine
+    from nuclear.orchestration.run_graph import run_analysis
+    from nuclear.storage.backends.local_fs import LocalFSBackend
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SQLiteEngine, "DB_PATH", tmp_path / "nuclear.db")
+    monkeypatch.setattr(LocalFSBackend, "ROOT_DIR", tmp_path / "snapshots")
+    monkeypatch.setenv("NUCLEAR_MEMO", "0")
+    with LocalBatchServer(polls_until_complete=0) as srv:
+        monkeypatch.setattr("nuclear.llm.batch.get_batch_engine", lambda phase: _engine(srv, tmp_path))
+        res = run_analysis([], run_id="batched")
+        sent = [b["metadata"] for b in srv.batches.values()]
+    assert res.ok, res.failed()
+    assert sent == [{"phase": "P1-2", "run_id": "batched"}]
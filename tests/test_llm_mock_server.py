@@ -0,0 +1,72 @@
+"""
+Local OpenAI-compatible stand-in tests - chat completions, SSE, faults, benchmark driver.
+"""
+
+import json
+import threading
+
+import httpx
+
+from nuclear.llm.bench import percentile, run_benchmark
+from nuclear.llm.hermes_reasoning_parser import parse_hermes_response
+from nuclear.llm.mock_server import MockLLMConfig, MockLLMServer
+
+
+def _chat(base_url, **body):
+    body.setdefault("messages", [{"role": "system", "content": "STATIC"}, {"role": "user", "content": "NVDA"}])
+    return httpx.post(f"{base_url}/chat/completions", json={"model": "m", **body}, timeout=10)
+
+
+def test_chat_completion_with_think_tags_and_prefix_cache():
+    config = MockLLMConfig(think_text="weighing capex", completion_tokens=42)
+    with MockLLMServer(config, responder=lambda body: '{"tier": "A"}') as srv:
+        first = _chat(srv.base_url).json()
+        second = _chat(srv.base_url).json()
+    content = first["choices"][0]["message"]["content"]
+    parsed = parse_hermes_response(content)
+    assert parsed.reasoning_trace == "weighing capex" and json.loads(parsed.final_answer) == {"tier": "A"}
+    assert first["usage"]["completion_tokens"] == 42 and first["usage"]["prompt_tokens"] > 0
+    assert first["usage"]["prompt_tokens_details"]["cached_tokens"] == 0
+    assert second["usage"]["prompt_tokens_details"]["cached_tokens"] > 0
+
+
+def test_sse_stream_reassembles_to_full_answer():
+    with MockLLMServer(MockLLMConfig(stream_chunks=4), responder=lambda body: "abcdefghij") as srv:
+        with httpx.stream("POST", f"{srv.base_url}/chat/completions",
+                          json={"model": "m", "stream": True, "messages": [{"role": "user", "content": "x"}]}) as resp:
+            assert resp.headers["content-type"].startswith("text/event-stream")
+            events = [line[len("data: "):] for line in resp.iter_lines() if line.startswith("data: ")]
+    assert events[-1] == "[DONE]"
+    chunks = [json.loads(e) for e in events[:-1]]
+    assert "".join(c["choices"][0]["delta"]["content"] for c in chunks) == "abcdefghij"
+    assert chunks[-1]["choices"][0]["finish_reason"] == "stop" and "usage" in chunks[-1]
+
+
+def test_rate_limit_and_error_injection():
+    with MockLLMServer(MockLLMConfig(rate_limit_rate=1.0, retry_after_sec=2)) as srv:
+        resp = _chat(srv.base_url)
+        assert resp.status_code == 429 and resp.headers["Retry-After"] == "2"
+    with MockLLMServer(MockLLMConfig(error_rate=1.0)) as srv:
+        assert _chat(srv.base_url).status_code == 500
+        assert srv.status_counts == {500: 1}
+
+
+def test_latency_distribution_and_in_flight_tracking():
+    srv = MockLLMServer(MockLLMConfig(latency_ms=100, latency_dist="lognormal", seed=7, tail_rate=1.0, tail_ms=50))
+    assert all(s >= 0 for s in (srv.sample_latency_sec() for _ in range(50)))
+    with MockLLMServer(MockLLMConfig(latency_ms=150)) as srv:
+        threads = [threading.Thread(target=_chat, args=(srv.base_url,)) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert srv.chat_requests == 5 and srv.max_in_flight == 5 and srv.in_flight == 0
+
+
+def test_benchmark_reports_throughput_and_tails():
+    assert percentile([1, 2, 3, 4], 50) == 2 and percentile([], 99) is None
+    report = run_benchmark(calls=12, concurrency=4, phases=["P1-2", "P2-2"], config=MockLLMConfig(latency_ms=5))
+    assert report["ok"] == 12 and report["failed"] == 0
+    assert report["throughput_per_sec"] > 0 and report["latency_ms"]["p99"] >= report["latency_ms"]["p50"]
+    assert report["server"]["chat_requests"] == 12
+    assert report["prefix_cache"]["P1-2"]["prefix_hits"] == 5
@@ -0,0 +1,153 @@
+"""
+LLMRouter provider chain tests - ordered fallback, circuit breakers, hedging.
+No network: fake clients only.
+"""
+
+import threading
+import time
+
+import pytest
+
+from nuclear.llm.base import BaseLLMClient, LLMUnavailableError
+from nuclear.llm.circuit_breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+from nuclear.llm.hedging import LatencyTracker
+from nuclear.llm.router import LLMRouter
+
+
+class FakeClient(BaseLLMClient):
+    def __init__(self, name, text="ok", delay=0.0, fail=False):
+        self._name = name
+        self.text = text
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def name(self):
+        return self._name
+
+    def generate(self, prompt, schema=None):
+        with self._lock:
+            self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self._name} down")
+        return {"text": self.text, "confidence": 0.5, "reasoning": None, "metadata": {}}
+
+
+def test_fallback_to_next_provider():
+    a, b = FakeClient("a", fail=True), FakeClient("b", text="from b")
+    router = LLMRouter(chains={"default": [a, b]}, hedge=False)
+    res = router.generate("hi")
+    assert res["text"] == "from b"
+    assert res["metadata"]["provider"] == "b"
+    assert a.calls == 1
+
+
+def test_phase_chain_override():
+    a, b = FakeClient("a", text="A"), FakeClient("b", text="B")
+    router = LLMRouter(chains={"default": [a], "P1-2": [b, a]}, hedge=False)
+    assert router.generate("x", phase="P1-2")["text"] == "B"
+    assert router.generate("x", phase="P0")["text"] == "A"
+
+
+def test_circuit_opens_and_skips_provider():
+    a, b = FakeClient("a", fail=True), FakeClient("b")
+    router = LLMRouter(chains={"default": [a, b]}, hedge=False)
+    for _ in range(5):
+        router.generate("x")
+    # Breaker threshold is 3: after that `a` is skipped.
+    assert a.calls == 3
+    assert router.chain_for()[0].breaker.state == OPEN
+
+
+def test_all_providers_failed_raises():
+    router = LLMRouter(chains={"default": [FakeClient("a", fail=True)]}, hedge=False)
+    with pytest.raises(LLMUnavailableError):
+        router.generate("x")
+
+
+def test_breaker_half_open_probe():
+    now = [0.0]
+    br = CircuitBreaker("p", failure_threshold=1, reset_timeout_sec=10, clock=lambda: now[0])
+    br.record_failure()
+    assert br.state == OPEN and not br.allow()
+    now[0] = 11
+    assert br.state == HALF_OPEN
+    assert br.allow() is True
+    assert br.allow() is False  # only one probe
+    br.record_success()
+    assert br.state == CLOSED
+
+
+def test_latency_tracker_p95():
+    t = LatencyTracker(min_samples=5)
+    assert t.p95() is None
+    for v in range(1, 101):
+        t.record(v / 100)
+    assert t.p95() == pytest.approx(0.95)
+
+
+def test_hedge_fires_after_p95_and_takes_fastest():
+    slow, fast = FakeClient("slow", text="slow"), FakeClient("fast", text="fast")
+    router = LLMRouter(chains={"default": [slow, fast]}, hedge=True)
+    # Warm the primary's latency window with fast samples so p95 ~= 0.
+    for _ in range(25):
+        router.chain_for()[0].latency.record(0.01)
+    slow.delay = 0.5
+    started = time.perf_counter()
+    res = router.generate("x")
+    assert res["text"] == "fast"
+    assert time.perf_counter() - started < 0.4
+    assert fast.calls == 1
+
+
+def test_no_hedge_without_observations():
+    slow, fast = FakeClient("slow", text="slow", delay=0.05), FakeClient("fast", text="fast")
+    router = LLMRouter(chains={"default": [slow, fast]}, hedge=True)
+    assert router.generate("x")["text"] == "slow"
+    assert fast.calls == 0
+
+
+def test_hedge_skipped_while_losers_hold_the_pool(monkeypatch):
+    monkeypatch.setenv("NUCLEAR_LLM_HEDGE_WORKERS", "2")
+    slow, fast = FakeClient("slow", text="slow"), FakeClient("fast", text="fast")
+    router = LLMRouter(chains={"default": [slow, fast]}, hedge=True)
+    for _ in range(25):
+        router.chain_for()[0].latency.record(0.01)
+    slow.delay = 0.3
+    assert router.generate("x")["text"] == "fast"
+    pool = router._get_hedge_pool()
+    assert pool.workers == 2 and pool.busy == 1  # the abandoned slow leg is still running
+
+    # no room for two legs: call directly instead of queueing a hedge behind the loser
+    assert router.generate("y")["text"] == "slow" and fast.calls == 1
+    deadline = time.monotonic() + 2
+    while pool.busy and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pool.busy == 0
+
+
+def test_lazy_chains_build_one_slot_per_provider_under_concurrency():
+    router = LLMRouter(hedge=False)
+    start = threading.Barrier(16)
+
+    def build(_):
+        start.wait()
+        return router.chain_for("P1-2")
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(16) as ex:
+        chains = list(ex.map(build, range(16)))
+    assert all(c is chains[0] for c in chains)
+    assert len({id(s.breaker) for s in router._slots.values()}) == len(router._slots)
+
+
+def test_default_router_is_stub_without_network(monkeypatch):
+    monkeypatch.delenv("NUCLEAR_LLM_NETWORK", raising=False)
+    router = LLMRouter()
+    assert router.active_client_name == "stub"
+    assert router.generate("x")["text"] == "stub response"
@@ -0,0 +1,89 @@
+"""
+§2.7 routing table tests - phase -> model/limits, overrides, per-model pools and stats.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from nuclear.llm.routing import GEMINI_FLASH, HERMES_4, O3, OPUS, ModelRoute, RoutingTable
+from nuclear.m0.core import M0Engine
+from nuclear.m0.job import M0Request
+
+
+def test_default_routes_follow_ssot():
+    table = RoutingTable()
+    assert table.route_for("P0").model == OPUS
+    assert table.route_for("P0.7").model == O3
+    for phase in ["P0.5", "P2.5", "P3"]:
+        assert table.route_for(phase).model == HERMES_4
+    assert table.route_for("P1-1.5").model == GEMINI_FLASH
+    assert table.route_for("UNKNOWN") == table.default
+
+
+def test_overrides_file_and_model_swap(tmp_path, monkeypatch):
+    path = tmp_path / "routes.json"
+    path.write_text(json.dumps({"P0.7": {"timeout_sec": 600}, "P9": {"model": "x/y", "concurrency": 1}}))
+    monkeypatch.setenv("NUCLEAR_LLM_ROUTES_FILE", str(path))
+    table = RoutingTable.from_env()
+    assert table.route_for("P0.7") == ModelRoute(
+        O3, max_tokens=8192, temperature=1.0, timeout_sec=600, concurrency=2, context_tokens=200_000
+    )
+    assert table.route_for("P9").model == "x/y"
+    # Dual-analyst leg swaps the model but keeps the phase's limits
+    swapped = table.route_for("P1-1", model=HERMES_4)
+    assert swapped.model == HERMES_4 and swapped.max_tokens == table.route_for("P1-1").max_tokens
+    with pytest.raises(ValueError):
+        table.apply_overrides({"P0": {"modle": "typo"}})
+
+
+def test_engine_routes_phase_to_model_with_own_pool():
+    seen = []
+    engine = M0Engine(llm_call=lambda r, m: seen.append((r.phase, m)) or {"text": "ok"}, routing=RoutingTable())
+    engine.submit(M0Request(phase="P0.7", system_prompt="", user_prompt="a"), timeout=5)
+    engine.submit(M0Request(phase="P1-1.5", system_prompt="", user_prompt="b"), timeout=5)
+    assert seen == [("P0.7", O3), ("P1-1.5", GEMINI_FLASH)]
+    stats = engine.model_stats()
+    assert stats[O3]["concurrency"] == 2 and stats[GEMINI_FLASH]["concurrency"] == 16
+
+
+def test_slow_model_does_not_starve_fast_model():
+    release = threading.Event()
+
+    def call(request, model):
+        if model == O3:
+            release.wait(5)
+        return {"text": "ok"}
+
+    engine = M0Engine(llm_call=call, routing=RoutingTable())
+    slow = [engine.submit_async(M0Request(phase="P0.7", system_prompt="", user_prompt=f"s{i}")) for i in range(6)]
+    started = time.perf_counter()
+    fast = [engine.submit_async(M0Request(phase="P1-1.5", system_prompt="", user_prompt=f"f{i}")) for i in range(20)]
+    for f in fast:
+        f.result(timeout=2)
+    assert time.perf_counter() - started < 1.0
+
+    stats = engine.model_stats()
+    assert stats[O3]["in_flight"] == 2 and stats[O3]["queue_depth"] == 4
+    release.set()
+    for f in slow:
+        f.result(timeout=5)
+    time.sleep(0.05)
+    stats = engine.report()
+    assert stats[O3]["completed"] == 6 and stats[O3]["queue_depth"] == 0
+    assert stats[GEMINI_FLASH]["latency_p95_ms"] is not None
+
+
+def test_router_builds_route_clients_when_network_enabled(monkeypatch):
+    from nuclear.llm.router import LLMRouter
+
+    monkeypatch.setenv("NUCLEAR_LLM_NETWORK", "1")
+    monkeypatch.setenv("OPENROUTER_API_KEY", "k")
+    monkeypatch.delenv("NUCLEAR_LLM_PROVIDER_CHAIN", raising=False)
+    router = LLMRouter()
+    slot = router.chain_for("P0.7")[0]
+    assert slot.client.model == O3 and slot.client.timeout == 300
+    assert slot.name == f"openrouter/{O3}"
+    assert router.chain_for("P1-1", model=HERMES_4)[0].client.model == HERMES_4
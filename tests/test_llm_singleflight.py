@@ -0,0 +1,124 @@
+"""
+Singleflight coalescing tests - identical in-flight LLM requests share one upstream call.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from nuclear.llm.base import BaseLLMClient
+from nuclear.llm.router import LLMRouter
+from nuclear.llm.singleflight import SingleFlight, prompt_fingerprint
+
+
+class SlowClient(BaseLLMClient):
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def name(self):
+        return "slow"
+
+    def generate(self, prompt, schema=None):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return {"text": f"answer:{prompt}", "confidence": 0.5, "reasoning": None, "metadata": {}}
+
+
+def test_fingerprint_stable_and_phase_scoped():
+    a = prompt_fingerprint("p", {"b": 1, "a": 2}, "P1-2")
+    b = prompt_fingerprint("p", {"a": 2, "b": 1}, "P1-2")
+    assert a == b
+    assert a != prompt_fingerprint("p", {"a": 2, "b": 1}, "P2-2")
+
+
+def test_concurrent_identical_requests_share_one_call():
+    client = SlowClient()
+    router = LLMRouter(chains={"default": [client]}, hedge=False)
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(pool.map(lambda _: router.generate("same", phase="P1-2", run_id="r1"), range(5)))
+
+    assert client.calls == 1
+    assert all(r["text"] == "answer:same" for r in results)
+    # Followers get independent copies
+    results[0]["text"] = "mutated"
+    assert results[1]["text"] == "answer:same"
+
+    metrics = router.run_metrics("r1")
+    assert metrics["llm_requests"] == 5
+    assert metrics["llm_upstream_calls"] == 1
+    assert metrics["llm_singleflight_dedup"] == 4
+
+
+def test_distinct_prompts_not_coalesced():
+    client = SlowClient(delay=0.05)
+    router = LLMRouter(chains={"default": [client]}, hedge=False)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        list(pool.map(lambda i: router.generate(f"p{i}", run_id="r2"), range(3)))
+    assert client.calls == 3
+    assert router.pop_run_metrics("r2").get("llm_singleflight_dedup", 0) == 0
+    assert router.run_metrics("r2") == {}
+
+
+def test_log_run_pops_router_metrics(monkeypatch, tmp_path):
+    import nuclear.llm.router as router_mod
+    from nuclear.progress import run_log
+
+    router = LLMRouter(chains={"default": [SlowClient(delay=0)]}, hedge=False)
+    monkeypatch.setattr(router_mod, "_router", router)
+    monkeypatch.setattr(run_log, "RUN_LOG_PATH", tmp_path / "run_log.jsonl")
+    router.generate("x", run_id="r3")
+    router.generate("x", run_id="other")
+
+    entry = run_log.log_run("analyze", "success", "r3", "done", metrics={"nodes": 4})
+    assert entry["metrics"] == {"llm_requests": 1, "llm_upstream_calls": 1, "nodes": 4}
+    assert router.run_metrics("r3") == {} and router.run_metrics("other") != {}
+
+
+def test_run_metrics_are_bounded(monkeypatch):
+    import nuclear.llm.router as router_mod
+
+    monkeypatch.setattr(router_mod, "MAX_TRACKED_RUNS", 3)
+    router = LLMRouter(chains={"default": [SlowClient(delay=0)]}, hedge=False)
+    for i in range(5):
+        router.generate(f"p{i}", run_id=f"run{i}")
+    assert router.run_metrics("run0") == {} and router.run_metrics("run4")["llm_requests"] == 1
+    assert len(router._run_metrics) == 3
+
+
+def test_sequential_requests_are_not_cached():
+    client = SlowClient(delay=0)
+    router = LLMRouter(chains={"default": [client]}, hedge=False)
+    router.generate("x")
+    router.generate("x")
+    assert client.calls == 2
+
+
+def test_leader_error_propagates_to_followers():
+    group = SingleFlight()
+    gate = threading.Event()
+
+    def boom():
+        gate.wait(1)
+        raise RuntimeError("upstream down")
+
+    errors = []
+
+    def call():
+        try:
+            group.do("k", boom)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    gate.set()
+    for t in threads:
+        t.join()
+    assert errors == ["upstream down"] * 3
+    assert group.in_flight() == 0
@@ -0,0 +1,198 @@
+"""
+Structured output tests - tolerant JSON repair and field-scoped repair retries.
+"""
+
+import json
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from nuclear.llm.structured import (
+    JSONRepairError,
+    extract_json,
+    field_subschema,
+    generate_structured,
+    parse_structured,
+    repair_json,
+)
+
+
+class Fit(BaseModel):
+    passes: bool
+    reasoning: str
+
+
+class Answer(BaseModel):
+    tier: str
+    score: float
+    fit: Fit
+    tags: List[str] = []
+
+
+GOOD = {"tier": "A", "score": 0.7, "fit": {"passes": True, "reasoning": "r"}, "tags": ["x"]}
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        json.dumps(GOOD),
+        "```json\n" + json.dumps(GOOD) + "\n```",
+        "<think>hmm {not json}</think>Sure, here it is: " + json.dumps(GOOD) + " Hope this helps!",
+        '{"tier": "A", "score": 0.7, "fit": {"passes": true, "reasoning": "r",}, "tags": ["x",],}',
+    ],
+)
+def test_extract_json_variants(raw):
+    data, _ = extract_json(raw)
+    assert data == GOOD
+
+
+def test_truncated_tail_is_closed():
+    data, repaired = extract_json('{"tier": "A", "tags": ["x", "y"], "fit": {"passes": true, "reasoning": "cut off he')
+    assert repaired
+    assert data == {"tier": "A", "tags": ["x", "y"], "fit": {"passes": True, "reasoning": "cut off he"}}
+
+
+def test_truncated_mid_key_backs_off_to_last_complete_member():
+    assert json.loads(repair_json('{"tier": "A", "sco')) == {"tier": "A"}
+    assert json.loads(repair_json('{"tier": "A", "score": 0.')) in ({"tier": "A", "score": 0}, {"tier": "A"})
+    assert json.loads(repair_json('[{"a": 1}, {"b": tr')) == [{"a": 1}, {}]
+
+
+def test_strings_with_brackets_and_escapes_untouched():
+    raw = '{"reasoning": "uses [brackets], {braces} and \\"quotes\\",", "tier": "S"}'
+    assert extract_json(raw)[0]["reasoning"] == 'uses [brackets], {braces} and "quotes",'
+
+
+def test_no_json_raises():
+    with pytest.raises(JSONRepairError):
+        repair_json("I cannot answer that.")
+
+
+def test_valid_output_needs_no_repair_call():
+    calls = []
+    res = parse_structured(json.dumps(GOOD), Answer, repair_call=lambda p, s: calls.append(p))
+    assert res.ok and not res.repaired and calls == []
+
+
+def test_only_failing_fields_are_resent_and_merged():
+    bad = dict(GOOD, score="high", fit={"passes": "maybe?"})
+    seen = []
+
+    def repair(prompt, schema):
+        seen.append(schema)
+        return '```json\n{"score": 0.9, "fit": {"passes": false, "reasoning": "fixed"}, "tier": "X"}\n```'
+
+    res = parse_structured(json.dumps(bad), Answer, repair_call=repair, prompt="original")
+    assert res.ok and res.repair_rounds == 1
+    assert set(seen[0]["required"]) == {"score", "fit"}
+    assert "tier" not in seen[0]["properties"]
+    # Valid fields from the first answer are kept; unrequested keys in the patch are ignored.
+    assert res.data["tier"] == "A" and res.data["score"] == 0.9
+    assert res.instance.fit.reasoning == "fixed"
+
+
+def test_repair_gives_up_after_max_rounds():
+    calls = []
+
+    def repair(prompt, schema):
+        calls.append(prompt)
+        return "still not json"
+
+    res = parse_structured("nope", Answer, repair_call=repair, max_rounds=2)
+    assert not res.ok
+    assert len(calls) == 2
+    assert set(res.failing_fields) == {"tier", "score", "fit"}
+
+
+def test_generate_structured_sends_full_schema_first():
+    schemas = []
+
+    def call(prompt, schema):
+        schemas.append(schema)
+        return json.dumps(GOOD)
+
+    assert generate_structured(call, "p", Answer).ok
+    assert schemas[0] == Answer.model_json_schema()
+
+
+def test_field_subschema_keeps_defs():
+    sub = field_subschema(Answer, ["fit"])
+    assert "$defs" in sub and "Fit" in sub["$defs"]
+    assert list(sub["properties"]) == ["fit"]
+
+
+def test_openrouter_sends_json_schema_and_falls_back_on_400(monkeypatch):
+    import httpx
+
+    import nuclear.llm.openrouter_client as orc
+
+    payloads = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        payloads.append(body)
+        if "response_format" in body:
+            return httpx.Response(400, json={"error": {"message": "response_format unsupported"}})
+        return httpx.Response(200, json={"model": "m", "choices": [{"message": {"content": "{}"}, "finish_reason": "stop"}]})
+
+    real_client = httpx.Client
+    monkeypatch.setattr(orc.httpx, "Client", lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw))
+    monkeypatch.setattr(orc, "_json_schema_unsupported", set())
+    client = orc.OpenRouterClient(api_key="k", model="m")
+
+    assert client.generate("p", Answer.model_json_schema())["text"] == "{}"
+    assert payloads[0]["response_format"]["type"] == "json_schema"
+    assert payloads[0]["response_format"]["json_schema"]["schema"]["title"] == "Answer"
+    assert "response_format" not in payloads[1]
+    # Remembered: next call goes straight to prompt-only JSON
+    client.generate("p", Answer.model_json_schema())
+    assert len(payloads) == 3 and "response_format" not in payloads[2]
+    # ... per model: a new client for the same model skips it, another model still sends it
+    orc.OpenRouterClient(api_key="k", model="m").generate("p", Answer.model_json_schema())
+    assert "response_format" not in payloads[3]
+    orc.OpenRouterClient(api_key="k", model="other").generate("p", Answer.model_json_schema())
+    assert "response_format" in payloads[4] and "response_format" not in payloads[5]
+
+
+def test_openrouter_unrelated_400_keeps_json_schema(monkeypatch):
+    import httpx
+
+    import nuclear.llm.openrouter_client as orc
+
+    payloads = []
+
+    def handler(request):
+        payloads.append(json.loads(request.content))
+        return httpx.Response(400, json={"error": {"message": "maximum context length exceeded"}})
+
+    real_client = httpx.Client
+    monkeypatch.setattr(orc.httpx, "Client", lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw))
+    monkeypatch.setattr(orc, "_json_schema_unsupported", set())
+    with pytest.raises(httpx.HTTPStatusError):
+        orc.OpenRouterClient(api_key="k", model="m").generate("p", Answer.model_json_schema())
+    assert len(payloads) == 1 and orc._json_schema_unsupported == set()
+
+
+def test_openrouter_stream_falls_back_on_json_schema_400(monkeypatch):
+    import httpx
+
+    import nuclear.llm.openrouter_client as orc
+
+    payloads = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        payloads.append(body)
+        if "response_format" in body:
+            return httpx.Response(400, json={"error": {"message": "json_schema is not supported"}})
+        sse = 'data: {"model": "m", "choices": [{"delta": {"content": "{}"}, "finish_reason": "stop"}]}\n\ndata: [DONE]\n\n'
+        return httpx.Response(200, text=sse, headers={"Content-Type": "text/event-stream"})
+
+    real_client = httpx.Client
+    monkeypatch.setattr(orc.httpx, "Client", lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw))
+    monkeypatch.setattr(orc, "_json_schema_unsupported", set())
+    monkeypatch.setenv("NUCLEAR_LLM_STREAM", "1")
+    res = orc.OpenRouterClient(api_key="k", model="m").generate("p", Answer.model_json_schema())
+    assert res["text"] == "{}" and res["metadata"]["ttft_ms"] is not None
+    assert "response_format" in payloads[0] and "response_format" not in payloads[1] and payloads[1]["stream"]
@@ -0,0 +1,146 @@
+"""
+LLM call telemetry tests - llm_calls rows from the router, parse outcome, per-phase/model stats.
+Fake clients / local mock server only; DB in tmp_path.
+"""
+
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from nuclear.db.repos import LlmCallRepo
+from nuclear.db.sqlite import SQLiteEngine
+from nuclear.llm.base import BaseLLMClient
+from nuclear.llm.router import LLMRouter
+from nuclear.llm.telemetry import (
+    LLMCallRecord,
+    flush_telemetry,
+    parse_window,
+    record_call,
+    record_parse,
+    stats_by_phase_model,
+)
+
+
+@pytest.fixture(autouse=True)
+def tmp_db(monkeypatch, tmp_path):
+    flush_telemetry(timeout=5)
+    monkeypatch.setattr(SQLiteEngine, "DB_PATH", tmp_path / "telemetry.db")
+    monkeypatch.setenv("NUCLEAR_LLM_SINGLEFLIGHT", "0")
+    yield
+    flush_telemetry(timeout=5)
+
+
+class UsageClient(BaseLLMClient):
+    def __init__(self, name="fake", fail=False):
+        self._name = name
+        self.fail = fail
+
+    @property
+    def name(self):
+        return self._name
+
+    def generate(self, prompt, schema=None):
+        if self.fail:
+            raise RuntimeError(f"{self._name} down")
+        usage = {"prompt_tokens": 120, "completion_tokens": 30, "prompt_tokens_details": {"cached_tokens": 100}}
+        return {"text": "ok", "confidence": 0.5, "reasoning": None, "metadata": {"usage": usage, "ttft_ms": 12.5}}
+
+
+def _since():
+    return (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+
+
+def test_router_records_ok_call_with_tokens_failover_and_parse():
+    router = LLMRouter(chains={"default": [UsageClient("a", fail=True), UsageClient("b")]}, hedge=False)
+    res = router.generate("prompt", phase="P1-2", run_id="r1", ticker="NVDA", attempt=2)
+    call_id = res["metadata"]["llm_call_id"]
+    record_parse(call_id, True)
+    flush_telemetry(timeout=5)
+
+    [row] = LlmCallRepo.list_since(_since(), run_id="r1")
+    assert row["id"] == call_id and row["status"] == "ok"
+    assert row["phase"] == "P1-2" and row["provider"] == "b" and row["ticker"] == "NVDA"
+    assert row["prompt_tokens"] == 120 and row["completion_tokens"] == 30 and row["cached_tokens"] == 100
+    assert row["cache_hit"] == 1 and row["ttft_ms"] == 12.5
+    # one M0 retry before this call + one provider failover within it
+    assert row["retry_count"] == 2
+    assert row["parse_ok"] == 1
+
+
+def test_router_records_failed_call_and_reraises():
+    router = LLMRouter(chains={"default": [UsageClient("a", fail=True)]}, hedge=False)
+    with pytest.raises(Exception):
+        router.generate("prompt", phase="P2-2", run_id="r2")
+    flush_telemetry(timeout=5)
+    [row] = LlmCallRepo.list_since(_since(), run_id="r2")
+    assert row["status"] == "error" and "a down" in row["error"]
+
+
+def test_stats_percentiles_by_phase_and_model():
+    for ms in range(1, 101):
+        record_call(LLMCallRecord(phase="P1-2", model="m-a", provider="p", latency_ms=float(ms), run_id="s"))
+    record_call(LLMCallRecord(phase="P1-2", model="m-a", provider="p", latency_ms=9999.0, status="error", run_id="s"))
+    record_call(LLMCallRecord(phase="P2-2", model="m-b", provider="p", latency_ms=5.0, run_id="s"))
+    flush_telemetry(timeout=5)
+
+    rows = stats_by_phase_model(datetime.now(timezone.utc) - parse_window("1h"), run_id="s")
+    by_key = {(r["phase"], r["model"]): r for r in rows}
+    a = by_key[("P1-2", "m-a")]
+    assert a["calls"] == 101 and a["errors"] == 1
+    assert a["latency_ms"] == {"p50": 50.0, "p95": 95.0, "p99": 99.0}
+    assert by_key[("P2-2", "m-b")]["calls"] == 1
+    assert stats_by_phase_model(datetime.now(timezone.utc) - parse_window("1h"), phase="P2-2", run_id="s")[0]["model"] == "m-b"
+
+
+def test_parse_window():
+    assert parse_window("30m") == timedelta(minutes=30)
+    assert parse_window("24h") == timedelta(hours=24)
+    assert parse_window("7d") == timedelta(days=7)
+    with pytest.raises(ValueError):
+        parse_window("soon")
+
+
+def test_streaming_client_reports_ttft(monkeypatch):
+    from nuclear.llm.mock_server import MockLLMConfig, MockLLMServer
+    from nuclear.llm.openrouter_client import OpenRouterClient
+
+    monkeypatch.setenv("NUCLEAR_LLM_STREAM", "1")
+    with MockLLMServer(MockLLMConfig(latency_ms=200, stream_chunks=4), responder=lambda body: "abcdefgh") as srv:
+        monkeypatch.setenv("OPENROUTER_BASE_URL", srv.base_url)
+        res = OpenRouterClient(api_key="x", model="m").generate("STATIC\nNVDA", cache_prefix_len=6)
+    assert res["text"] == "abcdefgh"
+    assert res["metadata"]["usage"]["prompt_tokens"] > 0
+    # first chunk at ~latency/2, full body at ~latency
+    assert 90 <= res["metadata"]["ttft_ms"] < 190
+
+
+def test_non_streaming_client_reports_response_time_as_ttft(monkeypatch):
+    from nuclear.llm.mock_server import MockLLMConfig, MockLLMServer
+    from nuclear.llm.openrouter_client import OpenRouterClient
+
+    monkeypatch.delenv("NUCLEAR_LLM_STREAM", raising=False)
+    with MockLLMServer(MockLLMConfig(latency_ms=100), responder=lambda body: "abc") as srv:
+        monkeypatch.setenv("OPENROUTER_BASE_URL", srv.base_url)
+        res = OpenRouterClient(api_key="x", model="m").generate("NVDA")
+    assert res["text"] == "abc"
+    assert res["metadata"]["ttft_ms"] >= 90  # first token arrives with the whole response
+
+
+def test_queued_rows_survive_process_exit(tmp_path):
+    db = tmp_path / "exit.db"
+    code = (
+        "from pathlib import Path\n"
+        "from nuclear.db.sqlite import SQLiteEngine\n"
+        "from nuclear.llm.telemetry import LLMCallRecord, record_call\n"
+        f"SQLiteEngine.DB_PATH = Path({str(db)!r})\n"
+        "for i in range(50):\n"
+        "    record_call(LLMCallRecord(phase='P1-2', model='m', provider='p', latency_ms=1.0, run_id='exit'))\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT count(*) FROM llm_calls WHERE run_id = 'exit'").fetchone()[0] == 50
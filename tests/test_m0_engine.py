@@ -0,0 +1,273 @@
+"""
+M0 job engine tests - priority queue, per-model pools, idempotent jobs, retries, §2.6 audit flow.
+Fake LLM calls only (no router / network).
+"""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from nuclear.m0.core import M0Engine, M0JobError
+from nuclear.m0.job import M0Request, ROLE_ANALYST, ROLE_DEEP_AUDITOR, ROLE_SCOUT
+
+
+def _req(phase="P1-2", user="u", **kw):
+    return M0Request(phase=phase, system_prompt="s", user_prompt=user, **kw)
+
+
+class Recorder:
+    def __init__(self, delay=0.0, text="ok"):
+        self.delay = delay
+        self.text = text
+        self.calls = []
+        self.active = {}
+        self.max_active = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, request, model):
+        with self._lock:
+            self.calls.append((request.phase, request.role, model, request.user_prompt))
+            self.active[model] = self.active.get(model, 0) + 1
+            self.max_active[model] = max(self.max_active.get(model, 0), self.active[model])
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            text = self.text(request) if callable(self.text) else self.text
+            return {"text": text, "reasoning": None, "metadata": {}}
+        finally:
+            with self._lock:
+                self.active[model] -= 1
+
+
+def test_job_id_is_stable_and_idempotent():
+    assert _req().job_id == _req().job_id
+    assert _req().job_id != _req(user="other").job_id
+    assert _req().job_id != _req(run_id="r2").job_id
+
+
+def test_priority_queue_runs_upstream_phases_first():
+    gate = threading.Event()
+    order = []
+
+    def call(request, model):
+        if request.user_prompt == "blocker":
+            gate.wait(2)
+        order.append(request.phase)
+        return {"text": "ok"}
+
+    engine = M0Engine(llm_call=call, model_concurrency=1)
+    # Priority applies within one model's pool
+    blocker = engine.submit_async(_req("P3", "blocker", model="m"))
+    time.sleep(0.05)  # worker is now busy
+    futs = [engine.submit_async(_req(p, f"x{p}", model="m")) for p in ["P3", "P2-2", "P0", "P1-2"]]
+    gate.set()
+    for f in [blocker] + futs:
+        f.result(timeout=5)
+    assert order == ["P3", "P0", "P1-2", "P2-2", "P3"]
+
+
+def test_per_model_concurrency_is_bounded():
+    rec = Recorder(delay=0.05)
+    engine = M0Engine(llm_call=rec, model_concurrency=2)
+    futs = [engine.submit_async(_req(user=f"a{i}", model="m-a")) for i in range(6)]
+    futs += [engine.submit_async(_req(user=f"b{i}", model="m-b")) for i in range(6)]
+    for f in futs:
+        f.result(timeout=5)
+    assert rec.max_active == {"m-a": 2, "m-b": 2}
+
+
+def test_duplicate_jobs_share_one_call_and_cache():
+    rec = Recorder(delay=0.1)
+    engine = M0Engine(llm_call=rec)
+    f1, f2 = engine.submit_async(_req()), engine.submit_async(_req())
+    assert f1 is f2
+    first = f1.result(timeout=5)
+    again = engine.submit(_req())
+    assert again == first
+    assert len(rec.calls) == 1
+
+
+def test_retries_with_jitter_then_success():
+    attempts = []
+    sleeps = []
+
+    def flaky(request, model):
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError("429")
+        return {"text": "done"}
+
+    engine = M0Engine(llm_call=flaky, max_attempts=3, sleep=sleeps.append)
+    res = engine.submit(_req(), timeout=5)
+    assert res.text == "done" and res.attempts == 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= engine.retry_base_ms / 1000
+    assert 0 <= sleeps[1] <= 2 * engine.retry_base_ms / 1000
+
+
+def test_retries_exhausted_raises_and_is_not_cached():
+    calls = []
+
+    def down(request, model):
+        calls.append(1)
+        return {"text": "  "}
+
+    engine = M0Engine(llm_call=down, max_attempts=2, sleep=lambda s: None)
+    with pytest.raises(M0JobError):
+        engine.submit(_req(), timeout=5)
+    with pytest.raises(M0JobError):
+        engine.submit(_req(), timeout=5)
+    assert len(calls) == 4
+
+
+def test_audit_flow_analyst_then_scout_then_deep_auditor():
+    rec = Recorder(text=lambda r: json.dumps({"role": r.role}))
+    engine = M0Engine(llm_call=rec)
+    res = engine.submit_with_audit(_req("P1-1"))
+    roles = [c[1] for c in rec.calls]
+    assert roles == [ROLE_ANALYST, ROLE_SCOUT, ROLE_DEEP_AUDITOR]
+    assert json.loads(res.final_conclusion) == {"role": "analyst"}
+    assert res.text == res.final_conclusion
+    assert res.scouts[0].role == ROLE_SCOUT and res.deep_auditor.role == ROLE_DEEP_AUDITOR
+    # Scout sees the analyst output
+    assert '"role":"analyst"' in [c[3] for c in rec.calls if c[1] == ROLE_SCOUT][0]
+
+
+def test_dual_analyst_legs_run_concurrently(monkeypatch):
+    monkeypatch.setenv("NUCLEAR_M0_DUAL_ANALYST_MODELS", "deepseek,hermes")
+    rec = Recorder(delay=0.2, text="{}")
+    engine = M0Engine(llm_call=rec)
+    started = time.perf_counter()
+    res = engine.submit_with_audit(_req("P1-1"))
+    elapsed = time.perf_counter() - started
+    assert [a.model for a in res.analysts] == ["deepseek", "hermes"]
+    assert len(res.scouts) == 2
+    # analyst+scout legs overlap, then deep auditor: ~3 x delay, not 5 x delay
+    assert elapsed < 0.85
+
+
+def test_scout_failure_does_not_fail_audit():
+    def call(request, model):
+        if request.role == ROLE_SCOUT:
+            raise RuntimeError("scout down")
+        return {"text": "{}"}
+
+    engine = M0Engine(llm_call=call, max_attempts=1)
+    res = engine.submit_with_audit(_req("P1-1"))
+    assert res.scouts == [None]
+    assert res.final_conclusion == "{}"
+
+
+def test_p1_step1_runs_through_m0(monkeypatch):
+    import nuclear.phases.p1.p1_step1 as p1s1
+
+    company = {"ticker": "ASML", "company_name": "ASML", "market": "US", "p0_theme_id": "T1",
+               "p0_subtheme_id": "ST1", "chain_position": "upstream", "inclusion_reason": "EUV", "confidence": 0.9}
+    answer = "```json\n" + json.dumps({"companies": [company], "market_distribution": {"US": 1},}) + "\n```"
+    engine = M0Engine(llm_call=lambda r, m: {"text": answer if r.role == ROLE_ANALYST else "{}"})
+    monkeypatch.setattr(p1s1, "get_m0", lambda: engine)
+
+    dump = SimpleNamespace(model_dump=lambda: {})
+    out = p1s1.run_p1_step1(dump, dump, dump, run_id="r_m0")
+    assert [c.ticker for c in out.companies] == ["ASML"]
+
+
+def _company(ticker, confidence=0.9, market="US"):
+    return {"ticker": ticker, "company_name": ticker, "market": market, "p0_theme_id": "T1",
+            "p0_subtheme_id": "ST1", "chain_position": "upstream", "inclusion_reason": "R", "confidence": confidence}
+
+
+def _companies_answer(*companies):
+    return json.dumps({"companies": list(companies)})
+
+
+def test_dual_analysts_agree_skip_audit(monkeypatch):
+    from nuclear.phases.p1.p1_step1 import _company_overlap, _merge_company_outputs
+
+    monkeypatch.setenv("NUCLEAR_M0_DUAL_ANALYST_MODELS", "deepseek,hermes")
+    rec = Recorder(delay=0.2, text=lambda r: _companies_answer(_company("NVDA"), _company("ASML")))
+    engine = M0Engine(llm_call=rec)
+    started = time.perf_counter()
+    res = engine.submit_with_audit(_req("P1-1"), agreement=_company_overlap, merge=_merge_company_outputs)
+    elapsed = time.perf_counter() - started
+    assert [c[1] for c in rec.calls] == [ROLE_ANALYST, ROLE_ANALYST]
+    assert res.agreement == 1.0 and res.escalated is False and res.deep_auditor is None
+    assert set(res.leg_latency_ms) == {"deepseek", "hermes"}
+    # bounded by the slower analyst, not the sum
+    assert elapsed < 0.35
+    assert [c["ticker"] for c in json.loads(res.final_conclusion)["companies"]] == ["NVDA", "ASML"]
+
+
+def test_dual_analysts_disagree_escalate_with_both_outputs(monkeypatch):
+    from nuclear.phases.p1.p1_step1 import _company_overlap
+
+    monkeypatch.setenv("NUCLEAR_M0_DUAL_ANALYST_MODELS", "deepseek,hermes")
+
+    def text(r):
+        if r.role != ROLE_ANALYST:
+            return "{}"
+        return _companies_answer(_company("NVDA")) if r.model == "deepseek" else _companies_answer(_company("AMD"))
+
+    rec = Recorder(text=text)
+    res = M0Engine(llm_call=rec).submit_with_audit(_req("P1-1"), agreement=_company_overlap)
+    assert res.agreement == 0.0 and res.escalated is True
+    assert len(res.scouts) == 2 and res.deep_auditor.role == ROLE_DEEP_AUDITOR
+    auditor_prompt = [c[3] for c in rec.calls if c[1] == ROLE_DEEP_AUDITOR][0]
+    assert "NVDA" in auditor_prompt and "AMD" in auditor_prompt
+    assert json.loads(res.final_conclusion)["companies"][0]["ticker"] == "NVDA"
+
+
+def test_auditor_verdict_adopts_one_analyst_on_escalation(monkeypatch):
+    from nuclear.phases.p1.p1_step1 import _company_overlap, _merge_company_outputs
+
+    monkeypatch.setenv("NUCLEAR_M0_DUAL_ANALYST_MODELS", "deepseek,hermes")
+
+    def text(r):
+        if r.role == ROLE_DEEP_AUDITOR:
+            assert "deepseek, hermes, merge" in r.system_prompt
+            return json.dumps({"what_analyst_missed": "NVDA thesis is stale", "verdict": "hermes"})
+        if r.role == ROLE_SCOUT:
+            return "{}"
+        return _companies_answer(_company("NVDA")) if r.model == "deepseek" else _companies_answer(_company("AMD"))
+
+    res = M0Engine(llm_call=Recorder(text=text)).submit_with_audit(
+        _req("P1-1"), agreement=_company_overlap, merge=_merge_company_outputs)
+    assert res.escalated and res.verdict == "hermes"
+    assert [c["ticker"] for c in json.loads(res.final_conclusion)["companies"]] == ["AMD"]
+
+
+def test_single_analyst_revise_verdict_reruns_analyst_with_audit():
+    def text(r):
+        if r.role == ROLE_DEEP_AUDITOR:
+            return json.dumps({"what_analyst_missed": "export controls", "verdict": "revise"})
+        if r.role == ROLE_SCOUT:
+            return "{}"
+        return json.dumps({"answer": "revised" if "export controls" in r.user_prompt else "first"})
+
+    rec = Recorder(text=text)
+    res = M0Engine(llm_call=rec).submit_with_audit(_req("P1-1"))
+    assert res.verdict == "revise" and json.loads(res.final_conclusion) == {"answer": "revised"}
+    assert [c[1] for c in rec.calls] == [ROLE_ANALYST, ROLE_SCOUT, ROLE_DEEP_AUDITOR, ROLE_ANALYST]
+
+    # an unknown verdict keeps the analyst answer
+    rec = Recorder(text=lambda r: json.dumps({"verdict": "bogus"} if r.role == ROLE_DEEP_AUDITOR else {"answer": 1}))
+    res = M0Engine(llm_call=rec).submit_with_audit(_req("P1-1", user="other"))
+    assert res.verdict is None and json.loads(res.final_conclusion) == {"answer": 1}
+
+
+def test_company_merge_is_deterministic():
+    from nuclear.phases.p1.p1_step1 import _company_overlap, _merge_company_outputs
+
+    a = _companies_answer(_company("NVDA", 0.7), _company("2330.TW", 0.9, "TW"))
+    b = _companies_answer(_company("nvda", 0.95), _company("AVGO", 0.6))
+    assert _company_overlap([a, b]) == 1 / 3
+    assert _company_overlap([a, "not json"]) == 0.0
+    merged = json.loads(_merge_company_outputs([a, b]))
+    assert [c["ticker"] for c in merged["companies"]] == ["NVDA", "2330.TW", "AVGO"]
+    assert merged["companies"][0]["confidence"] == 0.95
+    assert merged["low_confidence_candidates"] == ["2330.TW", "AVGO"]
+    assert merged["market_distribution"] == {"US": 2, "TW": 1}
+    assert _merge_company_outputs([a, b]) == _merge_company_outputs([a, b])
@@ -0,0 +1,125 @@
+"""
+P1-1.5 long-filing extraction tests - page/section chunking with overlap, concurrent
+per-chunk extraction through M0, evidence merge/dedup, per-chunk cache. Fake LLM calls only.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from nuclear.db.schema import create_tables
+from nuclear.db.sqlite import SQLiteEngine
+from nuclear.m0.core import M0Engine
+from nuclear.phases.p1 import p1_extraction
+from nuclear.phases.p1.p1_extraction_chunks import merge_evidence, split_document
+from nuclear.prompts.compaction import estimate_tokens
+
+
+def _filing(paras_per_section=12):
+    business = "\n\n".join(f"Business paragraph {i}. " + "supply chain detail " * 12 for i in range(paras_per_section))
+    mdna = "\n\n".join(f"MD&A paragraph {i}. " + "gross margin detail " * 12 for i in range(paras_per_section))
+    return f"PART I\n\nItem 1. Business\n\n{business}\f\fItem 7. Management's Discussion\n\n{mdna}"
+
+
+def test_split_respects_budget_sections_pages_and_overlap():
+    chunks = split_document(_filing(), max_tokens=300, overlap_tokens=80)
+    assert len(chunks) > 2
+    assert all(c.tokens <= 300 + 10 for c in chunks)  # + [Page N] markers
+    # Item 7 starts its own chunk on page 3 (two form feeds)
+    item7 = [c for c in chunks if c.section and c.section.startswith("Item 7")]
+    assert item7[0].text.startswith("[Page 3]\n\nItem 7.") and item7[0].page_start == 3
+    # neighbouring chunks within a section share trailing paragraphs
+    first, second = chunks[0], chunks[1]
+    assert first.text.split("\n\n")[-1] in second.text
+    # every paragraph appears somewhere
+    text = "\n".join(c.text for c in chunks)
+    assert all(f"paragraph {i}." in text for i in range(12))
+
+
+def test_oversized_paragraph_is_hard_split():
+    chunks = split_document("x" * 5000, max_tokens=200, overlap_tokens=0)
+    assert len(chunks) > 1 and all(estimate_tokens(c.text) <= 210 for c in chunks)
+
+
+def test_merge_dedups_overlap_and_keeps_longer_quote():
+    def ev(c, p=1):
+        return {"content": c, "page_number": p, "source_document": "10-K", "section": "Business"}
+
+    merged = merge_evidence([
+        {"p1_industry_evidence": [ev("Share is 80%."), ev("Fabs in Taiwan")]},
+        {"p1_industry_evidence": [ev("share is  80%."), ev("Fabs in Taiwan and Arizona.", 2)],
+         "p2_financial_evidence": [ev("R&D up 20%")]},
+    ])
+    assert [e["content"] for e in merged["p1_industry_evidence"]] == ["Share is 80%.", "Fabs in Taiwan and Arizona."]
+    assert [e["content"] for e in merged["p2_financial_evidence"]] == ["R&D up 20%"]
+    assert merged["p2_5_institutional_evidence"] == []
+
+
+@pytest.fixture
+def chunked_engine(monkeypatch, tmp_path):
+    monkeypatch.setattr(SQLiteEngine, "DB_PATH", tmp_path / "extract.db")
+    create_tables()
+    monkeypatch.setenv("NUCLEAR_EXTRACTION_CHUNK_TOKENS", "300")
+    monkeypatch.setenv("NUCLEAR_EXTRACTION_OVERLAP_TOKENS", "80")
+    calls = []
+    active = {"now": 0, "max": 0}
+    failing = set()  # paragraph markers whose chunk the fake LLM errors on
+    lock = threading.Lock()
+
+    def llm(request, model):
+        with lock:
+            calls.append(request.user_prompt)
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.05)
+        with lock:
+            active["now"] -= 1
+        if any(marker in request.user_prompt for marker in failing):
+            raise RuntimeError("upstream 500")
+        para = next(line for line in request.user_prompt.splitlines() if "paragraph" in line)
+        return {"text": json.dumps({
+            "p1_industry_evidence": [{"content": para[:40]}],
+            "p2_financial_evidence": [],
+            "p2_5_institutional_evidence": [{"content": "BlackRock holds 7%.", "page_number": 9}],
+        })}
+
+    engine = M0Engine(llm_call=llm, model_concurrency=8)
+    monkeypatch.setattr(p1_extraction, "get_m0", lambda: engine)
+    monkeypatch.setattr(p1_extraction, "_stub_fetch_report", lambda t, m: _filing())
+    yield calls, active, failing
+    engine.shutdown()
+
+
+def test_run_extraction_chunks_concurrently_merges_and_caches(chunked_engine):
+    calls, active, _ = chunked_engine
+    out = p1_extraction.run_extraction("NVDA", "US", run_id="r1")
+    n_chunks = len(calls)
+    assert n_chunks > 2 and active["max"] > 1
+    assert out.extraction_status == "EXTRACTED"
+    # the same institutional quote from every chunk is kept once
+    assert [e.content for e in out.p2_5_institutional_evidence] == ["BlackRock holds 7%."]
+    assert out.p2_5_institutional_evidence[0].page_number == 9
+    # missing page/section default to the chunk's
+    assert out.p1_industry_evidence[0].page_number == 1 and out.p1_industry_evidence[0].section
+
+    again = p1_extraction.run_extraction("NVDA", "US", run_id="r2")
+    assert len(calls) == n_chunks  # unchanged filing: every chunk from cache
+    assert again.model_dump() == out.model_dump()
+
+
+def test_failed_chunk_marks_extraction_incomplete_and_is_retried(chunked_engine):
+    calls, _, failing = chunked_engine
+    failing.add("MD&A paragraph 11.")
+    out = p1_extraction.run_extraction("NVDA", "US", run_id="r1")
+    assert out.extraction_status == "INCOMPLETE_EXTRACTION" and out.failed_chunks >= 1
+    # evidence of the chunks that did succeed is kept
+    assert out.p1_industry_evidence and out.p2_5_institutional_evidence
+
+    n_calls = len(calls)
+    failing.clear()
+    again = p1_extraction.run_extraction("NVDA", "US", run_id="r2")
+    assert again.extraction_status == "EXTRACTED" and again.failed_chunks == 0
+    # only the failed chunks were not cached
+    assert 0 < len(calls) - n_calls <= out.failed_chunks
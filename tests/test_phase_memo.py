@@ -0,0 +1,76 @@
+"""
+Phase memo tests - P2 / P2.5 / P3 outputs reused across runs while the memo key
+(inputs + external data + code / skills / model fingerprint) is unchanged; stale rules.
+DB and snapshot store in tmp_path.
+"""
+
+import pytest
+
+import nuclear.orchestration.memo as memo_mod
+from nuclear.db.sqlite import SQLiteEngine
+from nuclear.orchestration.memo import PhaseMemo, strip_volatile
+from nuclear.orchestration.run_graph import run_analysis
+from nuclear.storage.backends.local_fs import LocalFSBackend
+
+PER_TICKER = ("P2", "P2.5", "P3")
+
+
+@pytest.fixture(autouse=True)
+def tmp_store(monkeypatch, tmp_path):
+    monkeypatch.setattr(SQLiteEngine, "DB_PATH", tmp_path / "nuclear.db")
+    monkeypatch.setattr(LocalFSBackend, "ROOT_DIR", tmp_path / "snapshots")
+
+
+def _hits(res):
+    return sorted(n for n, r in res.nodes.items() if r.memo_hit)
+
+
+def test_second_run_reuses_unchanged_tickers():
+    first = run_analysis([], run_id="w1")
+    assert first.ok and first.memo_hits == 0
+    tickers = [c.ticker for c in first.results["P1-2"].companies]
+
+    second = run_analysis([], run_id="w2")
+    assert second.ok
+    assert _hits(second) == sorted(f"{p}:{t}" for p in PER_TICKER for t in tickers)
+    p3 = second.results[f"P3:{tickers[0]}"]
+    assert p3.run_id == "w2"  # reused output is rebound to the new run
+    assert p3.model_dump(exclude={"run_id"}) == first.results[f"P3:{tickers[0]}"].model_dump(exclude={"run_id"})
+    assert [s.ticker for s in second.results["P4"].per_stock] == tickers
+
+
+def test_changed_external_data_recomputes_only_that_ticker(monkeypatch):
+    import nuclear.phases.p2.p2_1_fact_model as p21
+
+    first = run_analysis([], run_id="d1")
+    changed = first.results["P1-2"].companies[0].ticker
+    real = p21.fetch_financial_data
+
+    def fetch(ticker):
+        data = real(ticker)
+        return {**data, "cfo": 1} if ticker == changed else data
+
+    monkeypatch.setattr(p21, "fetch_financial_data", fetch)
+    second = run_analysis([], run_id="d2")
+    assert f"P2:{changed}" not in _hits(second)
+    others = [c.ticker for c in first.results["P1-2"].companies if c.ticker != changed]
+    assert all(f"P2:{t}" in _hits(second) for t in others)
+
+
+def test_stale_rules_expiry_and_disable(monkeypatch):
+    run_analysis([], run_id="s1")
+    assert run_analysis([], run_id="s2", memo=PhaseMemo("s2", max_age_days=0)).memo_hits == 0
+    monkeypatch.setenv("NUCLEAR_MEMO", "0")
+    assert run_analysis([], run_id="s3").memo_hits == 0
+
+
+def test_key_ignores_run_bookkeeping_but_not_fingerprint(monkeypatch):
+    memo = PhaseMemo("k")
+    a = {"P2:X": {"score": 1, "run_id": "r1", "created_at": "t1", "nested": [{"snapshot_id": "s1"}]}}
+    b = {"P2:X": {"score": 1, "run_id": "r2", "created_at": "t2", "nested": [{"snapshot_id": "s2"}]}}
+    assert strip_volatile(a) == {"P2:X": {"score": 1, "nested": [{}]}}
+    assert memo.key("P2.5", a) == memo.key("P2.5", b)
+    assert memo.key("P2.5", a) != memo.key("P2.5", {"P2:X": {"score": 2}})
+
+    monkeypatch.setattr(memo_mod, "skills_fingerprint", lambda subs: "skills-v2")
+    assert PhaseMemo("k").key("P2.5", a) != memo.key("P2.5", a)
@@ -0,0 +1,111 @@
+"""
+Prompt prefix caching tests - stable per-phase prefix, cache_control hints, hit-rate stats.
+"""
+
+import json
+
+import httpx
+
+from nuclear.llm import openrouter_client as orc
+from nuclear.llm.base import BaseLLMClient
+from nuclear.llm.prompt_cache import PrefixCacheStats, build_messages, prefix_hash
+from nuclear.llm.router import LLMRouter
+from nuclear.phases.p2.p2_2_prompts import build_p22_analyst_prompt
+from nuclear.phases.p3.p3_prompts import build_p3_analyst_prompt
+from nuclear.prompts.skills_injector import SkillsInjector
+
+
+class PrefixClient(BaseLLMClient):
+    supports_prompt_cache = True
+
+    def __init__(self):
+        self.prefix_lens = []
+
+    @property
+    def name(self):
+        return "prefix"
+
+    def generate(self, prompt, schema=None, cache_prefix_len=None):
+        self.prefix_lens.append(cache_prefix_len)
+        usage = {"prompt_tokens": 100, "prompt_tokens_details": {"cached_tokens": 80 if len(self.prefix_lens) > 1 else 0}}
+        return {"text": "ok", "confidence": 0.5, "reasoning": None, "metadata": {"usage": usage}}
+
+
+class PlainClient(BaseLLMClient):
+    @property
+    def name(self):
+        return "plain"
+
+    def generate(self, prompt, schema=None):
+        return {"text": "ok", "confidence": 0.5, "reasoning": None, "metadata": {}}
+
+
+def test_build_messages_cache_control_by_model(monkeypatch):
+    prompt = "STATIC\n\nticker data"
+    anthropic = build_messages(prompt, len("STATIC"), "anthropic/claude-opus-4.5")
+    assert anthropic[0]["content"][0] == {"type": "text", "text": "STATIC", "cache_control": {"type": "ephemeral"}}
+    assert anthropic[1] == {"role": "user", "content": "ticker data"}
+    # Automatic prefix caching providers: plain system message, no hint
+    assert build_messages(prompt, len("STATIC"), "deepseek/deepseek-r1")[0] == {"role": "system", "content": "STATIC"}
+    assert build_messages(prompt, None, "anthropic/x") == [{"role": "user", "content": prompt}]
+    monkeypatch.setenv("NUCLEAR_LLM_PROMPT_CACHE", "0")
+    assert build_messages(prompt, len("STATIC"), "anthropic/x")[0]["content"] == "STATIC"
+
+
+def test_prefix_stats_ttl_and_hit_rate():
+    now = [0.0]
+    stats = PrefixCacheStats(ttl_sec=300, clock=lambda: now[0])
+    assert stats.observe("P2-2", "m", "prefix") is False
+    now[0] = 10
+    assert stats.observe("P2-2", "m", "prefix", {"prompt_tokens": 10, "cache_read_input_tokens": 8}) is True
+    assert stats.observe("P2-2", "other-model", "prefix") is False
+    now[0] = 1000
+    assert stats.observe("P2-2", "m", "prefix") is False
+    snap = stats.snapshot()["P2-2"]
+    assert snap["requests"] == 4 and snap["prefix_hits"] == 1 and snap["hit_rate"] == 0.25
+    assert snap["distinct_prefixes"] == 1 and snap["cached_tokens"] == 8
+
+
+def test_router_passes_prefix_and_counts_hits():
+    client = PrefixClient()
+    router = LLMRouter(chains={"default": [client]}, hedge=False)
+    system = "[SYSTEM] static"
+    for ticker in ["NVDA", "AMD", "TSM"]:
+        router.generate(f"{system}\n\n{ticker}", phase="P2-2", run_id="r1", cache_prefix_len=len(system))
+    assert client.prefix_lens == [len(system)] * 3
+    metrics = router.run_metrics("r1")
+    assert metrics["llm_prefix_cache_hits"] == 2 and metrics["llm_prefix_cache_misses"] == 1
+    snap = router.prefix_cache.snapshot()["P2-2"]
+    assert snap["cached_tokens"] == 160 and snap["cached_token_ratio"] == round(160 / 300, 4)
+    # Clients without prefix support keep the plain (prompt, schema) call
+    plain = LLMRouter(chains={"default": [PlainClient()]}, hedge=False)
+    assert plain.generate("abc\n\nd", phase="P3", cache_prefix_len=3)["text"] == "ok"
+
+
+def test_openrouter_sends_cacheable_system_message(monkeypatch):
+    payloads = []
+
+    def handler(request):
+        payloads.append(json.loads(request.content))
+        return httpx.Response(200, json={"model": "m", "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}]})
+
+    real_client = httpx.Client
+    monkeypatch.setattr(orc.httpx, "Client", lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw))
+    client = orc.OpenRouterClient(api_key="k", model="anthropic/claude-opus-4.5")
+    client.generate("STATIC\n\nNVDA", cache_prefix_len=6)
+    messages = payloads[0]["messages"]
+    assert messages[0]["role"] == "system" and messages[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert messages[1]["content"] == "NVDA"
+
+
+def test_phase_prompts_have_byte_identical_prefix():
+    SkillsInjector.clear_cache()
+    a = build_p22_analyst_prompt("NVDA", {"r": 1}, {"l": 1}, {"p2_inputs": {"cycle": "up"}}, {})
+    b = build_p22_analyst_prompt("AMD", {"r": 2}, {"l": 2}, {"p2_inputs": {"cycle": "down"}}, {})
+    assert a["system"] == b["system"]
+    assert "'cycle': 'up'" in a["user"] and "'cycle': 'up'" not in a["system"]
+    p3a = build_p3_analyst_prompt("NVDA", {"thesis_statement": "AI capex"}, {}, {}, {})
+    p3b = build_p3_analyst_prompt("AMD", {"thesis_statement": "share gains"}, {}, {}, {})
+    assert prefix_hash(p3a["system"]) == prefix_hash(p3b["system"])
+    assert "AI capex" in p3a["user"]
+    assert SkillsInjector.inject_skills("P3") is SkillsInjector.inject_skills("P3")
@@ -0,0 +1,89 @@
+"""
+Prompt compaction tests - estimator, pruning, priority-driven truncation, PromptBuilder wiring.
+"""
+
+import json
+
+from nuclear.phases.p2.p2_2_prompts import build_p22_analyst_prompt
+from nuclear.prompts.base import PromptBuilder
+from nuclear.prompts.compaction import (
+    compact_payload,
+    estimate_tokens,
+    payload_budget,
+    prune,
+    render_payload,
+)
+
+
+def _evidence(n):
+    return [{"id": i, "quote": f"revenue grew {i}% on datacenter demand", "source": "10-K"} for i in range(n)]
+
+
+def test_estimator_ascii_and_cjk():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd" * 10) == 10
+    assert estimate_tokens("營收成長") == 4
+
+
+def test_prune_nulls_empties_and_defaults():
+    payload = {"a": None, "b": "", "c": [], "d": {"e": None}, "f": 1, "g": [1, None], "currency": "USD"}
+    assert prune(payload, defaults={"currency": "USD"}) == {"f": 1, "g": [1]}
+
+
+def test_compact_separators_save_tokens():
+    res = compact_payload({"x": {"y": [1, 2, 3]}, "z": None})
+    assert res.text == '{"x":{"y":[1,2,3]}}'
+    assert res.tokens_saved > 0
+    assert res.as_dict()["tokens_saved"] == res.tokens_saved
+
+
+def test_budget_truncates_least_important_list_first():
+    payload = {"evidence": _evidence(40), "peers": _evidence(40), "facts": {"revenue": 100}}
+    res = compact_payload(payload, budget_tokens=700, priorities={"evidence": 10, "peers": 90})
+    data = json.loads(res.text)
+    assert res.tokens_after <= 700
+    assert "peers" in res.truncated
+    assert len(data["peers"]) < len(data["evidence"])
+    assert data["_truncated"] == res.truncated
+    assert data["facts"] == {"revenue": 100}
+
+
+def test_priority_zero_is_never_truncated_or_dropped():
+    payload = {"anchor": _evidence(30), "extra": _evidence(30)}
+    res = compact_payload(payload, budget_tokens=50, priorities={"anchor": 0})
+    data = json.loads(res.text)
+    assert len(data["anchor"]) == 30
+    assert "extra" in res.dropped and "extra" not in data
+
+
+def test_budget_from_route_and_env_cap(monkeypatch):
+    assert payload_budget("P2-2") == 128_000 - 6144
+    monkeypatch.setenv("NUCLEAR_PROMPT_MAX_INPUT_TOKENS", "1000")
+    assert payload_budget("P2-2", fixed_text="abcd" * 100) == 900
+    assert payload_budget(None) == 1000
+
+
+def test_render_payload_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("NUCLEAR_PROMPT_COMPACT", "0")
+    text, res = render_payload({"a": None})
+    assert res is None and text == json.dumps({"a": None}, indent=2)
+
+
+def test_prompt_builder_reports_compaction(monkeypatch):
+    monkeypatch.setenv("NUCLEAR_PROMPT_MAX_INPUT_TOKENS", "2500")
+    prompt = PromptBuilder.build(["[ROLE]"], "Analyse.", {"evidence": _evidence(200), "note": None}, phase="P1-2")
+    stats = prompt["compaction"]
+    assert stats["tokens_saved"] > 0 and stats["truncated"]
+    assert '"note"' not in prompt["user"]
+    assert estimate_tokens(prompt["system"] + prompt["user"]) <= 2500 + 50
+
+
+def test_p22_prompt_keeps_anchors_and_trims_evidence(monkeypatch):
+    monkeypatch.setenv("NUCLEAR_PROMPT_MAX_INPUT_TOKENS", "6000")
+    fact_model = {"revenue": [100, 120, 150], "segments": None}
+    prompt = build_p22_analyst_prompt(
+        "NVDA", fact_model, {"level_1": "Semis"}, {}, {"p2_financial_evidence": _evidence(500)}
+    )
+    assert '{"revenue":[100,120,150]}' in prompt["user"]
+    assert '{"level_1":"Semis"}' in prompt["user"]
+    assert "p1_extraction_evidence" in prompt["compaction"]["truncated"]
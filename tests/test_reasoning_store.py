@@ -0,0 +1,95 @@
+"""
+M20 reasoning trace store tests - gzip content-addressed blobs, async writes, ai_outputs index.
+"""
+
+import gzip
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from nuclear.llm.traces import ReasoningTrace
+from nuclear.storage.reasoning import LocalTraceBackend, ReasoningTraceStore, trace_key
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(LocalTraceBackend, "ROOT_DIR", tmp_path)
+    return ReasoningTraceStore(backend_type="local_fs", async_writes=True)
+
+
+def _trace(text):
+    return ReasoningTrace(model="hermes-4", text=text, created_at=datetime.now(timezone.utc))
+
+
+def test_write_is_content_addressed_gzip_and_indexed(store, tmp_path):
+    from nuclear.db.repos import AiOutputRepo
+
+    run_id = f"run_{uuid.uuid4().hex[:8]}"
+    text = "<long reasoning> " * 500
+    key = store.write(_trace(text), run_id=run_id, phase="P1-2", ticker="NVDA")
+    assert key == trace_key(text) and key.startswith("reasoning/")
+    assert store.flush(timeout=10) == 1
+
+    blob = tmp_path / f"{key}.gz"
+    assert blob.exists()
+    assert gzip.decompress(blob.read_bytes()).decode() == text
+    assert blob.stat().st_size < len(text) // 10
+    assert store.read(key) == text
+
+    rows = AiOutputRepo.list_for_run(run_id)
+    assert len(rows) == 1
+    assert rows[0]["phase"] == "P1-2" and rows[0]["ticker"] == "NVDA"
+    assert rows[0]["model_name"] == "hermes-4"
+    assert rows[0]["reasoning_trace_storage_key"] == key
+
+
+def test_identical_traces_share_blob_but_get_own_rows(store, tmp_path):
+    from nuclear.db.repos import AiOutputRepo
+
+    run_id = f"run_{uuid.uuid4().hex[:8]}"
+    k1 = store.write(_trace("same"), run_id=run_id, phase="P2-2", ticker="A")
+    k2 = store.write(_trace("same"), run_id=run_id, phase="P2-2", ticker="B")
+    store.flush(timeout=10)
+    assert k1 == k2
+    assert len(list(tmp_path.rglob("*.gz"))) == 1
+    assert {r["ticker"] for r in AiOutputRepo.list_for_run(run_id, phase="P2-2")} == {"A", "B"}
+
+
+def test_write_returns_before_persist(store, monkeypatch):
+    import threading
+
+    gate = threading.Event()
+    original = LocalTraceBackend.put
+
+    def slow_put(self, key, data):
+        gate.wait(5)
+        original(self, key, data)
+
+    monkeypatch.setattr(LocalTraceBackend, "put", slow_put)
+    key = store.write(_trace("slow trace"), run_id="r", phase="P3")
+    assert not store.backend.exists(key)
+    gate.set()
+    store.flush(timeout=10)
+    assert store.backend.exists(key)
+
+
+def test_router_records_trace_ref(store, monkeypatch):
+    import nuclear.storage.reasoning as reasoning
+    from nuclear.llm.base import BaseLLMClient
+    from nuclear.llm.router import LLMRouter
+
+    class ThinkingClient(BaseLLMClient):
+        name = "thinking"
+
+        def generate(self, prompt, schema=None):
+            return {"text": "{}", "confidence": 0.5, "reasoning": "because", "metadata": {"model": "hermes-4"}}
+
+    monkeypatch.setattr(reasoning, "_store", store)
+    res = LLMRouter(chains={"default": [ThinkingClient()]}, hedge=False).generate(
+        "p", phase="P1-2", run_id="r_trace", ticker="TSM"
+    )
+    store.flush(timeout=10)
+    assert res["reasoning_trace_ref"].storage_key == trace_key("because")
+    assert res["reasoning_trace_ref"].model == "hermes-4"
+    assert store.read(trace_key("because")) == "because"
@@ -0,0 +1,122 @@
+"""
+Run checkpoint tests - per-node completion in run_nodes and `nuclear resume <run_id>`:
+completed nodes are rehydrated from their snapshots, only the failed part re-runs.
+DB, snapshot store and outputs/ in tmp_path.
+"""
+
+import json
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from nuclear.cli import cmd_resume, cmd_wb_flow
+from nuclear.db.repos import RunRepo, RunStateRepo
+from nuclear.db.sqlite import SQLiteEngine
+from nuclear.orchestration.checkpoint import RunCheckpoint
+from nuclear.orchestration.run_graph import DONE, FAILED, Node, RunGraph
+from nuclear.storage.backends.local_fs import LocalFSBackend
+from nuclear.storage.snapshot import SnapshotWriter, load_snapshot
+
+
+@pytest.fixture(autouse=True)
+def tmp_store(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SQLiteEngine, "DB_PATH", tmp_path / "nuclear.db")
+    monkeypatch.setattr(LocalFSBackend, "ROOT_DIR", tmp_path / "snapshots")
+
+
+def _nodes(run_id):
+    return {r["node"]: r for r in RunStateRepo.list_nodes(run_id)}
+
+
+def test_wb_flow_resume_skips_wb1_and_reuses_run_id(monkeypatch, capsys):
+    import nuclear.phases.weekly.wb1 as wb1
+    import nuclear.phases.weekly.wb2 as wb2
+
+    real_wb2 = wb2.run_wb2_and_persist
+
+    def flaky_wb2(**kwargs):
+        raise RuntimeError("upstream timeout")
+
+    monkeypatch.setattr(wb2, "run_wb2_and_persist", flaky_wb2)
+    assert cmd_wb_flow(Namespace(run_id=None)) == 1
+    run_id = json.loads(capsys.readouterr().out.strip().splitlines()[-1])["run_id"]
+    nodes = _nodes(run_id)
+    assert nodes["wb1"]["status"] == DONE and nodes["wb1"]["snapshot_id"]
+    assert nodes["wb2"]["status"] == FAILED and "upstream timeout" in nodes["wb2"]["error"]
+    assert RunRepo.get(run_id)["status"] == "failed"
+
+    # WB-1 must come from its snapshot, not be recomputed
+    monkeypatch.setattr(wb1, "run_wb1_macro", lambda *a, **k: pytest.fail("WB-1 recomputed"))
+    monkeypatch.setattr(wb2, "run_wb2_and_persist", real_wb2)
+    Path("outputs/wb1_output.json").unlink()
+
+    assert cmd_resume(Namespace(run_id=run_id, workers=None)) == 0
+    nodes = _nodes(run_id)
+    assert nodes["wb2"]["status"] == DONE and nodes["wb2"]["attempts"] == 2
+    assert nodes["wb1"]["attempts"] == 1
+    assert RunRepo.get(run_id)["status"] == "completed"
+    assert RunStateRepo.get(run_id)["status"] == "completed"
+    assert json.loads(Path("outputs/wb1_output.json").read_text())["worldview_version"] == "stub_v1"
+
+
+def test_resume_unknown_run_id():
+    assert cmd_resume(Namespace(run_id="nope", workers=None)) == 1
+
+
+class Score(BaseModel):
+    ticker: str
+    score: float
+
+
+def test_graph_resume_rehydrates_completed_nodes_and_fan_out():
+    calls = {}
+    broken = {"AMD"}
+
+    def counted(name, fn):
+        def wrapper(inputs):
+            calls[name] = calls.get(name, 0) + 1
+            return fn(inputs)
+        return wrapper
+
+    def score(t):
+        def fn(i):
+            if t in broken:
+                raise RuntimeError("rate limited")
+            return Score(ticker=t, score=len(t))
+        return counted(f"score:{t}", fn)
+
+    def build():
+        def fan(tickers):
+            return [Node(f"score:{t}", score(t), ticker=t, output_model=Score) for t in tickers]
+
+        return RunGraph([
+            Node("select", counted("select", lambda i: ["NVDA", "AMD"]), fan_out=fan),
+            Node("total", counted("total", lambda i: sum(v.score for k, v in i.items() if k.startswith("score:"))),
+                 ("select",), collect=("score:",)),
+        ])
+
+    snaps = SnapshotWriter("local_fs")
+    first = build().run(run_id="r1", snapshots=snaps, checkpoint=RunCheckpoint("r1", "test").begin())
+    assert first.nodes["score:AMD"].status == FAILED and not first.ok
+    assert RunStateRepo.get("r1")["status"] == "failed"
+
+    broken.clear()
+    second = build().run(run_id="r1", snapshots=snaps, checkpoint=RunCheckpoint.open("r1").begin())
+    assert second.ok
+    assert calls == {"select": 1, "score:NVDA": 1, "score:AMD": 2, "total": 2}
+    assert second.nodes["select"].resumed and second.nodes["score:NVDA"].resumed
+    assert not second.nodes["score:AMD"].resumed
+    assert isinstance(second.results["score:NVDA"], Score)  # rehydrated as output_model
+    assert second.results["total"] == 7
+    assert second.nodes["score:NVDA"].snapshot_id == first.nodes["score:NVDA"].snapshot_id
+
+
+def test_load_snapshot_rejects_modified_payload():
+    meta = SnapshotWriter("local_fs").save(phase="wb1", payload={"a": 1}, run_id="r")
+    assert load_snapshot(meta.snapshot_id) == {"a": 1}
+    Path(meta.payload_ref).write_text(json.dumps({"a": 2}), encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_snapshot(meta.snapshot_id)
@@ -0,0 +1,163 @@
+"""
+Run graph tests - DAG ordering, concurrency of independent nodes, fan-out / join,
+failure isolation, snapshots and critical path, per-ticker nodes batched on the ticker
+executor. Plus the P0 -> P4 chain end to end and P3-Delta tracking of its P3 outputs.
+"""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from nuclear.orchestration import ticker_pool
+from nuclear.orchestration.run_graph import (
+    DONE,
+    FAILED,
+    SKIPPED,
+    Node,
+    RunGraph,
+    run_analysis,
+    run_p3_delta_tracking,
+)
+
+
+class MemorySnapshots:
+    def __init__(self):
+        self.saved = []
+        self._lock = threading.Lock()
+
+    def save(self, phase, payload, run_id):
+        json.dumps(payload, default=str)
+        with self._lock:
+            self.saved.append((phase, run_id))
+            return SimpleNamespace(snapshot_id=f"snap_{len(self.saved)}")
+
+
+def _sleep(ms, value=None):
+    def fn(inputs):
+        time.sleep(ms / 1000)
+        return value if value is not None else sorted(inputs)
+    return fn
+
+
+def test_independent_nodes_run_concurrently_and_join_sees_inputs():
+    graph = RunGraph([
+        Node("root", _sleep(10, "r")),
+        Node("a", _sleep(150), ("root",)),
+        Node("b", _sleep(150), ("root",)),
+        Node("join", lambda i: i, ("a", "b")),
+    ])
+    started = time.perf_counter()
+    res = graph.run(run_id="g1", max_workers=4)
+    assert time.perf_counter() - started < 0.28  # a and b overlap
+    assert res.ok and set(res.results["join"]) == {"a", "b"}
+    assert res.critical_path[0] == "root" and res.critical_path[-1] == "join"
+
+
+def test_fan_out_join_and_failure_isolation():
+    def fan(tickers):
+        nodes = []
+        for t in tickers:
+            def work(i, t=t):
+                if t == "BAD":
+                    raise RuntimeError("no data")
+                time.sleep(0.1)
+                return t.lower()
+            nodes += [Node(f"work:{t}", work, ticker=t), Node(f"post:{t}", lambda i, t=t: i[f"work:{t}"] + "!", (f"work:{t}",))]
+        return nodes
+
+    graph = RunGraph([
+        Node("select", lambda i: ["NVDA", "AMD", "BAD", "ASML"], fan_out=fan),
+        Node("join", lambda i: sorted(v for k, v in i.items() if k.startswith("post:")), ("select",), collect=("post:",)),
+    ])
+    snaps = MemorySnapshots()
+    started = time.perf_counter()
+    res = graph.run(run_id="g2", max_workers=8, snapshots=snaps)
+    assert time.perf_counter() - started < 0.3  # tickers fan out in parallel
+    assert res.results["join"] == ["amd!", "asml!", "nvda!"]
+    assert res.nodes["work:BAD"].status == FAILED and "no data" in res.nodes["work:BAD"].error
+    assert res.nodes["post:BAD"].status == SKIPPED
+    assert res.nodes["join"].status == DONE and not res.ok
+    # every successful node persisted under its phase prefix
+    assert ("post", "g2") in snaps.saved and len(snaps.saved) == 1 + 3 + 3 + 1
+    assert res.nodes["join"].snapshot_id
+    assert res.critical_path[0] == "select" and res.critical_path[-1] == "join"
+
+
+def test_pool_nodes_of_a_phase_run_as_one_ticker_batch(monkeypatch):
+    batches = []
+    real = ticker_pool.map_tickers
+
+    def spy(fn, tickers, *args, **kwargs):
+        batches.append(sorted(tickers))
+        return real(fn, tickers, *args, **kwargs)
+
+    monkeypatch.setattr(ticker_pool, "map_tickers", spy)
+
+    def fan(tickers):
+        nodes = []
+        for t in tickers:
+            def work(i, t=t):
+                if t == "BAD":
+                    raise RuntimeError("no data")
+                return t.lower()
+
+            nodes += [Node(f"work:{t}", work, ticker=t, pool=ticker_pool.THREAD),
+                      Node(f"post:{t}", lambda i, t=t: i[f"work:{t}"] + "!", (f"work:{t}",), ticker=t,
+                           pool=ticker_pool.THREAD)]
+        return nodes
+
+    graph = RunGraph([
+        Node("select", lambda i: ["NVDA", "BAD", "AMD"], fan_out=fan),
+        Node("join", lambda i: sorted(v for k, v in i.items() if k.startswith("post:")), ("select",), collect=("post:",)),
+    ])
+    res = graph.run(run_id="g3", max_workers=4)
+    assert batches == [["work:AMD", "work:BAD", "work:NVDA"], ["post:AMD", "post:NVDA"]]
+    assert res.results["join"] == ["amd!", "nvda!"]
+    assert res.nodes["work:BAD"].error == "RuntimeError: no data" and res.nodes["post:BAD"].status == SKIPPED
+    with pytest.raises(ValueError, match="thread pool only"):
+        RunGraph([Node("x", _sleep(0), pool=ticker_pool.PROCESS)])
+
+
+def test_unknown_input_and_cycle_are_rejected():
+    with pytest.raises(ValueError):
+        RunGraph([Node("a", _sleep(0), ("missing",))]).run()
+    with pytest.raises(ValueError):
+        RunGraph([Node("a", _sleep(0), ("b",)), Node("b", _sleep(0), ("a",))]).run()
+
+
+def test_analysis_chain_runs_p0_to_p4_per_ticker(monkeypatch):
+    monkeypatch.setenv("NUCLEAR_MEMO", "0")  # MemorySnapshots are not indexed
+    snaps = MemorySnapshots()
+    res = run_analysis([], run_id="chain", snapshots=snaps, max_workers=8)
+    assert res.ok, res.failed()
+    tickers = [c.ticker for c in res.results["P1-2"].companies]
+    assert tickers
+    for t in tickers:
+        for phase in ("P1-1.5", "P2", "P2.5", "P3"):
+            assert res.nodes[f"{phase}:{t}"].status == DONE
+    assert [s.ticker for s in res.results["P4"].per_stock] == tickers
+    assert res.critical_path[:3] == ["P0", "P0.5", "P0.7"] and res.critical_path[-1] == "P4"
+    assert "P1-2" in res.critical_path
+    assert {p for p, _ in snaps.saved} >= {"P0", "P0.5", "P0.7", "P1-1", "P1-1.5", "P1-2", "P2", "P2.5", "P3", "P4"}
+
+
+def test_p3_delta_tracks_the_p3_outputs_of_an_analysis_run(monkeypatch, tmp_path):
+    from nuclear.db.repos import SnapshotRepo
+    from nuclear.db.sqlite import SQLiteEngine
+    from nuclear.storage.backends.local_fs import LocalFSBackend
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SQLiteEngine, "DB_PATH", tmp_path / "nuclear.db")
+    monkeypatch.setattr(LocalFSBackend, "ROOT_DIR", tmp_path / "snapshots")
+    monkeypatch.setenv("NUCLEAR_MEMO", "0")
+    res = run_analysis([], run_id="week1", max_workers=8)
+    tickers = [c.ticker for c in res.results["P1-2"].companies]
+
+    batch = run_p3_delta_tracking("week1", "week2", market_data=lambda t: ({}, {"cat": 5}), max_workers=2)
+    assert batch.ok and list(batch.results) == tickers
+    assert all(d.cat_update.current_cat == 5 and d.run_id == "week2" for d in batch.results.values())
+    assert len(SnapshotRepo.all_for_run("week2", "P3-Delta")) == len(tickers)
+    assert run_p3_delta_tracking("missing", "week3").outcomes == []
@@ -170,3 +170,59 @@ class TestNoApiKeysRequired:
         # These should complete without network
         assert run_daily(dry_run=True) == 0
         assert run_weekly(dry_run=True) == 0
+
+
+class TestInProcessRunner:
+    """In-process mode: one warm process, WB-1 handed to WB-2 in memory; subprocess mode kept."""
+
+    @pytest.fixture(autouse=True)
+    def tmp_cwd(self, monkeypatch, tmp_path):
+        from nuclear.db.sqlite import SQLiteEngine
+        from nuclear.storage.backends.local_fs import LocalFSBackend
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(SQLiteEngine, "DB_PATH", tmp_path / "nuclear.db")
+        monkeypatch.setattr(LocalFSBackend, "ROOT_DIR", tmp_path / "snapshots")
+        monkeypatch.delenv("NUCLEAR_SCHEDULE_MODE", raising=False)
+
+    def test_schedule_mode_default_env_and_invalid(self, monkeypatch):
+        from nuclear.orchestration.schedule import schedule_mode
+
+        assert schedule_mode() == "inprocess"
+        monkeypatch.setenv("NUCLEAR_SCHEDULE_MODE", "subprocess")
+        assert schedule_mode() == "subprocess"
+        assert schedule_mode("inprocess") == "inprocess"
+        with pytest.raises(ValueError):
+            schedule_mode("thread")
+
+    def test_weekly_inprocess_hands_wb1_over_in_memory(self):
+        from nuclear.orchestration.schedule import run_weekly
+        from nuclear.progress import read_recent_runs
+
+        with patch("nuclear.phases.weekly.wb2.load_wb1_output", side_effect=AssertionError("re-read from disk")), \
+             patch("nuclear.orchestration.schedule.subprocess") as mock_sub:
+            assert run_weekly(run_id="wk_inproc") == 0
+            mock_sub.run.assert_not_called()
+
+        entry = read_recent_runs(1)[-1]
+        assert entry["run_id"] == "wk_inproc" and entry["status"] == "success"
+        assert entry["metrics"]["mode"] == "inprocess"
+        assert entry["metrics"]["wb1_ms"] >= 0 and entry["metrics"]["wb2_ms"] >= 0
+
+    def test_weekly_inprocess_failure_names_the_stage(self):
+        from nuclear.orchestration.schedule import run_weekly
+        from nuclear.progress import read_recent_runs
+
+        with patch("nuclear.phases.weekly.wb2.run_wb2_and_persist", side_effect=RuntimeError("boom")):
+            assert run_weekly(run_id="wk_fail") == 1
+        entry = read_recent_runs(1)[-1]
+        assert entry["status"] == "failed" and entry["errors"] == ["WB2 failed: boom"]
+
+    def test_weekly_subprocess_mode_still_spawns_both_stages(self):
+        from nuclear.orchestration.schedule import run_weekly
+
+        with patch("nuclear.orchestration.schedule.subprocess") as mock_sub:
+            mock_sub.run.return_value = MagicMock(returncode=0, stderr="")
+            assert run_weekly(run_id="wk_sub", mode="subprocess") == 0
+        cmds = [c.args[0] for c in mock_sub.run.call_args_list]
+        assert [c[3] for c in cmds] == ["wb1", "wb2"]
@@ -0,0 +1,118 @@
+"""
+Per-ticker executor tests - ordered results, per-ticker error isolation, chunking, process
+pools (memory cap, dying worker), D-3's chunked fetch with per-ticker fallback and the
+P3-Delta batch entry point.
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from nuclear.orchestration.ticker_pool import PROCESS, THREAD, map_tickers
+from nuclear.phases.daily.adapters.d3_ticker_adapter import TickerDerivativeAdapter
+from nuclear.phases.daily.d3 import run_d3
+from nuclear.phases.p3.p3_delta import run_p3_delta_batch
+from nuclear.phases.p3.p3_schemas import P3DeltaOutput
+
+
+def _square(ticker, n):
+    if ticker == "BAD":
+        raise ValueError("no data")
+    if ticker == "HOG":
+        bytearray(2 * 1024 ** 3)  # over the worker memory cap
+    if ticker == "CRASH":
+        os._exit(1)
+    return n * n
+
+
+def test_thread_pool_keeps_input_order_and_isolates_errors():
+    delays = {"A": 0.05, "B": 0.0, "BAD": 0.01, "C": 0.02}
+
+    def work(ticker, scale):
+        time.sleep(delays[ticker])
+        if ticker == "BAD":
+            raise RuntimeError("rate limited")
+        return f"{ticker}x{scale}"
+
+    batch = map_tickers(work, list(delays), 2, pool=THREAD, max_workers=4, chunk_size=1)
+    assert [o.ticker for o in batch.outcomes] == ["A", "B", "BAD", "C"]
+    assert list(batch.results) == ["A", "B", "C"] and batch.results["A"] == "Ax2"
+    assert batch.failed == {"BAD": "RuntimeError: rate limited"} and not batch.ok
+
+
+def test_chunks_run_as_one_task_each():
+    threads = {}
+    lock = threading.Lock()
+
+    def work(ticker):
+        with lock:
+            threads.setdefault(threading.current_thread().name, []).append(ticker)
+        return ticker
+
+    tickers = [f"T{i}" for i in range(12)]
+    batch = map_tickers(work, tickers, max_workers=3, chunk_size=4)
+    assert list(batch.results) == tickers
+    assert sorted(len(v) for v in threads.values())[-1] >= 4  # a chunk stays on one worker
+    assert {tuple(v[i:i + 4]) for v in threads.values() for i in range(0, len(v), 4)} <= {
+        tuple(tickers[i:i + 4]) for i in range(0, 12, 4)
+    }
+
+
+def test_mapping_passes_per_ticker_items():
+    batch = map_tickers(_square, {"A": 3, "BAD": 1, "B": 4})
+    assert batch.results == {"A": 9, "B": 16} and list(batch.failed) == ["BAD"]
+
+
+def test_unknown_pool_type():
+    with pytest.raises(ValueError):
+        map_tickers(_square, {"A": 1}, pool="gpu")
+
+
+def test_process_pool_memory_cap_and_dead_worker_are_per_ticker():
+    batch = map_tickers(_square, {"A": 2, "HOG": 1, "CRASH": 1, "B": 3}, pool=PROCESS, max_workers=2,
+                        chunk_size=2, memory_limit_mb=1024)
+    assert batch.results == {"A": 4, "B": 9}
+    assert batch.failed["HOG"].startswith("MemoryError")
+    assert batch.failed["CRASH"].startswith("BrokenProcessPool")
+
+
+def test_p3_delta_batch_on_process_pool():
+    inputs = {t: {"previous_p3": {"cat": 1}, "current_indicators": {"cat": cat}} for t, cat in
+              [("NVDA", 1), ("AMD", 4)]}
+    inputs["BROKEN"] = {}  # missing previous_p3
+    batch = run_p3_delta_batch(inputs, run_id="r1", max_workers=2)
+    assert list(batch.results) == ["NVDA", "AMD"]
+    assert isinstance(batch.results["AMD"], P3DeltaOutput)
+    assert batch.results["AMD"].skeleton_validity == "CRITICAL" and batch.results["NVDA"].run_id == "r1"
+    assert batch.failed["BROKEN"].startswith("KeyError")
+
+
+class FlakyAdapter(TickerDerivativeAdapter):
+    def __init__(self):
+        self.calls = []
+
+    def fetch(self, date, tickers):
+        self.calls.append(list(tickers))
+        if "BAD" in tickers:
+            raise ConnectionError("timeout")
+        return {t: {"iv": 0.3} for t in tickers}
+
+
+def test_d3_skips_failed_tickers():
+    adapter = FlakyAdapter()
+    out = run_d3("2026-02-04", tickers=["AAPL", "BAD", "MSFT"], adapter=adapter)
+    assert out.derivatives_stub == {"AAPL": {"iv": 0.3}, "MSFT": {"iv": 0.3}}
+    assert out.signals["failed_tickers"] == {"BAD": "ConnectionError: timeout"}
+    assert out.universe_size == 3
+    assert adapter.calls[0] == ["AAPL", "BAD", "MSFT"]  # one batched call, then per-ticker retries
+    assert sorted(adapter.calls[1:]) == [["AAPL"], ["BAD"], ["MSFT"]]
+
+
+def test_d3_fetches_in_chunks(monkeypatch):
+    monkeypatch.setenv("NUCLEAR_D3_FETCH_CHUNK", "2")
+    adapter = FlakyAdapter()
+    out = run_d3("2026-02-04", tickers=["A", "B", "C", "D", "BAD"], adapter=adapter)
+    assert list(out.derivatives_stub) == ["A", "B", "C", "D"]
+    assert sorted(adapter.calls) == [["A", "B"], ["BAD"], ["BAD"], ["C", "D"]]
@@ -0,0 +1,152 @@
+"""
+Tracing tests - span nesting, context across thread / process pools, nested-only db and
+snapshot spans, sinks (sqlite, JSONL file, OTLP payload) and the critical-path / CLI views.
+DB in tmp_path.
+"""
+
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from nuclear.db.sqlite import SQLiteEngine
+from nuclear.orchestration.run_graph import Node, RunGraph
+from nuclear.orchestration.ticker_pool import map_tickers
+from nuclear.storage.backends.local_fs import LocalFSBackend
+from nuclear.storage.snapshot import SnapshotWriter
+from nuclear.utils import tracing
+from nuclear.utils.tracing import DB, LLM, PHASE, RUN, SNAPSHOT, TICKER, SpanRecord, span
+
+
+@pytest.fixture(autouse=True)
+def tmp_db(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(SQLiteEngine, "DB_PATH", tmp_path / "nuclear.db")
+    monkeypatch.setattr(LocalFSBackend, "ROOT_DIR", tmp_path / "snapshots")
+    monkeypatch.setenv("NUCLEAR_TRACE_FILE", str(tmp_path / "spans.jsonl"))
+    monkeypatch.delenv("NUCLEAR_TRACE_SINKS", raising=False)
+    monkeypatch.delenv("NUCLEAR_TRACING", raising=False)
+
+
+def _work(ticker):
+    with span("llm.generate", kind=LLM, model="m"):
+        time.sleep(0.001)
+    return ticker.lower()
+
+
+def test_spans_nest_across_thread_pools():
+    with span("daily", kind=RUN, run_id="r1"):
+        with span("D-3", kind=PHASE):
+            batch = map_tickers(_work, ["AAPL", "MSFT"], max_workers=2, chunk_size=1)
+        with ThreadPoolExecutor(1) as pool:
+            pool.submit(tracing.propagate(_work), "TSM").result()
+            pool.submit(_work, "ORPHAN").result()  # not propagated: a trace of its own
+    assert batch.ok
+    records = tracing.load_spans("r1")
+    spans = {(r.name, r.attrs.get("ticker")): r for r in records}
+    root, phase = spans[("daily", None)], spans[("D-3", None)]
+    assert root.parent_id is None and phase.parent_id == root.span_id
+    tickers = [r for r in records if r.kind == TICKER]
+    assert sorted(r.attrs["ticker"] for r in tickers) == ["AAPL", "MSFT"]
+    assert all(t.parent_id == phase.span_id for t in tickers)
+    llm = [r for r in records if r.kind == LLM]
+    assert len(llm) == 3 and {r.parent_id for r in llm} == {t.span_id for t in tickers} | {root.span_id}
+    assert {r.trace_id for r in records} == {root.trace_id}
+
+
+def test_db_and_snapshot_spans_only_inside_a_trace():
+    SnapshotWriter().save(phase="daily/d1", payload={"x": 1}, run_id="untraced")
+    with span("daily", kind=RUN, run_id="r2"):
+        SnapshotWriter().save(phase="daily/d1", payload={"x": 1}, run_id="r2")
+    records = tracing.load_spans("r2")
+    snap = next(r for r in records if r.kind == SNAPSHOT)
+    assert snap.attrs["phase"] == "daily/d1"
+    assert any(r.kind == DB and r.parent_id == snap.span_id for r in records)
+    assert tracing.load_spans("untraced") == []
+
+
+def test_error_status_and_disabled(monkeypatch):
+    with pytest.raises(ValueError):
+        with span("weekly", kind=RUN, run_id="r3"):
+            raise ValueError("bad input")
+    (rec,) = tracing.load_spans("r3")
+    assert rec.status == "error" and rec.error == "ValueError: bad input"
+
+    monkeypatch.setenv("NUCLEAR_TRACING", "0")
+    with span("weekly", kind=RUN, run_id="r4") as sp:
+        assert sp is None
+    assert tracing.load_spans("r4") == []
+
+
+def test_run_graph_spans_and_critical_path():
+    def sleep(ms):
+        return lambda inputs: time.sleep(ms / 1000) or ms
+
+    graph = RunGraph()
+    graph.add(Node("P0", sleep(5)))
+    graph.add(Node("P2:NVDA", sleep(60), inputs=("P0",), ticker="NVDA"))
+    graph.add(Node("P2:AMD", sleep(10), inputs=("P0",), ticker="AMD"))
+    graph.add(Node("P4", sleep(5), collect=("P2:",)))
+    graph.run(run_id="g1")
+
+    records = tracing.load_spans("g1")
+    spans = {r.name: r for r in records}
+    assert spans["P2:NVDA"].kind == TICKER and spans["P0"].kind == PHASE
+    assert all(r.parent_id == spans["run_graph"].span_id for r in records if r.name != "run_graph")
+    assert [r.name for r in tracing.critical_path(records)] == ["run_graph", "P4"]
+    assert tracing.slowest(records, 2, kind=TICKER)[0].name == "P2:NVDA"
+    self_ms = tracing.self_time_by_kind(records)
+    assert list(self_ms)[0] == TICKER and self_ms[TICKER] >= 70  # overlapping tickers both count
+
+
+def test_critical_path_follows_the_last_finishing_child():
+    def rec(name, parent, start, end):
+        return SpanRecord("t", name, parent, "r", name, PHASE, start, end)
+
+    records = [rec("run", None, 0, 100), rec("a", "run", 0, 90), rec("b", "run", 10, 95),
+               rec("b1", "b", 10, 40), rec("b2", "b", 40, 95)]
+    assert [r.name for r in tracing.critical_path(records)] == ["run", "b", "b2"]
+
+
+def test_file_sink_and_otlp_payload(monkeypatch, tmp_path):
+    monkeypatch.setenv("NUCLEAR_TRACE_SINKS", "file")
+    with span("wa", kind=RUN, run_id="r5", model="m", tokens=12):
+        with span("llm.generate", kind=LLM):
+            pass
+    lines = [json.loads(line) for line in (tmp_path / "spans.jsonl").read_text().splitlines()]
+    assert [d["name"] for d in lines] == ["llm.generate", "wa"]
+    assert [r.name for r in tracing.load_spans("r5")] == ["llm.generate", "wa"]  # file fallback
+
+    payload = tracing.to_otlp(tracing.load_spans("r5"))
+    otlp = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    llm, root = otlp
+    assert llm["parentSpanId"] == root["spanId"] and "parentSpanId" not in root
+    assert llm["kind"] == 3 and root["status"] == {"code": 1}
+    attrs = {a["key"]: a["value"] for a in root["attributes"]}
+    assert attrs["tokens"] == {"intValue": "12"} and attrs["nuclear.run_id"] == {"stringValue": "r5"}
+
+
+def test_unknown_sink(monkeypatch):
+    monkeypatch.setenv("NUCLEAR_TRACE_SINKS", "sqlite,zipkin")
+    with pytest.raises(ValueError):
+        tracing.configured_sinks()
+
+
+def test_trace_cli(monkeypatch, capsys):
+    from nuclear.cli import main
+
+    with span("daily", kind=RUN, run_id="cli-run"):
+        with span("D-1", kind=PHASE):
+            pass
+    monkeypatch.setattr(sys, "argv", ["nuclear", "trace", "cli-run", "--top", "5"])
+    assert main() == 0
+    out = capsys.readouterr().out
+    assert "Critical path:" in out and "D-1 [phase]" in out
+
+    monkeypatch.setattr(sys, "argv", ["nuclear", "trace"])
+    assert main() == 0
+    assert "cli-run" in capsys.readouterr().out
+    monkeypatch.setattr(sys, "argv", ["nuclear", "trace", "missing"])
+    assert main() == 1